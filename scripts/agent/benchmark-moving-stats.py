@@ -0,0 +1,123 @@
+"""
+Compare the float-based MovingStatistics against the previous Decimal-based one.
+
+Each round updates the statistics of the given number of metrics once, as a stat
+collection cycle of the agent does, and every ``--serialize-every`` rounds the
+filtered statistics of all metrics are serialized as for a Redis update:
+
+    ./py scripts/agent/benchmark-moving-stats.py --metrics 5000 --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import time
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from typing import Protocol
+
+from ai.backend.agent.stats import MovingStatistics, _to_serializable_value
+
+log = logging.getLogger("benchmark-moving-stats")
+
+STATS_FILTER = ("avg", "max", "rate")
+
+
+class DecimalMovingStatistics:
+    """The statistics as kept before, with Decimal arithmetic on every update."""
+
+    __slots__ = ("_count", "_last", "_max", "_min", "_sum")
+
+    def __init__(self) -> None:
+        self._last: list[tuple[Decimal, float]] = []
+        self._sum = Decimal(0)
+        self._min = Decimal("inf")
+        self._max = Decimal("-inf")
+        self._count = 0
+
+    def update(self, value: Decimal) -> None:
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        self._count += 1
+        self._last.append((value, time.perf_counter()))
+        if len(self._last) > 2:
+            self._last.pop(0)
+
+    def serialize_stat(self, name: str) -> str:
+        match name:
+            case "max":
+                return _to_serializable_value(self._max)
+            case "avg":
+                return _to_serializable_value(self._sum / self._count)
+            case "rate":
+                if len(self._last) < 2:
+                    return _to_serializable_value(Decimal(0))
+                delta = self._last[-1][0] - self._last[-2][0]
+                if delta < 0:
+                    return _to_serializable_value(Decimal(0))
+                elapsed = Decimal(self._last[-1][1] - self._last[-2][1])
+                return _to_serializable_value(delta / elapsed)
+        raise KeyError(name)
+
+
+class Statistics(Protocol):
+    def update(self, value: Decimal) -> None: ...
+
+    def serialize_stat(self, name: str) -> str: ...
+
+
+def measure(
+    name: str,
+    factory: Callable[[], Statistics],
+    samples: Sequence[Sequence[Decimal]],
+    serialize_every: int,
+) -> None:
+    stats = [factory() for _ in samples[0]]
+    update_time = serialize_time = 0.0
+    for round_idx, values in enumerate(samples, 1):
+        started = time.perf_counter()
+        for stat, value in zip(stats, values, strict=True):
+            stat.update(value)
+        update_time += time.perf_counter() - started
+        if round_idx % serialize_every == 0:
+            started = time.perf_counter()
+            for stat in stats:
+                for stat_name in STATS_FILTER:
+                    stat.serialize_stat(stat_name)
+            serialize_time += time.perf_counter() - started
+    updates = len(samples) * len(stats)
+    log.info(
+        "%s: %.3fs for %d updates (%.0f ns each), %.3fs for serialization",
+        name,
+        update_time,
+        updates,
+        update_time / updates * 1e9,
+        serialize_time,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--metrics", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--serialize-every", type=int, default=10)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    rng = random.Random(0)
+    # Cumulative counters with fractional increments, like CPU time and I/O bytes.
+    totals = [Decimal(rng.randrange(1_000_000)) for _ in range(args.metrics)]
+    samples: list[list[Decimal]] = []
+    for _ in range(args.rounds):
+        totals = [total + Decimal(rng.randrange(100_000)) / 1000 for total in totals]
+        samples.append(totals)
+
+    measure("Decimal", DecimalMovingStatistics, samples, args.serialize_every)
+    measure("float", MovingStatistics, samples, args.serialize_every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Measure the output throughput of BaseRunner.run_subproc() in lines per second.
+
+A child process prints the given number of lines, which run_subproc() relays to
+the console, the task log, and the agent socket.  The same run is repeated with
+the previous relay that wrote and sent every 4 KiB chunk on its own.  Discard the
+console output to measure the relay itself:
+
+    ./py scripts/kernel/benchmark-subproc-output.py --lines 200000 > /dev/null
+
+Use ``--block-buffered`` to let the child write in large blocks instead of a
+line at a time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import concurrent.futures
+import logging
+import os
+import sys
+import time
+from typing import Any
+from unittest import mock
+
+import zmq
+import zmq.asyncio
+
+from ai.backend.kernel import base
+from ai.backend.kernel.app import Runner
+
+log = logging.getLogger("benchmark-subproc-output")
+
+
+async def legacy_pipe_output(
+    stream: asyncio.StreamReader,
+    outsock: zmq.Socket[Any],
+    target: str,
+    log_fd: int,
+    _writer: concurrent.futures.Executor | None = None,
+) -> None:
+    """The relay of run_subproc() before output coalescing."""
+    console_fd = sys.stdout.fileno() if target == "stdout" else sys.stderr.fileno()
+    target_bytes = target.encode("ascii")
+    loop = asyncio.get_running_loop()
+    while True:
+        data = await stream.read(4096)
+        if not data:
+            break
+        await asyncio.gather(
+            loop.run_in_executor(None, os.write, console_fd, data),
+            loop.run_in_executor(None, os.write, log_fd, data),
+            outsock.send_multipart([target_bytes, data]),
+            return_exceptions=True,
+        )
+
+
+async def count_lines(insock: zmq.asyncio.Socket, total: int) -> int:
+    lines = 0
+    frames = 0
+    while lines < total:
+        _, data = await insock.recv_multipart()
+        lines += data.count(b"\n")
+        frames += 1
+    return frames
+
+
+async def measure(runner: Runner, insock: zmq.asyncio.Socket, cmd: list[str], lines: int) -> None:
+    counter = asyncio.create_task(count_lines(insock, lines))
+    started = time.perf_counter()
+    retcode = await runner.run_subproc(cmd)
+    frames = await counter
+    elapsed = time.perf_counter() - started
+    if retcode != 0:
+        raise RuntimeError(f"The child process exited with {retcode}")
+    log.info("  %.2fs, %.0f lines/s, %d frames to the agent", elapsed, lines / elapsed, frames)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--line-length", type=int, default=80)
+    parser.add_argument("--block-buffered", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    # The kernel runner relays output with the same default executor.
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    )
+    zctx = zmq.asyncio.Context()
+    insock = zctx.socket(zmq.PULL)
+    insock.bind("inproc://benchmark-subproc-output")
+    # run_subproc() only needs the output socket and the child environment, while
+    # BaseRunner.__init__() expects to run inside a kernel container.
+    runner = Runner.__new__(Runner)
+    runner.child_env = dict(os.environ)
+    runner.outsock = zctx.socket(zmq.PUSH)
+    runner.outsock.connect("inproc://benchmark-subproc-output")
+
+    line = "x" * (args.line_length - 1)
+    cmd = [
+        sys.executable,
+        *([] if args.block_buffered else ["-u"]),
+        "-c",
+        f"for _ in range({args.lines}): print({line!r})",
+    ]
+    try:
+        log.info("run_subproc() with %d lines:", args.lines)
+        await measure(runner, insock, cmd, args.lines)
+        log.info("run_subproc() with the previous per-chunk relay:")
+        with mock.patch.object(base, "pipe_output", legacy_pipe_output):
+            await measure(runner, insock, cmd, args.lines)
+    finally:
+        runner.outsock.close()
+        insock.close()
+        zctx.term()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""
+Compare the vfolder clone engine against shutil.copytree() on a given directory.
+
+Run it on the filesystem to evaluate, e.g. a loopback XFS image with reflinks:
+
+    truncate -s 20G /tmp/xfs.img
+    mkfs.xfs -m reflink=1 /tmp/xfs.img
+    sudo mount -o loop /tmp/xfs.img /mnt/xfs && sudo chown $USER /mnt/xfs
+    ./py scripts/storage-proxy/benchmark-clone.py /mnt/xfs
+
+or ``mkfs.btrfs`` for btrfs.  Use ``--no-reflink`` to measure the in-kernel copy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+from ai.backend.storage.volumes.vfs.clone import DEFAULT_CLONE_CONCURRENCY, TreeCloner
+
+log = logging.getLogger("benchmark-clone")
+
+
+def make_tree(root: Path, dirs: int, files_per_dir: int, file_size: int, large_files: int) -> None:
+    for i in range(dirs):
+        subdir = root / f"dir{i % 16:02d}" / f"sub{i:04d}"
+        subdir.mkdir(parents=True)
+        for j in range(files_per_dir):
+            (subdir / f"file{j:04d}.bin").write_bytes(os.urandom(file_size))
+    for i in range(large_files):
+        with (root / f"large{i}.bin").open("wb") as f:
+            f.writelines(os.urandom(1024 * 1024) for _ in range(1024))
+    os.sync()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("workdir", type=Path)
+    parser.add_argument("--dirs", type=int, default=200)
+    parser.add_argument("--files-per-dir", type=int, default=100)
+    parser.add_argument("--file-size", type=int, default=16 * 1024)
+    parser.add_argument("--large-files", type=int, default=4, help="number of 1 GiB files")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CLONE_CONCURRENCY)
+    parser.add_argument("--no-reflink", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    src = args.workdir / "clone-bench-src"
+    shutil.rmtree(src, ignore_errors=True)
+    make_tree(src, args.dirs, args.files_per_dir, args.file_size, args.large_files)
+
+    dst = args.workdir / "clone-bench-copytree"
+    started = time.perf_counter()
+    await asyncio.get_running_loop().run_in_executor(
+        None, lambda: shutil.copytree(src, dst, dirs_exist_ok=True)
+    )
+    log.info("shutil.copytree: %.2fs", time.perf_counter() - started)
+    shutil.rmtree(dst)
+
+    dst = args.workdir / "clone-bench-cloner"
+    cloner = TreeCloner(src, dst, concurrency=args.concurrency)
+    if args.no_reflink:
+        cloner._use_reflink = False
+    started = time.perf_counter()
+    result = await cloner.run()
+    log.info(
+        "TreeCloner (concurrency=%d): %.2fs for %d files, %d bytes",
+        args.concurrency,
+        time.perf_counter() - started,
+        result.files_copied,
+        result.bytes_copied,
+    )
+    shutil.rmtree(dst)
+    shutil.rmtree(src)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import enum
 import errno
+import functools
 import logging
 import pickle
 import re
@@ -27,7 +28,7 @@ from collections.abc import (
     Sequence,
 )
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC
 from decimal import Decimal
 from importlib.resources import files
@@ -70,6 +71,8 @@ from ai.backend.agent.errors import (
 )
 from ai.backend.agent.etcd import AgentEtcdClientView
 from ai.backend.agent.health.heartbeat import HeartbeatTask
+from ai.backend.agent.image_cache import ImageCacheManager, ImageStorageUsage
+from ai.backend.agent.image_pull import ImagePullCoordinator, PullProgressCallback
 from ai.backend.agent.legacy_inference_env import LegacyInferenceEnvTranslator
 from ai.backend.agent.metrics.metric import (
     StatScope,
@@ -81,6 +84,7 @@ from ai.backend.agent.tasks import (
     CleanupReportedKernelsTask,
     CollectContainerStatTask,
     CollectProcessStatTask,
+    EvictImagesTask,
     ReportKernelCommitStatusTask,
     ScanImagesTask,
     SyncContainerLifecyclesTask,
@@ -321,6 +325,7 @@ def update_additional_gids(environ: MutableMapping[str, str], gids: Collection[i
 class ScanImagesResult:
     scanned_images: Mapping[ImageCanonical, InstalledImageInfo]
     removed_images: Mapping[ImageCanonical, InstalledImageInfo]
+    image_sizes: Mapping[ImageCanonical, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -865,8 +870,13 @@ class AbstractAgent[
     _ongoing_exec_batch_tasks: weakref.WeakSet[asyncio.Task[Any]]
     _ongoing_destruction_tasks: weakref.WeakValueDictionary[KernelId, asyncio.Task[Any]]
     _ongoing_model_service_tasks: set[asyncio.Task[None]]
+    _ongoing_prefetch_tasks: set[asyncio.Task[None]]
+    _prefetch_sema: asyncio.Semaphore
     _metric_registry: CommonMetricRegistry
 
+    image_cache: ImageCacheManager
+    image_pull_coordinator: ImagePullCoordinator
+
     # Health monitoring tracking
     _active_pulls: dict[str, PullTaskInfo]  # key: image canonical name
     _active_creates: dict[KernelId, CreateTaskInfo]
@@ -950,7 +960,13 @@ class AbstractAgent[
         self._ongoing_exec_batch_tasks = weakref.WeakSet()
         self._ongoing_destruction_tasks = weakref.WeakValueDictionary()
         self._ongoing_model_service_tasks = set()
+        self._ongoing_prefetch_tasks = set()
+        self._prefetch_sema = asyncio.Semaphore(local_config.agent.image_cache.prefetch_concurrency)
         self._metric_registry = CommonMetricRegistry.instance()
+        self.image_cache = ImageCacheManager(
+            min_idle_time=local_config.agent.image_cache.min_idle_time
+        )
+        self.image_pull_coordinator = ImagePullCoordinator()
 
         # Initialize health monitoring tracking maps
         self._active_pulls = {}
@@ -1048,6 +1064,7 @@ class AbstractAgent[
         if not self._skip_initial_scan:
             scan_images_result = await self.scan_images()
             self.images = scan_images_result.scanned_images
+            self.image_cache.sync(self.images.keys(), scan_images_result.image_sizes)
             periodic_tasks.append(ScanImagesTask(self))
             await self.scan_running_kernels()
 
@@ -1062,6 +1079,10 @@ class AbstractAgent[
         if self.local_config.agent.sync_container_lifecycles.enabled:
             periodic_tasks.append(SyncContainerLifecyclesTask(self))
 
+        # Prepare LRU eviction of images under disk pressure.
+        if self.local_config.agent.image_cache.enabled:
+            periodic_tasks.append(EvictImagesTask(self))
+
         self._agent_runner = Runner(resources=[])
         host_port_observer = HostPortObserver(self)
         kernel_presence_observer = KernelPresenceObserver(self, self.valkey_schedule_client)
@@ -1124,6 +1145,8 @@ class AbstractAgent[
         """
         await cancel_tasks(self._ongoing_exec_batch_tasks)
         await cancel_tasks(self._ongoing_model_service_tasks)
+        await cancel_tasks(self._ongoing_prefetch_tasks)
+        await self.image_pull_coordinator.close()
 
         async with self.registry_lock:
             # Close all pending kernel runners.
@@ -1192,7 +1215,7 @@ class AbstractAgent[
                         except asyncio.CancelledError:
                             continue
         if isinstance(event, (KernelStartedAnycastEvent, KernelTerminatedAnycastEvent)):
-            await self.save_last_registry()
+            await self.save_last_registry(kernel_ids=(event.kernel_id,))
 
     async def anycast_event(self, event: AbstractAnycastEvent) -> None:
         """
@@ -2067,6 +2090,7 @@ class AbstractAgent[
     async def scan_images_periodically(self) -> None:
         result = await self.scan_images()
         self.images = result.scanned_images
+        self.image_cache.sync(self.images.keys(), result.image_sizes)
         if result.removed_images:
             await self.anycast_event(
                 AgentInstalledImagesRemoveEvent(
@@ -2096,9 +2120,12 @@ class AbstractAgent[
         registry_conf: ImageRegistry,
         *,
         timeout_seconds: float | None,
+        progress_callback: PullProgressCallback | None = None,
     ) -> None:
         """
         Pull the given image from the given registry.
+        If given, *progress_callback* receives the downloaded and total bytes
+        of the image layers as the pull proceeds.
         """
 
     @abstractmethod
@@ -2114,16 +2141,9 @@ class AbstractAgent[
         """
         Check whether the agent has images and pull if needed.
         Spawn bgtasks that pull the specified images and return bgtask IDs.
-        Tracks pull operations for health monitoring.
+        Concurrent requests for the same image wait for a single shared pull.
         """
-        from datetime import datetime
-
         from ai.backend.common.bgtask.reporter import ProgressReporter
-        from ai.backend.common.events.event_types.image.anycast import (
-            ImagePullFailedEvent,
-            ImagePullFinishedEvent,
-            ImagePullStartedEvent,
-        )
 
         log.info(
             "check_and_pull(images:{0})",
@@ -2139,95 +2159,126 @@ class AbstractAgent[
 
         bgtask_mgr = self.background_task_manager
 
-        async def _pull(_reporter: ProgressReporter, *, img_conf: ImageConfig) -> None:
+        async def _pull(reporter: ProgressReporter, *, img_conf: ImageConfig) -> None:
             img_ref = ImageRef.from_image_config(img_conf)
-            img_canonical = img_ref.canonical
 
-            # Track pull operation for health monitoring
-            with self.track_pull(img_canonical) as should_proceed:
-                if not should_proceed:
-                    log.debug("Image {} is already being pulled, skipping", img_canonical)
-                    return
+            async def report_progress(current: int, total: int) -> None:
+                reporter.total_progress = total
+                await reporter.update(current - reporter.current_progress)
 
-                need_to_pull = await self.check_image(
-                    img_ref, img_conf["digest"], AutoPullBehavior(img_conf["auto_pull"])
+            started = await self.image_pull_coordinator.pull(
+                (img_ref.canonical, img_conf["digest"]),
+                functools.partial(self._check_and_pull_image, img_ref, img_conf),
+                progress=report_progress,
+            )
+            if not started:
+                log.debug("Joined the ongoing pull of image {}", img_ref)
+
+        ret: dict[str, str] = {}
+        for img, img_conf in image_configs.items():
+            task_id = await bgtask_mgr.start(_pull, img_conf=img_conf)
+            ret[img] = task_id.hex
+
+        return ret
+
+    async def _check_and_pull_image(
+        self,
+        img_ref: ImageRef,
+        img_conf: ImageConfig,
+        report_progress: PullProgressCallback,
+    ) -> None:
+        """
+        Pull the image if needed, reporting the outcome to the manager with events.
+        Always run through ``image_pull_coordinator`` so that an image is pulled once at a time.
+        """
+        from datetime import datetime
+
+        from ai.backend.common.events.event_types.image.anycast import (
+            ImagePullFailedEvent,
+            ImagePullFinishedEvent,
+            ImagePullStartedEvent,
+        )
+
+        img_canonical = img_ref.canonical
+        self.image_cache.touch(ImageCanonical(img_canonical))
+
+        # Track pull operation for health monitoring
+        with self.track_pull(img_canonical):
+            need_to_pull = await self.check_image(
+                img_ref, img_conf["digest"], AutoPullBehavior(img_conf["auto_pull"])
+            )
+
+            if need_to_pull:
+                log.info("check_and_pull() start pulling {!s}", img_ref)
+
+                await self.anycast_event(
+                    ImagePullStartedEvent(
+                        image=str(img_ref),
+                        image_ref=img_ref,
+                        agent_id=self.id,
+                        timestamp=datetime.now(UTC).timestamp(),
+                    )
                 )
 
-                if need_to_pull:
-                    log.info("check_and_pull() start pulling {!s}", img_ref)
+                image_pull_timeout = self.local_config.api.pull_timeout
+                try:
+                    await self.pull_image(
+                        img_ref,
+                        img_conf["registry"],
+                        timeout_seconds=image_pull_timeout,
+                        progress_callback=report_progress,
+                    )
+
+                except TimeoutError:
+                    log.exception(
+                        "Image pull timeout (img:{!s}, sec:{})", img_ref, image_pull_timeout
+                    )
 
                     await self.anycast_event(
-                        ImagePullStartedEvent(
+                        ImagePullFailedEvent(
                             image=str(img_ref),
                             image_ref=img_ref,
                             agent_id=self.id,
-                            timestamp=datetime.now(UTC).timestamp(),
+                            msg=f"timeout (s:{image_pull_timeout})",
                         )
                     )
+                    raise
 
-                    image_pull_timeout = self.local_config.api.pull_timeout
-                    try:
-                        await self.pull_image(
-                            img_ref, img_conf["registry"], timeout_seconds=image_pull_timeout
-                        )
-
-                    except TimeoutError:
-                        log.exception(
-                            "Image pull timeout (img:{!s}, sec:{})", img_ref, image_pull_timeout
-                        )
-
-                        await self.anycast_event(
-                            ImagePullFailedEvent(
-                                image=str(img_ref),
-                                image_ref=img_ref,
-                                agent_id=self.id,
-                                msg=f"timeout (s:{image_pull_timeout})",
-                            )
-                        )
-                        raise
+                except Exception as e:
+                    log.exception("Image pull failed (img:{}, err:{!r})", img_ref, e)
 
-                    except Exception as e:
-                        log.exception("Image pull failed (img:{}, err:{!r})", img_ref, e)
-
-                        await self.anycast_event(
-                            ImagePullFailedEvent(
-                                image=str(img_ref),
-                                image_ref=img_ref,
-                                agent_id=self.id,
-                                msg=repr(e),
-                            )
+                    await self.anycast_event(
+                        ImagePullFailedEvent(
+                            image=str(img_ref),
+                            image_ref=img_ref,
+                            agent_id=self.id,
+                            msg=repr(e),
                         )
-                        raise
+                    )
+                    raise
 
-                    else:
-                        log.info("Image pull succeeded {}", img_ref)
-                        await self.anycast_event(
-                            ImagePullFinishedEvent(
-                                image=str(img_ref),
-                                image_ref=img_ref,
-                                agent_id=self.id,
-                                timestamp=datetime.now(UTC).timestamp(),
-                            )
-                        )
                 else:
-                    log.debug("No need to pull image {}", img_ref)
-
+                    log.info("Image pull succeeded {}", img_ref)
                     await self.anycast_event(
                         ImagePullFinishedEvent(
                             image=str(img_ref),
                             image_ref=img_ref,
                             agent_id=self.id,
                             timestamp=datetime.now(UTC).timestamp(),
-                            msg="Image already exists",
                         )
                     )
-
-        ret: dict[str, str] = {}
-        for img, img_conf in image_configs.items():
-            task_id = await bgtask_mgr.start(_pull, img_conf=img_conf)
-            ret[img] = task_id.hex
-
-        return ret
+            else:
+                log.debug("No need to pull image {}", img_ref)
+
+                await self.anycast_event(
+                    ImagePullFinishedEvent(
+                        image=str(img_ref),
+                        image_ref=img_ref,
+                        agent_id=self.id,
+                        timestamp=datetime.now(UTC).timestamp(),
+                        msg="Image already exists",
+                    )
+                )
 
     @abstractmethod
     async def check_image(
@@ -2239,6 +2290,91 @@ class AbstractAgent[
         """
         return False
 
+    async def get_image_storage_usage(self) -> ImageStorageUsage | None:
+        """
+        Return the disk usage of the filesystem holding the local image store,
+        or None if the backend does not manage images on a local disk.
+        """
+        return None
+
+    async def evict_images(self) -> None:
+        """
+        Purge least-recently-used images until the image store usage drops to the
+        low watermark, once it has exceeded the high watermark.
+        """
+        config = self.local_config.agent.image_cache
+        usage = await self.get_image_storage_usage()
+        if usage is None or usage.ratio < config.high_watermark:
+            return
+        bytes_to_free = usage.used - int(usage.total * config.low_watermark)
+        in_use = {
+            ImageCanonical(kernel_obj.image.canonical)
+            for kernel_obj in self.kernel_registry.values()
+        }
+        in_use.update(ImageCanonical(image) for image in self._active_pulls)
+        victims = self.image_cache.select_evictions(bytes_to_free, in_use=in_use)
+        if not victims:
+            log.warning(
+                "image store usage is {:.1%} but there is no idle image to evict",
+                usage.ratio,
+            )
+            return
+        log.info(
+            "evicting {} image(s) to free {} bytes (usage: {:.1%}): {}",
+            len(victims),
+            bytes_to_free,
+            usage.ratio,
+            victims,
+        )
+        result = await self.purge_images(PurgeImagesReq(images=[*victims]))
+        for resp in result.responses:
+            if resp.error is None:
+                self.image_cache.forget(ImageCanonical(resp.image))
+
+    async def prefetch_images(self, image_configs: Mapping[str, ImageConfig]) -> list[str]:
+        """
+        Start pulling the given images in the background ahead of kernel creation.
+        Images already installed or being pulled are skipped, and so is the whole
+        request when image eviction is disabled or while the image store is above
+        the high watermark.
+        Returns the keys of the images accepted for prefetching.
+        """
+        config = self.local_config.agent.image_cache
+        if not config.enabled:
+            log.debug("prefetch_images(): skipped as image eviction is disabled")
+            return []
+        usage = await self.get_image_storage_usage()
+        if usage is not None and usage.ratio >= config.high_watermark:
+            log.debug("prefetch_images(): skipped as the image store usage is {:.1%}", usage.ratio)
+            return []
+        accepted: list[str] = []
+        for img, img_conf in image_configs.items():
+            canonical = img_conf["canonical"]
+            if canonical in self.images or canonical in self._active_pulls:
+                continue
+            accepted.append(img)
+            task = asyncio.create_task(self._prefetch_image(img_conf))
+            self._ongoing_prefetch_tasks.add(task)
+            task.add_done_callback(self._ongoing_prefetch_tasks.discard)
+        if accepted:
+            log.info("prefetch_images(images:{})", accepted)
+        return accepted
+
+    async def _prefetch_image(self, img_conf: ImageConfig) -> None:
+        img_ref = ImageRef.from_image_config(img_conf)
+        key = (img_ref.canonical, img_conf["digest"])
+        async with self._prefetch_sema:
+            if self.image_pull_coordinator.is_pulling(key):
+                return
+            try:
+                await self.image_pull_coordinator.pull(
+                    key, functools.partial(self._check_and_pull_image, img_ref, img_conf)
+                )
+            except Exception:
+                # Already logged and reported to the manager by _check_and_pull_image().
+                return
+            log.info("Image prefetch succeeded {}", img_ref)
+
     async def scan_running_kernels(self) -> None:
         """
         Scan currently running kernels and recreate the kernel objects in
@@ -2577,6 +2713,7 @@ class AbstractAgent[
         """
         kernel_id = ownership_data.kernel_id
         session_id = ownership_data.session_id
+        self.image_cache.touch(ImageCanonical(kernel_image.canonical))
 
         # Track kernel creation for health monitoring
         with self.track_create(kernel_id, session_id) as should_proceed:
@@ -2673,11 +2810,19 @@ class AbstractAgent[
                             reason=ctx.image_ref.canonical,
                         ),
                     )
-                    try:
+
+                    async def _pull(report_progress: PullProgressCallback) -> None:
                         await self.pull_image(
                             ctx.image_ref,
                             kernel_config["image"]["registry"],
                             timeout_seconds=image_pull_timeout,
+                            progress_callback=report_progress,
+                        )
+
+                    # Kernels of the same image created at once share a single pull.
+                    try:
+                        await self.image_pull_coordinator.pull(
+                            (ctx.image_ref.canonical, kernel_config["image"]["digest"]), _pull
                         )
 
                     except TimeoutError as e:
@@ -3699,10 +3844,14 @@ class AbstractAgent[
     async def ping_kernel(self, kernel_id: KernelId) -> dict[str, float] | None:
         return await self.kernel_registry[kernel_id].ping()
 
-    async def save_last_registry(self, force: bool = False) -> None:
+    async def save_last_registry(
+        self,
+        force: bool = False,
+        kernel_ids: Collection[KernelId] | None = None,
+    ) -> None:
         await self._write_kernel_registry_to_recovery(
             self.kernel_registry,
-            KernelRegistrySaveMetadata(force),
+            KernelRegistrySaveMetadata(force, kernel_ids),
         )
 
 
@@ -127,6 +127,106 @@ class SyncContainerLifecyclesConfig(BaseConfigSchema):
     ]
 
 
+class ImageCacheConfig(BaseConfigSchema):
+    enabled: Annotated[
+        bool,
+        Field(default=False),
+        BackendAIConfigMeta(
+            description=(
+                "Controls whether the agent evicts least-recently-used kernel images when the "
+                "disk holding the container runtime's image store fills up beyond "
+                "`high-watermark`. Images used by running kernels or being pulled are never "
+                "evicted. Prefetch hints from the manager are accepted only when this is enabled, "
+                "so that prefetched images cannot fill up the disk."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="false", prod="true"),
+        ),
+    ]
+    interval: Annotated[
+        float,
+        Field(default=60.0, gt=0),
+        BackendAIConfigMeta(
+            description="Time interval in seconds between disk usage checks of the image store.",
+            added_version="26.8.0",
+            example=ConfigExample(local="60.0", prod="60.0"),
+        ),
+    ]
+    high_watermark: Annotated[
+        float,
+        Field(
+            default=0.85,
+            gt=0,
+            le=1,
+            validation_alias=AliasChoices("high-watermark", "high_watermark"),
+            serialization_alias="high-watermark",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Fraction of the image store disk usage that triggers eviction. "
+                "Prefetch hints are also ignored while the usage is above this level."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="0.85", prod="0.85"),
+        ),
+    ]
+    low_watermark: Annotated[
+        float,
+        Field(
+            default=0.75,
+            gt=0,
+            le=1,
+            validation_alias=AliasChoices("low-watermark", "low_watermark"),
+            serialization_alias="low-watermark",
+        ),
+        BackendAIConfigMeta(
+            description="Fraction of the image store disk usage that eviction tries to reach.",
+            added_version="26.8.0",
+            example=ConfigExample(local="0.75", prod="0.7"),
+        ),
+    ]
+    min_idle_time: Annotated[
+        float,
+        Field(
+            default=3600.0,
+            ge=0,
+            validation_alias=AliasChoices("min-idle-time", "min_idle_time"),
+            serialization_alias="min-idle-time",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Minimum time in seconds since an image was last used before it may be evicted. "
+                "Protects freshly prefetched images and images of kernels about to be created."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="3600.0", prod="21600.0"),
+        ),
+    ]
+    prefetch_concurrency: Annotated[
+        int,
+        Field(
+            default=1,
+            ge=1,
+            validation_alias=AliasChoices("prefetch-concurrency", "prefetch_concurrency"),
+            serialization_alias="prefetch-concurrency",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of images pulled at once for prefetch hints. "
+                "Kept low so that prefetching does not compete with on-demand pulls."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="1", prod="2"),
+        ),
+    ]
+
+    @model_validator(mode="after")
+    def _check_watermarks(self) -> Self:
+        if self.low_watermark > self.high_watermark:
+            raise ValueError("low-watermark must not be greater than high-watermark")
+        return self
+
+
 class NodeMetricConfig(BaseConfigSchema):
     enable: Annotated[
         bool,
@@ -1289,6 +1389,22 @@ class OverridableAgentConfig(BaseConfigSchema):
             composite=CompositeType.FIELD,
         ),
     ]
+    image_cache: Annotated[
+        ImageCacheConfig,
+        Field(
+            default_factory=ImageCacheConfig,
+            validation_alias=AliasChoices("image-cache", "image_cache"),
+            serialization_alias="image-cache",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Configuration for the kernel image cache. Controls LRU eviction of images "
+                "under disk pressure and prefetching of images hinted by the manager."
+            ),
+            added_version="26.8.0",
+            composite=CompositeType.FIELD,
+        ),
+    ]
     utilization_metric: Annotated[
         UtilizationMetricConfig,
         Field(
@@ -64,6 +64,8 @@ from ai.backend.agent.errors import (
 from ai.backend.agent.errors.resources import PortPoolExhaustedError
 from ai.backend.agent.etcd import AgentEtcdClientView
 from ai.backend.agent.fs import create_scratch_filesystem, destroy_scratch_filesystem
+from ai.backend.agent.image_cache import ImageStorageUsage
+from ai.backend.agent.image_pull import PullProgressCallback
 from ai.backend.agent.kernel import AbstractKernel, KernelRegistry
 from ai.backend.agent.kernel_registry.adapter import (
     KernelRecoveryDataAdapter,
@@ -73,10 +75,8 @@ from ai.backend.agent.kernel_registry.container.creator import (
     ContainerBasedKernelRegistryCreatorArgs,
     ContainerBasedLoaderWriterCreator,
 )
-from ai.backend.agent.kernel_registry.pickle.creator import (
-    PickleBasedKernelRegistryCreatorArgs,
-    PickleBasedLoaderWriterCreator,
-)
+from ai.backend.agent.kernel_registry.journal.creator import JournalBasedLoaderWriterCreator
+from ai.backend.agent.kernel_registry.pickle.creator import PickleBasedKernelRegistryCreatorArgs
 from ai.backend.agent.kernel_registry.recovery.docker_recovery import (
     DockerKernelRegistryRecovery,
 )
@@ -169,7 +169,7 @@ from ai.backend.logging import BraceStyleAdapter
 from ai.backend.logging.formatter import pretty
 
 from .kernel import DockerKernel
-from .utils import PersistentServiceContainer
+from .utils import LayerProgressAggregator, PersistentServiceContainer
 
 if TYPE_CHECKING:
     from ai.backend.common.auth import PublicKey
@@ -1579,7 +1579,7 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
         self.checked_invalid_images = set()
         self._seccomp_profile_as_path = False
         self._cgroup_path_cache = LRUCache(maxsize=_CGROUP_PATH_CACHE_SIZE)
-        pickle_loader_writer_creator = PickleBasedLoaderWriterCreator.create(
+        journal_loader_writer_creator = JournalBasedLoaderWriterCreator.create(
             PickleBasedKernelRegistryCreatorArgs(
                 scratch_root=local_config.container.scratch_root,
                 ipc_base_path=local_config.agent.ipc_base_path,
@@ -1589,8 +1589,8 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
                 local_instance_id=self.local_instance_id,
             ),
         )
-        pickle_loader = pickle_loader_writer_creator.create_loader()
-        pickle_writer = pickle_loader_writer_creator.create_writer()
+        journal_loader = journal_loader_writer_creator.create_loader()
+        journal_writer = journal_loader_writer_creator.create_writer()
         container_loader_writer_creator = ContainerBasedLoaderWriterCreator(
             ContainerBasedKernelRegistryCreatorArgs(
                 scratch_root=local_config.container.scratch_root,
@@ -1601,10 +1601,10 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
         container_writer = container_loader_writer_creator.create_writer()
         self._kernel_recovery = DockerKernelRegistryRecovery(
             loader=container_loader,
-            writers=[pickle_writer, container_writer],
+            writers=[journal_writer, container_writer],
         )
         self._kernel_recovery_adapter = KernelRecoveryDataAdapter(
-            pickle_loader,
+            journal_loader,
             [KernelRecoveryDataAdapterTarget(container_loader, container_writer)],
         )
 
@@ -1693,7 +1693,7 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
         self.monitor_docker_task = asyncio.create_task(self.monitor_docker_events())
         self.docker_ptask_group = aiotools.PersistentTaskGroup()
 
-        # For legacy accelerator plugins
+        # For legacy accelerator plugins and image pulls
         self.docker = Docker()
 
         self.network_plugin_ctx = NetworkPluginContext(
@@ -1874,6 +1874,7 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
             all_images = await docker.images.list()
             scanned_images: dict[ImageCanonical, InstalledImageInfo] = {}
             removed_images: dict[ImageCanonical, InstalledImageInfo] = {}
+            image_sizes: dict[ImageCanonical, int] = {}
             for image in all_images:
                 if image["RepoTags"] is None:
                     continue
@@ -1905,6 +1906,7 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
                                 inspect_result=img_detail,
                             )
                         )
+                        image_sizes[ImageCanonical(repo_tag)] = img_detail.get("Size", 0)
             for added_image in scanned_images.keys() - self.images.keys():
                 log.debug("found kernel image: {0}", added_image)
 
@@ -1915,6 +1917,7 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
             return ScanImagesResult(
                 scanned_images=scanned_images,
                 removed_images=removed_images,
+                image_sizes=image_sizes,
             )
 
     async def handle_agent_socket(self) -> None:
@@ -2047,6 +2050,7 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
         registry_conf: ImageRegistry,
         *,
         timeout_seconds: float | None,
+        progress_callback: PullProgressCallback | None = None,
     ) -> None:
         auth_config = None
         reg_user = registry_conf.get("username")
@@ -2057,15 +2061,18 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
                 "auth": encoded_creds,
             }
         log.info("pulling image {} from registry", image_ref.canonical)
-        async with closing_async(Docker()) as docker:
-            result = await docker.images.pull(
-                image_ref.canonical, auth=auth_config, timeout=timeout_seconds
-            )
-
-            if not result:
-                raise RuntimeError("Failed to pull image: unexpected return value from aiodocker")
-            if error := result[-1].get("error"):
+        progress = LayerProgressAggregator()
+        received = False
+        async for item in self.docker.images.pull(
+            image_ref.canonical, auth=auth_config, timeout=timeout_seconds, stream=True
+        ):
+            received = True
+            if error := item.get("error"):
                 raise RuntimeError(f"Failed to pull image: {error}")
+            if progress.update(item) and progress_callback is not None:
+                await progress_callback(progress.current, progress.total)
+        if not received:
+            raise RuntimeError("Failed to pull image: unexpected return value from aiodocker")
 
     async def _purge_image(self, docker: Docker, request: DockerPurgeImageReq) -> PurgeImageResp:
         try:
@@ -2118,6 +2125,22 @@ class DockerAgent(AbstractAgent[DockerKernel, DockerKernelCreationContext]):
                 raise
         return False
 
+    @override
+    async def get_image_storage_usage(self) -> ImageStorageUsage | None:
+        docker_root = self.docker_info.get("DockerRootDir")
+        if not docker_root:
+            return None
+        try:
+            st = await asyncio.to_thread(os.statvfs, docker_root)
+        except OSError as e:
+            # e.g., the Docker root lives inside a VM in the linuxkit mode.
+            log.debug("cannot measure the disk usage of {}: {!r}", docker_root, e)
+            return None
+        return ImageStorageUsage(
+            used=st.f_frsize * (st.f_blocks - st.f_bfree),
+            total=st.f_frsize * st.f_blocks,
+        )
+
     @override
     async def init_kernel_context(
         self,
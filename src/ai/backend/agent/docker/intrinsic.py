@@ -17,6 +17,13 @@ from aiodocker.exceptions import DockerError
 
 from ai.backend.agent import __version__  # pants: no-infer-dep
 from ai.backend.agent.alloc_map import AllocationStrategy
+from ai.backend.agent.docker.cgroup_stat import (
+    CgroupStatReader,
+    find_keyed_value,
+    parse_single_value,
+    sum_blkio_service_bytes,
+    sum_io_stat,
+)
 from ai.backend.agent.docker.kernel import DockerKernel
 from ai.backend.agent.errors import InvalidArgumentError, InvalidResourceConfigError
 from ai.backend.agent.plugin.network import (
@@ -31,6 +38,7 @@ from ai.backend.agent.resources import (
     DeviceSlotInfo,
     DiscretePropertyAllocMap,
 )
+from ai.backend.agent.scratch import ScratchUsageTracker
 from ai.backend.agent.stats import (
     ContainerMeasurement,
     Measurement,
@@ -41,7 +49,6 @@ from ai.backend.agent.stats import (
     StatModes,
 )
 from ai.backend.agent.types import Container, MountInfo
-from ai.backend.agent.utils import read_sysfs
 from ai.backend.agent.vendor.linux import libnuma
 from ai.backend.common.asyncio import current_loop
 from ai.backend.common.cgroup import CgroupController, CgroupResolutionFailed
@@ -100,6 +107,43 @@ class ContainerStatResult:
     scratch_size: int
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class _CgroupMemoryStat:
+    mem_cur_bytes: int
+    mem_max_bytes: int
+    io_read_bytes: int
+    io_write_bytes: int
+
+
+async def _resolve_cgroup_paths(
+    ctx: StatContext,
+    controllers: Sequence[CgroupController],
+    container_ids: Sequence[str],
+    plugin_name: str,
+) -> dict[ContainerId, list[Path]]:
+    """Resolve the cgroup paths of the given controllers for all containers concurrently."""
+
+    async def resolve(cid: ContainerId) -> list[Path]:
+        return [await ctx.agent.get_cgroup_path(controller, cid) for controller in controllers]
+
+    cids = [ContainerId(cid) for cid in container_ids]
+    results = await asyncio.gather(*(resolve(cid) for cid in cids), return_exceptions=True)
+    cgroup_paths: dict[ContainerId, list[Path]] = {}
+    for cid, result in zip(cids, results, strict=True):
+        if isinstance(result, (OSError, CgroupResolutionFailed)):
+            log.warning(
+                "{0}: cannot read stats: sysfs unreadable for container {1}\n{2!r}",
+                plugin_name,
+                cid[:7],
+                result,
+            )
+            continue
+        if isinstance(result, BaseException):
+            raise result
+        cgroup_paths[cid] = result
+    return cgroup_paths
+
+
 def _parse_proc_net_dev(content: str) -> ContainerNetStat:
     """Parse /proc/net/dev content and return stats for non-lo interfaces."""
     rx_bytes = 0
@@ -200,13 +244,16 @@ class CPUPlugin(AbstractComputePlugin):
     ]
 
     _docker: Docker
+    _cgroup_reader: CgroupStatReader
 
     @override
     async def init(self, context: Any | None = None) -> None:
         self._docker = Docker()
+        self._cgroup_reader = CgroupStatReader()
 
     @override
     async def cleanup(self) -> None:
+        await self._cgroup_reader.close()
         await self._docker.close()
 
     @override
@@ -287,34 +334,43 @@ class CPUPlugin(AbstractComputePlugin):
         if not container_ids:
             return []
 
-        async def sysfs_impl(container_id: str) -> float | None:
+        async def sysfs_impl() -> list[float | None]:
             version = ctx.agent.docker_info["CgroupVersion"]  # type: ignore[attr-defined]
-            try:
-                cpu_path = await ctx.agent.get_cgroup_path(
-                    CgroupController.CPUACCT, ContainerId(container_id)
-                )
-                match version:
-                    case "1":
-                        cpu_used = read_sysfs(cpu_path / "cpuacct.usage", int) / 1e6
-                    case "2":
-                        cpu_stats = {
-                            k: v
-                            for k, v in map(
-                                lambda line: line.split(" "),
-                                (cpu_path / "cpu.stat").read_text().splitlines(),
-                            )
-                        }
-                        cpu_used = int(cpu_stats["usage_usec"]) / 1e3
-                    case _:
-                        return None
-            except (OSError, CgroupResolutionFailed) as e:
-                log.warning(
-                    "CPUPlugin: cannot read stats: sysfs unreadable for container {0}\n{1!r}",
-                    container_id[:7],
-                    e,
-                )
-                return None
-            return cpu_used
+            match version:
+                case "1":
+                    stat_file = "cpuacct.usage"
+                case "2":
+                    stat_file = "cpu.stat"
+                case _:
+                    return [None] * len(container_ids)
+
+            def parse(_cid: ContainerId, contents: Sequence[bytes]) -> float:
+                if version == "1":
+                    return parse_single_value(contents[0]) / 1e6
+                usage_usec = find_keyed_value(contents[0], b"usage_usec")
+                if usage_usec is None:
+                    raise ValueError("usage_usec not found in cpu.stat")
+                return usage_usec / 1e3
+
+            cpu_paths = await _resolve_cgroup_paths(
+                ctx, (CgroupController.CPUACCT,), container_ids, "CPUPlugin"
+            )
+            results = await self._cgroup_reader.read(
+                {cid: [cpu_path / stat_file] for cid, (cpu_path,) in cpu_paths.items()},
+                parse,
+            )
+            cpu_used_list: list[float | None] = []
+            for cid in container_ids:
+                result = results.get(ContainerId(cid))
+                if isinstance(result, Exception):
+                    log.warning(
+                        "CPUPlugin: cannot read stats: sysfs unreadable for container {0}\n{1!r}",
+                        cid[:7],
+                        result,
+                    )
+                    result = None
+                cpu_used_list.append(result)
+            return cpu_used_list
 
         async def api_impl(container_id: str) -> float | None:
             container = DockerContainer(self._docker, id=container_id)
@@ -329,17 +385,15 @@ class CPUPlugin(AbstractComputePlugin):
             return cpu_usage / 1e6
 
         if ctx.mode == StatModes.CGROUP:
-            impl = sysfs_impl
+            results = await sysfs_impl()
         elif ctx.mode == StatModes.DOCKER:
-            impl = api_impl
+            tasks = []
+            for cid in container_ids:
+                tasks.append(asyncio.create_task(api_impl(cid)))
+            results = await asyncio.gather(*tasks)
         else:
             raise RuntimeError("should not reach here")
 
-        tasks = []
-        for cid in container_ids:
-            tasks.append(asyncio.create_task(impl(cid)))
-        results = await asyncio.gather(*tasks)
-
         q = Decimal("0.000")
         per_container_cpu_used = {}
         per_container_cpu_util = {}
@@ -548,14 +602,21 @@ class MemoryPlugin(AbstractComputePlugin):
 
     _docker: Docker
     _graph_root_prefix: str | None
+    _cgroup_reader: CgroupStatReader
+    _scratch_usage: ScratchUsageTracker
 
     @override
     async def init(self, context: Any | None = None) -> None:
         self._docker = Docker()
         self._graph_root_prefix = await self._get_graph_root_prefix()
+        self._cgroup_reader = CgroupStatReader()
+        self._scratch_usage = ScratchUsageTracker()
+        await self._scratch_usage.start()
 
     @override
     async def cleanup(self) -> None:
+        await self._scratch_usage.stop()
+        await self._cgroup_reader.close()
         await self._docker.close()
 
     async def _get_graph_root_prefix(self) -> str | None:
@@ -700,107 +761,81 @@ class MemoryPlugin(AbstractComputePlugin):
         if not container_ids:
             return []
 
-        def get_scratch_size(_container_id: str) -> int:
-            # Temporarily disabled as this function incurs too much delay with
-            # a large number of files in scratch dirs, causing indefinite accumulation of
-            # stat collector tasks and slowing down everything.
-            return 0
-            # for kernel_id, info in ctx.agent.kernel_registry.items():
-            #     if info['container_id'] == container_id:
-            #         break
-            # else:
-            #     return 0
-            # work_dir = ctx.agent.local_config['container']['scratch-root'] / str(kernel_id) / 'work'
-            # total_size = 0
-            # for path in work_dir.rglob('*'):
-            #     if path.is_symlink():
-            #         total_size += path.lstat().st_size
-            #     elif path.is_file():
-            #         total_size += path.stat().st_size
-            # return total_size
+        # Scratch directories are measured by a background worker, as walking them inline
+        # with a large number of files would stall the stat collection loop.
+        scratch_root: Path = self.local_config["container"]["scratch-root"]
+        self._scratch_usage.sync({
+            str(kernel.container_id): scratch_root / str(kernel_id)
+            for kernel_id, kernel in ctx.agent.kernel_registry.items()
+            if kernel.container_id is not None
+        })
 
-        async def sysfs_impl(
-            container_id: str,
-        ) -> ContainerStatResult | None:
-            version = ctx.agent.get_cgroup_version()
+        def get_scratch_size(container_id: str) -> int:
+            return self._scratch_usage.get_usage(container_id) or 0
 
-            try:
-                mem_path = await ctx.agent.get_cgroup_path(
-                    CgroupController.MEMORY, ContainerId(container_id)
+        cgroup_stats: dict[ContainerId, _CgroupMemoryStat | Exception] = {}
+
+        async def read_cgroup_stats() -> None:
+            version = ctx.agent.get_cgroup_version()
+            match version:
+                case "1":
+                    mem_files = ("memory.usage_in_bytes", "memory.limit_in_bytes", "memory.stat")
+                    io_file = "blkio.throttle.io_service_bytes"
+                    inactive_key = b"total_inactive_file"
+                    sum_io_bytes = sum_blkio_service_bytes
+                case "2":
+                    mem_files = ("memory.current", "memory.max", "memory.stat")
+                    io_file = "io.stat"
+                    inactive_key = b"inactive_file"
+                    sum_io_bytes = sum_io_stat
+                case _:
+                    return
+
+            def parse(cid: ContainerId, contents: Sequence[bytes]) -> _CgroupMemoryStat:
+                mem_cur_bytes = parse_single_value(contents[0])
+                mem_max_bytes = parse_single_value(contents[1])
+                try:
+                    mem_cur_bytes -= find_keyed_value(contents[2], inactive_key) or 0
+                except ValueError:
+                    log.warning(
+                        "MemoryPlugin: cannot parse inactive stat. container: {0}",
+                        cid[:7],
+                    )
+                io_read_bytes, io_write_bytes = sum_io_bytes(contents[3])
+                return _CgroupMemoryStat(
+                    mem_cur_bytes=mem_cur_bytes,
+                    mem_max_bytes=mem_max_bytes,
+                    io_read_bytes=io_read_bytes,
+                    io_write_bytes=io_write_bytes,
                 )
-                io_path = await ctx.agent.get_cgroup_path(
-                    CgroupController.BLKIO, ContainerId(container_id)
+
+            cgroup_paths = await _resolve_cgroup_paths(
+                ctx,
+                (CgroupController.MEMORY, CgroupController.BLKIO),
+                container_ids,
+                "MemoryPlugin",
+            )
+            cgroup_stats.update(
+                await self._cgroup_reader.read(
+                    {
+                        cid: [*(mem_path / name for name in mem_files), io_path / io_file]
+                        for cid, (mem_path, io_path) in cgroup_paths.items()
+                    },
+                    parse,
                 )
-                io_read_bytes = 0
-                io_write_bytes = 0
-                match version:
-                    case "1":
-                        mem_cur_bytes = read_sysfs(mem_path / "memory.usage_in_bytes", int)
-                        mem_max_bytes = read_sysfs(mem_path / "memory.limit_in_bytes", int)
-
-                        for line in (mem_path / "memory.stat").read_text().splitlines():
-                            key, _, value = line.partition(" ")
-                            if key == "total_inactive_file":
-                                try:
-                                    mem_cur_bytes -= int(value)
-                                except ValueError:
-                                    log.warning(
-                                        "MemoryPlugin: cannot parse inactive stat. container: {0}",
-                                        container_id[:7],
-                                    )
-                                break
-
-                        # example data:
-                        #   8:0 Read 13918208
-                        #   8:0 Write 0
-                        #   8:0 Sync 0
-                        #   8:0 Async 13918208
-                        #   8:0 Total 13918208
-                        #   Total 13918208
-                        for line in (
-                            (io_path / "blkio.throttle.io_service_bytes").read_text().splitlines()
-                        ):
-                            if line.startswith("Total "):
-                                continue
-                            dev, op, nbytes = line.strip().split()
-                            if op == "Read":
-                                io_read_bytes += int(nbytes)
-                            elif op == "Write":
-                                io_write_bytes += int(nbytes)
-                    case "2":
-                        mem_cur_bytes = read_sysfs(mem_path / "memory.current", int)
-                        mem_max_bytes = read_sysfs(mem_path / "memory.max", int)
-
-                        for line in (mem_path / "memory.stat").read_text().splitlines():
-                            key, _, value = line.partition(" ")
-                            if key == "inactive_file":
-                                try:
-                                    mem_cur_bytes -= int(value)
-                                except ValueError:
-                                    log.warning(
-                                        "MemoryPlugin: cannot parse inactive stat. container: {0}",
-                                        container_id[:7],
-                                    )
-                                break
-
-                        # example data:
-                        # 8:16 rbytes=1459200 wbytes=314773504 rios=192 wios=353 dbytes=0 dios=0
-                        # 8:0 rbytes=3387392 wbytes=176128 rios=103 wios=32 dbytes=0 dios=0
-                        # 253:0 8:0 rbytes=3387392 wbytes=176128 rios=103 wios=32 dbytes=0 dios=0
-                        for line in (io_path / "io.stat").read_text().splitlines():
-                            for io_stat in line.split():
-                                stat, _, value = io_stat.partition("=")
-                                if stat == "rbytes":
-                                    io_read_bytes += int(value)
-                                if stat == "wbytes":
-                                    io_write_bytes += int(value)
-                    case _:
-                        return None
-            except (OSError, CgroupResolutionFailed) as e:
+            )
+
+        async def sysfs_impl(
+            container_id: str,
+        ) -> ContainerStatResult | None:
+            cgroup_stat = cgroup_stats.get(ContainerId(container_id))
+            if cgroup_stat is None:
+                return None
+            if isinstance(cgroup_stat, Exception):
                 log.warning(
                     "MemoryPlugin: cannot read stats: sysfs unreadable for container {0}\n{1!r}",
                     container_id[:7],
-                    e,
+                    cgroup_stat,
                 )
                 return None
             container = DockerContainer(self._docker, id=container_id)
@@ -846,13 +881,12 @@ class MemoryPlugin(AbstractComputePlugin):
                         " skipping net stat collection",
                         container_id[:7],
                     )
-            loop = current_loop()
-            scratch_sz = await loop.run_in_executor(None, get_scratch_size, container_id)
+            scratch_sz = get_scratch_size(container_id)
             return ContainerStatResult(
-                mem_cur_bytes=mem_cur_bytes,
-                mem_capacity_bytes=mem_max_bytes,
-                io_read_bytes=io_read_bytes,
-                io_write_bytes=io_write_bytes,
+                mem_cur_bytes=cgroup_stat.mem_cur_bytes,
+                mem_capacity_bytes=cgroup_stat.mem_max_bytes,
+                io_read_bytes=cgroup_stat.io_read_bytes,
+                io_write_bytes=cgroup_stat.io_write_bytes,
                 net_rx_bytes=net_stat.rx_bytes,
                 net_tx_bytes=net_stat.tx_bytes,
                 scratch_size=scratch_sz,
@@ -883,8 +917,7 @@ class MemoryPlugin(AbstractComputePlugin):
             for name, stat in ret["networks"].items():
                 net_rx_bytes += stat["rx_bytes"]
                 net_tx_bytes += stat["tx_bytes"]
-            loop = current_loop()
-            scratch_sz = await loop.run_in_executor(None, get_scratch_size, container_id)
+            scratch_sz = get_scratch_size(container_id)
             return ContainerStatResult(
                 mem_cur_bytes=mem_cur_bytes,
                 mem_capacity_bytes=mem_capacity_bytes,
@@ -896,6 +929,8 @@ class MemoryPlugin(AbstractComputePlugin):
             )
 
         if ctx.mode == StatModes.CGROUP:
+            # Read the cgroup files of all containers in one batch off the event loop.
+            await read_cgroup_stats()
             impl = sysfs_impl
         elif ctx.mode == StatModes.DOCKER:
             impl = api_impl
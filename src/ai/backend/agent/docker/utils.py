@@ -21,6 +21,49 @@ log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 IMAGE_CHUNK_SIZE: Final[int] = 1 * 1024 * 1024 * 1024  # 1MiB
 
 
+class LayerProgressAggregator:
+    """
+    Sums up the per-layer download progress in the status stream of a Docker image pull.
+
+    Layers that already exist locally never report their sizes, so the total only
+    grows as the layers to download start reporting theirs.
+    """
+
+    _layers: dict[str, tuple[int, int]]
+
+    def __init__(self) -> None:
+        self._layers = {}
+
+    def update(self, status: Mapping[str, Any]) -> bool:
+        """Apply a status item and return whether the aggregated progress has changed."""
+        layer_id = status.get("id")
+        if layer_id is None:
+            return False
+        match status.get("status"):
+            case "Downloading":
+                detail = status.get("progressDetail") or {}
+                total = detail.get("total") or 0
+                if total <= 0:
+                    return False
+                self._layers[layer_id] = (min(detail.get("current") or 0, total), total)
+                return True
+            case "Download complete" | "Pull complete":
+                if (layer := self._layers.get(layer_id)) is None or layer[0] == layer[1]:
+                    return False
+                self._layers[layer_id] = (layer[1], layer[1])
+                return True
+            case _:
+                return False
+
+    @property
+    def current(self) -> int:
+        return sum(current for current, _ in self._layers.values())
+
+    @property
+    def total(self) -> int:
+        return sum(total for _, total in self._layers.values())
+
+
 class PersistentServiceContainer:
     def __init__(
         self,
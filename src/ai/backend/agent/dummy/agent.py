@@ -16,6 +16,7 @@ from ai.backend.agent.agent import (
 )
 from ai.backend.agent.config.unified import AgentUnifiedConfig
 from ai.backend.agent.errors import UnsupportedResource
+from ai.backend.agent.image_pull import PullProgressCallback
 from ai.backend.agent.kernel import AbstractKernel
 from ai.backend.agent.kernel_registry.writer.types import KernelRegistrySaveMetadata
 from ai.backend.agent.resources import (
@@ -329,6 +330,7 @@ class DummyAgent(
         registry_conf: ImageRegistry,
         *,
         timeout_seconds: float | None,
+        progress_callback: PullProgressCallback | None = None,
     ) -> None:
         delay = self.dummy_agent_cfg["delay"]["pull-image"]
         await asyncio.sleep(delay)
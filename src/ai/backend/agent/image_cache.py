@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+
+from ai.backend.common.types import ImageCanonical
+
+
+@dataclass(frozen=True, slots=True)
+class ImageStorageUsage:
+    """The disk usage of the filesystem that holds the container runtime's image store."""
+
+    used: int
+    total: int
+
+    @property
+    def ratio(self) -> float:
+        return self.used / self.total if self.total else 0.0
+
+
+@dataclass(slots=True)
+class _CachedImage:
+    size: int
+    last_used: float
+
+
+class ImageCacheManager:
+    """
+    Tracks the size and the last use of the kernel images installed on the agent
+    and picks the least-recently-used ones to evict when the image store fills up.
+
+    The last-use time is kept in memory only, so an image first seen by :meth:`sync`
+    (e.g., after an agent restart) counts as used at that moment.  This errs on the
+    side of keeping images until they have been idle for ``min_idle_time`` under
+    the watch of the current agent process.
+    """
+
+    _images: dict[ImageCanonical, _CachedImage]
+    _min_idle_time: float
+    _clock: Callable[[], float]
+
+    def __init__(self, *, min_idle_time: float, clock: Callable[[], float] = time.time) -> None:
+        self._images = {}
+        self._min_idle_time = min_idle_time
+        self._clock = clock
+
+    def sync(
+        self,
+        installed: Collection[ImageCanonical],
+        sizes: Mapping[ImageCanonical, int],
+    ) -> None:
+        """Replace the set of tracked images with the installed ones, keeping their last use."""
+        now = self._clock()
+        for canonical in self._images.keys() - set(installed):
+            del self._images[canonical]
+        for canonical in installed:
+            size = sizes.get(canonical, 0)
+            if (image := self._images.get(canonical)) is None:
+                self._images[canonical] = _CachedImage(size=size, last_used=now)
+            else:
+                image.size = size
+
+    def touch(self, canonical: ImageCanonical) -> None:
+        """Mark the image as used now, starting to track it if not yet installed."""
+        now = self._clock()
+        if (image := self._images.get(canonical)) is None:
+            self._images[canonical] = _CachedImage(size=0, last_used=now)
+        else:
+            image.last_used = now
+
+    def forget(self, canonical: ImageCanonical) -> None:
+        self._images.pop(canonical, None)
+
+    def get_last_used(self, canonical: ImageCanonical) -> float | None:
+        image = self._images.get(canonical)
+        return image.last_used if image is not None else None
+
+    def select_evictions(
+        self,
+        bytes_to_free: int,
+        *,
+        in_use: Collection[ImageCanonical] = (),
+    ) -> list[ImageCanonical]:
+        """
+        Return the least-recently-used images whose total size covers *bytes_to_free*,
+        skipping the images in *in_use* and those used within ``min_idle_time``.
+        Fewer images are returned if there are not enough eviction candidates.
+
+        Since images may share layers, removing them may free less than their sizes
+        add up to; the caller is expected to re-check the disk usage later.
+        """
+        if bytes_to_free <= 0:
+            return []
+        idle_since = self._clock() - self._min_idle_time
+        candidates = sorted(
+            (
+                (image.last_used, canonical, image.size)
+                for canonical, image in self._images.items()
+                if canonical not in in_use and image.last_used <= idle_since
+            )
+        )
+        selected: list[ImageCanonical] = []
+        freed = 0
+        for _, canonical, size in candidates:
+            if freed >= bytes_to_free:
+                break
+            selected.append(canonical)
+            freed += size
+        return selected
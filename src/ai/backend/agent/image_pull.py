@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+
+from ai.backend.common.asyncio import cancel_tasks
+from ai.backend.logging import BraceStyleAdapter
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+type PullProgressCallback = Callable[[int, int], Awaitable[None]]
+"""Receives the (current, total) bytes of a pull."""
+
+type PullFunc = Callable[[PullProgressCallback], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class _InflightPull:
+    task: asyncio.Task[None] | None = None
+    listeners: list[PullProgressCallback] = field(default_factory=list)
+    current: int = 0
+    total: int = 0
+    last_reported_at: float = 0.0
+
+
+class ImagePullCoordinator:
+    """
+    Coalesces concurrent pulls of the same image into a single in-flight pull.
+
+    The first caller for a key starts the pull and later callers for the same key
+    join it, so that every caller returns only after the image is ready and gets
+    the same exception if the pull fails.  The progress reported by the pull is
+    fanned out to the callbacks of all current waiters, at most once per
+    ``progress_interval`` except for the final report.
+
+    The pull runs in its own task, so a cancelled waiter does not abort the pull
+    for the others.
+    """
+
+    _inflight: dict[Hashable, _InflightPull]
+    _progress_interval: float
+
+    def __init__(self, *, progress_interval: float = 1.0) -> None:
+        self._inflight = {}
+        self._progress_interval = progress_interval
+
+    def is_pulling(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def pull(
+        self,
+        key: Hashable,
+        pull_func: PullFunc,
+        *,
+        progress: PullProgressCallback | None = None,
+    ) -> bool:
+        """
+        Run *pull_func* unless a pull for *key* is already in flight, and wait for it.
+        Returns True if this call started the pull and False if it joined one.
+        """
+        inflight = self._inflight.get(key)
+        started = inflight is None
+        if inflight is None:
+            inflight = _InflightPull()
+            task = asyncio.create_task(self._run(key, inflight, pull_func))
+            task.add_done_callback(_consume_exception)
+            inflight.task = task
+            self._inflight[key] = inflight
+        else:
+            if inflight.task is None:
+                raise RuntimeError(f"The in-flight pull of {key} has no task")
+            task = inflight.task
+            if progress is not None and inflight.total:
+                await progress(inflight.current, inflight.total)
+        if progress is not None:
+            inflight.listeners.append(progress)
+        try:
+            await asyncio.shield(task)
+        finally:
+            if progress is not None:
+                inflight.listeners.remove(progress)
+        return started
+
+    async def close(self) -> None:
+        await cancel_tasks([
+            inflight.task for inflight in self._inflight.values() if inflight.task is not None
+        ])
+
+    async def _run(self, key: Hashable, inflight: _InflightPull, pull_func: PullFunc) -> None:
+        loop = asyncio.get_running_loop()
+
+        async def report(current: int, total: int) -> None:
+            inflight.current, inflight.total = current, total
+            now = loop.time()
+            if current < total and now - inflight.last_reported_at < self._progress_interval:
+                return
+            inflight.last_reported_at = now
+            for listener in [*inflight.listeners]:
+                try:
+                    await listener(current, total)
+                except Exception as e:
+                    log.debug("failed to report the image pull progress of {}: {!r}", key, e)
+
+        try:
+            await pull_func(report)
+        finally:
+            self._inflight.pop(key, None)
+
+
+def _consume_exception(task: asyncio.Task[None]) -> None:
+    # Waiters see the exception through asyncio.shield(); this only silences the
+    # "never retrieved" warning when all of them have been cancelled.
+    if not task.cancelled():
+        task.exception()
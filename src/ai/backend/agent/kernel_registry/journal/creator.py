@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Self
+
+from ai.backend.agent.kernel_registry.loader.journal import JournalBasedKernelRegistryLoader
+from ai.backend.agent.kernel_registry.loader.pickle import PickleBasedKernelRegistryLoader
+from ai.backend.agent.kernel_registry.pickle.creator import (
+    PickleBasedKernelRegistryCreatorArgs,
+    PickleBasedLoaderWriterCreator,
+)
+from ai.backend.agent.kernel_registry.writer.journal import JournalBasedKernelRegistryWriter
+
+
+class JournalBasedLoaderWriterCreator:
+    """
+    Creates a loader and writer for journal-based kernel registry.
+    The snapshot and journal files are placed next to the pickle-based registry file,
+    which is only read while no snapshot has been written yet.
+    """
+
+    def __init__(
+        self,
+        registry_file_path: Path,
+        legacy_registry_file_path: Path,
+    ) -> None:
+        self._registry_file = registry_file_path
+        self._legacy_registry_file = legacy_registry_file_path
+        self._snapshot_file = registry_file_path.with_name(registry_file_path.stem + ".snapshot")
+        self._journal_file = registry_file_path.with_name(registry_file_path.stem + ".journal")
+
+    @classmethod
+    def create(cls, args: PickleBasedKernelRegistryCreatorArgs) -> Self:
+        pickle_creator = PickleBasedLoaderWriterCreator.create(args)
+        return cls(
+            registry_file_path=pickle_creator.registry_file_path,
+            legacy_registry_file_path=pickle_creator.legacy_registry_file_path,
+        )
+
+    def create_loader(self) -> JournalBasedKernelRegistryLoader:
+        return JournalBasedKernelRegistryLoader(
+            self._snapshot_file,
+            self._journal_file,
+            legacy_loader=PickleBasedKernelRegistryLoader(
+                self._registry_file,
+                self._legacy_registry_file,
+            ),
+        )
+
+    def create_writer(self) -> JournalBasedKernelRegistryWriter:
+        return JournalBasedKernelRegistryWriter(
+            self._snapshot_file,
+            self._journal_file,
+        )
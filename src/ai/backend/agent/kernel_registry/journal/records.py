@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import enum
+import struct
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from ai.backend.common import msgpack
+from ai.backend.common.types import KernelId
+
+# Each record is framed as (payload length, CRC32 of payload) followed by a msgpack payload.
+_FRAME = struct.Struct("!II")
+
+
+class JournalOp(enum.StrEnum):
+    BEGIN = "begin"
+    PUT = "put"
+    REMOVE = "remove"
+
+
+@dataclass(frozen=True, slots=True)
+class JournalRecord:
+    """
+    A single entry of a kernel registry snapshot or journal file.
+
+    Every file starts with a ``BEGIN`` record carrying the ID of the snapshot it
+    belongs to, followed by ``PUT`` records holding a pickled kernel object and
+    ``REMOVE`` records holding only the kernel ID.
+    """
+
+    op: JournalOp
+    snapshot_id: str | None = None
+    kernel_id: KernelId | None = None
+    kernel: bytes | None = None
+
+    def encode(self) -> bytes:
+        match self.op:
+            case JournalOp.BEGIN:
+                body: dict[str, object] = {"op": self.op.value, "snapshot_id": self.snapshot_id}
+            case JournalOp.PUT:
+                body = {"op": self.op.value, "kernel_id": self.kernel_id, "kernel": self.kernel}
+            case JournalOp.REMOVE:
+                body = {"op": self.op.value, "kernel_id": self.kernel_id}
+        payload = msgpack.packb(body)
+        return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+
+def encode_records(records: Iterable[JournalRecord]) -> bytes:
+    return b"".join(record.encode() for record in records)
+
+
+def decode_records(data: bytes) -> tuple[list[JournalRecord], int]:
+    """
+    Decode the records in *data* up to the first incomplete or corrupt one.
+
+    Returns the decoded records and the number of bytes they span, so that
+    callers can tell a torn write at the tail from a fully valid file.
+    """
+    records: list[JournalRecord] = []
+    offset = 0
+    while offset + _FRAME.size <= len(data):
+        length, checksum = _FRAME.unpack_from(data, offset)
+        begin = offset + _FRAME.size
+        payload = data[begin : begin + length]
+        if len(payload) < length or zlib.crc32(payload) != checksum:
+            break
+        try:
+            body = msgpack.unpackb(payload)
+            record = JournalRecord(
+                op=JournalOp(body["op"]),
+                snapshot_id=body.get("snapshot_id"),
+                kernel_id=body.get("kernel_id"),
+                kernel=body.get("kernel"),
+            )
+        except (ValueError, KeyError, TypeError):
+            break
+        records.append(record)
+        offset = begin + length
+    return records, offset
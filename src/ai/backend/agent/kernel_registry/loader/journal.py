@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+import pickle
+from collections.abc import MutableMapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, cast, override
+
+from ai.backend.agent.kernel_registry.exception import KernelRegistryLoadError
+from ai.backend.agent.kernel_registry.journal.records import (
+    JournalOp,
+    JournalRecord,
+    decode_records,
+)
+from ai.backend.common.types import KernelId
+from ai.backend.logging import BraceStyleAdapter
+
+from .abc import AbstractKernelRegistryLoader
+
+if TYPE_CHECKING:
+    from ai.backend.agent.kernel import AbstractKernel
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+
+class JournalBasedKernelRegistryLoader(AbstractKernelRegistryLoader):
+    """
+    Loads the kernel registry by replaying the journal on top of the last snapshot.
+
+    When neither file exists yet, the registry is imported from the legacy loader
+    (the pickle-based one), so that the first save afterwards migrates it.
+    """
+
+    def __init__(
+        self,
+        snapshot_file_path: Path,
+        journal_file_path: Path,
+        legacy_loader: AbstractKernelRegistryLoader,
+    ) -> None:
+        self._snapshot_file_path = snapshot_file_path
+        self._journal_file_path = journal_file_path
+        self._legacy_loader = legacy_loader
+
+    @override
+    async def load_kernel_registry(self) -> MutableMapping[KernelId, AbstractKernel]:
+        try:
+            snapshot_data = self._snapshot_file_path.read_bytes()
+        except FileNotFoundError:
+            log.info(
+                "No kernel registry snapshot at {}, importing the legacy registry",
+                str(self._snapshot_file_path),
+            )
+            return await self._legacy_loader.load_kernel_registry()
+        snapshot, valid_size = decode_records(snapshot_data)
+        if valid_size != len(snapshot_data) or not snapshot or snapshot[0].op != JournalOp.BEGIN:
+            # Snapshots are replaced atomically, so this is not a torn write.
+            log.warning("Corrupt kernel registry snapshot: {}", str(self._snapshot_file_path))
+            raise KernelRegistryLoadError
+        registry: dict[KernelId, AbstractKernel] = {}
+        self._replay(registry, snapshot[1:])
+        try:
+            journal_data = self._journal_file_path.read_bytes()
+        except FileNotFoundError:
+            journal_data = b""
+        journal, valid_size = decode_records(journal_data)
+        if valid_size != len(journal_data):
+            log.warning(
+                "Discarding a torn write at the tail of the kernel registry journal {} ({} bytes)",
+                str(self._journal_file_path),
+                len(journal_data) - valid_size,
+            )
+        if journal and journal[0].op == JournalOp.BEGIN:
+            if journal[0].snapshot_id == snapshot[0].snapshot_id:
+                self._replay(registry, journal[1:])
+            else:
+                # The agent stopped while compacting, after the new snapshot had been
+                # written, so the journal only has changes already in the snapshot.
+                log.info(
+                    "Skipping a stale kernel registry journal: {}",
+                    str(self._journal_file_path),
+                )
+        return registry
+
+    @staticmethod
+    def _replay(
+        registry: dict[KernelId, AbstractKernel],
+        records: Sequence[JournalRecord],
+    ) -> None:
+        for record in records:
+            if record.kernel_id is None:
+                continue
+            match record.op:
+                case JournalOp.PUT if record.kernel is not None:
+                    try:
+                        kernel = pickle.loads(record.kernel)
+                    except Exception as e:
+                        log.warning(
+                            "Failed to restore kernel {} from the registry journal: {!r}",
+                            record.kernel_id,
+                            e,
+                        )
+                        continue
+                    registry[record.kernel_id] = cast("AbstractKernel", kernel)
+                case JournalOp.REMOVE:
+                    registry.pop(record.kernel_id, None)
@@ -36,6 +36,14 @@ class PickleBasedLoaderWriterCreator:
         self._registry_file = registry_file_path
         self._legacy_registry_file = legacy_registry_file_path
 
+    @property
+    def registry_file_path(self) -> Path:
+        return self._registry_file
+
+    @property
+    def legacy_registry_file_path(self) -> Path:
+        return self._legacy_registry_file
+
     @classmethod
     def _last_registry_file_name(
         cls,
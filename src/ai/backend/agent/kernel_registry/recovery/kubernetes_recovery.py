@@ -5,8 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Self
 
-from ai.backend.agent.kernel_registry.loader.pickle import PickleBasedKernelRegistryLoader
-from ai.backend.agent.kernel_registry.writer.pickle import PickleBasedKernelRegistryWriter
+from ai.backend.agent.kernel_registry.journal.creator import JournalBasedLoaderWriterCreator
 from ai.backend.common.types import AgentId
 from ai.backend.logging import BraceStyleAdapter
 
@@ -31,10 +30,11 @@ class KubernetesKernelRegistryRecovery(BaseKernelRegistryRecovery):
         legacy_registry_file_path = args.ipc_base_path / registry_file_name
         last_registry_file_path = args.var_base_path / registry_file_name
 
+        creator = JournalBasedLoaderWriterCreator(
+            registry_file_path=last_registry_file_path,
+            legacy_registry_file_path=legacy_registry_file_path,
+        )
         return cls(
-            loader=PickleBasedKernelRegistryLoader(
-                last_registry_file_path,
-                legacy_registry_file_path,
-            ),
-            writers=[PickleBasedKernelRegistryWriter(last_registry_file_path)],
+            loader=creator.create_loader(),
+            writers=[creator.create_writer()],
         )
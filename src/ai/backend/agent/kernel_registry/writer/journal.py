@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import pickle
+import time
+import uuid
+from collections.abc import Collection, MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
+from ai.backend.agent.kernel_registry.journal.records import (
+    JournalOp,
+    JournalRecord,
+    encode_records,
+)
+from ai.backend.common.types import KernelId
+from ai.backend.logging import BraceStyleAdapter
+
+from .abc import AbstractKernelRegistryWriter
+from .pickle import SAVE_COOL_DOWN_SECONDS
+from .types import KernelRegistrySaveMetadata
+
+if TYPE_CHECKING:
+    from ai.backend.agent.kernel import AbstractKernel
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+DEFAULT_COMPACTION_THRESHOLD = 256
+
+
+class JournalBasedKernelRegistryWriter(AbstractKernelRegistryWriter):
+    """
+    Persists the kernel registry as a snapshot plus an append-only journal.
+
+    Each save appends a checksummed record only for the kernels added, changed, or
+    removed since the last save, and fsyncs the journal.  The first save of the
+    process and every save after ``compaction_threshold`` journal records rewrite
+    the snapshot atomically and start a new journal, tagged with a fresh snapshot
+    ID so that a journal left over from an interrupted compaction is never
+    replayed onto the newer snapshot.
+
+    Like the pickle-based writer, saves that are not forced are skipped within
+    ``save_cool_down`` seconds of the last write.  The kernels hinted by a skipped
+    save are remembered, so that the next write still picks up their changes.
+    """
+
+    def __init__(
+        self,
+        snapshot_file_path: Path,
+        journal_file_path: Path,
+        *,
+        compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD,
+        save_cool_down: float = SAVE_COOL_DOWN_SECONDS,
+    ) -> None:
+        self._snapshot_file_path = snapshot_file_path
+        self._journal_file_path = journal_file_path
+        self._compaction_threshold = compaction_threshold
+        self._save_cool_down = save_cool_down
+        self._last_saved_time = time.monotonic()
+        # Kernels hinted by the saves skipped since the last write; None for every kernel.
+        self._deferred_kernel_ids: set[KernelId] | None = set()
+        self._lock = asyncio.Lock()
+        # Digests of the pickled kernels as of the last save; None until the first compaction.
+        self._persisted: dict[KernelId, bytes] | None = None
+        self._journal_records = 0
+
+    @override
+    async def save_kernel_registry(
+        self, data: MutableMapping[KernelId, AbstractKernel], metadata: KernelRegistrySaveMetadata
+    ) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            kernel_ids = self._merge_deferred_kernel_ids(metadata.kernel_ids)
+            if (not metadata.force) and (now < self._last_saved_time + self._save_cool_down):
+                self._deferred_kernel_ids = kernel_ids
+                return  # don't save too frequently
+            try:
+                if self._persisted is None:
+                    await self._compact(data)
+                    self._mark_saved(now)
+                    return
+                records = self._collect_changes(self._persisted, data, kernel_ids)
+                if not records:
+                    self._deferred_kernel_ids = set()
+                    return
+                if self._journal_records + len(records) > self._compaction_threshold:
+                    await self._compact(data)
+                    self._mark_saved(now)
+                    return
+                await asyncio.to_thread(self._append, encode_records(records))
+                self._journal_records += len(records)
+                self._mark_saved(now)
+                log.debug(
+                    "Appended {} record(s) to the kernel registry journal {}",
+                    len(records),
+                    str(self._journal_file_path),
+                )
+            except Exception as e:
+                # Start over with a full snapshot on the next save.
+                self._persisted = None
+                log.exception(
+                    "Failed to save kernel registry to {} (error: {})",
+                    str(self._journal_file_path),
+                    str(e),
+                )
+
+    def _merge_deferred_kernel_ids(
+        self, kernel_ids: Collection[KernelId] | None
+    ) -> set[KernelId] | None:
+        if kernel_ids is None or self._deferred_kernel_ids is None:
+            return None
+        return self._deferred_kernel_ids | set(kernel_ids)
+
+    def _mark_saved(self, now: float) -> None:
+        self._last_saved_time = now
+        self._deferred_kernel_ids = set()
+
+    def _collect_changes(
+        self,
+        persisted: dict[KernelId, bytes],
+        data: MutableMapping[KernelId, AbstractKernel],
+        kernel_ids: Collection[KernelId] | None,
+    ) -> list[JournalRecord]:
+        records: list[JournalRecord] = []
+        for kernel_id in persisted.keys() - data.keys():
+            del persisted[kernel_id]
+            records.append(JournalRecord(JournalOp.REMOVE, kernel_id=kernel_id))
+        if kernel_ids is None:
+            candidates = list(data.keys())
+        else:
+            candidates = [kernel_id for kernel_id in kernel_ids if kernel_id in data]
+        for kernel_id in candidates:
+            payload = pickle.dumps(data[kernel_id])
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if persisted.get(kernel_id) == digest:
+                continue
+            persisted[kernel_id] = digest
+            records.append(JournalRecord(JournalOp.PUT, kernel_id=kernel_id, kernel=payload))
+        return records
+
+    async def _compact(self, data: MutableMapping[KernelId, AbstractKernel]) -> None:
+        snapshot_id = uuid.uuid4().hex
+        begin = JournalRecord(JournalOp.BEGIN, snapshot_id=snapshot_id)
+        records = [begin]
+        persisted: dict[KernelId, bytes] = {}
+        for kernel_id, kernel in data.items():
+            payload = pickle.dumps(kernel)
+            persisted[kernel_id] = hashlib.blake2b(payload, digest_size=16).digest()
+            records.append(JournalRecord(JournalOp.PUT, kernel_id=kernel_id, kernel=payload))
+        await asyncio.to_thread(
+            self._write_snapshot, encode_records(records), encode_records([begin])
+        )
+        self._persisted = persisted
+        self._journal_records = 0
+        log.debug("Saved kernel registry snapshot to {}", str(self._snapshot_file_path))
+
+    def _write_snapshot(self, snapshot: bytes, journal_header: bytes) -> None:
+        self._replace_file(self._snapshot_file_path, snapshot)
+        self._replace_file(self._journal_file_path, journal_header)
+
+    def _append(self, records: bytes) -> None:
+        with self._journal_file_path.open("ab") as f:
+            f.write(records)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _replace_file(path: Path, content: bytes) -> None:
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(path)
@@ -1,6 +1,12 @@
+from collections.abc import Collection
 from dataclasses import dataclass
 
+from ai.backend.common.types import KernelId
+
 
 @dataclass
 class KernelRegistrySaveMetadata:
     force: bool
+    # When set, only these kernels may have changed since the last save (removals are
+    # still detected from the whole registry), letting writers skip the unchanged ones.
+    kernel_ids: Collection[KernelId] | None = None
@@ -37,6 +37,7 @@ from ai.backend.agent.agent import (
 from ai.backend.agent.config.unified import AgentUnifiedConfig, ScratchType
 from ai.backend.agent.errors import K8sError, UnsupportedResource
 from ai.backend.agent.etcd import AgentEtcdClientView
+from ai.backend.agent.image_pull import PullProgressCallback
 from ai.backend.agent.kernel import AbstractKernel, KernelRegistry
 from ai.backend.agent.kernel_registry.recovery.kubernetes_recovery import (
     KubernetesKernelRegistryRecovery,
@@ -1113,6 +1114,7 @@ class KubernetesAgent(
         registry_conf: ImageRegistry,
         *,
         timeout_seconds: float | None,
+        progress_callback: PullProgressCallback | None = None,
     ) -> None:
         # TODO: Add support for appropriate image pulling mechanism on K8s
         pass
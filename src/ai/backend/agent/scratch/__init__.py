@@ -1,3 +1,4 @@
+from .usage import IncrementalDirWalker, ScratchUsageMethod, ScratchUsageTracker
 from .utils import (
     create_loop_filesystem,
     create_sparse_file,
@@ -5,6 +6,9 @@ from .utils import (
 )
 
 __all__ = (
+    "IncrementalDirWalker",
+    "ScratchUsageMethod",
+    "ScratchUsageTracker",
     "create_loop_filesystem",
     "create_sparse_file",
     "destroy_loop_filesystem",
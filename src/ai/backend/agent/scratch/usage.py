@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import ctypes
+import ctypes.util
+import enum
+import fcntl
+import logging
+import os
+import struct
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import psutil
+
+from ai.backend.logging import BraceStyleAdapter
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+# struct fsxattr { __u32 fsx_xflags, fsx_extsize, fsx_nextents, fsx_projid, fsx_cowextsize;
+#                  unsigned char fsx_pad[8]; }
+_FSXATTR = struct.Struct("=5I8x")
+_FS_IOC_FSGETXATTR = 0x801C581F  # _IOR('X', 31, struct fsxattr)
+_Q_GETQUOTA = 0x800007
+_PRJQUOTA = 2
+
+
+class _IfDqblk(ctypes.Structure):
+    _fields_ = [
+        ("dqb_bhardlimit", ctypes.c_uint64),
+        ("dqb_bsoftlimit", ctypes.c_uint64),
+        ("dqb_curspace", ctypes.c_uint64),
+        ("dqb_ihardlimit", ctypes.c_uint64),
+        ("dqb_isoftlimit", ctypes.c_uint64),
+        ("dqb_curinodes", ctypes.c_uint64),
+        ("dqb_btime", ctypes.c_uint64),
+        ("dqb_itime", ctypes.c_uint64),
+        ("dqb_valid", ctypes.c_uint32),
+    ]
+
+
+class ScratchUsageMethod(enum.StrEnum):
+    MOUNT = "mount"
+    PROJECT_QUOTA = "project-quota"
+    WALK = "walk"
+
+
+def get_project_id(path: Path) -> int:
+    """Return the filesystem project ID assigned to the given directory (0 if none)."""
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        buf = fcntl.ioctl(fd, _FS_IOC_FSGETXATTR, bytes(_FSXATTR.size))
+    finally:
+        os.close(fd)
+    return _FSXATTR.unpack(buf)[3]
+
+
+def get_project_quota_usage(device: str, project_id: int) -> int:
+    """Return the bytes charged to the given project on the block device via quotactl(2)."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    dqblk = _IfDqblk()
+    ret = libc.quotactl(
+        (_Q_GETQUOTA << 8) | _PRJQUOTA,
+        os.fsencode(device),
+        project_id,
+        ctypes.byref(dqblk),
+    )
+    if ret == -1:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"quotactl() failed: {os.strerror(errno)}")
+    return dqblk.dqb_curspace
+
+
+def _find_block_device(path: Path) -> str | None:
+    best: tuple[int, str] | None = None
+    for part in psutil.disk_partitions(all=True):
+        mountpoint = part.mountpoint.rstrip("/") + "/"
+        if not (str(path) + "/").startswith(mountpoint):
+            continue
+        if best is None or len(mountpoint) > best[0]:
+            best = (len(mountpoint), part.device)
+    if best is None or not best[1].startswith("/dev/"):
+        return None
+    return best[1]
+
+
+@dataclass(slots=True)
+class _DirRecord:
+    mtime_ns: int
+    own_bytes: int
+    subdirs: list[str]
+
+
+@dataclass(slots=True)
+class _ScratchTarget:
+    path: Path
+    method: ScratchUsageMethod | None = None
+    device: str = ""
+    project_id: int = 0
+    dirs: dict[str, _DirRecord] = field(default_factory=dict)
+    last_full_scan: float = 0.0
+    usage: int | None = None
+
+
+class IncrementalDirWalker:
+    """
+    Computes the disk usage of a directory tree, remembering each directory's
+    mtime and the bytes allocated by its direct non-directory entries.
+
+    On the next pass, a directory whose mtime has not changed is not listed
+    again; only its subdirectories are visited.  Since appending to an existing
+    file does not touch the mtime of its parent directory, callers should
+    request a full scan periodically to pick up files that grew in place.
+    """
+
+    _dirs: dict[str, _DirRecord]
+
+    def __init__(self, dirs: dict[str, _DirRecord] | None = None) -> None:
+        self._dirs = dirs if dirs is not None else {}
+
+    def scan(self, root: Path, *, full: bool = False) -> int:
+        new_dirs: dict[str, _DirRecord] = {}
+        total = 0
+        stack = [str(root)]
+        while stack:
+            path = stack.pop()
+            try:
+                st = os.lstat(path)
+            except FileNotFoundError:
+                if not new_dirs:
+                    raise  # the root itself is gone
+                continue
+            record = self._dirs.get(path)
+            if full or record is None or record.mtime_ns != st.st_mtime_ns:
+                try:
+                    record = self._list_dir(path, st)
+                except (FileNotFoundError, NotADirectoryError):
+                    continue
+            new_dirs[path] = record
+            total += record.own_bytes
+            stack.extend(record.subdirs)
+        self._dirs.clear()
+        self._dirs.update(new_dirs)
+        return total
+
+    @staticmethod
+    def _list_dir(path: str, st: os.stat_result) -> _DirRecord:
+        own_bytes = st.st_blocks * 512
+        subdirs: list[str] = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        own_bytes += entry.stat(follow_symlinks=False).st_blocks * 512
+                except FileNotFoundError:
+                    continue
+        return _DirRecord(st.st_mtime_ns, own_bytes, subdirs)
+
+
+class ScratchUsageTracker:
+    """
+    Tracks the disk usage of container scratch directories in the background.
+
+    For each directory, the cheapest available method is picked once:
+
+    * ``mount``: the directory is its own mount (the "memory" and "hostfile"
+      scratch types), so statvfs(3) reports its usage directly.
+    * ``project-quota``: the directory carries an XFS/ext4 project ID of its
+      own on a filesystem mounted with project quotas, so quotactl(2) reports
+      the usage.  An ID inherited from the parent directory or shared with
+      another tracked directory would report the usage of all of them, and
+      such directories are walked instead.
+    * ``walk``: otherwise, an :class:`IncrementalDirWalker` that only re-lists
+      changed directories, with a full rescan every ``full_scan_interval``.
+
+    All measurements run one at a time on a dedicated worker thread, and
+    :meth:`get_usage` only returns the last result, so slow filesystems never
+    hold up the stat collection loop.
+    """
+
+    _interval: float
+    _full_scan_interval: float
+    _targets: dict[str, _ScratchTarget]
+    _executor: concurrent.futures.ThreadPoolExecutor | None
+    _task: asyncio.Task[None] | None
+
+    def __init__(self, *, interval: float = 10.0, full_scan_interval: float = 600.0) -> None:
+        self._interval = interval
+        self._full_scan_interval = full_scan_interval
+        self._targets = {}
+        self._executor = None
+        self._task = None
+
+    async def start(self) -> None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="scratch-usage"
+        )
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
+
+    def sync(self, paths: Mapping[str, Path]) -> None:
+        """Replace the set of tracked directories, keeping the state of the unchanged ones."""
+        for key in self._targets.keys() - paths.keys():
+            del self._targets[key]
+        for key, path in paths.items():
+            target = self._targets.get(key)
+            if target is None or target.path != path:
+                self._targets[key] = _ScratchTarget(path)
+
+    def get_usage(self, key: str) -> int | None:
+        target = self._targets.get(key)
+        return target.usage if target is not None else None
+
+    async def refresh(self) -> None:
+        """Measure all tracked directories once."""
+        loop = asyncio.get_running_loop()
+        for key, target in [*self._targets.items()]:
+            try:
+                usage = await loop.run_in_executor(self._executor, self._measure, target)
+            except OSError as e:
+                log.debug("scratch usage: cannot measure {} ({}): {!r}", key, target.path, e)
+                continue
+            target.usage = usage
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                log.exception("scratch usage: unexpected error")
+            await asyncio.sleep(self._interval)
+
+    def _measure(self, target: _ScratchTarget) -> int:
+        if target.method is None:
+            self._detect_method(target)
+        match target.method:
+            case ScratchUsageMethod.MOUNT:
+                st = os.statvfs(target.path)
+                return st.f_frsize * (st.f_blocks - st.f_bfree)
+            case ScratchUsageMethod.PROJECT_QUOTA:
+                return get_project_quota_usage(target.device, target.project_id)
+            case _:
+                now = time.monotonic()
+                full = now - target.last_full_scan >= self._full_scan_interval
+                usage = IncrementalDirWalker(target.dirs).scan(target.path, full=full)
+                if full:
+                    target.last_full_scan = now
+                return usage
+
+    def _detect_method(self, target: _ScratchTarget) -> None:
+        if os.path.ismount(target.path):
+            target.method = ScratchUsageMethod.MOUNT
+            return
+        try:
+            project_id = get_project_id(target.path)
+            device = _find_block_device(target.path)
+            if (
+                project_id
+                and device is not None
+                and self._is_own_project_id(target, device, project_id)
+            ):
+                get_project_quota_usage(device, project_id)
+                target.method = ScratchUsageMethod.PROJECT_QUOTA
+                target.device = device
+                target.project_id = project_id
+                return
+        except (OSError, AttributeError):
+            # No project ID support, quotas disabled, or no quotactl() in this libc.
+            pass
+        target.method = ScratchUsageMethod.WALK
+
+    def _is_own_project_id(self, target: _ScratchTarget, device: str, project_id: int) -> bool:
+        if get_project_id(target.path.parent) == project_id:
+            return False
+        is_own = True
+        for other in list(self._targets.values()):
+            if other is target or other.method != ScratchUsageMethod.PROJECT_QUOTA:
+                continue
+            if other.device == device and other.project_id == project_id:
+                # Both were measured as the whole project; walk them from now on.
+                other.method = ScratchUsageMethod.WALK
+                is_own = False
+        return is_own
@@ -771,6 +771,21 @@ class AgentRPCServer(aobject):
         agent = self.runtime.get_agent(agent_id)
         return await agent.check_and_pull(image_configs)
 
+    @rpc_function
+    @collect_error
+    async def prefetch_images(
+        self,
+        image_configs: Mapping[str, ImageConfig],
+        agent_id: AgentId | None = None,
+    ) -> list[str]:
+        """
+        Pull the hinted images in the background ahead of kernel scheduling.
+        Returns the keys of the images accepted for prefetching.
+        """
+        log.debug("rpc::prefetch_images(images:{})", list(image_configs.keys()))
+        agent = self.runtime.get_agent(agent_id)
+        return await agent.prefetch_images(image_configs)
+
     @rpc_function
     @collect_error
     async def create_kernels(
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import enum
 import logging
+import math
 import sys
 import time
 import uuid
@@ -210,88 +211,144 @@ def _to_serializable_value(value: Decimal, *, exponent: Decimal = Decimal("0.000
         return str(quantized)
 
 
+_STAT_NAMES: Final[tuple[str, ...]] = ("min", "max", "sum", "avg", "diff", "rate")
+
+
+def _format_float(value: float) -> str:
+    """
+    The float counterpart of :func:`_to_serializable_value`.
+
+    Formatting to three decimal places rounds the exact binary value half-to-even,
+    just like quantizing ``Decimal(value)``, so both produce the same strings.
+    """
+    if not math.isfinite(value):
+        return str(Decimal(value))
+    text = f"{value:.3f}".rstrip("0")
+    return text.removesuffix(".")
+
+
 class MovingStatistics:
+    """
+    Running statistics of a metric.
+
+    The state is kept as floats, with the last two data points in fixed slots, so
+    that an update costs a handful of float operations.  Values are converted to
+    ``Decimal`` only when read through the properties, and the serialized form is
+    produced straight from the floats.
+    """
+
     __slots__ = (
         "_count",
-        "_last",
+        "_last_time",
+        "_last_value",
         "_max",
         "_min",
+        "_prev_time",
+        "_prev_value",
         "_sum",
     )
-    _sum: Decimal
+    _sum: float
     _count: int
-    _min: Decimal
-    _max: Decimal
-    _last: list[tuple[Decimal, float]]
+    _min: float
+    _max: float
+    _last_value: float
+    _last_time: float
+    _prev_value: float
+    _prev_time: float
 
     def __init__(self, initial_value: Decimal | None = None) -> None:
-        self._last = []
-        if initial_value is None:
-            self._sum = Decimal(0)
-            self._min = Decimal("inf")
-            self._max = Decimal("-inf")
-            self._count = 0
-        else:
-            self._sum = initial_value
-            self._min = initial_value
-            self._max = initial_value
-            self._count = 1
-            point = (initial_value, time.perf_counter())
-            self._last.append(point)
-
-    def update(self, value: Decimal) -> None:
-        self._sum += value
-        self._min = min(self._min, value)
-        self._max = max(self._max, value)
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._count = 0
+        self._last_value = self._prev_value = 0.0
+        self._last_time = self._prev_time = 0.0
+        if initial_value is not None:
+            self.update(initial_value)
+
+    def update(self, value: Decimal | float) -> None:
+        fvalue = float(value)
+        self._sum += fvalue
+        if fvalue < self._min:
+            self._min = fvalue
+        if fvalue > self._max:
+            self._max = fvalue
         self._count += 1
-        point = (value, time.perf_counter())
-        self._last.append(point)
         # keep only the latest two data points
-        if len(self._last) > 2:
-            self._last.pop(0)
+        self._prev_value = self._last_value
+        self._prev_time = self._last_time
+        self._last_value = fvalue
+        self._last_time = time.perf_counter()
 
     @property
     def min(self) -> Decimal:
-        return self._min
+        return Decimal(self._min)
 
     @property
     def max(self) -> Decimal:
-        return self._max
+        return Decimal(self._max)
 
     @property
     def sum(self) -> Decimal:
-        return self._sum
+        return Decimal(self._sum)
 
     @property
     def avg(self) -> Decimal:
-        return self._sum / self._count
+        return Decimal(self._float_avg())
 
     @property
     def diff(self) -> Decimal:
-        if len(self._last) == 2:
-            delta = self._last[-1][0] - self._last[-2][0]
-            if delta < 0:  # Counter reset (e.g., container restart)
-                return Decimal(0)
-            return delta
-        return Decimal(0)
+        return Decimal(self._float_diff())
 
     @property
     def rate(self) -> Decimal:
-        if len(self._last) == 2:
-            delta = self._last[-1][0] - self._last[-2][0]
-            if delta < 0:  # Counter reset (e.g., container restart)
-                return Decimal(0)
-            return delta / Decimal(self._last[-1][1] - self._last[-2][1])
-        return Decimal(0)
+        return Decimal(self._float_rate())
+
+    def _float_avg(self) -> float:
+        return self._sum / self._count
+
+    def _float_diff(self) -> float:
+        if self._count < 2:
+            return 0.0
+        delta = self._last_value - self._prev_value
+        if delta < 0:  # Counter reset (e.g., container restart)
+            return 0.0
+        return delta
+
+    def _float_rate(self) -> float:
+        if self._count < 2:
+            return 0.0
+        delta = self._last_value - self._prev_value
+        elapsed = self._last_time - self._prev_time
+        if delta < 0 or elapsed <= 0:  # Counter reset (e.g., container restart)
+            return 0.0
+        return delta / elapsed
+
+    def serialize_stat(self, name: str) -> str:
+        """Serialize a single statistic, named as in :meth:`to_serializable_dict`."""
+        match name:
+            case "min":
+                return _format_float(self._min)
+            case "max":
+                return _format_float(self._max)
+            case "sum":
+                return _format_float(self._sum)
+            case "avg":
+                return _format_float(self._float_avg())
+            case "diff":
+                return _format_float(self._float_diff())
+            case "rate":
+                return _format_float(self._float_rate())
+        raise KeyError(name)
 
     def to_serializable_dict(self) -> MovingStatValue:
         return {
-            "min": _to_serializable_value(self.min),
-            "max": _to_serializable_value(self.max),
-            "sum": _to_serializable_value(self.sum),
-            "avg": _to_serializable_value(self.avg),
-            "diff": _to_serializable_value(self.diff),
-            "rate": _to_serializable_value(self.rate),
+            "min": self.serialize_stat("min"),
+            "max": self.serialize_stat("max"),
+            "sum": self.serialize_stat("sum"),
+            "avg": self.serialize_stat("avg"),
+            "diff": self.serialize_stat("diff"),
+            "rate": self.serialize_stat("rate"),
             "version": 2,
         }
 
@@ -347,9 +404,10 @@ class Metric:
                 else "0.00"
             ),
             "unit_hint": self.unit_hint,
+            # Only the filtered statistics are computed and formatted.
             **{
-                f"stats.{k}": v  # type: ignore
-                for k, v in self.stats.to_serializable_dict().items()
+                f"stats.{k}": self.stats.serialize_stat(k)  # type: ignore
+                for k in _STAT_NAMES
                 if k in self.stats_filter
             },
         }
@@ -4,6 +4,7 @@ from .cleanup_reported_kernels import CleanupReportedKernelsTask
 from .collect_container_stat import CollectContainerStatTask
 from .collect_node_stat import CollectNodeStatTask
 from .collect_process_stat import CollectProcessStatTask
+from .evict_images import EvictImagesTask
 from .report_kernel_commit_status import ReportKernelCommitStatusTask
 from .scan_images import ScanImagesTask
 from .sync_container_lifecycles import SyncContainerLifecyclesTask
@@ -14,6 +15,7 @@ __all__ = [
     "CollectContainerStatTask",
     "CollectNodeStatTask",
     "CollectProcessStatTask",
+    "EvictImagesTask",
     "ReportKernelCommitStatusTask",
     "ScanImagesTask",
     "SyncContainerLifecyclesTask",
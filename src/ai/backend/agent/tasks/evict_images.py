@@ -0,0 +1,38 @@
+"""Periodic task that evicts least-recently-used images under disk pressure."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, override
+
+from ai.backend.common.cron import PeriodicTask
+
+if TYPE_CHECKING:
+    from ai.backend.agent.agent import AbstractAgent
+
+
+class EvictImagesTask(PeriodicTask):
+    """Periodically check the image store usage and evict idle images above the watermark."""
+
+    _agent: Final[AbstractAgent[Any, Any]]
+
+    def __init__(self, agent: AbstractAgent[Any, Any]) -> None:
+        self._agent = agent
+
+    @property
+    @override
+    def name(self) -> str:
+        return "evict_images"
+
+    @property
+    @override
+    def interval(self) -> float:
+        return self._agent.local_config.agent.image_cache.interval
+
+    @property
+    @override
+    def initial_delay(self) -> float:
+        return self._agent.local_config.agent.image_cache.interval
+
+    @override
+    async def run(self) -> None:
+        await self._agent.evict_images()
@@ -27,6 +27,8 @@ from .http import (
     URLNotFound,
 )
 from .service import (
+    AdmissionQueueFull,
+    AdmissionTimeout,
     ContainerConnectionRefused,
     CoordinatorConnectionError,
     DatabaseError,
@@ -69,6 +71,8 @@ __all__ = [
     "UnsupportedProtocol",
     "DatabaseError",
     "ContainerConnectionRefused",
+    "AdmissionQueueFull",
+    "AdmissionTimeout",
     "WorkerRegistrationError",
     "CoordinatorConnectionError",
 ]
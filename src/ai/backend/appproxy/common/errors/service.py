@@ -98,6 +98,36 @@ class ContainerConnectionRefused(BackendAIError, web.HTTPBadGateway):
         )
 
 
+class AdmissionQueueFull(BackendAIError, web.HTTPTooManyRequests):
+    """Raised when an inference circuit's admission queue has no room left."""
+
+    error_type = "https://api.backend.ai/probs/appproxy/admission-queue-full"
+    error_title = "Too many requests are waiting for the inference endpoint."
+
+    @override
+    def error_code(self) -> ErrorCode:
+        return ErrorCode(
+            domain=ErrorDomain.APPPROXY,
+            operation=ErrorOperation.ACCESS,
+            error_detail=ErrorDetail.UNAVAILABLE,
+        )
+
+
+class AdmissionTimeout(BackendAIError, web.HTTPServiceUnavailable):
+    """Raised when a request waits for admission longer than the queue deadline."""
+
+    error_type = "https://api.backend.ai/probs/appproxy/admission-timeout"
+    error_title = "Timed out waiting for the inference endpoint to accept the request."
+
+    @override
+    def error_code(self) -> ErrorCode:
+        return ErrorCode(
+            domain=ErrorDomain.APPPROXY,
+            operation=ErrorOperation.ACCESS,
+            error_detail=ErrorDetail.TIMEOUT,
+        )
+
+
 class WorkerRegistrationError(BackendAIError, web.HTTPForbidden):
     """Raised when worker registration fails."""
 
@@ -50,6 +50,13 @@ class AppMode(enum.StrEnum):
     INFERENCE = "inference"
 
 
+class RouteBalancingMode(enum.StrEnum):
+    WEIGHTED_RANDOM = "weighted-random"
+    POWER_OF_TWO_CHOICES = "power-of-two-choices"
+    PEAK_EWMA = "peak-ewma"
+    LEAST_OUTSTANDING = "least-outstanding"
+
+
 @dataclass
 class Slot:
     frontend_mode: FrontendMode
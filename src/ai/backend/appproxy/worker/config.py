@@ -30,6 +30,7 @@ from ai.backend.appproxy.common.types import (
     FrontendMode,
     FrontendServerMode,
     ProxyProtocol,
+    RouteBalancingMode,
 )
 from ai.backend.common import config
 from ai.backend.common.configs import (
@@ -772,6 +773,83 @@ class ProxyWorkerConfig(BaseSchema):
         ),
     ]
 
+    live_data_flush_interval: Annotated[
+        float,
+        Field(default=1.0, gt=0),
+        BackendAIConfigMeta(
+            description=(
+                "The interval in seconds for flushing aggregated last-access markers and request "
+                "counters to Redis. Markers and counters are kept in memory per session and "
+                "circuit and written as one pipelined batch per interval, so the last-access "
+                "time seen by the idle checker lags by at most this interval."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="1.0", prod="1.0"),
+        ),
+    ]
+
+    route_balancing_mode: Annotated[
+        RouteBalancingMode,
+        Field(default=RouteBalancingMode.WEIGHTED_RANDOM),
+        BackendAIConfigMeta(
+            description=(
+                "How HTTP and WebSocket requests are spread over the healthy routes of a circuit. "
+                "'weighted-random' picks by traffic_ratio only. 'power-of-two-choices' draws two "
+                "routes and takes the one with fewer in-flight requests, 'peak-ewma' compares "
+                "their recent latency times in-flight requests, and 'least-outstanding' picks "
+                "among the routes with the fewest in-flight requests. All modes weigh load by "
+                "traffic_ratio so that canary ratios still apply."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="weighted-random", prod="peak-ewma"),
+        ),
+    ]
+
+    inference_max_inflight_per_replica: Annotated[
+        int | None,
+        Field(default=None, ge=1),
+        BackendAIConfigMeta(
+            description=(
+                "The number of HTTP requests an inference circuit forwards at once per healthy "
+                "replica. The circuit admits up to this value times its healthy replica count in "
+                "total, and the route balancing mode spreads them over the replicas, so one "
+                "replica is not strictly capped. Requests beyond that wait in a per-circuit FIFO "
+                "queue until a slot frees up. Set this to the batch concurrency the model server "
+                "serves best. When unset, requests are forwarded without admission control."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="", prod="8"),
+        ),
+    ]
+
+    inference_admission_queue_size: Annotated[
+        int,
+        Field(default=1024, ge=0),
+        BackendAIConfigMeta(
+            description=(
+                "The maximum number of requests waiting for admission per inference circuit. "
+                "Requests arriving at a full queue are rejected with HTTP 429 and a Retry-After "
+                "header. Only used when inference_max_inflight_per_replica is set."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="1024", prod="1024"),
+        ),
+    ]
+
+    inference_admission_queue_timeout: Annotated[
+        float,
+        Field(default=30.0, gt=0),
+        BackendAIConfigMeta(
+            description=(
+                "The maximum number of seconds a request waits for admission to an inference "
+                "circuit. Requests still queued past this deadline are shed with HTTP 503 and a "
+                "Retry-After header. Only used when inference_max_inflight_per_replica is set."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="30.0", prod="30.0"),
+        ),
+    ]
+
     trusted_proxies: Annotated[
         list[IPvAnyNetwork],
         Field(default_factory=list),
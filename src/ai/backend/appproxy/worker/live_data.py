@@ -0,0 +1,90 @@
+"""In-worker aggregation of last-access markers and request counters."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager as actxmgr
+from typing import TYPE_CHECKING
+
+from ai.backend.appproxy.common.config import get_default_redis_key_ttl
+from ai.backend.logging import BraceStyleAdapter
+
+if TYPE_CHECKING:
+    from ai.backend.common.clients.valkey_client.valkey_live.client import ValkeyLiveClient
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+
+class LiveDataAggregator:
+    """Coalesces per-request live data writes into one Redis batch per interval.
+
+    Last-access markers keep only the latest timestamp per key and request
+    counters accumulate deltas, so the number of Redis commands per flush is
+    bounded by the number of distinct sessions and circuits touched, not by
+    the request or connection count. A marker recorded at time ``t`` reaches
+    Redis by ``t + flush_interval`` plus one round trip, which is the staleness
+    the idle checker has to tolerate.
+    """
+
+    _valkey_live: ValkeyLiveClient
+    _flush_interval: float
+    _last_used: dict[str, float]
+    _request_counts: Counter[str]
+
+    def __init__(self, valkey_live: ValkeyLiveClient, *, flush_interval: float) -> None:
+        self._valkey_live = valkey_live
+        self._flush_interval = flush_interval
+        self._last_used = {}
+        self._request_counts = Counter()
+
+    def mark_last_used(self, keys: Iterable[str], timestamp: float) -> None:
+        for key in keys:
+            if timestamp > self._last_used.get(key, 0.0):
+                self._last_used[key] = timestamp
+
+    def increase_request_count(self, key: str) -> None:
+        self._request_counts[key] += 1
+
+    async def flush(self) -> None:
+        if not self._last_used and not self._request_counts:
+            return
+        last_used, self._last_used = self._last_used, {}
+        request_counts, self._request_counts = self._request_counts, Counter()
+        try:
+            await self._valkey_live.store_and_incr_multiple_live_data(
+                {key: str(timestamp) for key, timestamp in last_used.items()},
+                request_counts,
+                # Request counters keep the default expiration of the live data client.
+                ex=get_default_redis_key_ttl(),
+            )
+        except Exception:
+            # Merge back so that the next flush retries them; newer timestamps win.
+            for key, timestamp in last_used.items():
+                self.mark_last_used((key,), timestamp)
+            self._request_counts.update(request_counts)
+            raise
+
+    @actxmgr
+    async def run(self) -> AsyncIterator[None]:
+        """Flush periodically while the context is open, and once more on exit."""
+        task = asyncio.create_task(self._flush_loop())
+        try:
+            yield
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Failed to flush live data on shutdown")
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Failed to flush live data")
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from ai.backend.appproxy.common.errors import AdmissionQueueFull, AdmissionTimeout
+
+if TYPE_CHECKING:
+    from ai.backend.appproxy.worker.types import ProxyMetricObserver
+
+
+@dataclass(slots=True)
+class AdmissionSpec:
+    """Runtime tunables for an :class:`AdmissionController`."""
+
+    max_inflight_per_replica: int
+    max_queue_size: int = 1024
+    queue_timeout: float = 30.0
+
+
+class AdmissionController:
+    """Per-circuit admission control in front of the route pool.
+
+    At most ``max_inflight_per_replica`` times the number of healthy
+    replicas are admitted at once. This is one capacity shared by the
+    whole circuit, not a limit enforced on each replica: which replica
+    serves an admitted request is left to the route pool's balancing
+    mode, so an unevenly loaded replica may have more requests in flight
+    than ``max_inflight_per_replica``. Each worker process also admits
+    independently. Further requests wait in a FIFO queue
+    of at most ``max_queue_size`` entries; a request arriving at a full
+    queue is rejected right away with HTTP 429, and one still queued
+    after ``queue_timeout`` seconds is shed with HTTP 503. Both carry a
+    ``Retry-After`` header.
+
+    A slot freed by a finishing request is handed directly to the oldest
+    waiter, so a newcomer cannot overtake the queue. The capacity is
+    re-read whenever a slot is released or :meth:`wake` is called, which
+    the owner does whenever the set of healthy replicas changes; with no
+    healthy replica at all, requests queue until one becomes available
+    or their deadline passes.
+    """
+
+    _spec: AdmissionSpec
+    _replica_count: Callable[[], int]
+    _metrics: ProxyMetricObserver
+    _deployment_id: str
+    _active: int
+    _waiters: deque[asyncio.Future[None]]
+
+    def __init__(
+        self,
+        spec: AdmissionSpec,
+        *,
+        replica_count: Callable[[], int],
+        metrics: ProxyMetricObserver,
+        deployment_id: str,
+    ) -> None:
+        self._spec = spec
+        self._replica_count = replica_count
+        self._metrics = metrics
+        self._deployment_id = deployment_id
+        self._active = 0
+        self._waiters = deque()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold an admission slot for the duration of the block."""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def wake(self) -> None:
+        """Hand free slots to queued requests after the capacity may have grown."""
+        capacity = self._spec.max_inflight_per_replica * self._replica_count()
+        while self._waiters and self._active < capacity:
+            waiter = self._waiters.popleft()
+            self._metrics.observe_admission_queue_depth(deployment_id=self._deployment_id, delta=-1)
+            if waiter.done():
+                continue
+            self._active += 1
+            waiter.set_result(None)
+
+    async def _acquire(self) -> None:
+        self.wake()
+        capacity = self._spec.max_inflight_per_replica * self._replica_count()
+        if not self._waiters and self._active < capacity:
+            self._active += 1
+            self._metrics.observe_admission_wait(deployment_id=self._deployment_id, duration=0.0)
+            return
+        if len(self._waiters) >= self._spec.max_queue_size:
+            self._metrics.observe_admission_rejected(
+                deployment_id=self._deployment_id, reason="queue_full"
+            )
+            raise AdmissionQueueFull(headers=self._retry_after_headers())
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._metrics.observe_admission_queue_depth(deployment_id=self._deployment_id, delta=1)
+        started_at = time.perf_counter()
+        try:
+            async with asyncio.timeout(self._spec.queue_timeout):
+                await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before the deadline or cancellation hit;
+                # pass it on to the next waiter instead of leaking it.
+                self._release()
+            else:
+                self._discard(waiter)
+            if isinstance(e, TimeoutError):
+                self._metrics.observe_admission_rejected(
+                    deployment_id=self._deployment_id, reason="timeout"
+                )
+                raise AdmissionTimeout(headers=self._retry_after_headers()) from e
+            raise
+        self._metrics.observe_admission_wait(
+            deployment_id=self._deployment_id, duration=time.perf_counter() - started_at
+        )
+
+    def _release(self) -> None:
+        self._active -= 1
+        self.wake()
+
+    def _discard(self, waiter: asyncio.Future[None]) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        self._metrics.observe_admission_queue_depth(deployment_id=self._deployment_id, delta=-1)
+
+    def _retry_after_headers(self) -> dict[str, str]:
+        return {"Retry-After": str(math.ceil(self._spec.queue_timeout))}
+
+
+__all__ = (
+    "AdmissionController",
+    "AdmissionSpec",
+)
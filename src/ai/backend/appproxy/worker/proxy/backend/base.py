@@ -43,16 +43,16 @@ class BaseBackend:
 
     @final
     async def mark_last_used_time(self, route: RouteInfo) -> None:
-        await self.root_context.last_used_time_marker_redis_queue.put((
-            [
+        self.root_context.live_data_aggregator.mark_last_used(
+            (
                 f"session.{route.session_id}.last_access",
                 f"circuit.{self.circuit.id}.last_access",
-            ],
+            ),
             time.time(),
-        ))
+        )
 
     @final
     async def increase_request_counter(self) -> None:
-        await self.root_context.request_counter_redis_queue.put(
+        self.root_context.live_data_aggregator.increase_request_count(
             f"circuit.{self.circuit.id}.requests"
         )
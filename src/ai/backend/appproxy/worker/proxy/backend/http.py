@@ -4,7 +4,7 @@ import asyncio
 import logging
 import time
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 from functools import partial
 from typing import Any, Final, override
 
@@ -14,7 +14,7 @@ from multidict import CIMultiDict
 from yarl import URL
 
 from ai.backend.appproxy.common.errors import ContainerConnectionRefused
-from ai.backend.appproxy.common.types import RouteInfo
+from ai.backend.appproxy.common.types import AppMode, RouteInfo
 from ai.backend.common.clients.http_client.client_pool import (
     ClientKey,
     ClientPool,
@@ -23,9 +23,10 @@ from ai.backend.common.clients.http_client.client_pool import (
 from ai.backend.common.cron import LocalCron
 from ai.backend.logging import BraceStyleAdapter
 
+from .admission import AdmissionController, AdmissionSpec
 from .base import BaseBackend, HttpRequest
 from .last_access_marker import LastAccessMarkerTask
-from .pool import RoutePool
+from .pool import RoutePool, RoutePoolSpec, RouteRequestTracker
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 
@@ -49,20 +50,48 @@ class HTTPBackend(BaseBackend):
     observed while proxying real requests feed back into the pool via
     ``record_failure`` so that hot-path failures count toward the
     failure threshold (the background TCP probe complements this).
+    Every proxied request is also tracked in the pool so that the
+    configured ``route_balancing_mode`` sees in-flight counts and
+    time-to-first-response latencies.
+
+    For inference circuits, ``inference_max_inflight_per_replica`` turns on
+    an :class:`AdmissionController` that caps the requests forwarded per
+    healthy replica and queues the rest.
     """
 
     _pool: RoutePool
+    _admission: AdmissionController | None
 
     def __init__(self, routes: list[RouteInfo], *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
-        self._pool = RoutePool(initial_routes=routes)
+        proxy_config = self.root_context.local_config.proxy_worker
+        self._admission = None
+        if (
+            self.circuit.app_mode == AppMode.INFERENCE
+            and proxy_config.inference_max_inflight_per_replica is not None
+        ):
+            self._admission = AdmissionController(
+                AdmissionSpec(
+                    max_inflight_per_replica=proxy_config.inference_max_inflight_per_replica,
+                    max_queue_size=proxy_config.inference_admission_queue_size,
+                    queue_timeout=proxy_config.inference_admission_queue_timeout,
+                ),
+                replica_count=lambda: self._pool.healthy_route_count,
+                metrics=self.root_context.metrics.proxy,
+                deployment_id=str(self.circuit.endpoint_id),
+            )
+        self._pool = RoutePool(
+            initial_routes=routes,
+            spec=RoutePoolSpec(balancing_mode=proxy_config.route_balancing_mode),
+            on_selection_change=self._admission.wake if self._admission is not None else None,
+        )
         client_timeout = aiohttp.ClientTimeout(
             total=None,
             connect=10.0,
             sock_connect=10.0,
             sock_read=None,
         )
-        cleanup_interval = self.root_context.local_config.proxy_worker.client_pool_cleanup_interval
+        cleanup_interval = proxy_config.client_pool_cleanup_interval
         self.client_pool = ClientPool(
             partial(
                 tcp_client_session_factory,
@@ -180,6 +209,12 @@ class HTTPBackend(BaseBackend):
             backend_rqst_hdrs,
             backend_rqst_body,
         )
+        async with self._admission.admit() if self._admission is not None else nullcontext():
+            return await self._forward_http(frontend_request, backend_request)
+
+    async def _forward_http(
+        self, frontend_request: web.Request, backend_request: HttpRequest
+    ) -> web.StreamResponse:
         route = await self._pool.select()
         await self.mark_last_used_time(route)
         await self.increase_request_counter()
@@ -191,41 +226,10 @@ class HTTPBackend(BaseBackend):
             route.kernel_port,
         )
         try:
-            async with self.request_http(route, backend_request) as backend_response:
-                # Use a multidict and add() so that repeated response headers
-                # (e.g. multiple Set-Cookie entries) are all preserved; a plain
-                # dict would keep only the last occurrence, breaking cookie-based
-                # auth flows such as RStudio Server's sign-in.
-                frontend_resp_hdrs: CIMultiDict[str] = CIMultiDict()
-                for key, value in backend_response.headers.items():
-                    if key not in HOP_ONLY_HEADERS:
-                        frontend_resp_hdrs.add(key, value)
-                frontend_resp_hdrs["Access-Control-Allow-Origin"] = "*"
-                frontend_response = web.StreamResponse(
-                    status=backend_response.status,
-                    reason=backend_response.reason,
-                    headers=frontend_resp_hdrs,
+            with self._pool.track(route) as tracker:
+                return await self._relay_http_response(
+                    frontend_request, route, backend_request, tracker
                 )
-                if "Content-Length" not in backend_response.headers:
-                    frontend_response.enable_chunked_encoding()
-                await frontend_response.prepare(frontend_request)
-                recv_len = 0
-                try:
-                    async for data in backend_response.content.iter_any():
-                        recv_len += len(data)
-                        await frontend_response.write(data)
-                except aiohttp.ClientPayloadError as e:
-                    log.exception(
-                        "{!r} (recv-len: {}, content-length: {}, headers: {!r})",
-                        e,
-                        recv_len,
-                        backend_response.content_length,
-                        frontend_resp_hdrs,
-                    )
-                finally:
-                    await frontend_response.write_eof()
-                self._pool.record_success(route)
-                return frontend_response
         except aiohttp.ServerDisconnectedError as e:
             self._pool.record_failure(route)
             log.debug(
@@ -247,6 +251,50 @@ class HTTPBackend(BaseBackend):
             log.exception("Unhandled exception while proxying HTTP request")
             raise
 
+    async def _relay_http_response(
+        self,
+        frontend_request: web.Request,
+        route: RouteInfo,
+        backend_request: HttpRequest,
+        tracker: RouteRequestTracker,
+    ) -> web.StreamResponse:
+        async with self.request_http(route, backend_request) as backend_response:
+            tracker.responded()
+            # Use a multidict and add() so that repeated response headers
+            # (e.g. multiple Set-Cookie entries) are all preserved; a plain
+            # dict would keep only the last occurrence, breaking cookie-based
+            # auth flows such as RStudio Server's sign-in.
+            frontend_resp_hdrs: CIMultiDict[str] = CIMultiDict()
+            for key, value in backend_response.headers.items():
+                if key not in HOP_ONLY_HEADERS:
+                    frontend_resp_hdrs.add(key, value)
+            frontend_resp_hdrs["Access-Control-Allow-Origin"] = "*"
+            frontend_response = web.StreamResponse(
+                status=backend_response.status,
+                reason=backend_response.reason,
+                headers=frontend_resp_hdrs,
+            )
+            if "Content-Length" not in backend_response.headers:
+                frontend_response.enable_chunked_encoding()
+            await frontend_response.prepare(frontend_request)
+            recv_len = 0
+            try:
+                async for data in backend_response.content.iter_any():
+                    recv_len += len(data)
+                    await frontend_response.write(data)
+            except aiohttp.ClientPayloadError as e:
+                log.exception(
+                    "{!r} (recv-len: {}, content-length: {}, headers: {!r})",
+                    e,
+                    recv_len,
+                    backend_response.content_length,
+                    frontend_resp_hdrs,
+                )
+            finally:
+                await frontend_response.write_eof()
+            self._pool.record_success(route)
+            return frontend_response
+
     async def proxy_ws(self, request: web.Request) -> web.WebSocketResponse:
         metrics = self.root_context.metrics
         stop_event = asyncio.Event()
@@ -320,24 +368,28 @@ class HTTPBackend(BaseBackend):
         await self.increase_request_counter()
 
         try:
-            async with self.connect_websocket(route, request, protocols=protocols) as upstream_ws:
-                try:
-                    async with asyncio.TaskGroup() as group:
-                        group.create_task(
-                            _proxy_task(upstream_ws, downstream_ws, tag="(up -> down)")
-                        )
-                        group.create_task(
-                            _proxy_task(downstream_ws, upstream_ws, tag="(down -> up)")
-                        )
-                        log.debug("created tasks, now waiting until one of two tasks end")
-                        await stop_event.wait()
-                finally:
-                    await marker_cron.stop()
-                    if not downstream_ws.closed:
-                        await downstream_ws.close()
-                    if not upstream_ws.closed:
-                        await upstream_ws.close()
-            log.trace("websocket connection closed")
+            with self._pool.track(route) as tracker:
+                async with self.connect_websocket(
+                    route, request, protocols=protocols
+                ) as upstream_ws:
+                    tracker.responded()
+                    try:
+                        async with asyncio.TaskGroup() as group:
+                            group.create_task(
+                                _proxy_task(upstream_ws, downstream_ws, tag="(up -> down)")
+                            )
+                            group.create_task(
+                                _proxy_task(downstream_ws, upstream_ws, tag="(down -> up)")
+                            )
+                            log.debug("created tasks, now waiting until one of two tasks end")
+                            await stop_event.wait()
+                    finally:
+                        await marker_cron.stop()
+                        if not downstream_ws.closed:
+                            await downstream_ws.close()
+                        if not upstream_ws.closed:
+                            await upstream_ws.close()
+                log.trace("websocket connection closed")
         except ClientConnectorError:
             self._pool.record_failure(route)
             log.trace("upstream connection closed")
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import contextlib
+import itertools
 import logging
+import math
 import random
 import time
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 
 from ai.backend.appproxy.common.errors import WorkerNotAvailable
-from ai.backend.appproxy.common.types import RouteInfo
+from ai.backend.appproxy.common.types import RouteBalancingMode, RouteInfo
 from ai.backend.logging import BraceStyleAdapter
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
@@ -29,6 +33,27 @@ class _PoolEntry:
     is_healthy: bool = True
     failure_count: int = 0
     unhealthy_since: float | None = None
+    in_flight: int = 0
+    latency_ewma: float | None = None
+    latency_observed_at: float = 0.0
+
+    def observe_latency(self, latency: float, now: float, decay_time: float) -> None:
+        # Peak EWMA: a slower sample replaces the average immediately, while faster
+        # samples pull it down gradually, weighted by the time since the last sample.
+        current = self.latency_ewma
+        if current is None or latency > current:
+            self.latency_ewma = latency
+        else:
+            w = math.exp(-(now - self.latency_observed_at) / decay_time)
+            self.latency_ewma = current * w + latency * (1.0 - w)
+        self.latency_observed_at = now
+
+    def latency_estimate(self, now: float, spec: RoutePoolSpec) -> float:
+        # Decay toward zero while no samples arrive so that a replica penalized
+        # for one slow response is eventually probed again.
+        if self.latency_ewma is None:
+            return spec.default_latency
+        return self.latency_ewma * math.exp(-(now - self.latency_observed_at) / spec.decay_time)
 
 
 @dataclass(slots=True)
@@ -39,15 +64,102 @@ class RoutePoolSpec:
     health_check_interval: float = 10.0
     connect_timeout: float = 1.0
     recovery_timeout: float = 60.0
+    balancing_mode: RouteBalancingMode = RouteBalancingMode.WEIGHTED_RANDOM
+    # Peak-EWMA tunables: the latency assumed for a replica without samples yet,
+    # and the time constant (seconds) of the moving average.
+    default_latency: float = 0.1
+    decay_time: float = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class _Selection:
+    """Immutable view of the selectable (healthy, positive-ratio) entries.
+
+    ``cum_weights[i]`` is the sum of ``traffic_ratio`` over ``entries[:i + 1]``,
+    so a weighted pick is a bisection instead of a scan.
+    """
+
+    entries: tuple[_PoolEntry, ...]
+    cum_weights: tuple[float, ...]
+
+    @classmethod
+    def build(cls, entries: Iterable[_PoolEntry]) -> _Selection:
+        selectable = tuple(
+            entry for entry in entries if entry.is_healthy and entry.route.traffic_ratio > 0
+        )
+        return cls(
+            entries=selectable,
+            cum_weights=tuple(
+                itertools.accumulate(entry.route.traffic_ratio for entry in selectable)
+            ),
+        )
+
+    def pick(self) -> int:
+        total = self.cum_weights[-1]
+        idx = bisect.bisect_right(self.cum_weights, random.random() * total)
+        return min(idx, len(self.entries) - 1)
+
+    def pick_other(self, first: int) -> int:
+        """Weighted pick among all entries except ``first``."""
+        cum = self.cum_weights
+        lo = cum[first - 1] if first > 0 else 0.0
+        weight = cum[first] - lo
+        r = random.random() * (cum[-1] - weight)
+        if r >= lo:
+            r += weight
+        idx = bisect.bisect_right(cum, r)
+        idx = min(idx, len(self.entries) - 1)
+        return idx if idx != first else (idx + 1) % len(self.entries)
+
+
+@dataclass(slots=True)
+class RouteRequestTracker:
+    """One request proxied to a route, as returned by :meth:`RoutePool.track`.
+
+    Call :meth:`responded` once the upstream starts answering so that the
+    time to first response feeds the route's latency estimate.
+    """
+
+    _entry: _PoolEntry | None
+    _decay_time: float
+    _started_at: float = field(default_factory=time.perf_counter)
+    _responded: bool = False
+
+    def responded(self) -> None:
+        if self._responded or self._entry is None:
+            return
+        self._responded = True
+        now = time.perf_counter()
+        self._entry.observe_latency(now - self._started_at, now, self._decay_time)
 
 
 class RoutePool:
     """Per-backend route pool with TCP-reachability health checks.
 
     Entries are keyed by ``(host, port)``. Selection picks a healthy
-    entry via ``traffic_ratio``-weighted random. TCP connect probes run
-    in the background and flip entries between healthy / unhealthy;
-    after ``recovery_timeout`` without recovery the entry is evicted.
+    entry according to ``spec.balancing_mode``:
+
+    - ``weighted-random``: ``traffic_ratio``-weighted random
+    - ``power-of-two-choices``: draw two entries by ``traffic_ratio`` and
+      take the one with fewer in-flight requests per unit of ratio
+    - ``peak-ewma``: like the above, comparing peak-EWMA latency times
+      ``in_flight + 1`` per unit of ratio
+    - ``least-outstanding``: ``traffic_ratio``-weighted random among the
+      entries with the fewest in-flight requests per unit of ratio
+
+    Load is always divided by ``traffic_ratio``, so canary weights keep
+    shaping traffic: idle pools fall back to weighted random, and busy
+    ones keep in-flight counts proportional to the ratios. In-flight
+    counts and latencies come from :meth:`track` on the proxy hot path.
+
+    TCP connect probes run in the background and flip entries between
+    healthy / unhealthy; after ``recovery_timeout`` without recovery the
+    entry is evicted.
+
+    :meth:`select` reads an immutable :class:`_Selection` snapshot without
+    taking the lock. The snapshot is rebuilt and swapped whole whenever the
+    route set or an entry's health changes, which is rare compared to
+    requests. ``on_selection_change`` is called after every such swap.
 
     Manager-issued route updates are applied via :meth:`update`:
 
@@ -61,27 +173,36 @@ class RoutePool:
     """
 
     _entries: dict[tuple[str, int], _PoolEntry]
+    _selection: _Selection
     _lock: asyncio.Lock
     _health_check_task: asyncio.Task[None] | None
     _spec: RoutePoolSpec
+    _on_selection_change: Callable[[], None] | None
 
     def __init__(
         self,
         initial_routes: list[RouteInfo] | None = None,
         *,
         spec: RoutePoolSpec | None = None,
+        on_selection_change: Callable[[], None] | None = None,
     ) -> None:
         self._entries = {}
         self._lock = asyncio.Lock()
         self._spec = spec or RoutePoolSpec()
+        self._on_selection_change = on_selection_change
         if initial_routes:
             for r in initial_routes:
                 self._entries[(r.current_kernel_host, r.kernel_port)] = _PoolEntry(route=r)
+        self._selection = _Selection.build(self._entries.values())
         self._health_check_task = asyncio.create_task(
             self._health_check_loop(),
             name="RoutePool._health_check_loop",
         )
 
+    @property
+    def healthy_route_count(self) -> int:
+        return len(self._selection.entries)
+
     async def close(self) -> None:
         task = self._health_check_task
         if task is not None:
@@ -109,20 +230,68 @@ class RoutePool:
                     self._entries[hp] = _PoolEntry(route=new_route)
                 else:
                     existing.route = new_route
+            self._rebuild_selection()
 
     async def select(self) -> RouteInfo:
-        async with self._lock:
-            candidates = [
-                entry.route
-                for entry in self._entries.values()
-                if entry.is_healthy and entry.route.traffic_ratio > 0
-            ]
-        if not candidates:
+        selection = self._selection
+        entries = selection.entries
+        if not entries:
             raise WorkerNotAvailable
-        if len(candidates) == 1:
-            return candidates[0]
-        ratios = [r.traffic_ratio for r in candidates]
-        return random.choices(candidates, weights=ratios, k=1)[0]
+        if len(entries) == 1:
+            return entries[0].route
+        match self._spec.balancing_mode:
+            case RouteBalancingMode.POWER_OF_TWO_CHOICES:
+                return self._select_two_choices(selection, _outstanding_cost).route
+            case RouteBalancingMode.PEAK_EWMA:
+                now = time.perf_counter()
+                return self._select_two_choices(
+                    selection,
+                    lambda entry: (
+                        entry.latency_estimate(now, self._spec)
+                        * (entry.in_flight + 1)
+                        / entry.route.traffic_ratio
+                    ),
+                ).route
+            case RouteBalancingMode.LEAST_OUTSTANDING:
+                return _select_least_outstanding(entries).route
+        return entries[selection.pick()].route
+
+    @contextlib.contextmanager
+    def track(self, route: RouteInfo) -> Iterator[RouteRequestTracker]:
+        """Count a request against ``route`` as in flight until the block exits."""
+        entry = self._entries.get((route.current_kernel_host, route.kernel_port))
+        if entry is not None and entry.route.route_id != route.route_id:
+            entry = None
+        tracker = RouteRequestTracker(entry, self._spec.decay_time)
+        if entry is None:
+            yield tracker
+            return
+        entry.in_flight += 1
+        try:
+            yield tracker
+        finally:
+            entry.in_flight -= 1
+
+    def _select_two_choices(
+        self,
+        selection: _Selection,
+        cost: Callable[[_PoolEntry], float],
+    ) -> _PoolEntry:
+        first = selection.pick()
+        a = selection.entries[first]
+        b = selection.entries[selection.pick_other(first)]
+        return b if cost(b) < cost(a) else a
+
+    def _rebuild_selection(self) -> None:
+        self._selection = _Selection.build(self._entries.values())
+        if self._on_selection_change is not None:
+            self._on_selection_change()
+
+    def _set_health(self, entry: _PoolEntry, healthy: bool) -> None:
+        if entry.is_healthy == healthy:
+            return
+        entry.is_healthy = healthy
+        self._rebuild_selection()
 
     def record_failure(self, route: RouteInfo) -> None:
         entry = self._entries.get((route.current_kernel_host, route.kernel_port))
@@ -130,7 +299,7 @@ class RoutePool:
             return
         entry.failure_count += 1
         if entry.failure_count >= self._spec.failure_threshold:
-            entry.is_healthy = False
+            self._set_health(entry, False)
             if entry.unhealthy_since is None:
                 entry.unhealthy_since = time.perf_counter()
             log.debug(
@@ -145,7 +314,7 @@ class RoutePool:
         if entry is None or entry.route.route_id != route.route_id:
             return
         entry.failure_count = 0
-        entry.is_healthy = True
+        self._set_health(entry, True)
         entry.unhealthy_since = None
 
     async def _health_check_loop(self) -> None:
@@ -173,11 +342,11 @@ class RoutePool:
         host, port = hp
         ok = await self._tcp_probe(host, port)
         if ok:
-            entry.is_healthy = True
+            self._set_health(entry, True)
             entry.failure_count = 0
             entry.unhealthy_since = None
             return
-        entry.is_healthy = False
+        self._set_health(entry, False)
         if entry.unhealthy_since is None:
             entry.unhealthy_since = time.perf_counter()
         if (
@@ -188,6 +357,7 @@ class RoutePool:
                 cached = self._entries.get(hp)
                 if cached is not None and cached.route.route_id == entry.route.route_id:
                     del self._entries[hp]
+                    self._rebuild_selection()
                     log.info(
                         "Evicted unreachable route {}:{} after {}s",
                         host,
@@ -209,7 +379,29 @@ class RoutePool:
         return True
 
 
+def _outstanding_cost(entry: _PoolEntry) -> float:
+    return entry.in_flight / entry.route.traffic_ratio
+
+
+def _select_least_outstanding(entries: tuple[_PoolEntry, ...]) -> _PoolEntry:
+    # Single pass, no candidate list: weighted reservoir sampling among the entries
+    # that tie for the lowest cost, restarted whenever a lower cost shows up.
+    chosen = entries[0]
+    least = math.inf
+    weight_sum = 0.0
+    for entry in entries:
+        cost = _outstanding_cost(entry)
+        if cost < least:
+            chosen, least, weight_sum = entry, cost, entry.route.traffic_ratio
+        elif cost == least:
+            weight_sum += entry.route.traffic_ratio
+            if random.random() * weight_sum < entry.route.traffic_ratio:
+                chosen = entry
+    return chosen
+
+
 __all__ = (
     "RoutePool",
     "RoutePoolSpec",
+    "RouteRequestTracker",
 )
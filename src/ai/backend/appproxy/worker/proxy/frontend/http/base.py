@@ -138,17 +138,20 @@ class BaseHTTPFrontend[TCircuitKeyType: (int, str)](BaseFrontend[HTTPBackend, TC
                 log.exception("Internal server error raised inside handlers")
             accept = request.headers.get(hdrs.ACCEPT, MEDIA_TYPE_HTML)
             if mime_match(accept, MEDIA_TYPE_JSON, strict=True):
-                return web.json_response(
+                resp = web.json_response(
                     ensure_json_serializable(ex.body_dict),
                     status=ex.status_code,
                     headers={"Access-Control-Allow-Origin": "*"},
                 )
-            return aiohttp_jinja2.render_template(
-                ERROR_TEMPLATE_NAME,
-                request,
-                ex.body_dict,
-                status=ex.status_code,
-            )
+            else:
+                resp = aiohttp_jinja2.render_template(
+                    ERROR_TEMPLATE_NAME,
+                    request,
+                    ex.body_dict,
+                    status=ex.status_code,
+                )
+            if retry_after := ex.headers.get(hdrs.RETRY_AFTER):
+                resp.headers[hdrs.RETRY_AFTER] = retry_after
         return resp
 
     @web.middleware
@@ -37,7 +37,6 @@ from aiohttp.web_app import CleanupError
 from setproctitle import setproctitle
 from tenacity import AsyncRetrying, TryAgain, retry_if_exception_type, wait_exponential
 
-from ai.backend.appproxy.common.config import get_default_redis_key_ttl
 from ai.backend.appproxy.common.defs import (
     AGENTID_WORKER,
     APPPROXY_ANYCAST_STREAM_KEY,
@@ -134,6 +133,7 @@ from .errors import (
     MissingProfilingConfigError,
     MissingTraefikConfigError,
 )
+from .live_data import LiveDataAggregator
 from .proxy.frontend import (
     H2PortFrontend,
     H2SubdomainFrontend,
@@ -240,30 +240,6 @@ async def exception_middleware(
         return resp
 
 
-async def request_counter_marker(root_ctx: RootContext) -> None:
-    """Request counter marker function using the valkey client."""
-    while True:
-        try:
-            redis_key = await root_ctx.request_counter_redis_queue.get()
-            await root_ctx.valkey_live.incr_live_data(redis_key)
-        except Exception:
-            # log errors and keep going on
-            log.exception("request_counter_marker(): error while handling request:")
-
-
-async def last_used_time_marker(root_ctx: RootContext) -> None:
-    """Last used time marker function using the valkey client."""
-    while True:
-        try:
-            keys, last_used = await root_ctx.last_used_time_marker_redis_queue.get()
-            data = {key: str(last_used) for key in keys}
-            ttl = get_default_redis_key_ttl()
-            await root_ctx.valkey_live.store_multiple_live_data(data, ex=ttl)
-        except Exception:
-            # log errors and keep going on
-            log.exception("last_used_time_marker(): error while handling request:")
-
-
 @asynccontextmanager
 async def redis_ctx(root_ctx: RootContext) -> AsyncIterator[None]:
     redis_profile_target = RedisProfileTarget.from_dict(root_ctx.local_config.redis.to_dict())
@@ -278,19 +254,14 @@ async def redis_ctx(root_ctx: RootContext) -> AsyncIterator[None]:
         db_id=REDIS_STATISTICS_DB,
         human_readable_name="appproxy-worker",
     )
-    root_ctx.last_used_time_marker_redis_queue = asyncio.Queue()
-    root_ctx.request_counter_redis_queue = asyncio.Queue()
-
-    last_used_time_marker_task = asyncio.create_task(last_used_time_marker(root_ctx))
-    request_counter_marker_task = asyncio.create_task(request_counter_marker(root_ctx))
+    root_ctx.live_data_aggregator = LiveDataAggregator(
+        root_ctx.valkey_live,
+        flush_interval=root_ctx.local_config.proxy_worker.live_data_flush_interval,
+    )
     try:
-        yield
+        async with root_ctx.live_data_aggregator.run():
+            yield
     finally:
-        last_used_time_marker_task.cancel()
-        await last_used_time_marker_task
-        request_counter_marker_task.cancel()
-        await request_counter_marker_task
-
         await root_ctx.valkey_live.close()
         await root_ctx.valkey_stat.close()
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import dataclasses
 import enum
 import time
@@ -53,6 +52,7 @@ from .errors import InvalidCircuitDataError, InvalidFrontendTypeError
 
 if TYPE_CHECKING:
     from .config import ServerConfig
+    from .live_data import LiveDataAggregator
     from .proxy.frontend.base import BaseFrontend
 
 
@@ -82,6 +82,10 @@ class ProxyMetricObserver:
     _connection_processed_traffics_tcp: prometheus_client.Counter
     _connection_total_traffics_tcp: prometheus_client.Histogram
 
+    _admission_queue_depth: prometheus_client.Gauge
+    _admission_wait_duration: prometheus_client.Histogram
+    _admission_rejected: prometheus_client.Counter
+
     def __init__(self) -> None:
         self._upstream_request_sent_http = SafeCounter(
             name="appproxy_upstream_request_sent_http",
@@ -187,6 +191,22 @@ class ProxyMetricObserver:
             name="appproxy_connection_total_traffics_tcp",
             documentation="Number of bytes transferred from each TCP connection bidirectionally, updated on-the-fly",
         )
+        self._admission_queue_depth = SafeGauge(
+            name="appproxy_inference_admission_queue_depth",
+            labelnames=["deployment_id"],
+            documentation="Requests waiting for admission to an inference circuit",
+            multiprocess_mode="livesum",
+        )
+        self._admission_wait_duration = SafeHistogram(
+            name="appproxy_inference_admission_wait_duration_sec",
+            labelnames=["deployment_id"],
+            documentation="Seconds each admitted request waited before being forwarded to a replica",
+        )
+        self._admission_rejected = SafeCounter(
+            name="appproxy_inference_admission_rejected",
+            labelnames=["deployment_id", "reason"],
+            documentation="Total number of requests rejected by inference admission control. `reason` is either `queue_full` or `timeout`.",
+        )
 
     @classmethod
     def instance(cls) -> Self:
@@ -236,6 +256,15 @@ class ProxyMetricObserver:
         self._pending_connections_tcp.dec()
         self._proxy_request_iteration_duration_tcp.observe(duration)
 
+    def observe_admission_queue_depth(self, *, deployment_id: str, delta: int) -> None:
+        self._admission_queue_depth.labels(deployment_id=deployment_id).inc(delta)
+
+    def observe_admission_wait(self, *, deployment_id: str, duration: float) -> None:
+        self._admission_wait_duration.labels(deployment_id=deployment_id).observe(duration)
+
+    def observe_admission_rejected(self, *, deployment_id: str, reason: str) -> None:
+        self._admission_rejected.labels(deployment_id=deployment_id, reason=reason).inc()
+
 
 class CircuitMetricObserver:
     _instance: Self | None = None
@@ -320,8 +349,7 @@ class RootContext:
     http_client_pool: ClientPool
     worker_id: UUID
     local_config: ServerConfig
-    last_used_time_marker_redis_queue: asyncio.Queue[tuple[list[str], float]]
-    request_counter_redis_queue: asyncio.Queue[str]
+    live_data_aggregator: LiveDataAggregator
     cors_options: dict[str, aiohttp_cors.ResourceOptions]
     metrics: WorkerMetricRegistry
     health_probe: HealthProbe
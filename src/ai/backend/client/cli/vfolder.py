@@ -17,7 +17,11 @@ from ai.backend.cli.params import (
 )
 from ai.backend.cli.types import ExitCode
 from ai.backend.client.compat import asyncio_run
-from ai.backend.client.config import DEFAULT_CHUNK_SIZE, APIConfig
+from ai.backend.client.config import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENT_TRANSFERS,
+    APIConfig,
+)
 from ai.backend.client.func.vfolder import _default_list_fields
 from ai.backend.client.session import AsyncSession, Session
 from ai.backend.common.bgtask.types import BgtaskStatus
@@ -344,6 +348,15 @@ def info(name: str) -> None:
         " include the protocol part and the port number to replace."
     ),
 )
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENT_TRANSFERS,
+    help=(
+        "The maximum number of files uploaded in parallel. Raise this when uploading"
+        " many small files, where per-file round trips dominate the transfer time."
+    ),
+)
 def upload(
     name: str,
     filenames: tuple[Path, ...],
@@ -352,6 +365,7 @@ def upload(
     recursive: bool,
     chunk_size: int,
     override_storage_proxy: dict[str, str] | None,
+    max_concurrency: int,
 ) -> None:
     """
     TUS Upload a file to the virtual folder from the current working directory.
@@ -370,6 +384,7 @@ def upload(
                 recursive=recursive,
                 chunk_size=chunk_size,
                 show_progress=True,
+                max_concurrency=max_concurrency,
                 address_map=override_storage_proxy
                 or APIConfig.DEFAULTS["storage_proxy_address_map"],
             )
@@ -418,6 +433,15 @@ def upload(
     default=20,
     help="Maximum retry attempt when any failure occurs.",
 )
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENT_TRANSFERS,
+    help=(
+        "The maximum number of connections used at once. Large files are split into parts"
+        " downloaded in parallel, and multiple files are downloaded in parallel."
+    ),
+)
 def download(
     name: str,
     filenames: tuple[Path, ...],
@@ -425,6 +449,7 @@ def download(
     chunk_size: int,
     override_storage_proxy: dict[str, str] | None,
     max_retries: int,
+    max_concurrency: int,
 ) -> None:
     """
     Download a file from the virtual folder to the current working directory.
@@ -444,6 +469,7 @@ def download(
                 address_map=override_storage_proxy
                 or APIConfig.DEFAULTS["storage_proxy_address_map"],
                 max_retries=max_retries,
+                max_concurrency=max_concurrency,
             )
             print_done("Done.")
         except Exception as e:
@@ -10,9 +10,13 @@ import appdirs
 from dotenv import find_dotenv, load_dotenv
 from yarl import URL
 
+from .load_balancing import LoadBalancer
+
 __all__ = [
     "API_VERSION",
     "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_DOWNLOAD_PART_SIZE",
+    "DEFAULT_MAX_CONCURRENT_TRANSFERS",
     "MAX_INFLIGHT_CHUNKS",
     "APIConfig",
     "get_config",
@@ -33,6 +37,8 @@ MIN_API_VERSION = (7, "20230615")
 
 DEFAULT_CHUNK_SIZE = 16 * (2**20)  # 16 MiB
 MAX_INFLIGHT_CHUNKS = 4
+DEFAULT_MAX_CONCURRENT_TRANSFERS = 8
+DEFAULT_DOWNLOAD_PART_SIZE = 64 * (2**20)  # 64 MiB
 
 local_state_path = Path(appdirs.user_state_dir("backend.ai", "Lablup"))
 local_cache_path = Path(appdirs.user_cache_dir("backend.ai", "Lablup"))
@@ -148,6 +154,12 @@ class APIConfig:
         The users of the API and CLI will get network connection errors only when
         all of the given endpoints fail -- intermittent failures of a subset of endpoints
         will be hidden with a little increased latency.
+    :param load_balancer: How to order multiple endpoints for the next request, given
+        as ``<name>[:<arg>,...]``: ``simple_rr`` rotates them upon every request,
+        ``periodic_rr[:<interval>]`` rotates them every interval seconds, and
+        ``lowest_latency[:<decay-time>[,<ejection-time>]]`` prefers the endpoint with
+        the lowest recent latency and temporarily skips the ones failing to connect.
+        If unspecified, the endpoints are only rotated upon connection failures.
     :param endpoint_type: Either ``"api"`` or ``"session"``.
         If the endpoint type is ``"api"`` (the default if unspecified), it uses the access key and
         secret key in the configuration to access the manager API server directly.
@@ -181,6 +193,7 @@ class APIConfig:
         "storage_proxy_address_map": {},
         "connection_timeout": "10.0",
         "read_timeout": "0",
+        "load_balancer": "",
     }
     """
     The default values for config parameters settable via environment variables
@@ -188,6 +201,7 @@ class APIConfig:
     """
 
     _endpoints: list[URL]
+    _load_balancer: LoadBalancer | None
     _group: str
     _hash_type: str
     _skip_sslcert_validation: bool
@@ -211,6 +225,7 @@ class APIConfig:
         connection_timeout: float | None = None,
         read_timeout: float | None = None,
         announcement_handler: Callable[[str], None] | None = None,
+        load_balancer: str | None = None,
     ) -> None:
         self._endpoints = (
             _clean_urls(endpoint)
@@ -218,6 +233,16 @@ class APIConfig:
             else get_env("ENDPOINT", self.DEFAULTS["endpoint"], clean=_clean_urls)
         )
         random.shuffle(self._endpoints)
+        load_balancer_spec = (
+            load_balancer
+            if load_balancer is not None
+            else get_env("LOAD_BALANCER", self.DEFAULTS["load_balancer"], clean=str)
+        )
+        self._load_balancer = (
+            LoadBalancer.load(LoadBalancer.clean_config(load_balancer_spec))
+            if load_balancer_spec
+            else None
+        )
         self._endpoint_type = (
             endpoint_type
             if endpoint_type is not None
@@ -304,7 +329,18 @@ class APIConfig:
             self._endpoints.append(item)
 
     def load_balance_endpoints(self) -> None:
-        pass
+        if self._load_balancer is not None:
+            self._load_balancer.rotate(self._endpoints)
+
+    def report_endpoint_latency(self, endpoint: URL, latency: float) -> None:
+        """Feed the configured load balancer with the response latency of a request."""
+        if self._load_balancer is not None:
+            self._load_balancer.observe_latency(endpoint, latency)
+
+    def report_endpoint_failure(self, endpoint: URL) -> None:
+        """Feed the configured load balancer with a connection failure of a request."""
+        if self._load_balancer is not None:
+            self._load_balancer.observe_failure(endpoint)
 
     @property
     def endpoint_type(self) -> str:
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import os
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from http import HTTPStatus
 from pathlib import Path
 from typing import Any, TypeVar, cast
 from uuid import UUID
@@ -22,7 +26,12 @@ from tqdm import tqdm
 from yarl import URL
 
 from ai.backend.client.compat import current_loop
-from ai.backend.client.config import DEFAULT_CHUNK_SIZE, MAX_INFLIGHT_CHUNKS
+from ai.backend.client.config import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_DOWNLOAD_PART_SIZE,
+    DEFAULT_MAX_CONCURRENT_TRANSFERS,
+    MAX_INFLIGHT_CHUNKS,
+)
 from ai.backend.client.exceptions import BackendClientError
 from ai.backend.client.output.fields import vfolder_fields
 from ai.backend.client.output.types import FieldSpec, PaginatedResult
@@ -45,6 +54,9 @@ _default_list_fields = (
     vfolder_fields["ownership_type"],
 )
 
+# The manager rejects mkdir requests with more paths than this.
+_MKDIR_BATCH_SIZE = 50
+
 T = TypeVar("T")
 type list_[T] = list[T]
 
@@ -53,6 +65,112 @@ class ResponseFailed(Exception):
     pass
 
 
+@dataclass(slots=True)
+class _DownloadManifest:
+    """Progress of a ranged download, kept next to the partial file so that it can resume.
+
+    A manifest only applies to the same remote file version (size and
+    ``Last-Modified``) split with the same part size.
+    """
+
+    size: int
+    last_modified: str | None
+    part_size: int
+    completed: set[int] = field(default_factory=set)
+
+    @staticmethod
+    def path_for(file_path: Path) -> Path:
+        return file_path.with_name(f"{file_path.name}.bai-download")
+
+    @classmethod
+    def load(cls, file_path: Path) -> _DownloadManifest | None:
+        try:
+            data = json.loads(cls.path_for(file_path).read_text())
+            return cls(
+                size=int(data["size"]),
+                last_modified=data["last_modified"],
+                part_size=int(data["part_size"]),
+                completed={int(idx) for idx in data["completed"]},
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, file_path: Path) -> None:
+        manifest_path = self.path_for(file_path)
+        tmp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps({
+                "size": self.size,
+                "last_modified": self.last_modified,
+                "part_size": self.part_size,
+                "completed": sorted(self.completed),
+            })
+        )
+        tmp_path.replace(manifest_path)
+
+    @property
+    def num_parts(self) -> int:
+        return max(1, -(-self.size // self.part_size))
+
+    def part_range(self, idx: int) -> tuple[int, int]:
+        start = idx * self.part_size
+        return start, min(start + self.part_size, self.size) - 1
+
+    def pending_parts(self) -> list[int]:
+        return [idx for idx in range(self.num_parts) if idx not in self.completed]
+
+    def completed_bytes(self) -> int:
+        return sum(end - start + 1 for start, end in map(self.part_range, self.completed))
+
+
+def _parse_content_range_total(value: str | None) -> int | None:
+    # e.g., "bytes 0-67108863/536870912"
+    if value is None or "/" not in value:
+        return None
+    total = value.rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _preallocate(file_path: Path, size: int) -> None:
+    with file_path.open("wb") as f:
+        f.truncate(size)
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                pass  # not supported by the filesystem; the sparse file still works
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+async def _write_range(
+    response: aiohttp.ClientResponse,
+    fd: int,
+    start: int,
+    end: int,
+    chunk_size: int,
+    pbar: tqdm[Any],
+) -> None:
+    loop = current_loop()
+    offset = start
+    try:
+        while chunk := await response.content.read(chunk_size):
+            await loop.run_in_executor(None, _pwrite_all, fd, chunk, offset)
+            offset += len(chunk)
+            pbar.update(len(chunk))
+        if offset != end + 1:
+            raise ResponseFailed
+    except BaseException:
+        pbar.update(start - offset)
+        raise
+
+
 class VFolderByName(BaseFunction):
     name: str
     id: UUID | None = None
@@ -437,6 +555,188 @@ class VFolderByName(BaseFunction):
                 f"Downloading {file_path.name} failed after {max_retries} retries"
             ) from e
 
+    async def _download_file_ranged(
+        self,
+        http_session: aiohttp.ClientSession,
+        file_path: Path,
+        download_url: URL,
+        *,
+        part_size: int,
+        chunk_size: int,
+        budget: asyncio.Semaphore,
+        max_retries: int,
+        show_progress: bool,
+    ) -> bool:
+        """
+        Download a file as byte ranges fetched concurrently and written in place
+        into a preallocated file, resuming from its manifest if there is one.
+
+        The first pending part doubles as the probe for the file size and version.
+        Returns False when the server does not answer it with a partial response,
+        so that the caller can fall back to a single-stream download.
+        """
+        manifest = _DownloadManifest.load(file_path) if file_path.exists() else None
+        if manifest is not None and manifest.part_size != part_size:
+            manifest = None
+        first_part = 0
+        if manifest is not None and (pending := manifest.pending_parts()):
+            first_part = pending[0]
+        probe_start = first_part * part_size
+        fd: int | None = None
+        pbar: tqdm[Any] | None = None
+        try:
+            async with (
+                budget,
+                http_session.get(
+                    download_url,
+                    headers={hdrs.RANGE: f"bytes={probe_start}-{probe_start + part_size - 1}"},
+                    ssl=False,
+                ) as probe,
+            ):
+                size = None
+                if probe.status == HTTPStatus.PARTIAL_CONTENT:
+                    size = _parse_content_range_total(probe.headers.get(hdrs.CONTENT_RANGE))
+                if size is None:
+                    return False
+                last_modified = probe.headers.get(hdrs.LAST_MODIFIED)
+                if (
+                    manifest is None
+                    or manifest.size != size
+                    or manifest.last_modified != last_modified
+                ):
+                    manifest = _DownloadManifest(
+                        size=size, last_modified=last_modified, part_size=part_size
+                    )
+                    await asyncio.to_thread(_preallocate, file_path, size)
+                    manifest.save(file_path)
+                if show_progress:
+                    print(f"Downloading to {file_path} ({manifest.num_parts} parts) ...")
+                fd = os.open(file_path, os.O_WRONLY)
+                pbar = tqdm(
+                    total=size,
+                    initial=manifest.completed_bytes(),
+                    unit="bytes",
+                    unit_scale=True,
+                    unit_divisor=1024,
+                    disable=not show_progress,
+                )
+                try:
+                    await _write_range(
+                        probe, fd, *manifest.part_range(first_part), chunk_size, pbar
+                    )
+                except (
+                    ResponseFailed,
+                    aiohttp.ClientPayloadError,
+                    aiohttp.ClientConnectionError,
+                    TimeoutError,
+                ):
+                    pass  # fetched again below like any other pending part
+                else:
+                    manifest.completed.add(first_part)
+                    manifest.save(file_path)
+            async with asyncio.TaskGroup() as tg:
+                for idx in manifest.pending_parts():
+                    tg.create_task(
+                        self._download_part(
+                            http_session,
+                            fd,
+                            file_path,
+                            download_url,
+                            manifest,
+                            idx,
+                            chunk_size=chunk_size,
+                            budget=budget,
+                            max_retries=max_retries,
+                            pbar=pbar,
+                        )
+                    )
+        finally:
+            if pbar is not None:
+                pbar.close()
+            if fd is not None:
+                os.close(fd)
+        _DownloadManifest.path_for(file_path).unlink(missing_ok=True)
+        return True
+
+    async def _download_part(
+        self,
+        http_session: aiohttp.ClientSession,
+        fd: int,
+        file_path: Path,
+        download_url: URL,
+        manifest: _DownloadManifest,
+        idx: int,
+        *,
+        chunk_size: int,
+        budget: asyncio.Semaphore,
+        max_retries: int,
+        pbar: tqdm[Any],
+    ) -> None:
+        start, end = manifest.part_range(idx)
+        part_hdrs = {hdrs.RANGE: f"bytes={start}-{end}"}
+        if manifest.last_modified is not None:
+            # The server answers 200 with the whole file instead if it has changed since.
+            part_hdrs[hdrs.IF_RANGE] = manifest.last_modified
+        try:
+            async for attempt in AsyncRetrying(
+                wait=wait_exponential(multiplier=0.02, min=0.02, max=5.0),
+                stop=stop_after_attempt(max_retries),
+                retry=retry_if_exception_type(TryAgain),
+            ):
+                with attempt:
+                    try:
+                        async with (
+                            budget,
+                            http_session.get(download_url, headers=part_hdrs, ssl=False) as resp,
+                        ):
+                            if resp.status == HTTPStatus.OK:
+                                raise BackendClientError(
+                                    f"{file_path.name} has changed during the download."
+                                )
+                            if resp.status != HTTPStatus.PARTIAL_CONTENT:
+                                raise ResponseFailed
+                            await _write_range(resp, fd, start, end, chunk_size, pbar)
+                    except (
+                        ResponseFailed,
+                        aiohttp.ClientPayloadError,
+                        aiohttp.ClientConnectionError,
+                        TimeoutError,
+                    ) as e:
+                        raise TryAgain from e
+        except RetryError as e:
+            raise RuntimeError(
+                f"Downloading part {idx} of {file_path.name} failed after {max_retries} retries"
+            ) from e
+        manifest.completed.add(idx)
+        manifest.save(file_path)
+
+    async def _request_download_url(
+        self,
+        relpath: str | Path,
+        dst_dir: str | Path | None,
+        address_map: Mapping[str, str] | None,
+    ) -> URL:
+        rqst = Request("POST", f"/folders/{self.request_key}/request-download")
+        rqst.set_json({
+            "path": str(relpath),
+        })
+        async with rqst.fetch() as resp:
+            download_info = await resp.json()
+            overriden_url = download_info["url"]
+            if address_map:
+                if download_info["url"] in address_map:
+                    overriden_url = address_map[download_info["url"]]
+                else:
+                    raise BackendClientError(
+                        "Overriding storage proxy addresses are given, "
+                        "but no url matches with any of them.\n",
+                    )
+
+            params = {"token": download_info["token"]}
+            if dst_dir is not None:
+                params["dst_dir"] = str(dst_dir)
+            return URL(overriden_url).with_query(params)
+
     @api_function
     async def download(
         self,
@@ -448,37 +748,53 @@ class VFolderByName(BaseFunction):
         show_progress: bool = False,
         address_map: Mapping[str, str] | None = None,
         max_retries: int = 20,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_TRANSFERS,
+        part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
     ) -> None:
+        """
+        Download files from the virtual folder.
+
+        Files are downloaded in parallel and each file is split into ``part_size``
+        byte ranges fetched concurrently, with at most ``max_concurrency``
+        connections open in total. An interrupted download leaves a
+        ``.bai-download`` manifest next to the partial file, and downloading the
+        same path again resumes it from the parts already fetched.
+        """
         base_path = Path.cwd() if basedir is None else Path(basedir).resolve()
         await self.update_id_by_name()
         for relpath in relative_paths:
             file_path = base_path / relpath
-            if file_path.exists():
+            if file_path.exists() and not _DownloadManifest.path_for(file_path).exists():
                 raise RuntimeError("The target file already exists", file_path.name)
-
-            rqst = Request("POST", f"/folders/{self.request_key}/request-download")
-            rqst.set_json({
-                "path": str(relpath),
-            })
-            async with rqst.fetch() as resp:
-                download_info = await resp.json()
-                overriden_url = download_info["url"]
-                if address_map:
-                    if download_info["url"] in address_map:
-                        overriden_url = address_map[download_info["url"]]
-                    else:
-                        raise BackendClientError(
-                            "Overriding storage proxy addresses are given, "
-                            "but no url matches with any of them.\n",
-                        )
-
-                params = {"token": download_info["token"]}
-                if dst_dir is not None:
-                    params["dst_dir"] = str(dst_dir)
-                download_url = URL(overriden_url).with_query(params)
-            await self._download_file(
-                file_path, download_url, chunk_size, max_retries, show_progress
-            )
+        budget = asyncio.Semaphore(max_concurrency)
+        pending = iter(relative_paths)
+
+        async def _worker(http_session: aiohttp.ClientSession) -> None:
+            for relpath in pending:
+                file_path = base_path / relpath
+                download_url = await self._request_download_url(relpath, dst_dir, address_map)
+                if await self._download_file_ranged(
+                    http_session,
+                    file_path,
+                    download_url,
+                    part_size=part_size,
+                    chunk_size=chunk_size,
+                    budget=budget,
+                    max_retries=max_retries,
+                    show_progress=show_progress,
+                ):
+                    continue
+                _DownloadManifest.path_for(file_path).unlink(missing_ok=True)
+                async with budget:
+                    await self._download_file(
+                        file_path, download_url, chunk_size, max_retries, show_progress
+                    )
+
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        async with aiohttp.ClientSession(connector=connector) as http_session:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(max(1, min(max_concurrency, len(relative_paths)))):
+                    tg.create_task(_worker(http_session))
 
     async def _upload_files(
         self,
@@ -487,6 +803,7 @@ class VFolderByName(BaseFunction):
         dst_dir: str | Path | None = None,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         address_map: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_TRANSFERS,
     ) -> None:
         base_path = Path.cwd() if basedir is None else Path(basedir).resolve()
         await self.update_id_by_name()
@@ -495,34 +812,58 @@ class VFolderByName(BaseFunction):
                 raise BackendClientError(
                     f"Failed to upload {file_path}. Use recursive option to upload directories."
                 )
-            file_size = Path(file_path).stat().st_size
-            rqst = Request("POST", f"/folders/{self.request_key}/request-upload")
-            rqst.set_json({
-                "path": f"{Path(file_path).relative_to(base_path)!s}",
-                "size": int(file_size),
-            })
-            async with rqst.fetch() as resp:
-                upload_info = await resp.json()
-                overriden_url = upload_info["url"]
-                if address_map:
-                    if upload_info["url"] in address_map:
-                        overriden_url = address_map[upload_info["url"]]
-                    else:
-                        raise BackendClientError(
-                            "Overriding storage proxy addresses are given, "
-                            "but no url matches with any of them.\n",
-                        )
-                params = {"token": upload_info["token"]}
-                if dst_dir is not None:
-                    params["dst_dir"] = str(dst_dir)
-                upload_url = URL(overriden_url).with_query(params)
-            tus_client = client.TusClient()
-            if basedir:
-                input_file = (base_path / file_path).open("rb")
-            else:
-                input_file = Path(file_path).relative_to(base_path).open("rb")
-            print(f"Uploading {base_path / file_path} via {upload_info['url']} ...")
-            # TODO: refactor out the progress bar
+        # A fixed number of workers share one iterator so that only max_concurrency
+        # upload sessions (and coroutines) exist at any time, however many files there are.
+        pending = iter(file_paths)
+
+        async def _worker() -> None:
+            for file_path in pending:
+                await self._upload_file(
+                    file_path, base_path, basedir, dst_dir, chunk_size, address_map
+                )
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(max(1, min(max_concurrency, len(file_paths)))):
+                tg.create_task(_worker())
+
+    async def _upload_file(
+        self,
+        file_path: Path,
+        base_path: Path,
+        basedir: str | Path | None,
+        dst_dir: str | Path | None,
+        chunk_size: int,
+        address_map: Mapping[str, str] | None,
+    ) -> None:
+        file_size = Path(file_path).stat().st_size
+        rqst = Request("POST", f"/folders/{self.request_key}/request-upload")
+        rqst.set_json({
+            "path": f"{Path(file_path).relative_to(base_path)!s}",
+            "size": int(file_size),
+        })
+        async with rqst.fetch() as resp:
+            upload_info = await resp.json()
+            overriden_url = upload_info["url"]
+            if address_map:
+                if upload_info["url"] in address_map:
+                    overriden_url = address_map[upload_info["url"]]
+                else:
+                    raise BackendClientError(
+                        "Overriding storage proxy addresses are given, "
+                        "but no url matches with any of them.\n",
+                    )
+            params = {"token": upload_info["token"]}
+            if dst_dir is not None:
+                params["dst_dir"] = str(dst_dir)
+            upload_url = URL(overriden_url).with_query(params)
+        tus_client = client.TusClient()
+        if basedir:
+            input_file = (base_path / file_path).open("rb")
+        else:
+            input_file = Path(file_path).relative_to(base_path).open("rb")
+        print(f"Uploading {base_path / file_path} via {upload_info['url']} ...")
+        # TODO: refactor out the progress bar
+        try:
             uploader = tus_client.async_uploader(
                 file_stream=input_file,
                 url=upload_url,
@@ -530,6 +871,7 @@ class VFolderByName(BaseFunction):
                 chunk_size=chunk_size,
             )
             await uploader.upload()
+        finally:
             input_file.close()
 
     async def _upload_recursively(
@@ -539,21 +881,34 @@ class VFolderByName(BaseFunction):
         dst_dir: str | Path | None = None,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         address_map: Mapping[str, str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_TRANSFERS,
     ) -> None:
-        dir_list: list[Path] = []
+        empty_dirs: list[Path] = []
         file_list: list[Path] = []
         base_path = Path.cwd() if basedir is None else Path(basedir).resolve()
         for path in source:
             if path.is_file():
                 file_list.append(path)
-            else:
-                await self._mkdir([path.relative_to(base_path)])
-                dir_list.append(path)
-        await self._upload_files(file_list, basedir, dst_dir, chunk_size, address_map)
-        for dir in dir_list:
-            await self._upload_recursively(
-                list(dir.glob("*")), basedir, dst_dir, chunk_size, address_map
+                continue
+            for dirpath, dirnames, filenames in path.walk(follow_symlinks=True):
+                file_list.extend(dirpath / filename for filename in filenames)
+                if not dirnames and not filenames:
+                    empty_dirs.append(dirpath)
+        # The storage proxy creates the parent directories of every uploaded file,
+        # so only empty directories need an explicit mkdir (parents included).
+        dst_base = Path(dst_dir) if dst_dir is not None else Path()
+        for idx in range(0, len(empty_dirs), _MKDIR_BATCH_SIZE):
+            await self._mkdir(
+                [
+                    dst_base / dirpath.relative_to(base_path)
+                    for dirpath in empty_dirs[idx : idx + _MKDIR_BATCH_SIZE]
+                ],
+                parents=True,
+                exist_ok=True,
             )
+        await self._upload_files(
+            file_list, basedir, dst_dir, chunk_size, address_map, max_concurrency
+        )
 
     @api_function
     async def upload(
@@ -566,15 +921,20 @@ class VFolderByName(BaseFunction):
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         address_map: Mapping[str, str] | None = None,
         show_progress: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_TRANSFERS,
     ) -> None:
         if basedir:
             src_paths = [basedir / Path(src) for src in sources]
         else:
             src_paths = [Path(src).resolve() for src in sources]
         if recursive:
-            await self._upload_recursively(src_paths, basedir, dst_dir, chunk_size, address_map)
+            await self._upload_recursively(
+                src_paths, basedir, dst_dir, chunk_size, address_map, max_concurrency
+            )
         else:
-            await self._upload_files(src_paths, basedir, dst_dir, chunk_size, address_map)
+            await self._upload_files(
+                src_paths, basedir, dst_dir, chunk_size, address_map, max_concurrency
+            )
 
     async def _mkdir(
         self,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+import time
 from abc import ABCMeta, abstractmethod
 from collections.abc import Mapping
 from typing import override
@@ -23,13 +25,19 @@ class LoadBalancer(metaclass=ABCMeta):
     @staticmethod
     def clean_config(config: str) -> LoadBalancerConfig:
         name, _, raw_args = config.partition(":")
-        args = raw_args.split(",")
+        args = raw_args.split(",") if raw_args else []
         return LoadBalancerConfig(name, tuple(args))
 
     @abstractmethod
     def rotate(self, endpoints: list[URL]) -> None:
         raise NotImplementedError
 
+    def observe_latency(self, endpoint: URL, latency: float) -> None:
+        """Called with the time taken to receive the response headers of a request."""
+
+    def observe_failure(self, endpoint: URL) -> None:
+        """Called when a request could not connect to the endpoint."""
+
 
 class SimpleRRLoadBalancer(LoadBalancer):
     """
@@ -47,23 +55,95 @@ class SimpleRRLoadBalancer(LoadBalancer):
 class PeriodicRRLoadBalancer(LoadBalancer):
     """
     Rotates the endpoints upon the specified interval.
+
+    Configured as ``periodic_rr[:<interval-in-seconds>]`` (default: 60 seconds).
     """
 
+    _interval: float
+    _last_rotated: float
+
+    def __init__(self, interval: str = "60") -> None:
+        self._interval = float(interval)
+        self._last_rotated = time.monotonic()
+
     @override
     def rotate(self, endpoints: list[URL]) -> None:
-        pass
+        now = time.monotonic()
+        if len(endpoints) == 1 or now - self._last_rotated < self._interval:
+            return
+        self._last_rotated = now
+        item = endpoints.pop(0)
+        endpoints.append(item)
+
+
+@attrs.define(auto_attribs=True)
+class _EndpointStats:
+    latency: float
+    observed_at: float
+    ejected_until: float = 0.0
 
 
 class LowestLatencyLoadBalancer(LoadBalancer):
     """
-    Change the endpoints with the lowest average latency for last N requests.
+    Change the endpoints with the lowest average latency for recent requests.
+
+    Configured as ``lowest_latency[:<decay-time>[,<ejection-time>]]`` in seconds
+    (default: 30 seconds each).  The average is an exponentially weighted moving
+    average whose older samples lose weight with the given decay time, so it
+    follows the recent requests rather than a fixed count of them.  While an
+    endpoint receives no requests, its average decays toward zero so that it is
+    eventually tried again.  Endpoints without any samples yet are preferred so
+    that they get measured.  An endpoint that fails to connect is moved behind
+    all the others until the ejection time passes.
     """
 
+    _decay_time: float
+    _ejection_time: float
+    _stats: dict[URL, _EndpointStats]
+
+    def __init__(self, decay_time: str = "30", ejection_time: str = "30") -> None:
+        self._decay_time = float(decay_time)
+        self._ejection_time = float(ejection_time)
+        self._stats = {}
+
+    @override
+    def observe_latency(self, endpoint: URL, latency: float) -> None:
+        now = time.monotonic()
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            self._stats[endpoint] = _EndpointStats(latency=latency, observed_at=now)
+            return
+        w = math.exp(-(now - stats.observed_at) / self._decay_time)
+        stats.latency = stats.latency * w + latency * (1.0 - w)
+        stats.observed_at = now
+        stats.ejected_until = 0.0
+
+    @override
+    def observe_failure(self, endpoint: URL) -> None:
+        now = time.monotonic()
+        stats = self._stats.setdefault(endpoint, _EndpointStats(latency=0.0, observed_at=now))
+        stats.ejected_until = now + self._ejection_time
+
+    def latency_estimate(self, endpoint: URL, now: float) -> float:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            return 0.0
+        return stats.latency * math.exp(-(now - stats.observed_at) / self._decay_time)
+
     @override
     def rotate(self, endpoints: list[URL]) -> None:
-        pass
+        if len(endpoints) == 1:
+            return
+        now = time.monotonic()
+
+        def _sort_key(endpoint: URL) -> tuple[float, float]:
+            stats = self._stats.get(endpoint)
+            if stats is not None and stats.ejected_until > now:
+                return (stats.ejected_until, 0.0)
+            return (0.0, self.latency_estimate(endpoint, now))
 
-    # TODO: we need to collect and allow access to the latency statistics.
+        # The sort is stable, so ties keep the current (failover) order.
+        endpoints.sort(key=_sort_key)
 
 
 _cls_map: Mapping[str, type[LoadBalancer]] = {
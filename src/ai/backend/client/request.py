@@ -6,6 +6,7 @@ import io
 import json as modjson
 import logging
 import sys
+import time
 import uuid
 from collections import namedtuple
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping, Sequence
@@ -594,16 +595,24 @@ class FetchContextManager:
         self._session_mode = session_mode
 
     async def __aenter__(self) -> Response:
-        max_retries = len(self.session.config.endpoints)
+        config = self.session.config
+        max_retries = len(config.endpoints)
         retry_count = 0
         raw_resp: aiohttp.ClientResponse | None = None
         while True:
+            # The request context builder targets the endpoint current at this moment.
+            endpoint = config.endpoint
             try:
                 retry_count += 1
                 self._rqst_ctx = self.rqst_ctx_builder()
                 if self._rqst_ctx is None:
                     raise RuntimeError("Failed to build request context")
+                started_at = time.monotonic()
                 raw_resp = await self._rqst_ctx.__aenter__()
+                config.report_endpoint_latency(endpoint, time.monotonic() - started_at)
+                # Balance only after an attempt has reached the server, as a failed one
+                # has already moved on to the next endpoint.
+                config.load_balance_endpoints()
                 if self.check_status and raw_resp.status // 100 not in [2, 3]:
                     match self._session_mode:
                         case SessionMode.CLIENT:
@@ -615,6 +624,7 @@ class FetchContextManager:
                             pass
                 return self.response_cls(self.session, raw_resp, async_mode=self._async_mode)
             except aiohttp.ClientConnectionError as e:
+                config.report_endpoint_failure(endpoint)
                 if retry_count == max_retries:
                     msg = (
                         "Request to the API endpoint has failed.\n"
@@ -622,15 +632,13 @@ class FetchContextManager:
                         f"\u279c {e!r}"
                     )
                     raise BackendClientError(msg) from e
-                self.session.config.rotate_endpoints()
+                config.rotate_endpoints()
                 continue
             except aiohttp.ClientResponseError as e:
                 msg = f"API endpoint response error.\n\u279c {e!r}"
                 if raw_resp is not None:
                     await raw_resp.__aexit__(*sys.exc_info())
                 raise BackendClientError(msg) from e
-            finally:
-                self.session.config.load_balance_endpoints()
 
     async def __aexit__(self, *exc_info: Any) -> bool | None:
         if self._rqst_ctx is None:
@@ -774,9 +782,8 @@ class WebSocketContextManager:
                 msg = f"API endpoint response error.\n\u279c {e!r}"
                 raise BackendClientError(msg) from e
             else:
-                break
-            finally:
                 self.session.config.load_balance_endpoints()
+                break
 
         wrapped_ws = self.response_cls(self.session, cast(aiohttp.ClientResponse, raw_ws))
         if self.on_enter is not None:
@@ -922,6 +929,7 @@ class SSEContextManager:
             try:
                 retry_count += 1
                 raw_resp = await self.reconnect()
+                self.session.config.load_balance_endpoints()
                 return self.response_cls(self.session, raw_resp, connector=self.reconnect)
             except aiohttp.ClientConnectionError as e:
                 if retry_count == max_retries:
@@ -936,8 +944,6 @@ class SSEContextManager:
             except aiohttp.ClientResponseError as e:
                 msg = f"API endpoint response error.\n\u279c {e!r}"
                 raise BackendClientError(msg) from e
-            finally:
-                self.session.config.load_balance_endpoints()
 
     async def __aexit__(self, *args: Any) -> bool | None:
         if self._rqst_ctx is None:
@@ -36,6 +36,7 @@ from ai.backend.common.clients.valkey_client.valkey_bgtask.client import (
     TaskSetKey,
     ValkeyBgtaskClient,
 )
+from ai.backend.common.contexts.bgtask import with_bgtask_id
 from ai.backend.common.cron import LocalCron
 from ai.backend.common.events.dispatcher import (
     EventProducer,
@@ -501,60 +502,62 @@ class BackgroundTaskManager:
         subkey: BgTaskKey,
         manifest: BaseBackgroundTaskManifest,
     ) -> None:
-        async with self._hook.apply(
-            TaskContext(
-                task_name=task_name,
-                task_id=task_id,
-            )
-        ) as context:
-            task_status: TaskStatus = TaskStatus.SUCCESS
-            last_message = "Task completed successfully"
-            try:
-                task_result = await self._try_to_execute_new_task(task_name, manifest)
-                context.result = task_result
-                task_status = task_result.status().to_task_status()
-                last_message = task_result.result_message()
-            except Exception as e:
-                task_status = TaskStatus.FAILURE
-                last_message = f"Task failed with exception: {e}"
-                raise e
-            finally:
-                with suppress(Exception):
-                    await self._valkey_client.finish_subtask(
-                        task_id=task_id,
-                        subkey=subkey,
-                        status=task_status,
-                        last_message=last_message,
-                    )
+        with with_bgtask_id(task_id):
+            async with self._hook.apply(
+                TaskContext(
+                    task_name=task_name,
+                    task_id=task_id,
+                )
+            ) as context:
+                task_status: TaskStatus = TaskStatus.SUCCESS
+                last_message = "Task completed successfully"
+                try:
+                    task_result = await self._try_to_execute_new_task(task_name, manifest)
+                    context.result = task_result
+                    task_status = task_result.status().to_task_status()
+                    last_message = task_result.result_message()
+                except Exception as e:
+                    task_status = TaskStatus.FAILURE
+                    last_message = f"Task failed with exception: {e}"
+                    raise e
+                finally:
+                    with suppress(Exception):
+                        await self._valkey_client.finish_subtask(
+                            task_id=task_id,
+                            subkey=subkey,
+                            status=task_status,
+                            last_message=last_message,
+                        )
 
     async def _revive_task(
         self, task_name: BgtaskNameBase, task_info: TaskInfo, task_key: BgTaskKey
     ) -> None:
-        async with self._hook.apply(
-            TaskContext(
-                task_name=task_name,
-                task_id=task_info.task_id,
-            )
-        ) as context:
-            task_status: TaskStatus = TaskStatus.SUCCESS
-            last_message = "Task completed successfully"
-            try:
-                task_result = await self._try_to_revive_task(task_name, task_info)
-                context.result = task_result
-                task_status = task_result.status().to_task_status()
-                last_message = task_result.result_message()
-            except Exception as e:
-                task_status = TaskStatus.FAILURE
-                last_message = f"Task failed with exception: {e}"
-                raise e
-            finally:
-                with suppress(Exception):
-                    await self._valkey_client.finish_subtask(
-                        task_id=task_info.task_id,
-                        subkey=task_key,
-                        status=task_status,
-                        last_message=last_message,
-                    )
+        with with_bgtask_id(task_info.task_id):
+            async with self._hook.apply(
+                TaskContext(
+                    task_name=task_name,
+                    task_id=task_info.task_id,
+                )
+            ) as context:
+                task_status: TaskStatus = TaskStatus.SUCCESS
+                last_message = "Task completed successfully"
+                try:
+                    task_result = await self._try_to_revive_task(task_name, task_info)
+                    context.result = task_result
+                    task_status = task_result.status().to_task_status()
+                    last_message = task_result.result_message()
+                except Exception as e:
+                    task_status = TaskStatus.FAILURE
+                    last_message = f"Task failed with exception: {e}"
+                    raise e
+                finally:
+                    with suppress(Exception):
+                        await self._valkey_client.finish_subtask(
+                            task_id=task_info.task_id,
+                            subkey=task_key,
+                            status=task_status,
+                            last_message=last_message,
+                        )
 
     async def do_heartbeat(self) -> None:
         """Publish a heartbeat for ongoing background tasks. One iteration."""
@@ -192,6 +192,14 @@ class AgentClient(BackendAIClient):
             await self._peer.call.check_and_pull(image_configs, agent_id=self.agent_id),
         )
 
+    @agent_client_resilience.apply()
+    async def prefetch_images(self, image_configs: Mapping[str, ImageConfig]) -> list[str]:
+        """Hint the agent to pull images in the background before kernels are scheduled."""
+        return cast(
+            list[str],
+            await self._peer.call.prefetch_images(image_configs, agent_id=self.agent_id),
+        )
+
     @agent_client_resilience.apply()
     async def purge_images(
         self,
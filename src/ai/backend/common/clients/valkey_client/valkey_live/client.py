@@ -238,6 +238,35 @@ class ValkeyLiveClient:
         """Remove the session's last network access marker."""
         await self.delete_live_data(self._session_last_access_key(session_id))
 
+    @valkey_live_resilience.apply()
+    async def store_and_incr_multiple_live_data(
+        self,
+        values: Mapping[str, str | bytes],
+        increments: Mapping[str, int],
+        *,
+        ex: int | None = None,
+        incr_ex: int | None = None,
+    ) -> None:
+        """
+        Set and increment many live data keys in a single pipelined batch.
+
+        :param values: Keys to overwrite with the given values.
+        :param increments: Keys to increment by the given amounts.
+        :param ex: Expiration in seconds applied to the overwritten keys.
+        :param incr_ex: Expiration in seconds applied to the incremented keys.
+        """
+        if not values and not increments:
+            return
+        expiry = ExpirySet(ExpiryType.SEC, _DEFAULT_EXPIRATION if ex is None else ex)
+        incr_expiration_sec = _DEFAULT_EXPIRATION if incr_ex is None else incr_ex
+        batch = self._create_batch()
+        for key, value in values.items():
+            batch.set(key, value, expiry=expiry)
+        for key, amount in increments.items():
+            batch.incrby(key, amount)
+            batch.expire(key, incr_expiration_sec)
+        await self._execute_batch(batch)
+
     @valkey_live_resilience.apply()
     async def incr_live_data(
         self,
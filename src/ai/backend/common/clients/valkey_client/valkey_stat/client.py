@@ -861,6 +861,30 @@ class ValkeyStatClient:
         async with self._client.client() as conn:
             await conn.exec(batch, raise_on_error=True)
 
+    @valkey_stat_resilience.apply()
+    async def increment_keypair_query_counts(
+        self,
+        counts: Mapping[str, int],
+    ) -> None:
+        """
+        Add buffered query counts for several keypairs in a single round trip.
+
+        :param counts: Mapping of access keys to the number of queries to add.
+        """
+        if not counts:
+            return
+        now = await self._time()
+        batch = self._create_batch()
+        for access_key, count in counts.items():
+            num_queries_key = self._get_keypair_query_count_key(access_key)
+            batch.incrby(num_queries_key, count)
+            batch.expire(num_queries_key, 86400 * 30)  # retention: 1 month
+            last_call_time_key = self._get_keypair_last_call_time_key(access_key)
+            batch.set(last_call_time_key, str(now).encode())
+            batch.expire(last_call_time_key, 86400 * 30)  # retention: 1 month
+        async with self._client.client() as conn:
+            await conn.exec(batch, raise_on_error=True)
+
     @valkey_stat_resilience.apply()
     async def _get_multiple_keys(self, keys: list[str]) -> list[bytes | None]:
         """
@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Self, cast
 
@@ -210,6 +210,26 @@ class ValkeyStreamClient:
         async with self._client.client() as conn:
             await conn.xack(stream_key, group_name, [message_id])
 
+    @valkey_stream_resilience.apply()
+    async def done_stream_messages(
+        self,
+        stream_key: str,
+        group_name: str,
+        message_ids: Sequence[bytes],
+    ) -> None:
+        """
+        Acknowledge multiple messages in the consumer group with a single XACK.
+
+        :param stream_key: The key of the Valkey stream.
+        :param group_name: The name of the consumer group.
+        :param message_ids: The IDs of the messages to acknowledge.
+        :raises: GlideClientError if the messages cannot be acknowledged.
+        """
+        if not message_ids:
+            return
+        async with self._client.client() as conn:
+            await conn.xack(stream_key, group_name, list(message_ids))
+
     @valkey_stream_resilience.apply()
     async def enqueue_stream_message(
         self,
@@ -0,0 +1,32 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from ai.backend.common.bgtask.types import TaskID
+
+_bgtask_id_var: ContextVar[TaskID] = ContextVar("bgtask_id")
+
+
+def current_bgtask_id() -> TaskID | None:
+    """
+    Get the ID of the background task being executed from the context.
+    Returns None if not running in a background task.
+    """
+    try:
+        return _bgtask_id_var.get()
+    except LookupError:
+        return None
+
+
+@contextmanager
+def with_bgtask_id(task_id: TaskID) -> Iterator[None]:
+    """
+    Context manager to set up the ID of the background task being executed,
+    so that the task handlers can report their progress with it.
+    """
+    token = _bgtask_id_var.set(task_id)
+    try:
+        yield
+    finally:
+        # Reset the context variable to its previous state
+        _bgtask_id_var.reset(token)
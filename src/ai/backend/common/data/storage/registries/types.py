@@ -81,6 +81,19 @@ class FileObjectData(BackendAISchema):
         """,
         examples=["https://huggingface.co/microsoft/DialoGPT-medium/resolve/main/config.json"],
     )
+    digest: str | None = Field(
+        default=None,
+        description="""
+        Content digest of the file reported by the registry, if available.
+        The SHA-256 of Git LFS objects is given as 'sha256:<hex>' and the Git blob id
+        of other files as 'git-sha1:<hex>'. Used to deduplicate identical files.
+        """,
+        examples=[
+            "sha256:3f5c5bfd5ef7a4b5bdfa3a3b9d1dd5e4a1a42c2b0c4f2f8d0e7e3d0b1b0a9c8d",
+            "git-sha1:8f3e7c1b2a4d5e6f708192a3b4c5d6e7f8091a2b",
+            None,
+        ],
+    )
 
 
 class ModelData(BackendAISchema):
@@ -6,10 +6,12 @@ import logging
 import secrets
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from collections.abc import Callable, Coroutine, Sequence
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Callable, Coroutine, Hashable, Sequence
+from contextlib import asynccontextmanager as actxmgr
 from typing import (
     Any,
+    NotRequired,
     Protocol,
     TypedDict,
     TypeVar,
@@ -43,10 +45,12 @@ from .reporter import AbstractEventReporter, CompleteEventReportArgs, PrepareEve
 from .types import AbstractAnycastEvent, AbstractBroadcastEvent, AbstractEvent
 
 __all__ = (
+    "ConcurrencyOptions",
     "EventCallback",
     "EventDispatcher",
     "EventHandler",
     "EventProducer",
+    "HandlerConcurrencyLimiter",
 )
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
@@ -85,6 +89,7 @@ class EventHandler[TContext, TEvent: "AbstractEvent"]:
     coalescing_state: CoalescingState
     event_start_reporters: tuple[AbstractEventReporter, ...] = attrs.field(factory=tuple)
     event_complete_reporters: tuple[AbstractEventReporter, ...] = attrs.field(factory=tuple)
+    concurrency_opts: ConcurrencyOptions | None = None
 
 
 class CoalescingOptions(TypedDict):
@@ -151,6 +156,54 @@ class CoalescingState:
             return True
 
 
+class ConcurrencyOptions(TypedDict):
+    limiter: HandlerConcurrencyLimiter
+    ordering_key: NotRequired[Callable[[Any], Hashable]]
+
+
+class HandlerConcurrencyLimiter:
+    """
+    Bounds how many handler runs sharing this limiter execute at once.
+
+    Runs whose events map to the same ordering key are serialized in dispatch order,
+    while runs for different keys proceed in parallel up to ``max_concurrency``.
+    Handlers sharing one limiter share both the budget and the ordering, so e.g. every
+    kernel lifecycle event of a session can be handled in the order it was sent.
+    """
+
+    _semaphore: asyncio.Semaphore
+    _key_locks: dict[Hashable, asyncio.Lock]
+    _key_refs: Counter[Hashable]
+
+    def __init__(self, max_concurrency: int) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._key_locks = {}
+        self._key_refs = Counter()
+
+    @actxmgr
+    async def slot(self, key: Hashable | None = None) -> AsyncIterator[None]:
+        # The key lock is taken before the first suspension point, so runs for the
+        # same key queue up in the order their tasks were started.
+        if key is None:
+            async with self._semaphore:
+                yield
+            return
+        lock = self._key_locks.get(key)
+        if lock is None:
+            lock = self._key_locks[key] = asyncio.Lock()
+        self._key_refs[key] += 1
+        try:
+            async with lock, self._semaphore:
+                yield
+        finally:
+            self._key_refs[key] -= 1
+            if self._key_refs[key] <= 0:
+                del self._key_refs[key]
+                del self._key_locks[key]
+
+
 class EventObserver(Protocol):
     def observe_event_success(self, *, event_type: str, duration: float) -> None: ...
 
@@ -158,6 +211,10 @@ class EventObserver(Protocol):
         self, *, event_type: str, duration: float, exception: BaseException
     ) -> None: ...
 
+    def observe_pending_handlers(self, *, event_type: str, delta: int) -> None: ...
+
+    def observe_handler_lag(self, *, event_type: str, lag: float) -> None: ...
+
 
 class NopEventObserver:
     def observe_event_success(self, *, event_type: str, duration: float) -> None:
@@ -168,6 +225,12 @@ class NopEventObserver:
     ) -> None:
         pass
 
+    def observe_pending_handlers(self, *, event_type: str, delta: int) -> None:
+        pass
+
+    def observe_handler_lag(self, *, event_type: str, lag: float) -> None:
+        pass
+
 
 class _ConsumerPostCallback:
     def __init__(
@@ -215,6 +278,7 @@ class EventDispatcherGroup(ABC):
         coalescing_opts: CoalescingOptions | None = None,
         *,
         name: str | None = None,
+        concurrency_opts: ConcurrencyOptions | None = None,
     ) -> EventHandler[TContext, TConsumedEvent]:
         raise NotImplementedError
 
@@ -228,6 +292,7 @@ class EventDispatcherGroup(ABC):
         *,
         name: str | None = None,
         override_event_name: str | None = None,
+        concurrency_opts: ConcurrencyOptions | None = None,
     ) -> EventHandler[TContext, TSubscirbedEvent]:
         raise NotImplementedError
 
@@ -269,6 +334,7 @@ class _EventDispatcherWrapper(EventDispatcherGroup):
         coalescing_opts: CoalescingOptions | None = None,
         *,
         name: str | None = None,
+        concurrency_opts: ConcurrencyOptions | None = None,
     ) -> EventHandler[TContext, TConsumedEvent]:
         return self._event_dispatcher.consume(
             event_cls,
@@ -276,6 +342,7 @@ class _EventDispatcherWrapper(EventDispatcherGroup):
             callback,
             coalescing_opts=coalescing_opts,
             name=name,
+            concurrency_opts=concurrency_opts,
             start_reporters=tuple(self._start_reporters),
             complete_reporters=tuple(self._complete_reporters),
         )
@@ -290,6 +357,7 @@ class _EventDispatcherWrapper(EventDispatcherGroup):
         *,
         name: str | None = None,
         override_event_name: str | None = None,
+        concurrency_opts: ConcurrencyOptions | None = None,
     ) -> EventHandler[TContext, TSubscirbedEvent]:
         return self._event_dispatcher.subscribe(
             event_cls,
@@ -298,6 +366,7 @@ class _EventDispatcherWrapper(EventDispatcherGroup):
             coalescing_opts=coalescing_opts,
             name=name,
             override_event_name=override_event_name,
+            concurrency_opts=concurrency_opts,
             start_reporters=tuple(self._start_reporters),
             complete_reporters=tuple(self._complete_reporters),
         )
@@ -316,6 +385,10 @@ class EventDispatcher(EventDispatcherGroup):
     receive the same event.
 
     Subscriber example: enqueuing events to the queues for event streaming API handlers
+
+    With ``max_pending_handlers``, at most that many consumer (and, separately, subscriber)
+    handler runs are in flight at once; further messages wait in the message queue, so a
+    bounded consumer prefetch turns a slow handler into backpressure on the stream reader.
     """
 
     _consumers: defaultdict[
@@ -328,6 +401,8 @@ class EventDispatcher(EventDispatcherGroup):
     _subscriber_loop_task: asyncio.Task[Any] | None
     _consumer_taskgroup: PersistentTaskGroup
     _subscriber_taskgroup: PersistentTaskGroup
+    _consumer_budget: asyncio.Semaphore | None
+    _subscriber_budget: asyncio.Semaphore | None
 
     _log_events: bool
     _metric_observer: EventObserver
@@ -340,6 +415,7 @@ class EventDispatcher(EventDispatcherGroup):
         consumer_exception_handler: AsyncExceptionHandler | None = None,
         subscriber_exception_handler: AsyncExceptionHandler | None = None,
         event_observer: EventObserver | None = None,
+        max_pending_handlers: int | None = None,
     ) -> None:
         self._log_events = log_events
         self._closed = False
@@ -355,6 +431,12 @@ class EventDispatcher(EventDispatcherGroup):
             name="subscriber_taskgroup",
             exception_handler=subscriber_exception_handler,
         )
+        if max_pending_handlers is not None:
+            self._consumer_budget = asyncio.Semaphore(max_pending_handlers)
+            self._subscriber_budget = asyncio.Semaphore(max_pending_handlers)
+        else:
+            self._consumer_budget = None
+            self._subscriber_budget = None
         self._consumer_loop_task = None
         self._subscriber_loop_task = None
 
@@ -403,12 +485,16 @@ class EventDispatcher(EventDispatcherGroup):
         coalescing_opts: CoalescingOptions | None = None,
         *,
         name: str | None = None,
+        concurrency_opts: ConcurrencyOptions | None = None,
         start_reporters: Sequence[AbstractEventReporter] = tuple(),
         complete_reporters: Sequence[AbstractEventReporter] = tuple(),
     ) -> EventHandler[TContext, TConsumedEvent]:
         """
         Register a callback as a consumer. When multiple callback registers as a consumer
         on a single event, only one callable among those will be called.
+
+        With ``concurrency_opts``, runs of the callback are bounded by the given limiter
+        and serialized per ordering key.
         """
 
         if name is None:
@@ -423,6 +509,7 @@ class EventDispatcher(EventDispatcherGroup):
             CoalescingState(),
             event_start_reporters=tuple(start_reporters),
             event_complete_reporters=tuple(complete_reporters),
+            concurrency_opts=concurrency_opts,
         )
         self._consumers[event_cls.event_name()].add(cast(EventHandler[Any, AbstractEvent], handler))
         return handler
@@ -445,11 +532,15 @@ class EventDispatcher(EventDispatcherGroup):
         *,
         name: str | None = None,
         override_event_name: str | None = None,
+        concurrency_opts: ConcurrencyOptions | None = None,
         start_reporters: Sequence[AbstractEventReporter] = tuple(),
         complete_reporters: Sequence[AbstractEventReporter] = tuple(),
     ) -> EventHandler[TContext, TSubscirbedEvent]:
         """
         Subscribes to given event. All handlers will be called when certain event pops up.
+
+        With ``concurrency_opts``, runs of the callback are bounded by the given limiter
+        and serialized per ordering key.
         """
 
         if name is None:
@@ -464,6 +555,7 @@ class EventDispatcher(EventDispatcherGroup):
             CoalescingState(),
             event_start_reporters=tuple(start_reporters),
             event_complete_reporters=tuple(complete_reporters),
+            concurrency_opts=concurrency_opts,
         )
         override_event_name = override_event_name or event_cls.event_name()
         self._subscribers[override_event_name].add(cast(EventHandler[Any, AbstractEvent], handler))
@@ -487,10 +579,9 @@ class EventDispatcher(EventDispatcherGroup):
         message: EventMessage,
         post_callbacks: Sequence[PostCallback] = tuple(),
         metadata: MessageMetadata | None = None,
+        *,
+        dispatched_at: float | None = None,
     ) -> None:
-        coalescing_opts = evh.coalescing_opts
-        coalescing_state = evh.coalescing_state
-        cb = evh.callback
         evh_type = evh.handler_type
         event_cls = evh.event_cls
         if self._closed:
@@ -516,6 +607,39 @@ class EventDispatcher(EventDispatcherGroup):
             for post_callback in post_callbacks:
                 await post_callback.done()
             return
+        concurrency_opts = evh.concurrency_opts
+        if concurrency_opts is None:
+            await self._invoke(evh, source, event, post_callbacks, metadata, dispatched_at)
+            return
+        # Take the slot before any other await so that runs sharing an ordering key
+        # start in the order they were dispatched.
+        ordering_key = concurrency_opts.get("ordering_key")
+        key = ordering_key(event) if ordering_key is not None else None
+        async with concurrency_opts["limiter"].slot(key):
+            if self._closed:  # _closed can change while waiting for the slot
+                return  # type: ignore[unreachable]
+            await self._invoke(evh, source, event, post_callbacks, metadata, dispatched_at)
+
+    async def _invoke(
+        self,
+        evh: EventHandler,  # type: ignore[type-arg]
+        source: AgentId,
+        event: AbstractEvent,
+        post_callbacks: Sequence[PostCallback],
+        metadata: MessageMetadata | None,
+        dispatched_at: float | None,
+    ) -> None:
+        coalescing_opts = evh.coalescing_opts
+        coalescing_state = evh.coalescing_state
+        cb = evh.callback
+        evh_type = evh.handler_type
+        event_type = evh.event_cls.event_name()
+        start = time.perf_counter()
+        if dispatched_at is not None:
+            self._metric_observer.observe_handler_lag(
+                event_type=event_type,
+                lag=start - dispatched_at,
+            )
         for start_reporter in evh.event_start_reporters:
             await start_reporter.prepare_event_report(event, PrepareEventReportArgs())
         try:
@@ -589,13 +713,17 @@ class EventDispatcher(EventDispatcherGroup):
         payload = mq_msg.payload
         message = EventMessage(name=payload.name, payload=payload.payload)
         for consumer in consumer_handlers.copy():
-            self._consumer_taskgroup.create_task(
+            await self._spawn(
+                self._consumer_taskgroup,
+                self._consumer_budget,
+                event_name,
                 self._handle(
                     consumer,
                     AgentId(payload.legacy_source),
                     message,
                     [post_callback],
                     payload.metadata,
+                    dispatched_at=time.perf_counter(),
                 ),
             )
             await asyncio.sleep(0)
@@ -612,17 +740,43 @@ class EventDispatcher(EventDispatcherGroup):
             log.debug("DISPATCH_SUBSCRIBERS(ev:{})", event_name)
         message = EventMessage(name=payload.name, payload=payload.payload)
         for subscriber in subscriber_handlers.copy():
-            self._subscriber_taskgroup.create_task(
+            await self._spawn(
+                self._subscriber_taskgroup,
+                self._subscriber_budget,
+                event_name,
                 self._handle(
                     subscriber,
                     AgentId(payload.legacy_source),
                     message,
                     tuple(),
                     payload.metadata,
+                    dispatched_at=time.perf_counter(),
                 ),
             )
             await asyncio.sleep(0)
 
+    async def _spawn(
+        self,
+        taskgroup: PersistentTaskGroup,
+        budget: asyncio.Semaphore | None,
+        event_type: str,
+        handle: Coroutine[Any, Any, None],
+    ) -> None:
+        if budget is not None:
+            # Blocks the dispatch loop (and thus reading from the queue) until a run finishes.
+            await budget.acquire()
+        self._metric_observer.observe_pending_handlers(event_type=event_type, delta=1)
+
+        async def _run() -> None:
+            try:
+                await handle
+            finally:
+                self._metric_observer.observe_pending_handlers(event_type=event_type, delta=-1)
+                if budget is not None:
+                    budget.release()
+
+        taskgroup.create_task(_run())
+
     @preserve_termination_log  # type: ignore[misc]
     async def _consume_loop(self) -> None:
         async for msg in self._msg_queue.consume_queue():  # type: ignore
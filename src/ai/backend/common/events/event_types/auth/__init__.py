@@ -0,0 +1,3 @@
+from .broadcast import AuthContextInvalidatedBroadcastEvent
+
+__all__ = ("AuthContextInvalidatedBroadcastEvent",)
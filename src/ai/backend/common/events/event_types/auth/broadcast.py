@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import override
+
+from ai.backend.common.events.types import AbstractBroadcastEvent, EventDomain
+from ai.backend.common.events.user_event.user_event import UserEvent
+
+__all__ = ("AuthContextInvalidatedBroadcastEvent",)
+
+
+class AuthContextInvalidatedBroadcastEvent(AbstractBroadcastEvent):
+    """
+    Tells every manager to drop its cached authentication contexts.
+
+    Sent after a user, one of its keypairs, or a resource policy changed, so that
+    the next request re-reads what it is allowed to do instead of trusting a
+    cached copy until it expires.
+    """
+
+    @classmethod
+    @override
+    def event_domain(cls) -> EventDomain:
+        return EventDomain.AUTH
+
+    @classmethod
+    @override
+    def event_name(cls) -> str:
+        return "auth_context_invalidated"
+
+    @override
+    def domain_id(self) -> str | None:
+        return None
+
+    @override
+    def user_event(self) -> UserEvent | None:
+        return None
@@ -40,6 +40,7 @@ class EventDomain(enum.StrEnum):
     LOG = "log"
     WORKFLOW = "workflow"
     SERVICE_DISCOVERY = "service_discovery"
+    AUTH = "auth"
 
 
 class EventCacheDomain(enum.StrEnum):
@@ -6,7 +6,7 @@ import logging
 import random
 import socket
 import time
-from collections.abc import AsyncGenerator, Iterable
+from collections.abc import AsyncGenerator, Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any, Self, override
 
@@ -30,6 +30,9 @@ _DEFAULT_AUTOCLAIM_IDLE_TIMEOUT = 300_000  # 5 minutes
 _DEFAULT_AUTOCLAIM_INTERVAL = 60_000
 _DEFAULT_READ_BLOCK_MS = 10_000  # 10 second
 _DEFAULT_READ_COUNT = 64
+_DEFAULT_MIN_READ_COUNT = 8
+_DEFAULT_MAX_READ_COUNT = 512
+_DEFAULT_ACK_BATCH_SIZE = 256
 
 
 @dataclass
@@ -50,6 +53,104 @@ class _BackoffState:
         self.last_error_time = 0.0
 
 
+@dataclass
+class _ReadCountState:
+    """
+    Tracks the XREADGROUP COUNT of a stream.
+
+    A read that fills the whole batch means more messages are waiting, so the count doubles;
+    a read that returns less than half of it means the stream has drained, so it halves.
+    """
+
+    current: int
+    minimum: int
+    maximum: int
+
+    def update(self, received: int) -> None:
+        if received >= self.current:
+            self.current = min(self.current * 2, self.maximum)
+        elif received < self.current // 2:
+            self.current = max(self.current // 2, self.minimum)
+
+
+class _AckBatcher:
+    """
+    Coalesces message acknowledgments into multi-id XACK calls.
+
+    Acknowledged ids are flushed when ``max_batch_size`` of them are pending or
+    ``flush_interval`` seconds after the first one arrived, whichever comes first.
+    A failed flush keeps its ids for the next one; if the consumer stops before they
+    are acknowledged, the auto-claim loop redelivers them as usual.
+    """
+
+    _client: ValkeyStreamClient
+    _stream_keys: Sequence[str]
+    _group_name: str
+    _flush_interval: float
+    _max_batch_size: int
+    _pending: list[MessageId]
+    _flush_task: asyncio.Task[None] | None
+
+    def __init__(
+        self,
+        client: ValkeyStreamClient,
+        stream_keys: Sequence[str],
+        group_name: str,
+        *,
+        flush_interval: float,
+        max_batch_size: int,
+    ) -> None:
+        self._client = client
+        self._stream_keys = stream_keys
+        self._group_name = group_name
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._pending = []
+        self._flush_task = None
+
+    async def add(self, msg_id: MessageId) -> None:
+        self._pending.append(msg_id)
+        if len(self._pending) >= self._max_batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        msg_ids, self._pending = self._pending, []
+        try:
+            # XACK ignores ids that are not pending in the given stream, so acknowledging
+            # on every consumed stream is correct without tracking where each id came from.
+            for stream_key in self._stream_keys:
+                await self._client.done_stream_messages(stream_key, self._group_name, msg_ids)
+        except Exception:
+            self._pending[:0] = msg_ids
+            raise
+
+    async def close(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            log.warning("Failed to flush {} acknowledgments on close: {}", len(self._pending), e)
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self._flush_interval)
+        finally:
+            self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            log.warning("Failed to flush {} acknowledgments: {}", len(self._pending), e)
+        if self._pending and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+
 @dataclass
 class RedisConsumerArgs:
     stream_keys: Iterable[str]
@@ -61,6 +162,11 @@ class RedisConsumerArgs:
     backoff_initial_delay: float = 0.1  # 100ms first retry
     backoff_max_delay: float = 30.0  # cap at 30 seconds
     backoff_max_attempts: int | None = None  # None = infinite retry
+    prefetch_limit: int = 0  # 0 = unbounded local queue
+    min_read_count: int = _DEFAULT_MIN_READ_COUNT
+    max_read_count: int = _DEFAULT_MAX_READ_COUNT
+    ack_flush_interval: float | None = None  # None = acknowledge each message immediately
+    ack_batch_size: int = _DEFAULT_ACK_BATCH_SIZE
 
 
 class RedisConsumer(AbstractConsumer):
@@ -73,6 +179,10 @@ class RedisConsumer(AbstractConsumer):
 
     _client: ValkeyStreamClient
     _consume_queue: asyncio.Queue[MQMessage]
+    _min_read_count: int
+    _max_read_count: int
+    _read_count_state: dict[str, _ReadCountState]
+    _ack_batcher: _AckBatcher | None
     _stream_keys: set[str]
     _group_name: str
     _consumer_id: str
@@ -102,15 +212,39 @@ class RedisConsumer(AbstractConsumer):
             node_id: Node identifier for generating unique consumer ID
             autoclaim_idle_timeout: Timeout for auto-claiming idle messages (ms)
             autoclaim_start_id: Starting ID for auto-claim (default: "0-0")
+            prefetch_limit: Max messages read ahead of the consumer (0 = unbounded)
+            min_read_count: Lower bound of the adaptive XREADGROUP COUNT
+            max_read_count: Upper bound of the adaptive XREADGROUP COUNT
+            ack_flush_interval: Max delay before batched acknowledgments are sent (s)
+            ack_batch_size: Number of pending acknowledgments that triggers a flush
         """
         self._client = client
-        self._consume_queue = asyncio.Queue()
+        # A bounded queue makes the stream readers wait for the consumer, leaving
+        # unread messages in Redis instead of buffering them in memory.
+        self._consume_queue = asyncio.Queue(maxsize=args.prefetch_limit)
+        self._max_read_count = (
+            min(args.max_read_count, args.prefetch_limit)
+            if args.prefetch_limit > 0
+            else args.max_read_count
+        )
+        self._min_read_count = min(args.min_read_count, self._max_read_count)
+        self._read_count_state = {}
         self._stream_keys = set(args.stream_keys)
         self._group_name = args.group_name
         self._consumer_id = _generate_consumer_id(args.node_id)
         self._redis_target = redis_target
         self._autoclaim_idle_timeout = args.autoclaim_idle_timeout
         self._closed = False
+        if args.ack_flush_interval is not None:
+            self._ack_batcher = _AckBatcher(
+                client,
+                sorted(self._stream_keys),
+                self._group_name,
+                flush_interval=args.ack_flush_interval,
+                max_batch_size=args.ack_batch_size,
+            )
+        else:
+            self._ack_batcher = None
 
         # Backoff configuration
         self._backoff_initial_delay = args.backoff_initial_delay
@@ -202,6 +336,10 @@ class RedisConsumer(AbstractConsumer):
         if self._closed:
             raise MessageQueueClosedError("Consumer is closed")
 
+        if self._ack_batcher is not None:
+            await self._ack_batcher.add(msg_id)
+            return
+
         # Note: We acknowledge on the first stream key as the message could be from any stream
         # In practice, msg_id should be unique across streams so this should work
         for stream_key in self._stream_keys:
@@ -231,6 +369,8 @@ class RedisConsumer(AbstractConsumer):
             except asyncio.CancelledError:
                 log.debug("Task {} cancelled", task.get_name())
 
+        if self._ack_batcher is not None:
+            await self._ack_batcher.close()
         await self._client.close()
         log.debug("RedisConsumer closed")
 
@@ -280,13 +420,21 @@ class RedisConsumer(AbstractConsumer):
             client: ValkeyStreamClient for reading messages
             stream_key: The Redis stream key to read from
         """
+        read_count = self._read_count_state.get(stream_key)
+        if read_count is None:
+            read_count = self._read_count_state[stream_key] = _ReadCountState(
+                current=max(self._min_read_count, min(_DEFAULT_READ_COUNT, self._max_read_count)),
+                minimum=self._min_read_count,
+                maximum=self._max_read_count,
+            )
         payload = await client.read_consumer_group(
             stream_key,
             self._group_name,
             self._consumer_id,
-            count=_DEFAULT_READ_COUNT,
+            count=read_count.current,
             block_ms=_DEFAULT_READ_BLOCK_MS,
         )
+        read_count.update(len(payload) if payload else 0)
 
         if not payload:
             return
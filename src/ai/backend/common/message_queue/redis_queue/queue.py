@@ -40,6 +40,8 @@ class RedisMQArgs:
     # Optional arguments
     autoclaim_idle_timeout: int = _DEFAULT_AUTOCLAIM_IDLE_TIMEOUT
     autoclaim_start_id: str | None = None
+    consume_prefetch_limit: int = 0
+    consume_ack_flush_interval: float | None = None
 
 
 class RedisQueue(AbstractMessageQueue):
@@ -92,6 +94,8 @@ class RedisQueue(AbstractMessageQueue):
                 args.db,
                 args.autoclaim_idle_timeout,
                 args.autoclaim_start_id,
+                prefetch_limit=args.consume_prefetch_limit,
+                ack_flush_interval=args.consume_ack_flush_interval,
             ),
         )
 
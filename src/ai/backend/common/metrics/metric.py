@@ -224,6 +224,8 @@ class EventMetricObserver:
     _event_count: Counter
     _event_failure_count: Counter
     _event_processing_time_sec: Histogram
+    _event_pending_handler_count: Gauge
+    _event_handler_lag_sec: Histogram
 
     def __init__(self) -> None:
         self._event_count = Counter(
@@ -242,6 +244,18 @@ class EventMetricObserver:
             labelnames=["event_type", "status", "domain", "operation", "error_detail"],
             buckets=[0.001, 0.01, 0.1, 0.5, 1, 2, 5, 10, 30],
         )
+        self._event_pending_handler_count = Gauge(
+            name="backendai_event_pending_handler_count",
+            documentation="Number of dispatched event handler runs that have not finished yet",
+            labelnames=["event_type"],
+            multiprocess_mode="livesum",
+        )
+        self._event_handler_lag_sec = Histogram(
+            name="backendai_event_handler_lag_sec",
+            documentation="Time from dispatching an event to its handler starting, in seconds",
+            labelnames=["event_type"],
+            buckets=[0.001, 0.01, 0.1, 0.5, 1, 2, 5, 10, 30],
+        )
 
     @classmethod
     def instance(cls) -> Self:
@@ -249,6 +263,12 @@ class EventMetricObserver:
             cls._instance = cls()
         return cls._instance
 
+    def observe_pending_handlers(self, *, event_type: str, delta: int) -> None:
+        self._event_pending_handler_count.labels(event_type=event_type).inc(delta)
+
+    def observe_handler_lag(self, *, event_type: str, lag: float) -> None:
+        self._event_handler_lag_sec.labels(event_type=event_type).observe(lag)
+
     def observe_event_success(self, *, event_type: str, duration: float) -> None:
         self._event_count.labels(event_type=event_type).inc()
         self._event_processing_time_sec.labels(
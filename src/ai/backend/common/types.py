@@ -83,6 +83,7 @@ __all__ = (
     "AcceleratorNumberFormat",
     "AccessKey",
     "AgentId",
+    "AgentPlacementEngine",
     "AgentSelectionStrategy",
     "AutoPullBehavior",
     "AutoScalingMetricComparator",
@@ -2253,6 +2254,15 @@ class AgentSelectionStrategy(enum.StrEnum):
     LEGACY = "legacy"
 
 
+class AgentPlacementEngine(enum.StrEnum):
+    """How the agent selection pipeline evaluates the agents' slot state."""
+
+    # Per-agent trackers recomputing the remaining slots as Decimal dicts.
+    TRACKER = "tracker"
+    # A fixed-point agents x slot-types matrix updated incrementally.
+    MATRIX = "matrix"
+
+
 class PreemptionMode(enum.StrEnum):
     TERMINATE = "terminate"
     RESCHEDULE = "reschedule"
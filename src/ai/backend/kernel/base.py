@@ -68,28 +68,90 @@ class HealthStatus(enum.Enum):
     UNDETERMINED = 2
 
 
+OUTPUT_READ_SIZE = 64 * 1024
+OUTPUT_FLUSH_SIZE = 64 * 1024
+OUTPUT_FLUSH_INTERVAL = 0.005
+_IOV_MAX = 1024
+
+
+def _writev_all(fd: int, chunks: Sequence[bytes]) -> None:
+    """Write all chunks to the given fd with vectored I/O, resuming after partial writes."""
+    views = [memoryview(chunk) for chunk in chunks]
+    idx = 0
+    while idx < len(views):
+        written = os.writev(fd, views[idx : idx + _IOV_MAX])
+        while idx < len(views) and written >= len(views[idx]):
+            written -= len(views[idx])
+            idx += 1
+        if written:
+            views[idx] = views[idx][written:]
+
+
+def _write_output(fds: Sequence[int], chunks: Sequence[bytes]) -> None:
+    for fd in fds:
+        try:
+            _writev_all(fd, chunks)
+        except OSError:
+            # A broken console must not prevent writing the log file and vice versa.
+            pass
+
+
 async def pipe_output(
     stream: asyncio.StreamReader,
     outsock: zmq.Socket[Any],
     target: str,
     log_fd: int,
+    writer: concurrent.futures.Executor | None = None,
 ) -> None:
+    """
+    Relay the output of a subprocess to the console, the log file, and the agent.
+
+    Output is read in large chunks and coalesced until ``OUTPUT_FLUSH_SIZE`` bytes
+    are pending or ``OUTPUT_FLUSH_INTERVAL`` seconds have passed since the first
+    pending chunk, and each batch is written with one vectored write per fd and
+    sent as a single frame.  While a batch is being flushed, further output piles
+    up in the pipe and is picked up by the next read, so the batches grow with the
+    output rate.
+
+    The file writes run on *writer*, which should be a single-thread executor
+    shared by the stdout and stderr pipes of the same process so that their
+    writes to the log file do not interleave.
+    """
     if target not in ("stdout", "stderr"):
         raise ValueError(f"Invalid target: {target}. Must be 'stdout' or 'stderr'")
     console_fd = sys.stdout.fileno() if target == "stdout" else sys.stderr.fileno()
     target_bytes = target.encode("ascii")
+    fds = (console_fd, log_fd)
     loop = current_loop()
+    chunks: list[bytes] = []
+    pending_size = 0
+    deadline = 0.0
     try:
         while True:
-            data = await stream.read(4096)
-            if not data:
+            data: bytes | None
+            try:
+                if chunks:
+                    async with asyncio.timeout_at(deadline):
+                        data = await stream.read(OUTPUT_READ_SIZE)
+                else:
+                    data = await stream.read(OUTPUT_READ_SIZE)
+            except TimeoutError:
+                data = None  # the flush window has passed
+            eof = data == b""
+            if data:
+                if not chunks:
+                    deadline = loop.time() + OUTPUT_FLUSH_INTERVAL
+                chunks.append(data)
+                pending_size += len(data)
+            if chunks and (eof or data is None or pending_size >= OUTPUT_FLUSH_SIZE):
+                batch, chunks, pending_size = chunks, [], 0
+                await asyncio.gather(
+                    loop.run_in_executor(writer, _write_output, fds, batch),
+                    outsock.send_multipart([target_bytes, b"".join(batch)]),
+                    return_exceptions=True,
+                )
+            if eof:
                 break
-            await asyncio.gather(
-                loop.run_in_executor(None, os.write, console_fd, data),
-                loop.run_in_executor(None, os.write, log_fd, data),
-                outsock.send_multipart([target_bytes, data]),
-                return_exceptions=True,
-            )
     except asyncio.CancelledError:
         pass
     except Exception:
@@ -1043,6 +1105,9 @@ class BaseRunner(metaclass=ABCMeta):
             pipe_opts["stdout"] = asyncio.subprocess.PIPE
             pipe_opts["stderr"] = asyncio.subprocess.PIPE
             log_out = await asyncio.to_thread(Path(log_path).open, "ab")
+            output_writer = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="subproc-output"
+            )
             try:
                 env = {**self.child_env}
                 if batch:
@@ -1057,16 +1122,21 @@ class BaseRunner(metaclass=ABCMeta):
                     raise RuntimeError("Process stdout or stderr is None")
                 pipe_tasks = [
                     loop.create_task(
-                        pipe_output(proc.stdout, self.outsock, "stdout", log_out.fileno())
+                        pipe_output(
+                            proc.stdout, self.outsock, "stdout", log_out.fileno(), output_writer
+                        )
                     ),
                     loop.create_task(
-                        pipe_output(proc.stderr, self.outsock, "stderr", log_out.fileno())
+                        pipe_output(
+                            proc.stderr, self.outsock, "stderr", log_out.fileno(), output_writer
+                        )
                     ),
                 ]
                 retcode = await proc.wait()
                 await asyncio.gather(*pipe_tasks)
                 return retcode
             finally:
+                await asyncio.to_thread(output_writer.shutdown)
                 await asyncio.to_thread(log_out.close)
         except Exception:
             log.exception("unexpected error")
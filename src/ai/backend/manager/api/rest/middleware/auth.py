@@ -49,6 +49,10 @@ from ai.backend.common.plugin.hook import FIRST_COMPLETED, PASSED
 from ai.backend.common.types import AccessKey, ReadableCIDR, SecretKey
 from ai.backend.logging import BraceStyleAdapter
 from ai.backend.logging.utils import with_log_context_fields
+from ai.backend.manager.api.rest.middleware.auth_cache import (
+    AuthContextCache,
+    KeypairQueryCounter,
+)
 from ai.backend.manager.api.rest.types import WebRequestHandler
 from ai.backend.manager.data.auth.types import AuthenticatedKeypair, AuthenticatedUser
 from ai.backend.manager.errors.auth import (
@@ -669,10 +673,29 @@ async def _query_auth_context_by_access_key(
         )
 
 
+async def _resolve_auth_context(
+    db: ExtendedAsyncSAEngine,
+    auth_context_cache: AuthContextCache[_AuthContext] | None,
+    access_key: str,
+) -> _AuthContext | None:
+    """Serve the auth context from the cache, querying and caching it on a miss."""
+    if auth_context_cache is None:
+        return await _query_auth_context_by_access_key(db, access_key)
+    context = auth_context_cache.get(access_key)
+    if context is not None:
+        return context
+    generation = auth_context_cache.generation
+    context = await _query_auth_context_by_access_key(db, access_key)
+    if context is not None:
+        auth_context_cache.put(access_key, context, generation=generation)
+    return context
+
+
 async def _authenticate_via_jwt(
     db: ExtendedAsyncSAEngine,
+    auth_context_cache: AuthContextCache[_AuthContext] | None,
     jwt_validator: JWTValidator,
-    valkey_stat: ValkeyStatClient,
+    query_counter: KeypairQueryCounter,
     jwt_token: str,
 ) -> _AuthContext | None:
     try:
@@ -684,7 +707,7 @@ async def _authenticate_via_jwt(
         if not access_key:
             raise AuthorizationFailed("Access key not found in JWT token")
 
-        context = await _query_auth_context_by_access_key(db, access_key)
+        context = await _resolve_auth_context(db, auth_context_cache, access_key)
 
         if context is None:
             raise AuthorizationFailed("Access key not found in database")
@@ -692,7 +715,7 @@ async def _authenticate_via_jwt(
 
         log.trace("JWT authentication succeeded for access_key={}", access_key)
 
-        await valkey_stat.increment_keypair_query_count(access_key)
+        await query_counter.record(access_key)
         return context
 
     except JWTError as e:
@@ -703,7 +726,8 @@ async def _authenticate_via_jwt(
 async def _authenticate_via_hmac(
     request: web.Request,
     db: ExtendedAsyncSAEngine,
-    valkey_stat: ValkeyStatClient,
+    auth_context_cache: AuthContextCache[_AuthContext] | None,
+    query_counter: KeypairQueryCounter,
 ) -> _AuthContext | None:
     if not check_date(request):
         raise InvalidAuthParameters("Date/time sync error")
@@ -714,7 +738,7 @@ async def _authenticate_via_hmac(
 
     sign_method, access_key, signature = params
 
-    context = await _query_auth_context_by_access_key(db, access_key)
+    context = await _resolve_auth_context(db, auth_context_cache, access_key)
 
     if context is None:
         raise AuthorizationFailed("Access key not found in HMAC")
@@ -723,14 +747,15 @@ async def _authenticate_via_hmac(
     if not secrets.compare_digest(my_signature, signature):
         raise AuthorizationFailed("HMAC signature mismatch")
 
-    await valkey_stat.increment_keypair_query_count(access_key)
+    await query_counter.record(access_key)
     return context
 
 
 async def _authenticate_via_hook(
     request: web.Request,
     db: ExtendedAsyncSAEngine,
-    valkey_stat: ValkeyStatClient,
+    auth_context_cache: AuthContextCache[_AuthContext] | None,
+    query_counter: KeypairQueryCounter,
     hook_plugin_ctx: HookPluginContext,
 ) -> _AuthContext | None:
     hook_result = await hook_plugin_ctx.dispatch(
@@ -749,12 +774,12 @@ async def _authenticate_via_hook(
     if access_key is None:
         return None
 
-    context = await _query_auth_context_by_access_key(db, access_key)
+    context = await _resolve_auth_context(db, auth_context_cache, access_key)
 
     if context is None:
         raise AuthorizationFailed("Access key not found in hook")
 
-    await valkey_stat.increment_keypair_query_count(access_key)
+    await query_counter.record(access_key)
     return context
 
 
@@ -927,8 +952,16 @@ def build_auth_middleware(
     jwt_validator: JWTValidator,
     valkey_stat: ValkeyStatClient,
     hook_plugin_ctx: HookPluginContext,
+    auth_context_cache: AuthContextCache[_AuthContext] | None = None,
+    query_counter: KeypairQueryCounter | None = None,
 ) -> Middleware:
-    """Build an auth middleware with explicit dependencies."""
+    """Build an auth middleware with explicit dependencies.
+
+    Without ``auth_context_cache`` every request resolves its access key from the
+    database; without ``query_counter`` every request's query count is written
+    through to ``valkey_stat``.
+    """
+    counter = query_counter or KeypairQueryCounter(valkey_stat, flush_interval=None)
 
     @web.middleware
     async def _middleware(request: web.Request, handler: Handler) -> web.StreamResponse:
@@ -946,11 +979,15 @@ def build_auth_middleware(
         jwt_token = request.headers.get("X-BackendAI-Token")
         auth_header = request.headers.get("Authorization")
         if jwt_token:
-            context = await _authenticate_via_jwt(db, jwt_validator, valkey_stat, jwt_token)
+            context = await _authenticate_via_jwt(
+                db, auth_context_cache, jwt_validator, counter, jwt_token
+            )
         elif auth_header:
-            context = await _authenticate_via_hmac(request, db, valkey_stat)
+            context = await _authenticate_via_hmac(request, db, auth_context_cache, counter)
         else:
-            context = await _authenticate_via_hook(request, db, valkey_stat, hook_plugin_ctx)
+            context = await _authenticate_via_hook(
+                request, db, auth_context_cache, counter, hook_plugin_ctx
+            )
 
         authenticated_user: UserData | None = None
         if context is not None:
@@ -0,0 +1,260 @@
+"""Per-process caches backing the authentication middleware.
+
+* ``AuthContextCache`` — bounded TTL+LRU cache of resolved auth contexts keyed by
+  access key, dropped by ``AuthContextInvalidatedBroadcastEvent``.
+
+* ``AuthTableWriteWatcher`` — broadcasts that event whenever a committed
+  transaction has updated or deleted users, keypairs or their resource policies.
+
+* ``KeypairQueryCounter`` — buffers per-request keypair query counts and writes
+  them to Valkey in periodic pipelined batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager as actxmgr
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+import sqlalchemy as sa
+from sqlalchemy import event as sa_event
+
+from ai.backend.common.events.event_types.auth.broadcast import (
+    AuthContextInvalidatedBroadcastEvent,
+)
+from ai.backend.logging import BraceStyleAdapter
+
+if TYPE_CHECKING:
+    from ai.backend.common.clients.valkey_client.valkey_stat.client import ValkeyStatClient
+    from ai.backend.common.events.dispatcher import EventProducer
+    from ai.backend.manager.models.utils import ExtendedAsyncSAEngine
+
+log: Final = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+# Tables whose updates or deletions can revoke or change a resolved auth context.
+AUTH_CONTEXT_TABLES: Final[frozenset[str]] = frozenset({
+    "users",
+    "keypairs",
+    "user_resource_policies",
+    "keypair_resource_policies",
+})
+
+_AUTH_TABLES_WRITTEN: Final = "auth_tables_written"
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry[TContext]:
+    context: TContext
+    expires_at: float
+
+
+class AuthContextCache[TContext]:
+    """Resolved auth contexts keyed by access key, bounded in size and age.
+
+    Writes that may revoke access are broadcast to every manager, which drops
+    all of its entries; the TTL only bounds how long a missed broadcast can keep a
+    stale context alive. Only successful lookups are cached, so an unknown or
+    deactivated access key always reaches the database.
+
+    A lookup that started before an invalidation must not repopulate the cache
+    with what it read, so :meth:`put` takes the :attr:`generation` observed before
+    the query and is ignored if an invalidation happened since.
+    """
+
+    _ttl: float
+    _max_size: int
+    _entries: OrderedDict[str, _CacheEntry[TContext]]
+    _generation: int
+    _clock: Callable[[], float]
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, access_key: str) -> TContext | None:
+        entry = self._entries.get(access_key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[access_key]
+            return None
+        self._entries.move_to_end(access_key)
+        return entry.context
+
+    def put(self, access_key: str, context: TContext, *, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._entries.pop(access_key, None)
+        self._entries[access_key] = _CacheEntry(
+            context=context,
+            expires_at=self._clock() + self._ttl,
+        )
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+
+class AuthTableWriteWatcher:
+    """Invalidates auth contexts after any committed write to the auth tables.
+
+    The watcher hooks the engine's connection events instead of the code paths
+    issuing the writes, so that legacy GraphQL mutations, plugins and repository
+    methods alike revoke cached contexts. A connection remembers that it has
+    updated or deleted rows of :data:`AUTH_CONTEXT_TABLES`, and its commit drops
+    the local cache at once and broadcasts an invalidation to the other
+    managers. The rows a statement touched are not known here, and a policy
+    is shared by many users anyway, so every cached context is dropped;
+    these writes are rare administrative operations. Inserts are ignored as
+    they cannot revoke access, and so are raw SQL strings.
+    """
+
+    _db: ExtendedAsyncSAEngine
+    _event_producer: EventProducer
+    _auth_context_cache: AuthContextCache[Any]
+    _broadcasts: set[asyncio.Task[None]]
+
+    def __init__(
+        self,
+        db: ExtendedAsyncSAEngine,
+        event_producer: EventProducer,
+        auth_context_cache: AuthContextCache[Any],
+    ) -> None:
+        self._db = db
+        self._event_producer = event_producer
+        self._auth_context_cache = auth_context_cache
+        self._broadcasts = set()
+
+    @actxmgr
+    async def run(self) -> AsyncIterator[None]:
+        """Watch the engine while the context is open."""
+        engine = self._db.sync_engine
+        sa_event.listen(engine, "after_execute", self._after_execute)
+        sa_event.listen(engine, "commit", self._on_commit)
+        sa_event.listen(engine, "rollback", self._on_rollback)
+        try:
+            yield
+        finally:
+            sa_event.remove(engine, "after_execute", self._after_execute)
+            sa_event.remove(engine, "commit", self._on_commit)
+            sa_event.remove(engine, "rollback", self._on_rollback)
+            await asyncio.gather(*self._broadcasts, return_exceptions=True)
+
+    def _after_execute(
+        self,
+        conn: sa.engine.Connection,
+        clauseelement: Any,
+        multiparams: Any,
+        params: Any,
+        execution_options: Any,
+        result: Any,
+    ) -> None:
+        if not isinstance(clauseelement, (sa.sql.Update, sa.sql.Delete)):
+            return
+        if clauseelement.table.name not in AUTH_CONTEXT_TABLES:
+            return
+        if result.rowcount == 0:
+            return
+        conn.info[_AUTH_TABLES_WRITTEN] = True
+
+    def _on_commit(self, conn: sa.engine.Connection) -> None:
+        if not conn.info.pop(_AUTH_TABLES_WRITTEN, False):
+            return
+        self._auth_context_cache.clear()
+        # Commits run in the event loop thread through SQLAlchemy's greenlet bridge.
+        task = asyncio.get_running_loop().create_task(self._broadcast())
+        self._broadcasts.add(task)
+        task.add_done_callback(self._broadcasts.discard)
+
+    def _on_rollback(self, conn: sa.engine.Connection) -> None:
+        conn.info.pop(_AUTH_TABLES_WRITTEN, None)
+
+    async def _broadcast(self) -> None:
+        try:
+            await self._event_producer.broadcast_event(AuthContextInvalidatedBroadcastEvent())
+        except Exception:
+            log.exception("Failed to broadcast an auth context invalidation")
+
+
+class KeypairQueryCounter:
+    """Counts authenticated requests per access key.
+
+    With a flush interval, counts are buffered in memory and added to Valkey with
+    one pipelined ``INCRBY`` batch per interval instead of a round trip per
+    request; the last-call time recorded for a key is then the flush time. Without
+    one, every request is written through as before.
+    """
+
+    _valkey_stat: ValkeyStatClient
+    _flush_interval: float | None
+    _pending: Counter[str]
+
+    def __init__(self, valkey_stat: ValkeyStatClient, *, flush_interval: float | None) -> None:
+        self._valkey_stat = valkey_stat
+        self._flush_interval = flush_interval
+        self._pending = Counter()
+
+    async def record(self, access_key: str) -> None:
+        if self._flush_interval is None:
+            await self._valkey_stat.increment_keypair_query_count(access_key)
+            return
+        self._pending[access_key] += 1
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        counts, self._pending = self._pending, Counter()
+        try:
+            await self._valkey_stat.increment_keypair_query_counts(counts)
+        except Exception:
+            # Keep the counts for the next flush rather than losing them.
+            self._pending.update(counts)
+            raise
+
+    @actxmgr
+    async def run(self) -> AsyncIterator[None]:
+        """Flush periodically while the context is open, and once more on exit."""
+        if self._flush_interval is None:
+            yield
+            return
+        task = asyncio.create_task(self._flush_loop(self._flush_interval))
+        try:
+            yield
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Failed to flush keypair query counts on shutdown")
+
+    async def _flush_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Failed to flush keypair query counts")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Mapping
+from collections.abc import AsyncIterator, Mapping, Sequence
 from contextlib import asynccontextmanager as actxmgr
 from typing import Any
 from urllib.parse import quote
@@ -337,6 +337,30 @@ class StorageProxyManagerFacingClient:
             request_timeout=self._timeout_config.get_quota_scope.to_client_timeout(),
         )
 
+    @storage_proxy_client_resilience.apply()
+    async def get_quota_scopes(
+        self,
+        volume: str,
+        qsids: Sequence[str],
+    ) -> Mapping[str, Any]:
+        """
+        Get the information of multiple quota scopes in a volume at once.
+
+        :param volume: Volume name
+        :param qsids: Quota scope IDs
+        :return: Response containing the information of each quota scope,
+            or null for the quota scopes that do not exist
+        """
+        return await self._client.request_with_response(
+            "GET",
+            "quota-scopes",
+            body={
+                "volume": volume,
+                "qsids": list(qsids),
+            },
+            request_timeout=self._timeout_config.get_quota_scope.to_client_timeout(),
+        )
+
     @storage_proxy_client_resilience.apply()
     async def update_quota_scope(
         self,
@@ -527,6 +527,62 @@ class AuthConfig(BaseConfigSchema):
             example=ConfigExample(local="604800", prod="604800"),
         ),
     ]
+    context_cache_ttl: Annotated[
+        float | None,
+        Field(
+            default=None,
+            gt=0,
+            validation_alias=AliasChoices("context-cache-ttl", "context_cache_ttl"),
+            serialization_alias="context-cache-ttl",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Seconds to cache the resolved user and keypair of an access key in each "
+                "manager process. Changes to users, keypairs and resource policies invalidate "
+                "the cache through broadcast events; the TTL bounds how long a missed event "
+                "can leave a stale entry. Leave as None to query the database on every request."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="", prod="30.0"),
+        ),
+    ]
+    context_cache_max_size: Annotated[
+        int,
+        Field(
+            default=10000,
+            ge=1,
+            validation_alias=AliasChoices("context-cache-max-size", "context_cache_max_size"),
+            serialization_alias="context-cache-max-size",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of access keys kept in the authentication context cache. "
+                "The least recently used entries are evicted first."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="10000", prod="10000"),
+        ),
+    ]
+    query_count_flush_interval: Annotated[
+        float | None,
+        Field(
+            default=None,
+            gt=0,
+            validation_alias=AliasChoices(
+                "query-count-flush-interval", "query_count_flush_interval"
+            ),
+            serialization_alias="query-count-flush-interval",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Seconds between batched writes of per-keypair API query counts to Redis. "
+                "When set, counts are buffered in memory and the recorded last-call time "
+                "may lag by up to this interval. Leave as None to write on every request."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="", prod="1.0"),
+        ),
+    ]
 
 
 class RBACConfig(BaseConfigSchema):
@@ -1241,6 +1297,93 @@ class ManagerConfig(BaseConfigSchema):
             example=ConfigExample(local="", prod="9090"),
         ),
     ]
+    scheduling_snapshot_reconcile_interval: Annotated[
+        float | None,
+        Field(
+            default=None,
+            gt=0,
+            validation_alias=AliasChoices(
+                "scheduling-snapshot-reconcile-interval",
+                "scheduling_snapshot_reconcile_interval",
+            ),
+            serialization_alias="scheduling-snapshot-reconcile-interval",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Interval in seconds for verifying the in-memory scheduling occupancy snapshot "
+                "against the database. When set, scheduling ticks read global occupancy from "
+                "a snapshot kept current by session and kernel lifecycle events instead of "
+                "scanning all live allocations every tick. Leave as None to scan every tick."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="", prod="60.0"),
+        ),
+    ]
+    event_dispatch_max_pending: Annotated[
+        int | None,
+        Field(
+            default=None,
+            ge=1,
+            validation_alias=AliasChoices(
+                "event-dispatch-max-pending",
+                "event_dispatch_max_pending",
+            ),
+            serialization_alias="event-dispatch-max-pending",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of event handler runs the event dispatcher keeps in flight, "
+                "also used as the read-ahead limit of the event stream consumer. When the "
+                "limit is reached, further events stay in Redis until handlers catch up. "
+                "Leave as None to dispatch and prefetch without bound."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="", prod="512"),
+        ),
+    ]
+    kernel_lifecycle_event_concurrency: Annotated[
+        int,
+        Field(
+            default=64,
+            ge=1,
+            validation_alias=AliasChoices(
+                "kernel-lifecycle-event-concurrency",
+                "kernel_lifecycle_event_concurrency",
+            ),
+            serialization_alias="kernel-lifecycle-event-concurrency",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of kernel lifecycle event handlers run concurrently. Events "
+                "of the same session are always handled in the order they were sent, while "
+                "different sessions proceed in parallel up to this limit."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="64", prod="64"),
+        ),
+    ]
+    event_ack_flush_interval: Annotated[
+        float | None,
+        Field(
+            default=None,
+            gt=0,
+            validation_alias=AliasChoices(
+                "event-ack-flush-interval",
+                "event_ack_flush_interval",
+            ),
+            serialization_alias="event-ack-flush-interval",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum delay in seconds before acknowledgments of handled events are sent "
+                "to Redis. When set, acknowledgments are batched into a single XACK per "
+                "stream instead of one round trip per event, and pending ones are flushed "
+                "on shutdown. Leave as None to acknowledge each event immediately."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="", prod="0.05"),
+        ),
+    ]
     rbac: Annotated[
         RBACConfig,
         Field(default_factory=RBACConfig),
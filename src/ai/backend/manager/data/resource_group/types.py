@@ -13,6 +13,7 @@ from pydantic import ConfigDict, Field, field_serializer, field_validator
 from ai.backend.common.data.entity.resource_group import ResourceGroupID
 from ai.backend.common.data.entity.types import EntityData
 from ai.backend.common.types import (
+    AgentPlacementEngine,
     AgentSelectionStrategy,
     BackendAISchema,
     PreemptionMode,
@@ -95,6 +96,7 @@ class ResourceGroupSchedulerOptions:
     allow_fractional_resource_fragmentation: bool
     route_cleanup_target_statuses: list[str]
     preemption: PreemptionConfig = dataclasses.field(default_factory=PreemptionConfig)
+    agent_placement_engine: AgentPlacementEngine = AgentPlacementEngine.TRACKER
 
     def to_json(self) -> dict[str, Any]:
         """Convert scheduler options to JSON-serializable dict."""
@@ -104,6 +106,7 @@ class ResourceGroupSchedulerOptions:
             "config": dict(self.config),
             "agent_selection_strategy": self.agent_selection_strategy.value,
             "agent_selector_config": dict(self.agent_selector_config),
+            "agent_placement_engine": self.agent_placement_engine.value,
             "allow_fractional_resource_fragmentation": self.allow_fractional_resource_fragmentation,
             "route_cleanup_target_statuses": self.route_cleanup_target_statuses,
             "preemption": {
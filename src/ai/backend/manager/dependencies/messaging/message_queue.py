@@ -61,6 +61,8 @@ class MessageQueueDependency(
             group_name=EVENT_DISPATCHER_CONSUMER_GROUP,
             node_id=node_id,
             db=REDIS_STREAM_DB,
+            consume_prefetch_limit=config.manager.event_dispatch_max_pending or 0,
+            consume_ack_flush_interval=config.manager.event_ack_flush_interval,
         )
         queue = await RedisQueue.create(
             stream_redis_target,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import override
+from typing import Any, override
 
 from ai.backend.common.bgtask.bgtask import BackgroundTaskManager
 from ai.backend.common.clients.valkey_client.valkey_artifact.client import (
@@ -87,6 +87,10 @@ from ai.backend.manager.actions.validators.rbac.single_entity import (
     SingleEntityActionRBACValidator,
 )
 from ai.backend.manager.agent_cache import AgentRPCCache
+from ai.backend.manager.api.rest.middleware.auth_cache import (
+    AuthContextCache,
+    AuthTableWriteWatcher,
+)
 from ai.backend.manager.clients.agent.pool import AgentClientPool
 from ai.backend.manager.clients.appproxy.client import AppProxyClientPool
 from ai.backend.manager.clients.prometheus.client import PrometheusClient
@@ -194,6 +198,7 @@ class ProcessingResources:
     event_dispatcher: EventDispatcher
     processors: Processors
     stream_cleanup_handler: StreamCleanupEventHandler
+    auth_context_cache: AuthContextCache[Any] | None
 
 
 def _make_registered_reporters(
@@ -263,6 +268,9 @@ class ProcessingComposer(DependencyComposer[ProcessingInput, ProcessingResources
                 message_queue=setup_input.message_queue,
                 log_events=setup_input.log_events,
                 event_observer=setup_input.event_observer,
+                max_pending_handlers=(
+                    setup_input.config_provider.config.manager.event_dispatch_max_pending
+                ),
             ),
         )
 
@@ -388,6 +396,13 @@ class ProcessingComposer(DependencyComposer[ProcessingInput, ProcessingResources
         )
 
         # Step 3: Register Dispatchers and start EventDispatcher
+        auth_config = setup_input.config_provider.config.auth
+        auth_context_cache: AuthContextCache[Any] | None = None
+        if auth_config.context_cache_ttl is not None:
+            auth_context_cache = AuthContextCache(
+                ttl=auth_config.context_cache_ttl,
+                max_size=auth_config.context_cache_max_size,
+            )
         dispatchers = Dispatchers(
             DispatcherArgs(
                 valkey_container_log=setup_input.valkey_container_log,
@@ -411,6 +426,7 @@ class ProcessingComposer(DependencyComposer[ProcessingInput, ProcessingResources
                 storage_manager=setup_input.storage_manager,
                 config_provider=setup_input.config_provider,
                 event_producer=setup_input.event_producer,
+                auth_context_cache=auth_context_cache,
             )
         )
         dispatchers.dispatch(event_dispatcher)
@@ -457,8 +473,17 @@ class ProcessingComposer(DependencyComposer[ProcessingInput, ProcessingResources
             ),
         )
 
-        yield ProcessingResources(
+        resources = ProcessingResources(
             event_dispatcher=event_dispatcher,
             processors=processors,
             stream_cleanup_handler=dispatchers.stream_cleanup_handler,
+            auth_context_cache=auth_context_cache,
+        )
+        if auth_context_cache is None:
+            yield resources
+            return
+        auth_table_watcher = AuthTableWriteWatcher(
+            setup_input.db, setup_input.event_producer, auth_context_cache
         )
+        async with auth_table_watcher.run():
+            yield resources
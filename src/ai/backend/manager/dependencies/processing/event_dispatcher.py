@@ -17,6 +17,7 @@ class EventDispatcherInput:
     message_queue: AbstractMessageQueue
     log_events: bool
     event_observer: EventObserver | None
+    max_pending_handlers: int | None = None
 
 
 class EventDispatcherDependency(
@@ -40,6 +41,7 @@ class EventDispatcherDependency(
             setup_input.message_queue,
             log_events=setup_input.log_events,
             event_observer=setup_input.event_observer,
+            max_pending_handlers=setup_input.max_pending_handlers,
         )
         try:
             yield dispatcher
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from ai.backend.common.clients.valkey_client.valkey_container_log.client import (
     ValkeyContainerLogClient,
@@ -10,8 +11,10 @@ from ai.backend.common.clients.valkey_client.valkey_stream.client import ValkeyS
 from ai.backend.common.etcd import AsyncEtcd
 from ai.backend.common.events.dispatcher import (
     CoalescingOptions,
+    ConcurrencyOptions,
     EventDispatcher,
     EventProducer,
+    HandlerConcurrencyLimiter,
 )
 from ai.backend.common.events.event_types.agent.anycast import (
     AgentErrorEvent,
@@ -30,6 +33,9 @@ from ai.backend.common.events.event_types.artifact.anycast import (
 from ai.backend.common.events.event_types.artifact_registry.anycast import (
     DoScanReservoirRegistryEvent,
 )
+from ai.backend.common.events.event_types.auth.broadcast import (
+    AuthContextInvalidatedBroadcastEvent,
+)
 from ai.backend.common.events.event_types.bgtask.broadcast import (
     BgtaskCancelledEvent,
     BgtaskDoneEvent,
@@ -112,6 +118,7 @@ from ai.backend.common.events.event_types.vfolder.anycast import (
 )
 from ai.backend.common.events.hub.hub import EventHub
 from ai.backend.common.plugin.event import EventDispatcherPluginContext
+from ai.backend.manager.api.rest.middleware.auth_cache import AuthContextCache
 from ai.backend.manager.clients.storage_proxy.session_manager import StorageSessionManager
 from ai.backend.manager.config.provider import ManagerConfigProvider
 from ai.backend.manager.event_dispatcher.handlers.artifact import ArtifactEventHandler
@@ -133,10 +140,12 @@ from ai.backend.manager.sokovan.scheduler.coordinator import ScheduleCoordinator
 from ai.backend.manager.sokovan.scheduling_controller import SchedulingController
 
 from .handlers.agent import AgentEventHandler
+from .handlers.auth import AuthEventHandler
 from .handlers.idle_check import IdleCheckEventHandler
 from .handlers.image import ImageEventHandler
 from .handlers.kernel import KernelEventHandler
 from .handlers.notification import NotificationEventHandler
+from .handlers.scheduling_snapshot import SchedulingSnapshotEventHandler
 from .handlers.service_catalog import ServiceCatalogEventHandler
 from .handlers.session import SessionEventHandler
 from .handlers.stream_cleanup import StreamCleanupEventHandler
@@ -167,6 +176,7 @@ class DispatcherArgs:
     storage_manager: StorageSessionManager
     config_provider: ManagerConfigProvider
     event_producer: EventProducer
+    auth_context_cache: AuthContextCache[Any] | None = None
 
 
 class Dispatchers:
@@ -183,6 +193,9 @@ class Dispatchers:
     _artifact_event_handler: ArtifactEventHandler
     _artifact_registry_event_handler: ArtifactRegistryEventHandler
     _service_catalog_event_handler: ServiceCatalogEventHandler
+    _scheduling_snapshot_handler: SchedulingSnapshotEventHandler
+    _auth_event_handler: AuthEventHandler | None
+    _kernel_lifecycle_event_concurrency: int
     stream_cleanup_handler: StreamCleanupEventHandler
 
     def __init__(self, args: DispatcherArgs) -> None:
@@ -244,6 +257,17 @@ class Dispatchers:
             args.config_provider,
         )
         self._service_catalog_event_handler = ServiceCatalogEventHandler(args.db)
+        self._scheduling_snapshot_handler = SchedulingSnapshotEventHandler(
+            args.scheduler_repository
+        )
+        self._auth_event_handler = (
+            AuthEventHandler(args.auth_context_cache)
+            if args.auth_context_cache is not None
+            else None
+        )
+        self._kernel_lifecycle_event_concurrency = (
+            args.config_provider.config.manager.kernel_lifecycle_event_concurrency
+        )
         self.stream_cleanup_handler = StreamCleanupEventHandler(args.db)
 
     def dispatch(self, event_dispatcher: EventDispatcher) -> None:
@@ -264,6 +288,8 @@ class Dispatchers:
         self._dispatch_service_catalog_events(event_dispatcher)
         self._dispatch_session_broadcast_propagation(event_dispatcher)
         self._dispatch_stream_cleanup_events(event_dispatcher)
+        self._dispatch_scheduling_snapshot_events(event_dispatcher)
+        self._dispatch_auth_events(event_dispatcher)
 
     def _dispatch_bgtask_events(
         self,
@@ -348,48 +374,61 @@ class Dispatchers:
             name="api.session.syncklog",
         )
 
+        # Lifecycle events of one session are handled in the order they were sent,
+        # while different sessions proceed in parallel.
+        kernel_lifecycle_opts: ConcurrencyOptions = {
+            "limiter": HandlerConcurrencyLimiter(self._kernel_lifecycle_event_concurrency),
+            "ordering_key": lambda event: event.session_id,
+        }
         evd = event_dispatcher.with_reporters([EventLogger(self._db)])
         evd.consume(
             KernelPreparingAnycastEvent,
             None,
             self._kernel_event_handler.handle_kernel_preparing,
             name="api.session.kprep",
+            concurrency_opts=kernel_lifecycle_opts,
         )
         evd.consume(
             KernelPullingAnycastEvent,
             None,
             self._kernel_event_handler.handle_kernel_pulling,
             name="api.session.kpull",
+            concurrency_opts=kernel_lifecycle_opts,
         )
         evd.consume(
             KernelCreatingAnycastEvent,
             None,
             self._kernel_event_handler.handle_kernel_creating,
             name="api.session.kcreat",
+            concurrency_opts=kernel_lifecycle_opts,
         )
         evd.consume(
             KernelStartedAnycastEvent,
             None,
             self._kernel_event_handler.handle_kernel_started,
             name="api.session.kstart",
+            concurrency_opts=kernel_lifecycle_opts,
         )
         evd.consume(
             KernelCancelledAnycastEvent,
             None,
             self._kernel_event_handler.handle_kernel_cancelled,
             name="api.session.kstart",
+            concurrency_opts=kernel_lifecycle_opts,
         )
         evd.consume(
             KernelTerminatingAnycastEvent,
             None,
             self._kernel_event_handler.handle_kernel_terminating,
             name="api.session.kterming",
+            concurrency_opts=kernel_lifecycle_opts,
         )
         evd.consume(
             KernelTerminatedAnycastEvent,
             None,
             self._kernel_event_handler.handle_kernel_terminated,
             name="api.session.kterm",
+            concurrency_opts=kernel_lifecycle_opts,
         )
 
     def _dispatch_schedule_events(self, event_dispatcher: EventDispatcher) -> None:
@@ -683,3 +722,32 @@ class Dispatchers:
             None,
             self.stream_cleanup_handler.handle_kernel_terminating_broadcast,
         )
+
+    def _dispatch_scheduling_snapshot_events(
+        self,
+        event_dispatcher: EventDispatcher,
+    ) -> None:
+        """Subscribe to occupancy-changing broadcasts so every manager's
+        in-memory scheduling snapshot re-reads the affected sessions."""
+        kernel_handler = self._scheduling_snapshot_handler.handle_kernel_lifecycle
+        session_handler = self._scheduling_snapshot_handler.handle_session_lifecycle
+        event_dispatcher.subscribe(KernelStartedBroadcastEvent, None, kernel_handler)
+        event_dispatcher.subscribe(KernelCancelledBroadcastEvent, None, kernel_handler)
+        event_dispatcher.subscribe(KernelTerminatingBroadcastEvent, None, kernel_handler)
+        event_dispatcher.subscribe(KernelTerminatedBroadcastEvent, None, kernel_handler)
+        event_dispatcher.subscribe(SchedulingBroadcastEvent, None, session_handler)
+        event_dispatcher.subscribe(SessionCancelledBroadcastEvent, None, session_handler)
+        event_dispatcher.subscribe(SessionTerminatedBroadcastEvent, None, session_handler)
+
+    def _dispatch_auth_events(
+        self,
+        event_dispatcher: EventDispatcher,
+    ) -> None:
+        """Subscribe to auth-context invalidations when this manager caches them."""
+        if self._auth_event_handler is None:
+            return
+        event_dispatcher.subscribe(
+            AuthContextInvalidatedBroadcastEvent,
+            None,
+            self._auth_event_handler.handle_auth_context_invalidated,
+        )
@@ -0,0 +1,24 @@
+from typing import Any
+
+from ai.backend.common.events.event_types.auth.broadcast import (
+    AuthContextInvalidatedBroadcastEvent,
+)
+from ai.backend.common.types import AgentId
+from ai.backend.manager.api.rest.middleware.auth_cache import AuthContextCache
+
+
+class AuthEventHandler:
+    """Drops this manager's cached auth contexts when access may have been revoked."""
+
+    _auth_context_cache: AuthContextCache[Any]
+
+    def __init__(self, auth_context_cache: AuthContextCache[Any]) -> None:
+        self._auth_context_cache = auth_context_cache
+
+    async def handle_auth_context_invalidated(
+        self,
+        _context: None,
+        _source: AgentId,
+        event: AuthContextInvalidatedBroadcastEvent,
+    ) -> None:
+        self._auth_context_cache.clear()
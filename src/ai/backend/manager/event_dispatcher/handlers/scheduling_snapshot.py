@@ -0,0 +1,36 @@
+from ai.backend.common.events.event_types.kernel.broadcast import (
+    KernelLifecycleEvent,
+    KernelTerminationEvent,
+)
+from ai.backend.common.events.event_types.session.broadcast import (
+    BaseSessionEvent,
+    SchedulingBroadcastEvent,
+)
+from ai.backend.common.types import AgentId
+from ai.backend.manager.repositories.scheduler.repository import SchedulerRepository
+
+
+class SchedulingSnapshotEventHandler:
+    """Feeds session/kernel lifecycle broadcasts into the scheduler's
+    in-memory occupancy snapshot as staleness hints."""
+
+    _scheduler_repository: SchedulerRepository
+
+    def __init__(self, scheduler_repository: SchedulerRepository) -> None:
+        self._scheduler_repository = scheduler_repository
+
+    async def handle_kernel_lifecycle(
+        self,
+        _context: None,
+        _source: AgentId,
+        event: KernelLifecycleEvent | KernelTerminationEvent,
+    ) -> None:
+        self._scheduler_repository.mark_occupancy_stale([event.session_id])
+
+    async def handle_session_lifecycle(
+        self,
+        _context: None,
+        _source: AgentId,
+        event: BaseSessionEvent | SchedulingBroadcastEvent,
+    ) -> None:
+        self._scheduler_repository.mark_occupancy_stale([event.session_id])
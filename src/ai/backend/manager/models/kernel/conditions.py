@@ -171,6 +171,18 @@ class KernelConditions:
 
         return inner
 
+    @staticmethod
+    def for_image_prefetch(resource_group_id: ResourceGroupID) -> QueryCondition:
+        """Filter pending kernels of the resource group whose images may be prefetched."""
+
+        def inner() -> sa.sql.expression.ColumnElement[bool]:
+            return sa.and_(
+                KernelRow.resource_group_id == resource_group_id,
+                KernelRow.status == KernelStatus.PENDING,
+            )
+
+        return inner
+
     @staticmethod
     def for_fair_share_observation(
         resource_group_id: ResourceGroupID,
@@ -35,6 +35,7 @@ from ai.backend.common.data.entity.resource_group import ResourceGroupID
 from ai.backend.common.data.entity.types import ScopeID
 from ai.backend.common.schema.resource_group import PreemptionConfig
 from ai.backend.common.types import (
+    AgentPlacementEngine,
     AgentSelectionStrategy,
     BackendAISchema,
     SessionTypes,
@@ -101,6 +102,9 @@ class ResourceGroupOpts(BackendAISchema):
     # but agent selector configuration is stored as a part of the scheduler_opts column.
     agent_selection_strategy: AgentSelectionStrategy = AgentSelectionStrategy.DISPERSED
     agent_selector_config: dict[str, Any] = Field(default_factory=dict)
+    agent_placement_engine: AgentPlacementEngine = AgentPlacementEngine.TRACKER
+    """How agent selection evaluates slot state; ``matrix`` keeps a fixed-point agents x slots
+    matrix instead of per-agent Decimal dicts (same placements, cheaper on large groups)."""
 
     enforce_spreading_endpoint_replica: bool = False
     """Deprecated: replaced by the replica group's SessionGroup placement policy (BEP-1064).
@@ -133,6 +137,10 @@ class ResourceGroupOpts(BackendAISchema):
     def serialize_agent_selection_strategy(self, value: AgentSelectionStrategy) -> str:
         return value.value
 
+    @field_serializer("agent_placement_engine", mode="plain")
+    def serialize_agent_placement_engine(self, value: AgentPlacementEngine) -> str:
+        return value.value
+
 
 # When scheduling, we take the union of allowed scaling groups for
 # each domain, group, and keypair.
@@ -374,6 +382,7 @@ class ResourceGroupRow(CreatedAtMixin, Base):
                         preemption_min_runtime=self.scheduler_opts.preemption.preemption_min_runtime,
                         victim_scope=self.scheduler_opts.preemption.victim_scope,
                     ),
+                    agent_placement_engine=self.scheduler_opts.agent_placement_engine,
                 ),
             ),
             fair_share_spec=self.fair_share_spec or FairShareResourceGroupSpec(),
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -193,7 +193,7 @@ from ai.backend.manager.views.sokovan.workload import (
     WorkloadOwner,
 )
 
-from .types import KeypairConcurrencyData
+from .types import KeypairConcurrencyData, OccupancyChecksum, SessionOccupancyEntry
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 
@@ -267,13 +267,18 @@ class ScheduleDBSource:
         self._db = db
 
     async def fetch_scheduling_fetch(
-        self, resource_group_id: ResourceGroupID
+        self,
+        resource_group_id: ResourceGroupID,
+        *,
+        include_occupancy: bool = True,
     ) -> SchedulingFetch | None:
         """
         Batch-fetch the DB-side sources of one scheduling run in a single
         session; ``None`` when the group has no pending sessions. The
         repository composes the result with the Valkey retry hints and
-        the configured agent limit.
+        the configured agent limit. With ``include_occupancy=False`` the
+        global occupancy scan is skipped and ``occupancy`` is left ``None``
+        for the repository to fill from its in-memory snapshot store.
         Raises ScalingGroupNotFound if the resource group doesn't exist.
         """
         async with self._db.begin_readonly_session_read_committed() as db_sess:
@@ -287,7 +292,11 @@ class ScheduleDBSource:
 
             # 3. Fetch the remaining observations bounded by the pending owners
             agents = await self._fetch_agents(db_sess, resource_group.meta.id)
-            occupancy = await self._fetch_global_occupancy(db_sess, pending_sessions)
+            occupancy = (
+                await self._fetch_global_occupancy(db_sess, pending_sessions)
+                if include_occupancy
+                else None
+            )
             known_slot_types = await self._fetch_known_slot_types(db_sess)
             resource_policy = await self._fetch_resource_limits(
                 db_sess,
@@ -402,6 +411,7 @@ class ScheduleDBSource:
                 scheduler=rg_row.scheduler,
                 agent_selection_strategy=rg_row.scheduler_opts.agent_selection_strategy,
                 preemption_order=rg_row.scheduler_opts.preemption.order,
+                agent_placement_engine=rg_row.scheduler_opts.agent_placement_engine,
             ),
             preemption=rg_row.scheduler_opts.preemption,
         )
@@ -813,6 +823,153 @@ class ScheduleDBSource:
             by_domain={did: ResourceAllocation(slots=acc) for did, acc in _domain_accum.items()},
         )
 
+    async def fetch_global_occupancy(
+        self, pending_sessions: PendingSessions
+    ) -> ResourceOccupancySnapshot:
+        """Fetch cluster-wide occupancy for the owners of pending sessions in
+        its own session; see :meth:`_fetch_global_occupancy`."""
+        async with self._db.begin_readonly_session_read_committed() as db_sess:
+            return await self._fetch_global_occupancy(db_sess, pending_sessions)
+
+    async def fetch_session_occupancies(
+        self, session_ids: Collection[SessionId] | None = None
+    ) -> list[SessionOccupancyEntry]:
+        """Fetch the global occupancy contributed by individual sessions.
+
+        Uses the same live-allocation criteria as
+        :meth:`_fetch_global_occupancy`, grouped per session instead of per
+        owner scope, so an in-memory copy can be patched one session at a
+        time. ``None`` loads every session that occupies anything (the
+        seed); otherwise only the given sessions are returned, and a
+        requested session missing from the result no longer occupies
+        anything.
+        """
+        ra = ResourceAllocationRow.__table__
+        k = KernelRow.__table__
+        s = SessionRow.__table__
+        all_resource_statuses = (
+            KernelStatus.resource_occupied_statuses() | KernelStatus.resource_requested_statuses()
+        )
+        slot_stmt = (
+            sa.select(
+                k.c.session_id,
+                s.c.user_uuid,
+                s.c.group_id,
+                s.c.domain_id,
+                ra.c.slot_name,
+                sa.func.coalesce(sa.func.sum(ra.c.requested).filter(ra.c.used.is_(None)), 0).label(
+                    "requested"
+                ),
+                sa.func.coalesce(sa.func.sum(ra.c.used).filter(ra.c.used.is_not(None)), 0).label(
+                    "used"
+                ),
+                sa.func.count().label("row_count"),
+            )
+            .select_from(ra.join(k, ra.c.kernel_id == k.c.id).join(s, k.c.session_id == s.c.id))
+            .where(
+                k.c.status.in_(all_resource_statuses),
+                ra.c.free_at.is_(None),
+                k.c.session_type.not_in(SessionTypes.private_types()),
+            )
+            .group_by(k.c.session_id, s.c.user_uuid, s.c.group_id, s.c.domain_id, ra.c.slot_name)
+        )
+        count_stmt = sa.select(
+            s.c.id,
+            s.c.user_uuid,
+            s.c.group_id,
+            s.c.domain_id,
+            s.c.session_type,
+        ).where(s.c.status.in_(SessionStatus.resource_occupied_statuses()))
+        if session_ids is not None:
+            if not session_ids:
+                return []
+            slot_stmt = slot_stmt.where(k.c.session_id.in_(session_ids))
+            count_stmt = count_stmt.where(s.c.id.in_(session_ids))
+
+        async with self._db.begin_readonly_session_read_committed() as db_sess:
+            slot_rows = (await db_sess.execute(slot_stmt)).all()
+            count_rows = (await db_sess.execute(count_stmt)).all()
+
+        owners: dict[SessionId, tuple[UserID, ProjectID, DomainID]] = {}
+        slots: dict[SessionId, dict[ResourceSlotName, SlotAllocation]] = defaultdict(dict)
+        row_counts: dict[SessionId, int] = defaultdict(int)
+        for row in slot_rows:
+            session_id = SessionId(row.session_id)
+            owners[session_id] = (
+                UserID(row.user_uuid),
+                ProjectID(row.group_id),
+                DomainID(row.domain_id),
+            )
+            slots[session_id][ResourceSlotName(row.slot_name)] = SlotAllocation(
+                requested=row.requested, used=row.used
+            )
+            row_counts[session_id] += row.row_count
+        private_by_session: dict[SessionId, bool] = {}
+        for row in count_rows:
+            session_id = SessionId(row.id)
+            owners[session_id] = (
+                UserID(row.user_uuid),
+                ProjectID(row.group_id),
+                DomainID(row.domain_id),
+            )
+            private_by_session[session_id] = row.session_type in SessionTypes.private_types()
+
+        return [
+            SessionOccupancyEntry(
+                session_id=session_id,
+                user_id=user_id,
+                project_id=project_id,
+                domain_id=domain_id,
+                slots=slots.get(session_id, {}),
+                allocation_row_count=row_counts.get(session_id, 0),
+                counts_session=session_id in private_by_session,
+                is_private=private_by_session.get(session_id, False),
+            )
+            for session_id, (user_id, project_id, domain_id) in owners.items()
+        ]
+
+    async def fetch_occupancy_checksum(self) -> OccupancyChecksum:
+        """Fetch the cluster-wide totals of the rows :meth:`fetch_session_occupancies`
+        aggregates, cheap enough to verify an in-memory copy periodically."""
+        ra = ResourceAllocationRow.__table__
+        k = KernelRow.__table__
+        all_resource_statuses = (
+            KernelStatus.resource_occupied_statuses() | KernelStatus.resource_requested_statuses()
+        )
+        async with self._db.begin_readonly_session_read_committed() as db_sess:
+            totals = (
+                await db_sess.execute(
+                    sa.select(
+                        sa.func.count().label("row_count"),
+                        sa.func.coalesce(
+                            sa.func.sum(ra.c.requested).filter(ra.c.used.is_(None)), 0
+                        ).label("requested"),
+                        sa.func.coalesce(
+                            sa.func.sum(ra.c.used).filter(ra.c.used.is_not(None)), 0
+                        ).label("used"),
+                    )
+                    .select_from(ra.join(k, ra.c.kernel_id == k.c.id))
+                    .where(
+                        k.c.status.in_(all_resource_statuses),
+                        ra.c.free_at.is_(None),
+                        k.c.session_type.not_in(SessionTypes.private_types()),
+                    )
+                )
+            ).one()
+            session_count = (
+                await db_sess.execute(
+                    sa.select(sa.func.count())
+                    .select_from(SessionRow)
+                    .where(SessionRow.status.in_(SessionStatus.resource_occupied_statuses()))
+                )
+            ).scalar_one()
+        return OccupancyChecksum(
+            allocation_row_count=totals.row_count,
+            requested=Decimal(totals.requested),
+            used=Decimal(totals.used),
+            session_count=session_count,
+        )
+
     async def _fetch_resource_limits(
         self,
         db_sess: SASession,
@@ -2414,24 +2571,32 @@ class ScheduleDBSource:
         status is NOT changed here — the coordinator transitions the returned
         sessions to SCHEDULED.
 
+        The batch is written with a fixed number of set-based statements
+        regardless of its size: one ``UPDATE ... FROM (VALUES ...)`` promotes
+        every kernel, one statement reserves the summed slots per agent, and
+        one stamps the allocation rows.
+
         Returns the ids of the sessions that were actually allocated. If a
         reservation loses a capacity race (rare: the in-memory selector already
         filtered on capacity), the whole batch transaction is rolled back and an
         empty list is returned; the sessions stay PENDING and are retried next
         tick.
         """
-        scheduled_session_ids: list[SessionId] = []
+        if not allocations:
+            return []
         try:
             async with self._db.begin_session_read_committed() as db_sess:
                 now = await self._get_db_now_in_session(db_sess)
-                for allocation in allocations:
-                    await self._allocate_single_session(db_sess, allocation, now)
-                    scheduled_session_ids.append(allocation.session_id)
+                promoted = await self._promote_pending_kernels(
+                    db_sess, allocations, KernelStatus.SCHEDULED, "scheduled", now
+                )
+                await self._reserve_kernel_resources(db_sess, promoted)
+                await self._assign_session_agents(db_sess, allocations)
         except AgentResourceCapacityExceeded as e:
             log.warning("Allocation batch rolled back on capacity gate: {}", e)
             return []
 
-        return scheduled_session_ids
+        return [allocation.session_id for allocation in allocations]
 
     async def reserve_sessions(self, allocations: list[SessionAllocation]) -> list[SessionId]:
         """Prereserve the sessions backed by a preemption plan.
@@ -2443,122 +2608,105 @@ class ScheduleDBSource:
         returned sessions RESERVED. A failed capacity gate rolls the whole
         batch back and the sessions stay PENDING for the next tick.
         """
-        reserved_session_ids: list[SessionId] = []
+        if not allocations:
+            return []
         try:
             async with self._db.begin_session_read_committed() as db_sess:
                 now = await self._get_db_now_in_session(db_sess)
-                for allocation in allocations:
-                    await self._reserve_single_session(db_sess, allocation, now)
-                    reserved_session_ids.append(allocation.session_id)
+                promoted = await self._promote_pending_kernels(
+                    db_sess, allocations, KernelStatus.RESERVED, "reserved", now
+                )
+                await self._prereserve_kernel_resources(db_sess, promoted)
+                await self._assign_session_agents(db_sess, allocations)
         except AgentResourceCapacityExceeded as e:
             log.warning("Reservation batch rolled back on capacity gate: {}", e)
             return []
 
-        return reserved_session_ids
+        return [allocation.session_id for allocation in allocations]
 
-    async def _reserve_single_session(
+    async def _promote_pending_kernels(
         self,
         db_sess: SASession,
-        allocation: SessionAllocation,
+        allocations: Sequence[SessionAllocation],
+        status: KernelStatus,
+        status_info: str,
         now: datetime,
-    ) -> None:
-        """Prereserve and assign each kernel of a session to its chosen agent.
+    ) -> dict[KernelId, AgentId]:
+        """Advance every PENDING kernel of the batch to ``status`` and bind it
+        to its chosen agent in a single ``UPDATE kernels ... FROM (VALUES ...)``.
 
-        The PENDING -> RESERVED update doubles as the idempotency gate,
-        exactly like :meth:`_allocate_single_session`.
+        The ``status = PENDING`` predicate doubles as the idempotency gate: a
+        kernel already promoted on a previous pass does not match, is not
+        returned, and so never reserves its slots twice. Order is safe because
+        the whole batch is one transaction — a failed capacity gate afterwards
+        rolls the promotion back along with everything else.
+
+        Returns the kernels this pass promoted, mapped to their agents.
         """
-        for kernel_alloc in allocation.kernel_allocations:
-            promoted = await db_sess.execute(
-                sa.update(KernelRow)
+        kernel_allocs = [
+            kernel_alloc
+            for allocation in allocations
+            for kernel_alloc in allocation.kernel_allocations
+        ]
+        if not kernel_allocs:
+            return {}
+        k = KernelRow.__table__
+        bindings = sa.values(
+            sa.column("kernel_id", k.c.id.type),
+            sa.column("agent_id", sa.String),
+            sa.column("agent_addr", sa.String),
+            name="kernel_bindings",
+        ).data([
+            (kernel_alloc.kernel_id, kernel_alloc.agent_id, kernel_alloc.agent_addr)
+            for kernel_alloc in kernel_allocs
+        ])
+        promoted_rows = (
+            await db_sess.execute(
+                sa.update(k)
                 .where(
-                    sa.and_(
-                        KernelRow.id == kernel_alloc.kernel_id,
-                        KernelRow.status == KernelStatus.PENDING,
-                    )
+                    k.c.id == bindings.c.kernel_id,
+                    k.c.status == KernelStatus.PENDING,
                 )
                 .values(
-                    status=KernelStatus.RESERVED,
-                    status_info="reserved",
+                    status=status,
+                    status_info=status_info,
                     status_data={},
                     status_changed=now,
                     status_history=sql_json_merge(
-                        KernelRow.__table__.c.status_history,
+                        k.c.status_history,
                         (),
-                        {KernelStatus.RESERVED.name: now.isoformat()},
+                        {status.name: now.isoformat()},
                     ),
-                    agent=kernel_alloc.agent_id,
-                    agent_addr=kernel_alloc.agent_addr,
+                    agent=bindings.c.agent_id,
+                    agent_addr=bindings.c.agent_addr,
                 )
+                .returning(k.c.id, k.c.agent)
             )
-            if cast(CursorResult[Any], promoted).rowcount == 0:
-                continue
-            await self._prereserve_kernel_resources(
-                db_sess, KernelId(kernel_alloc.kernel_id), kernel_alloc.agent_id
-            )
-
-        await db_sess.execute(
-            sa.update(SessionRow)
-            .where(SessionRow.id == allocation.session_id)
-            .values(agent_ids=allocation.unique_agent_ids())
-        )
+        ).all()
+        return {KernelId(row.id): AgentId(row.agent) for row in promoted_rows}
 
-    async def _allocate_single_session(
+    async def _assign_session_agents(
         self,
         db_sess: SASession,
-        allocation: SessionAllocation,
-        now: datetime,
+        allocations: Sequence[SessionAllocation],
     ) -> None:
-        """Reserve and assign each kernel of a session to its chosen agent.
-
-        Runs in the caller's batch transaction. Per kernel, the PENDING ->
-        SCHEDULED update doubles as the idempotency gate: a matched row (rowcount
-        1) means this pass owns the transition and reserves the kernel's slots; a
-        kernel already SCHEDULED (rowcount 0, reserved on a previous pass) is
-        skipped so the reservation never double-counts. Order is safe because the
-        whole batch is one transaction — a capacity-exceeded reservation rolls
-        back the kernel update along with everything else.
+        """Write ``agent_ids`` on every session of the batch in one executemany.
 
-        Session status is NOT changed here: the coordinator owns session status
-        transitions. Only ``agent_ids`` is written on the session.
-
-        Raises AgentResourceCapacityExceeded if any kernel cannot be reserved;
-        the caller rolls back the whole batch transaction and retries next tick.
+        Resource-assignment metadata only (not status); the resource group
+        columns are already written at enqueue.
         """
-        for kernel_alloc in allocation.kernel_allocations:
-            promoted = await db_sess.execute(
-                sa.update(KernelRow)
-                .where(
-                    sa.and_(
-                        KernelRow.id == kernel_alloc.kernel_id,
-                        KernelRow.status == KernelStatus.PENDING,
-                    )
-                )
-                .values(
-                    status=KernelStatus.SCHEDULED,
-                    status_info="scheduled",
-                    status_data={},
-                    status_changed=now,
-                    status_history=sql_json_merge(
-                        KernelRow.__table__.c.status_history,
-                        (),
-                        {KernelStatus.SCHEDULED.name: now.isoformat()},
-                    ),
-                    agent=kernel_alloc.agent_id,
-                    agent_addr=kernel_alloc.agent_addr,
-                )
-            )
-            if cast(CursorResult[Any], promoted).rowcount == 0:
-                continue
-            await self._reserve_kernel_resources(
-                db_sess, KernelId(kernel_alloc.kernel_id), kernel_alloc.agent_id
-            )
-
-        # Resource-assignment metadata on the session (not status); the
-        # resource group columns are already written at enqueue.
+        sessions = SessionRow.__table__
         await db_sess.execute(
-            sa.update(SessionRow)
-            .where(SessionRow.id == allocation.session_id)
-            .values(agent_ids=allocation.unique_agent_ids())
+            sa.update(sessions)
+            .where(sessions.c.id == sa.bindparam("b_session_id"))
+            .values(agent_ids=sa.bindparam("b_agent_ids")),
+            [
+                {
+                    "b_session_id": allocation.session_id,
+                    "b_agent_ids": allocation.unique_agent_ids(),
+                }
+                for allocation in allocations
+            ],
         )
 
     async def update_kernel_status_pulling(self, kernel_id: UUID, reason: str) -> bool:
@@ -2798,60 +2946,54 @@ class ScheduleDBSource:
     async def _reserve_kernel_resources(
         self,
         db_sess: SASession,
-        kernel_id: KernelId,
-        agent_id: AgentId,
+        promoted: Mapping[KernelId, AgentId],
     ) -> None:
-        """Reserve a kernel's requested slots on its agent (SCHEDULED gate).
+        """Reserve the promoted kernels' requested slots on their agents
+        (SCHEDULED gate).
 
-        Reads the kernel's per-slot ``requested`` from its active
+        Reads each kernel's per-slot ``requested`` from its active
         ``resource_allocations`` rows -- the same source the RUNNING and free
-        paths use -- and, for each slot, atomically increments the agent's
-        ``reserved`` only while ``reserved + used + requested <= capacity`` still
-        holds. A non-matching row (capacity would be exceeded, or the agent has
-        no row for the slot) raises ``AgentResourceCapacityExceeded`` so the
-        caller can roll back the whole session allocation. Slots are visited in
-        a stable order to avoid deadlocks with concurrent releases.
+        paths use -- sums them per ``(agent, slot)`` and increments the agents'
+        ``reserved`` in one set-based statement that only matches while
+        ``reserved + prereserved + used + requested <= capacity`` still holds.
+        The increments are non-negative, so admitting the per-agent sum is
+        equivalent to admitting the kernels one by one. A non-matching pair
+        (capacity would be exceeded, or the agent has no row for the slot)
+        raises ``AgentResourceCapacityExceeded`` so the caller can roll back
+        the whole batch.
         """
-        ar = AgentResourceRow.__table__
+        if not promoted:
+            return
         requested_rows = (
             await db_sess.execute(
-                sa.select(ResourceAllocationRow.slot_name, ResourceAllocationRow.requested)
-                .where(
-                    ResourceAllocationRow.kernel_id == kernel_id,
+                sa.select(
+                    ResourceAllocationRow.kernel_id,
+                    ResourceAllocationRow.slot_name,
+                    ResourceAllocationRow.requested,
+                ).where(
+                    ResourceAllocationRow.kernel_id.in_(list(promoted)),
                     ResourceAllocationRow.free_at.is_(None),
                     ResourceAllocationRow.used_at.is_(None),
                 )
-                .order_by(ResourceAllocationRow.slot_name)
             )
         ).all()
+        demand: dict[tuple[AgentId, str], Decimal] = defaultdict(Decimal)
         for r in requested_rows:
-            new_reserved = ar.c.reserved + r.requested
-            result = await db_sess.execute(
-                sa.update(ar)
-                .where(
-                    ar.c.agent_id == agent_id,
-                    ar.c.slot_name == r.slot_name,
-                    new_reserved + ar.c.prereserved + ar.c.used <= ar.c.capacity,
-                )
-                .values(reserved=new_reserved)
-            )
-            if cast(CursorResult[Any], result).rowcount == 0:
-                raise AgentResourceCapacityExceeded(
-                    f"Agent {agent_id}: capacity exceeded for slot '{r.slot_name}'"
-                )
-        await self._stamp_allocations_reserved(db_sess, kernel_id)
+            demand[(promoted[KernelId(r.kernel_id)], r.slot_name)] += r.requested
+        await self._increment_agent_holds(db_sess, demand, bucket="reserved")
+        await self._stamp_allocations_reserved(db_sess, list(promoted))
 
     async def _prereserve_kernel_resources(
         self,
         db_sess: SASession,
-        kernel_id: KernelId,
-        agent_id: AgentId,
+        promoted: Mapping[KernelId, AgentId],
     ) -> None:
-        """Prereserve a kernel's requested slots ahead of the victims' release.
+        """Prereserve the promoted kernels' requested slots ahead of the
+        victims' release.
 
-        Targets the kernel's allocation rows that never held anything yet
+        Targets the kernels' allocation rows that never held anything yet
         (``prereserved_at``, ``used_at`` and ``free_at`` all unset): stamps
-        ``prereserved_at`` and adds their amounts into the agent's
+        ``prereserved_at`` and adds their summed amounts into each agent's
         ``prereserved`` in one pass. The guard excludes ``used``: the
         victims still hold their allocations, so the future holds may
         transiently overlap them. ``reserved + prereserved + requested <=
@@ -2859,12 +3001,13 @@ class ScheduleDBSource:
         satisfy is rejected, rolling back the stamp with the rest of the
         transaction.
         """
-        ar = AgentResourceRow.__table__
+        if not promoted:
+            return
         stamped_rows = (
             await db_sess.execute(
                 sa.update(ResourceAllocationRow)
                 .where(
-                    ResourceAllocationRow.kernel_id == kernel_id,
+                    ResourceAllocationRow.kernel_id.in_(list(promoted)),
                     ResourceAllocationRow.prereserved_at.is_(None),
                     ResourceAllocationRow.used_at.is_(None),
                     ResourceAllocationRow.free_at.is_(None),
@@ -2873,42 +3016,86 @@ class ScheduleDBSource:
                     prereserved_at=sa.func.now(),
                     prereserved=ResourceAllocationRow.requested,
                 )
-                .returning(ResourceAllocationRow.slot_name, ResourceAllocationRow.prereserved)
+                .returning(
+                    ResourceAllocationRow.kernel_id,
+                    ResourceAllocationRow.slot_name,
+                    ResourceAllocationRow.prereserved,
+                )
             )
         ).all()
-        if not stamped_rows:
+        demand: dict[tuple[AgentId, str], Decimal] = defaultdict(Decimal)
+        for r in stamped_rows:
+            demand[(promoted[KernelId(r.kernel_id)], r.slot_name)] += r.prereserved
+        await self._increment_agent_holds(db_sess, demand, bucket="prereserved")
+
+    async def _increment_agent_holds(
+        self,
+        db_sess: SASession,
+        demand: Mapping[tuple[AgentId, str], Decimal],
+        *,
+        bucket: Literal["reserved", "prereserved"],
+    ) -> None:
+        """Add the per-``(agent, slot)`` amounts into ``agent_resources.<bucket>``
+        with a single ``UPDATE ... FROM (VALUES ...)`` evaluating the capacity
+        gate per row.
+
+        The target rows are locked first in a stable ``(agent_id, slot_name)``
+        order so concurrent batches and releases cannot deadlock on the
+        join's plan-dependent row order. ``used`` only counts against the
+        ``reserved`` bucket (see :meth:`_prereserve_kernel_resources`).
+        Raises ``AgentResourceCapacityExceeded`` naming the first pair the
+        gate rejected.
+        """
+        if not demand:
             return
+        ar = AgentResourceRow.__table__
+        keys = sorted(demand)
+        await db_sess.execute(
+            sa.select(ar.c.agent_id)
+            .where(sa.tuple_(ar.c.agent_id, ar.c.slot_name).in_(keys))
+            .order_by(ar.c.agent_id, ar.c.slot_name)
+            .with_for_update()
+        )
         amounts = sa.values(
+            sa.column("agent_id", sa.String),
             sa.column("slot_name", sa.String),
-            sa.column("requested", sa.Numeric),
-            name="prereserve_amounts",
-        ).data([(row.slot_name, row.prereserved) for row in stamped_rows])
-        result = await db_sess.execute(
-            sa.update(ar)
-            .where(
-                ar.c.agent_id == agent_id,
-                ar.c.slot_name == amounts.c.slot_name,
-                ar.c.reserved + ar.c.prereserved + amounts.c.requested <= ar.c.capacity,
+            sa.column("amount", sa.Numeric),
+            name=f"{bucket}_amounts",
+        ).data([(agent_id, slot_name, demand[agent_id, slot_name]) for agent_id, slot_name in keys])
+        new_hold = ar.c.reserved + ar.c.prereserved + amounts.c.amount
+        if bucket == "reserved":
+            new_hold = new_hold + ar.c.used
+        admitted = (
+            await db_sess.execute(
+                sa.update(ar)
+                .where(
+                    ar.c.agent_id == amounts.c.agent_id,
+                    ar.c.slot_name == amounts.c.slot_name,
+                    new_hold <= ar.c.capacity,
+                )
+                .values({bucket: ar.c[bucket] + amounts.c.amount})
+                .returning(ar.c.agent_id, ar.c.slot_name)
             )
-            .values(prereserved=ar.c.prereserved + amounts.c.requested)
-        )
-        if cast(CursorResult[Any], result).rowcount != len(stamped_rows):
+        ).all()
+        if len(admitted) != len(keys):
+            admitted_keys = {(row.agent_id, row.slot_name) for row in admitted}
+            agent_id, slot_name = next(key for key in keys if key not in admitted_keys)
             raise AgentResourceCapacityExceeded(
-                f"Agent {agent_id}: prereservation exceeds capacity"
+                f"Agent {agent_id}: {bucket} capacity exceeded for slot '{slot_name}'"
             )
 
     async def _stamp_allocations_reserved(
         self,
         db_sess: SASession,
-        kernel_id: KernelId,
+        kernel_ids: Sequence[KernelId],
     ) -> None:
-        """Record the admitted hold on the kernel's active allocation rows:
+        """Record the admitted hold on the kernels' active allocation rows:
         the amount into the row's ``reserved`` bucket and the time into
         ``reserved_at`` (idempotent via the ``reserved_at IS NULL`` guard)."""
         await db_sess.execute(
             sa.update(ResourceAllocationRow)
             .where(
-                ResourceAllocationRow.kernel_id == kernel_id,
+                ResourceAllocationRow.kernel_id.in_(kernel_ids),
                 ResourceAllocationRow.free_at.is_(None),
                 ResourceAllocationRow.used_at.is_(None),
                 ResourceAllocationRow.reserved_at.is_(None),
@@ -1,13 +1,20 @@
 """Types for database source operations."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from decimal import Decimal
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession as SASession
 
+from ai.backend.common.data.entity.domain import DomainID
+from ai.backend.common.data.entity.project import ProjectID
+from ai.backend.common.data.entity.resource_slot import ResourceSlotName
+from ai.backend.common.data.entity.user import UserID
 from ai.backend.common.types import SessionId
 from ai.backend.manager.errors.kernel import SessionNotFound
 from ai.backend.manager.models.session import SessionRow
+from ai.backend.manager.views.sokovan.snapshot import SlotAllocation
 
 
 @dataclass
@@ -18,6 +25,33 @@ class KeypairConcurrencyData:
     sftp_count: int
 
 
+@dataclass(frozen=True)
+class SessionOccupancyEntry:
+    """Global occupancy one session contributes to its owner scopes."""
+
+    session_id: SessionId
+    user_id: UserID
+    project_id: ProjectID
+    domain_id: DomainID
+    # Per-slot totals of the session's live, non-private allocation rows
+    slots: Mapping[ResourceSlotName, SlotAllocation]
+    # Number of allocation rows folded into ``slots`` (checksum input)
+    allocation_row_count: int
+    # Whether the session counts against the user's session caps, and which one
+    counts_session: bool
+    is_private: bool
+
+
+@dataclass(frozen=True)
+class OccupancyChecksum:
+    """Cluster-wide totals used to verify an in-memory occupancy copy."""
+
+    allocation_row_count: int
+    requested: Decimal
+    used: Decimal
+    session_count: int
+
+
 class SessionRowCache:
     """Cache for pre-fetched session rows with lazy loading support."""
 
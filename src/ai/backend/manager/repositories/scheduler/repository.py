@@ -79,6 +79,8 @@ from ai.backend.manager.views.sokovan.workload import SessionWorkload
 
 from .cache_source.cache_source import ScheduleCacheSource
 from .db_source.db_source import ScheduleDBSource
+from .snapshot_store.occupancy import OccupancySnapshotStore
+from .types.session import PendingSessions
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 
@@ -107,6 +109,7 @@ class SchedulerRepository:
     _db: ExtendedAsyncSAEngine
     _db_source: ScheduleDBSource
     _cache_source: ScheduleCacheSource
+    _occupancy_store: OccupancySnapshotStore
     _valkey_schedule: ValkeyScheduleClient
     _config_provider: ManagerConfigProvider
     _storage_manager: StorageSessionManager
@@ -122,6 +125,7 @@ class SchedulerRepository:
         self._db = db
         self._db_source = ScheduleDBSource(db)
         self._cache_source = ScheduleCacheSource(valkey_stat)
+        self._occupancy_store = OccupancySnapshotStore(self._db_source)
         self._valkey_schedule = valkey_schedule
         self._config_provider = config_provider
         self._storage_manager = storage_manager
@@ -137,9 +141,24 @@ class SchedulerRepository:
         fully populated; ``None`` when there is nothing to schedule.
         Raises ScalingGroupNotFound if the resource group doesn't exist.
         """
-        fetch = await self._db_source.fetch_scheduling_fetch(resource_group_id)
+        reconcile_interval = (
+            self._config_provider.config.manager.scheduling_snapshot_reconcile_interval
+        )
+        fetch = await self._db_source.fetch_scheduling_fetch(
+            resource_group_id, include_occupancy=reconcile_interval is None
+        )
         if fetch is None:
             return None
+        if reconcile_interval is not None:
+            occupancy = await self._occupancy_store.snapshot(
+                PendingSessions(fetch.workloads), reconcile_interval=reconcile_interval
+            )
+        elif fetch.occupancy is not None:
+            occupancy = fetch.occupancy
+        else:
+            occupancy = await self._db_source.fetch_global_occupancy(
+                PendingSessions(fetch.workloads)
+            )
         failed_sessions_by_agent = await self._fetch_failed_sessions_by_agent(fetch.workloads)
         agent_limit = AgentLimit(max_container_count=await self._get_max_container_count())
         system_snapshot = SystemSnapshot(
@@ -154,7 +173,7 @@ class SchedulerRepository:
                 preemption_candidates=fetch.preemption_candidates,
             ),
             global_scope=GlobalScopeSnapshot(
-                occupancy=fetch.occupancy,
+                occupancy=occupancy,
                 resource_policy=fetch.resource_policy,
                 agent_limit=agent_limit,
             ),
@@ -226,7 +245,14 @@ class SchedulerRepository:
         Returns:
             The ids of the sessions that were actually allocated.
         """
-        return await self._db_source.allocate_sessions(allocations)
+        allocated = await self._db_source.allocate_sessions(allocations)
+        self._occupancy_store.mark_stale(allocated)
+        return allocated
+
+    def mark_occupancy_stale(self, session_ids: Sequence[SessionId]) -> None:
+        """Hint that the sessions' occupancy changed so the in-memory
+        scheduling snapshot re-reads them on the next tick."""
+        self._occupancy_store.mark_stale(session_ids)
 
     @scheduler_repository_resilience.apply()
     async def get_pending_timeout_sessions_by_ids(
@@ -285,7 +311,9 @@ class SchedulerRepository:
     @scheduler_repository_resilience.apply()
     async def reserve_sessions(self, allocations: list[SessionAllocation]) -> list[SessionId]:
         """Prereserve the sessions backed by a preemption plan."""
-        return await self._db_source.reserve_sessions(allocations)
+        reserved = await self._db_source.reserve_sessions(allocations)
+        self._occupancy_store.mark_stale(reserved)
+        return reserved
 
     @scheduler_repository_resilience.apply()
     async def admit_prereserved_kernels(self, session_ids: Sequence[SessionId]) -> list[KernelId]:
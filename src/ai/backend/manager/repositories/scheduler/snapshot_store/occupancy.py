@@ -0,0 +1,229 @@
+"""In-memory global occupancy for scheduling ticks."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+
+from ai.backend.common.data.entity.domain import DomainID
+from ai.backend.common.data.entity.project import ProjectID
+from ai.backend.common.data.entity.resource_slot import ResourceSlotName
+from ai.backend.common.data.entity.user import UserID
+from ai.backend.common.types import SessionId
+from ai.backend.logging.utils import BraceStyleAdapter
+from ai.backend.manager.repositories.scheduler.db_source.db_source import ScheduleDBSource
+from ai.backend.manager.repositories.scheduler.db_source.types import (
+    OccupancyChecksum,
+    SessionOccupancyEntry,
+)
+from ai.backend.manager.repositories.scheduler.types.session import PendingSessions
+from ai.backend.manager.views.sokovan.snapshot import (
+    ResourceAllocation,
+    ResourceOccupancySnapshot,
+    SlotAllocation,
+    UserResourceAllocation,
+)
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+
+class OccupancySnapshotStore:
+    """Global occupancy kept in memory between scheduling ticks.
+
+    The store is seeded once with every session's contribution from
+    :meth:`ScheduleDBSource.fetch_session_occupancies` and keeps per-owner
+    totals (user, project, domain) plus per-user session counts. Lifecycle
+    events only *mark* sessions stale; the next :meth:`snapshot` re-reads
+    just those sessions by primary key and patches the totals, so a tick
+    costs a small indexed lookup instead of the cluster-wide GROUPING SETS
+    scan.
+
+    Event delivery is best-effort, so every ``reconcile_interval`` seconds
+    the totals are compared against :meth:`ScheduleDBSource.fetch_occupancy_checksum`
+    and the store is reseeded on a mismatch. Agent capacity is still gated
+    by the allocation write itself, so a briefly stale copy can only delay
+    (or, between another manager's commit and its broadcast, loosen) the
+    owner-quota checks.
+    """
+
+    _db_source: ScheduleDBSource
+    _lock: asyncio.Lock
+    _seeded: bool
+    _last_reconciled: float
+    _stale_sessions: set[SessionId]
+    _entries: dict[SessionId, SessionOccupancyEntry]
+    _by_user: dict[UserID, dict[ResourceSlotName, SlotAllocation]]
+    _by_project: dict[ProjectID, dict[ResourceSlotName, SlotAllocation]]
+    _by_domain: dict[DomainID, dict[ResourceSlotName, SlotAllocation]]
+    _session_counts: Counter[UserID]
+    _sftp_session_counts: Counter[UserID]
+
+    def __init__(self, db_source: ScheduleDBSource) -> None:
+        self._db_source = db_source
+        self._lock = asyncio.Lock()
+        self._stale_sessions = set()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._seeded = False
+        self._last_reconciled = 0.0
+        self._entries = {}
+        self._by_user = defaultdict(dict)
+        self._by_project = defaultdict(dict)
+        self._by_domain = defaultdict(dict)
+        self._session_counts = Counter()
+        self._sftp_session_counts = Counter()
+
+    def mark_stale(self, session_ids: Iterable[SessionId]) -> None:
+        """Schedule the given sessions for a re-read on the next snapshot."""
+        self._stale_sessions.update(session_ids)
+
+    def invalidate(self) -> None:
+        """Drop the in-memory copy; the next snapshot reseeds from the DB."""
+        self._reset()
+
+    async def snapshot(
+        self,
+        pending_sessions: PendingSessions,
+        *,
+        reconcile_interval: float,
+    ) -> ResourceOccupancySnapshot:
+        """Return the occupancy of the pending sessions' owners.
+
+        Equivalent to ``ScheduleDBSource._fetch_global_occupancy`` for the
+        same owners. The returned mappings are fresh copies the caller may
+        mutate.
+        """
+        async with self._lock:
+            stale, self._stale_sessions = self._stale_sessions, set()
+            try:
+                if not self._seeded:
+                    await self._seed()
+                elif stale:
+                    await self._refresh(stale)
+            except BaseException:
+                self._stale_sessions |= stale
+                raise
+            if time.monotonic() - self._last_reconciled >= reconcile_interval:
+                await self._reconcile()
+            return self._build(pending_sessions)
+
+    async def _seed(self) -> None:
+        self._reset()
+        for entry in await self._db_source.fetch_session_occupancies():
+            self._apply(entry, sign=1)
+        self._seeded = True
+        self._last_reconciled = time.monotonic()
+        log.info("Seeded scheduling occupancy snapshot with {} sessions", len(self._entries))
+
+    async def _refresh(self, session_ids: set[SessionId]) -> None:
+        fresh = {
+            entry.session_id: entry
+            for entry in await self._db_source.fetch_session_occupancies(session_ids)
+        }
+        for session_id in session_ids:
+            previous = self._entries.pop(session_id, None)
+            if previous is not None:
+                self._apply(previous, sign=-1)
+            current = fresh.get(session_id)
+            if current is not None:
+                self._apply(current, sign=1)
+
+    async def _reconcile(self) -> None:
+        expected = await self._db_source.fetch_occupancy_checksum()
+        self._last_reconciled = time.monotonic()
+        actual = self._checksum()
+        if actual != expected:
+            log.warning(
+                "Scheduling occupancy snapshot drifted from the DB (memory: {}, db: {}); reseeding",
+                actual,
+                expected,
+            )
+            await self._seed()
+
+    def _apply(self, entry: SessionOccupancyEntry, *, sign: int) -> None:
+        """Fold a session's contribution into (sign=1) or out of (sign=-1) the totals."""
+        if sign > 0:
+            self._entries[entry.session_id] = entry
+        for totals, key in (
+            (self._by_user, entry.user_id),
+            (self._by_project, entry.project_id),
+            (self._by_domain, entry.domain_id),
+        ):
+            _add_slots(totals, key, entry.slots, sign)
+        if entry.counts_session:
+            counts = self._sftp_session_counts if entry.is_private else self._session_counts
+            counts[entry.user_id] += sign
+            if counts[entry.user_id] <= 0:
+                del counts[entry.user_id]
+
+    def _checksum(self) -> OccupancyChecksum:
+        requested = Decimal(0)
+        used = Decimal(0)
+        for entry in self._entries.values():
+            for alloc in entry.slots.values():
+                requested += alloc.requested
+                used += alloc.used
+        return OccupancyChecksum(
+            allocation_row_count=sum(e.allocation_row_count for e in self._entries.values()),
+            requested=requested,
+            used=used,
+            session_count=sum(self._session_counts.values())
+            + sum(self._sftp_session_counts.values()),
+        )
+
+    def _build(self, pending_sessions: PendingSessions) -> ResourceOccupancySnapshot:
+        by_user: dict[UserID, UserResourceAllocation] = {}
+        for user_id in pending_sessions.user_uuids:
+            slots = self._by_user.get(user_id)
+            session_count = self._session_counts.get(user_id, 0)
+            sftp_session_count = self._sftp_session_counts.get(user_id, 0)
+            if not slots and not session_count and not sftp_session_count:
+                continue
+            by_user[user_id] = UserResourceAllocation(
+                slots=dict(slots or {}),
+                session_count=session_count,
+                sftp_session_count=sftp_session_count,
+            )
+        return ResourceOccupancySnapshot(
+            by_user=by_user,
+            by_project={
+                project_id: ResourceAllocation(slots=dict(self._by_project[project_id]))
+                for project_id in pending_sessions.project_ids
+                if self._by_project.get(project_id)
+            },
+            by_domain={
+                domain_id: ResourceAllocation(slots=dict(self._by_domain[domain_id]))
+                for domain_id in pending_sessions.domain_ids
+                if self._by_domain.get(domain_id)
+            },
+        )
+
+
+def _add_slots[TScopeKey: (UserID, ProjectID, DomainID)](
+    totals: dict[TScopeKey, dict[ResourceSlotName, SlotAllocation]],
+    key: TScopeKey,
+    slots: Mapping[ResourceSlotName, SlotAllocation],
+    sign: int,
+) -> None:
+    if not slots:
+        return
+    scope = totals[key]
+    for slot_name, alloc in slots.items():
+        current = scope.get(slot_name)
+        if current is None:
+            current = SlotAllocation(requested=Decimal(0), used=Decimal(0))
+        updated = SlotAllocation(
+            requested=current.requested + sign * alloc.requested,
+            used=current.used + sign * alloc.used,
+        )
+        if updated.requested or updated.used:
+            scope[slot_name] = updated
+        else:
+            del scope[slot_name]
+    if not scope:
+        del totals[key]
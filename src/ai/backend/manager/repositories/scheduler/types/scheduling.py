@@ -30,7 +30,8 @@ class SchedulingFetch:
     policy: ResourceGroupSchedulingPolicy
     workloads: list[SessionWorkload]
     agents: list[AgentMeta]
-    occupancy: ResourceOccupancySnapshot
+    # None when the repository serves occupancy from its in-memory store
+    occupancy: ResourceOccupancySnapshot | None
     resource_policy: ResourcePolicySnapshot
     session_dependencies: SessionDependencySnapshot
     # DB-sourced time the fetch ran (single time authority across managers)
@@ -63,6 +63,7 @@ from .api.rest.middleware import (
     build_exception_middleware,
 )
 from .api.rest.middleware.auth import TRUSTED_PROXY_NETWORKS_KEY, parse_trusted_proxy_networks
+from .api.rest.middleware.auth_cache import KeypairQueryCounter
 from .api.rest.routing import RouteRegistry
 from .config.bootstrap import BootstrapConfig
 from .config.unified import EventLoopType
@@ -349,6 +350,13 @@ async def server_main(
                 config_provider=dep_resources.bootstrap.config_provider,
             ),
         )
+        auth_config = dep_resources.bootstrap.config_provider.config.auth
+        query_counter = KeypairQueryCounter(
+            dep_resources.infrastructure.valkey.stat,
+            flush_interval=auth_config.query_count_flush_interval,
+        )
+        # Entered after the dependencies so buffered counts are flushed before Valkey closes.
+        await manager_init_stack.enter_async_context(query_counter.run())
         root_app.middlewares.insert(
             2,
             build_auth_middleware(
@@ -356,6 +364,8 @@ async def server_main(
                 jwt_validator=dep_resources.system.jwt_validator,
                 valkey_stat=dep_resources.infrastructure.valkey.stat,
                 hook_plugin_ctx=dep_resources.plugins.hook_plugin_ctx,
+                auth_context_cache=dep_resources.processing.auth_context_cache,
+                query_counter=query_counter,
             ),
         )
 
@@ -1815,6 +1815,13 @@ class ScheduleCoordinator:
                 long_interval=300.0,  # 5 minutes
                 initial_delay=60.0,  # Start 1 minute after manager starts
             ),
+            # Image prefetch - hints agents to pull images of PENDING kernels ahead of placement
+            SchedulerTaskSpec(
+                ScheduleType.PREFETCH_IMAGES,
+                short_interval=None,  # No short-cycle task for observation
+                long_interval=30.0,
+                initial_delay=30.0,
+            ),
             # Cleanup containers for force-terminated sessions
             SchedulerTaskSpec(
                 ScheduleType.CLEANUP_FORCE_TERMINATED,
@@ -48,6 +48,7 @@ from ai.backend.manager.sokovan.scheduler.handlers.kernel import (
 )
 from ai.backend.manager.sokovan.scheduler.handlers.observer import (
     FairShareObserver,
+    ImagePrefetchObserver,
     KernelObserver,
 )
 from ai.backend.manager.sokovan.scheduler.launcher.launcher import (
@@ -361,6 +362,11 @@ def _create_kernel_observers(
             fair_share_repository=args.fair_share_repository,
             scheduler_repository=args.repository,
         ),
+        ScheduleType.PREFETCH_IMAGES: ImagePrefetchObserver(
+            repository=args.repository,
+            launcher=args.launcher,
+            valkey_schedule=args.valkey_schedule,
+        ),
     }
 
 
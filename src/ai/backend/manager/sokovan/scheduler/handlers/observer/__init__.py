@@ -7,9 +7,11 @@ read-only operations for metrics, fair share calculation, etc.
 
 from .base import KernelObserver, ObservationResult
 from .fair_share import FairShareObserver
+from .image_prefetch import ImagePrefetchObserver
 
 __all__ = [
     "KernelObserver",
     "ObservationResult",
     "FairShareObserver",
+    "ImagePrefetchObserver",
 ]
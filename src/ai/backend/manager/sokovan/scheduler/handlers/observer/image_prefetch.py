@@ -0,0 +1,197 @@
+"""Image prefetch observer for warming up agents ahead of session placement.
+
+This observer periodically hints agents to pull the images of pending kernels
+so that the pull is off the critical path once the sessions are scheduled.
+
+Targets:
+- Pending kernels, including the route sessions of deployment replicas
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from typing import TYPE_CHECKING, override
+from uuid import UUID
+
+from ai.backend.common.data.entity.image import ImageID
+from ai.backend.common.data.entity.resource_group import ResourceGroupID
+from ai.backend.common.data.entity.resource_slot import ResourceSlotName
+from ai.backend.common.types import AgentId, AgentSelectionStrategy, SessionId
+from ai.backend.logging.utils import BraceStyleAdapter
+from ai.backend.manager.data.kernel.types import KernelInfo
+from ai.backend.manager.models.clauses import QueryCondition
+from ai.backend.manager.models.kernel.conditions import KernelConditions
+from ai.backend.manager.views.sokovan.agent import AgentMeta
+from ai.backend.manager.views.sokovan.image import ImageConfigData
+
+from .base import KernelObserver, ObservationResult
+
+if TYPE_CHECKING:
+    from ai.backend.common.clients.valkey_client.valkey_schedule.client import (
+        ValkeyScheduleClient,
+    )
+    from ai.backend.manager.repositories.scheduler import SchedulerRepository
+    from ai.backend.manager.sokovan.scheduler.launcher.launcher import SessionLauncher
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+DEFAULT_MAX_PREFETCH_IMAGES = 8
+DEFAULT_AGENTS_PER_IMAGE = 2
+
+
+def select_prefetch_agents(
+    agents: Sequence[AgentMeta],
+    architecture: str,
+    requested_slots: Mapping[str, Decimal],
+    strategy: AgentSelectionStrategy,
+    *,
+    limit: int,
+) -> list[AgentMeta]:
+    """Pick the agents most likely to receive a kernel with the given requirements.
+
+    Only the agents of the same architecture with enough unreserved slots are
+    considered.  They are ordered by their average free ratio, the least free
+    first for the concentrated strategy and the most free first otherwise.
+
+    Args:
+        agents: Schedulable agents of the resource group
+        architecture: Architecture of the kernel image
+        requested_slots: Slots requested by the kernel
+        strategy: Agent selection strategy of the resource group
+        limit: Maximum number of agents to pick
+
+    Returns:
+        Up to ``limit`` agents in the order of preference
+    """
+    scored: list[tuple[Decimal, AgentMeta]] = []
+    for agent in agents:
+        if agent.architecture != architecture:
+            continue
+        slots = agent.resources.slots
+        if any(
+            amount > 0
+            and (
+                (slot := slots.get(ResourceSlotName(slot_name))) is None
+                or slot.capacity - slot.reserved < amount
+            )
+            for slot_name, amount in requested_slots.items()
+        ):
+            continue
+        ratios = [
+            (slot.capacity - slot.reserved) / slot.capacity
+            for slot in slots.values()
+            if slot.capacity > 0
+        ]
+        free_ratio = sum(ratios, Decimal(0)) / len(ratios) if ratios else Decimal(0)
+        scored.append((free_ratio, agent))
+    scored.sort(key=lambda item: item[0], reverse=strategy != AgentSelectionStrategy.CONCENTRATED)
+    return [agent for _, agent in scored[:limit]]
+
+
+class ImagePrefetchObserver(KernelObserver):
+    """Observes pending kernels and hints agents to prefetch their images.
+
+    Pending kernels are ordered by the position of their sessions in the
+    pending queue of the resource group, and the first ``max_images`` distinct
+    images are sent as prefetch hints to ``agents_per_image`` agents chosen by
+    :func:`select_prefetch_agents`.  Replicas of deployments are covered as
+    their route sessions wait in the same queue.
+
+    Agents ignore images they already have or are pulling, so repeating the
+    hints on every observation is cheap.
+
+    No kernel status transitions are performed.
+    """
+
+    def __init__(
+        self,
+        repository: SchedulerRepository,
+        launcher: SessionLauncher,
+        valkey_schedule: ValkeyScheduleClient,
+        *,
+        max_images: int = DEFAULT_MAX_PREFETCH_IMAGES,
+        agents_per_image: int = DEFAULT_AGENTS_PER_IMAGE,
+    ) -> None:
+        self._repository = repository
+        self._launcher = launcher
+        self._valkey_schedule = valkey_schedule
+        self._max_images = max_images
+        self._agents_per_image = agents_per_image
+
+    @classmethod
+    @override
+    def name(cls) -> str:
+        return "ImagePrefetchObserver"
+
+    @override
+    def get_query_condition(self, resource_group_id: ResourceGroupID) -> QueryCondition:
+        return KernelConditions.for_image_prefetch(resource_group_id)
+
+    @override
+    async def observe(
+        self,
+        resource_group_id: ResourceGroupID,
+        kernels: Sequence[KernelInfo],
+    ) -> ObservationResult:
+        """Send prefetch hints for the images of the given pending kernels.
+
+        Args:
+            resource_group_id: The id of the resource group being processed
+            kernels: Pending kernels of the resource group
+
+        Returns:
+            ObservationResult containing observed count
+        """
+        candidates = [kernel for kernel in kernels if kernel.image.image_id is not None]
+        if not candidates:
+            return ObservationResult(observed_count=0)
+
+        # The pending queue is keyed by the resource group name.
+        resource_group_name = await self._repository.get_resource_group_name_by_id(
+            resource_group_id
+        )
+        queue = await self._valkey_schedule.get_pending_queue(resource_group_name)
+        positions = {str(session_id): idx for idx, session_id in enumerate(queue)}
+        candidates.sort(key=lambda kernel: positions.get(kernel.session.session_id, len(queue)))
+
+        # The first pending kernel of each image decides the slots an agent must have.
+        kernels_by_image: dict[UUID, KernelInfo] = {}
+        for kernel in candidates:
+            if len(kernels_by_image) >= self._max_images:
+                break
+            if (image_id := kernel.image.image_id) is not None:
+                kernels_by_image.setdefault(image_id, kernel)
+
+        pull_data = await self._repository.get_sessions_for_pull_by_ids([
+            SessionId(UUID(kernel.session.session_id)) for kernel in kernels_by_image.values()
+        ])
+        schedule_data = await self._repository.fetch_compute_schedule_data(
+            resource_group_id, [ImageID(image_id) for image_id in kernels_by_image]
+        )
+
+        hints: defaultdict[AgentId, list[ImageConfigData]] = defaultdict(list)
+        for image_id, kernel in kernels_by_image.items():
+            image_config = pull_data.image_configs.get(image_id)
+            if image_config is None:
+                continue
+            targets = select_prefetch_agents(
+                schedule_data.resources.agents,
+                image_config.architecture,
+                kernel.resource.requested_slots,
+                schedule_data.agent_selection_strategy,
+                limit=self._agents_per_image,
+            )
+            for agent in targets:
+                hints[agent.id].append(image_config)
+
+        if hints:
+            log.debug(
+                "[ImagePrefetchObserver] Sending prefetch hints: resource_group={}, hints={}",
+                resource_group_id,
+                {agent_id: [img.canonical for img in images] for agent_id, images in hints.items()},
+            )
+            await self._launcher.prefetch_images(hints)
+        return ObservationResult(observed_count=len(candidates))
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections import defaultdict
-from collections.abc import Awaitable, Mapping
+from collections.abc import Awaitable, Mapping, Sequence
 from dataclasses import dataclass
 from itertools import groupby
 from typing import Any
@@ -159,6 +159,36 @@ class SessionLauncher:
                 ):
                     await asyncio.gather(*pull_tasks, return_exceptions=True)
 
+    async def prefetch_images(
+        self,
+        hints: Mapping[AgentId, Sequence[ImageConfigData]],
+    ) -> None:
+        """
+        Hint agents to pull the given images in the background before sessions
+        using them are scheduled. Prefetching is best-effort, so failures are only logged.
+
+        :param hints: Images to prefetch indexed by agent ID
+        """
+        auto_pull = AutoPullBehavior(self._config_provider.config.docker.image.auto_pull.value)
+
+        async def prefetch_for_agent(
+            agent_id: AgentId, images: Sequence[ImageConfigData]
+        ) -> list[str]:
+            image_configs = {img.canonical: img.to_image_config(auto_pull) for img in images}
+            async with self._agent_client_pool.acquire(agent_id) as client:
+                return await client.prefetch_images(image_configs)
+
+        agent_ids = list(hints.keys())
+        results = await asyncio.gather(
+            *[prefetch_for_agent(agent_id, hints[agent_id]) for agent_id in agent_ids],
+            return_exceptions=True,
+        )
+        for agent_id, result in zip(agent_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                log.debug("Failed to send image prefetch hints to {}: {!r}", agent_id, result)
+            elif result:
+                log.debug("Agent {} accepted image prefetch hints: {}", agent_id, result)
+
     async def start_sessions_for_handler(
         self,
         sessions: list[SessionDataForStart],
@@ -35,13 +35,14 @@ from ai.backend.manager.views.sokovan.snapshot import ScopeVictimCandidates, Sys
 from ai.backend.manager.views.sokovan.workload import SessionWorkload
 
 from .selectors.exceptions import BatchAgentSelectionFailedError, NoAvailableAgentError
+from .selectors.matrix import build_engine_trackers
 from .selectors.selector import (
     AgentSelection,
     AgentSelectionCriteria,
     AgentSelector,
     PlacementPlan,
 )
-from .selectors.tracker import AgentStateTracker, build_agent_trackers
+from .selectors.tracker import AgentStateTracker
 from .sequencers.drf import DRFSequencer
 from .sequencers.fair_share import FairShareSequencer
 from .sequencers.fifo import FIFOSequencer
@@ -71,7 +72,10 @@ class SchedulingState:
         return cls(
             snapshot=data.system_snapshot,
             resource_group=data.resource_group,
-            trackers=build_agent_trackers(data.system_snapshot.resource_group.resources),
+            trackers=build_engine_trackers(
+                data.system_snapshot.resource_group.policy.agent_placement_engine,
+                data.system_snapshot.resource_group.resources,
+            ),
         )
 
 
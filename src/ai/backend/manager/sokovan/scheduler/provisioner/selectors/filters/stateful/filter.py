@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
+from ai.backend.manager.sokovan.scheduler.provisioner.selectors.matrix import SlotMatrix
 from ai.backend.manager.sokovan.scheduler.provisioner.selectors.tracker import AgentStateTracker
 from ai.backend.manager.sokovan.scheduler.provisioner.selectors.types import ResourceRequirements
 from ai.backend.manager.views.sokovan.agent import AgentLimit
@@ -42,3 +43,16 @@ class AbstractStatefulTrackerFilter(ABC):
     ) -> Sequence[AgentStateTracker]:
         """The trackers that stay in the running."""
         raise NotImplementedError
+
+    def filter_matrix(
+        self,
+        matrix: SlotMatrix,
+        trackers: Sequence[AgentStateTracker],
+        criteria: AgentSelectionCriteria,
+        resource_req: ResourceRequirements,
+        limit: AgentLimit,
+    ) -> Sequence[AgentStateTracker]:
+        """:meth:`filter` for a matrix-backed pool; filters that read slot
+        state override it to compare the matrix rows. Must keep exactly the
+        trackers :meth:`filter` keeps, in the same order."""
+        return self.filter(trackers, criteria, resource_req, limit)
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, override
 from ai.backend.manager.sokovan.scheduler.provisioner.selectors.filters.stateful.filter import (
     AbstractStatefulTrackerFilter,
 )
+from ai.backend.manager.sokovan.scheduler.provisioner.selectors.matrix import SlotMatrix
 from ai.backend.manager.sokovan.scheduler.provisioner.selectors.tracker import AgentStateTracker
 from ai.backend.manager.sokovan.scheduler.provisioner.selectors.types import ResourceRequirements
 from ai.backend.manager.views.sokovan.agent import AgentLimit
@@ -40,6 +41,20 @@ class ResourceTrackerFilter(AbstractStatefulTrackerFilter):
     ) -> Sequence[AgentStateTracker]:
         return [tracker for tracker in trackers if self._has_room(tracker, resource_req)]
 
+    @override
+    def filter_matrix(
+        self,
+        matrix: SlotMatrix,
+        trackers: Sequence[AgentStateTracker],
+        criteria: AgentSelectionCriteria,
+        resource_req: ResourceRequirements,
+        limit: AgentLimit,
+    ) -> Sequence[AgentStateTracker]:
+        request = matrix.encode(resource_req.requested_slots.slots)
+        if request is None:
+            return self.filter(trackers, criteria, resource_req, limit)
+        return [tracker for tracker in trackers if matrix.fits(matrix.row_of(tracker), request)]
+
     def _has_room(
         self,
         tracker: AgentStateTracker,
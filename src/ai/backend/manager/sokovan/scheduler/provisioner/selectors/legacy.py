@@ -10,6 +10,7 @@ from collections.abc import Sequence
 from decimal import Decimal
 from typing import override
 
+from .matrix import SlotMatrix
 from .selector import (
     AbstractAgentSelector,
 )
@@ -71,3 +72,28 @@ class LegacyAgentSelector(AbstractAgentSelector):
             ]
 
         return max(trackers, key=tracker_sort_key)
+
+    @override
+    def select_tracker_by_matrix(
+        self,
+        matrix: SlotMatrix,
+        trackers: Sequence[AgentStateTracker],
+        resource_req: ResourceRequirements,
+    ) -> AgentStateTracker:
+        """
+        Select an agent tracker based on resource priorities, comparing the
+        fixed-point matrix rows with the same key as the tracker path.
+        """
+        cols = matrix.priority_cols(
+            order_slots_by_priority(
+                resource_req.requested_slots, self.agent_selection_resource_priority
+            )
+        )
+        zero_mask = matrix.zero_mask(resource_req.requested_slots.slots)
+        absent = -matrix.max_sentinel()
+
+        def row_sort_key(tracker: AgentStateTracker) -> list[int]:
+            row = matrix.row_of(tracker)
+            return [-matrix.unutilized(row, zero_mask), *matrix.priority_key(row, cols, absent)]
+
+        return max(trackers, key=row_sort_key)
@@ -0,0 +1,314 @@
+"""Dense fixed-point placement state for the matrix placement engine.
+
+The tracker engine recomputes ``remaining_slots()`` as a fresh dict of
+``Decimal`` for every candidate of every requirement. The matrix engine
+keeps the same state as one agents x slot-types matrix of fixed-point
+integers, updated incrementally as trackers change, so the resource filter
+and the strategy picks compare plain integers instead.
+
+Every value is scaled by a single power of ten chosen from the observed
+agent resources, so the integers are exact images of the ``Decimal``
+amounts and every comparison (and thus every pick) is identical to the
+tracker engine. An amount that does not fit the scale (a request with more
+fractional digits than any agent resource) marks the matrix inexact; the
+selection pipeline then falls back to the tracker path for the rest of the
+pass.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import cast, override
+
+from ai.backend.common.data.entity.resource_slot import ResourceSlotName
+from ai.backend.common.data.entity.session_group import SessionGroupID
+from ai.backend.common.types import AgentPlacementEngine
+from ai.backend.manager.views.sokovan.agent import AgentMeta, ResourceGroupResource
+from ai.backend.manager.views.sokovan.workload import ResourceRequest
+
+from .tracker import AgentStateTracker, build_agent_trackers
+
+# A requested slot encoded against the matrix columns: the column index
+# (None when no agent in the pool has the slot) and the scaled amount.
+type EncodedSlot = tuple[int | None, int]
+
+
+class SlotMatrix:
+    """Agents x slot-types matrix of remaining capacity in fixed point.
+
+    ``remaining[row][col]`` mirrors ``remaining_slots()`` of the tracker at
+    ``row``; columns the agent does not expose stay 0 and are marked absent
+    in ``present[row]`` (a bitmask over columns).
+    """
+
+    slot_names: tuple[ResourceSlotName, ...]
+    slot_index: Mapping[ResourceSlotName, int]
+    # Fixed point: every amount is stored as ``amount * 10 ** digits``
+    digits: int
+    scale: int
+    remaining: list[list[int]]
+    present: list[int]
+    # Columns with idle capacity before any in-batch allocation (the input
+    # of ``count_unutilized_capabilities``)
+    idle: list[int]
+    # Position of each row in agent-ID order (round-robin rotation)
+    id_rank: list[int]
+    exact: bool
+    _pending: dict[int, list[int]]
+    _reclaimed: dict[int, list[int]]
+
+    def __init__(self, agents: Sequence[AgentMeta], digits: int) -> None:
+        slot_names = sorted({
+            slot_name for agent in agents for slot_name in agent.resources.slots.keys()
+        })
+        self.slot_names = tuple(slot_names)
+        self.slot_index = {slot_name: col for col, slot_name in enumerate(slot_names)}
+        self.digits = digits
+        self.scale = 10**digits
+        self.remaining = []
+        self.present = []
+        self.idle = []
+        self.exact = True
+        self._pending = {}
+        self._reclaimed = {}
+        for agent in agents:
+            row = [0] * len(slot_names)
+            present = 0
+            idle = 0
+            for slot_name, resource in agent.resources.slots.items():
+                col = self.slot_index[slot_name]
+                available = resource.capacity - resource.reserved - resource.used
+                row[col] = self._to_fixed(available)
+                present |= 1 << col
+                if available > Decimal(0):
+                    idle |= 1 << col
+            self.remaining.append(row)
+            self.present.append(present)
+            self.idle.append(idle)
+        order = sorted(range(len(agents)), key=lambda index: agents[index].id)
+        self.id_rank = [0] * len(agents)
+        for rank, index in enumerate(order):
+            self.id_rank[index] = rank
+
+    @classmethod
+    def digits_for(cls, agents: Sequence[AgentMeta]) -> int | None:
+        """The fewest fractional digits that make every observed amount an
+        integer, or None when some amount is not finite."""
+        digits = 0
+        for agent in agents:
+            for resource in agent.resources.slots.values():
+                for amount in (resource.capacity, resource.reserved, resource.used):
+                    if not amount.is_finite():
+                        return None
+                    exponent = amount.as_tuple().exponent
+                    if isinstance(exponent, int):
+                        digits = max(digits, -exponent)
+        return digits
+
+    def _to_fixed(self, amount: Decimal) -> int:
+        scaled = amount.scaleb(self.digits)
+        if not scaled.is_finite() or scaled != scaled.to_integral_value():
+            raise ValueError(f"{amount} is not representable at scale {self.scale}")
+        return int(scaled)
+
+    @staticmethod
+    def row_of(tracker: AgentStateTracker) -> int:
+        """Row of a tracker drawn from a matrix-backed pool."""
+        return cast(MatrixAgentStateTracker, tracker).row
+
+    def encode(self, slots: Mapping[ResourceSlotName, Decimal]) -> list[EncodedSlot] | None:
+        """Encode requested slots against the columns (None if inexact)."""
+        encoded: list[EncodedSlot] = []
+        try:
+            for slot_name, amount in slots.items():
+                encoded.append((self.slot_index.get(slot_name), self._to_fixed(amount)))
+        except ValueError:
+            return None
+        return encoded
+
+    def fits(self, row: int, request: Sequence[EncodedSlot]) -> bool:
+        """Whether the row's remaining covers every requested amount (an
+        absent slot counts as 0 remaining)."""
+        remaining = self.remaining[row]
+        for col, amount in request:
+            if amount > (remaining[col] if col is not None else 0):
+                return False
+        return True
+
+    def unutilized(self, row: int, zero_mask: int) -> int:
+        """Idle columns of the row the request does not use."""
+        return (self.idle[row] & zero_mask).bit_count()
+
+    def zero_mask(self, slots: Mapping[ResourceSlotName, Decimal]) -> int:
+        """Bitmask of the columns requested as zero."""
+        mask = 0
+        for slot_name, amount in slots.items():
+            col = self.slot_index.get(slot_name)
+            if col is not None and amount == Decimal(0):
+                mask |= 1 << col
+        return mask
+
+    def priority_key(self, row: int, cols: Sequence[int], absent: int) -> list[int]:
+        """Remaining amounts of the row over ``cols`` (``absent`` for the
+        slots the agent does not expose)."""
+        remaining = self.remaining[row]
+        present = self.present[row]
+        return [remaining[col] if present >> col & 1 else absent for col in cols]
+
+    def priority_cols(self, slot_names: Sequence[ResourceSlotName]) -> list[int]:
+        """Columns of the prioritized slots.
+
+        Slots no agent exposes read the same sentinel on every row, so they
+        cannot change a comparison and are left out.
+        """
+        return [self.slot_index[name] for name in slot_names if name in self.slot_index]
+
+    def max_sentinel(self) -> int:
+        """``sys.maxsize`` in the matrix scale."""
+        return sys.maxsize * self.scale
+
+    def consume(self, row: int, slots: Mapping[ResourceSlotName, Decimal]) -> None:
+        """Mirror an in-flight allocation of the row's tracker."""
+        self._shift(row, slots, self._pending, -1)
+
+    def reclaim(self, row: int, slots: Mapping[ResourceSlotName, Decimal]) -> None:
+        """Mirror a provisional victim reclaim of the row's tracker."""
+        self._shift(row, slots, self._reclaimed, 1)
+
+    def commit(self, row: int) -> None:
+        """The in-flight allocation of the row became batch state."""
+        self._pending.pop(row, None)
+
+    def rollback(self, row: int) -> None:
+        """Give the in-flight allocation of the row back."""
+        self._restore(row, self._pending, 1)
+
+    def clear_reclaim(self, row: int) -> None:
+        """Drop the provisional reclaims of the row."""
+        self._restore(row, self._reclaimed, -1)
+
+    def _shift(
+        self,
+        row: int,
+        slots: Mapping[ResourceSlotName, Decimal],
+        journal: dict[int, list[int]],
+        sign: int,
+    ) -> None:
+        if not self.exact:
+            return
+        remaining = self.remaining[row]
+        present = self.present[row]
+        delta = journal.get(row)
+        if delta is None:
+            delta = journal[row] = [0] * len(self.slot_names)
+        for slot_name, amount in slots.items():
+            col = self.slot_index.get(slot_name)
+            if col is None or not present >> col & 1:
+                # remaining_slots() only reports the agent's own slots
+                continue
+            try:
+                fixed = self._to_fixed(amount)
+            except ValueError:
+                self.exact = False
+                return
+            remaining[col] += sign * fixed
+            delta[col] += fixed
+
+    def _restore(self, row: int, journal: dict[int, list[int]], sign: int) -> None:
+        delta = journal.pop(row, None)
+        if delta is None or not self.exact:
+            return
+        remaining = self.remaining[row]
+        for col, amount in enumerate(delta):
+            remaining[col] += sign * amount
+
+
+@dataclass(eq=False)
+class MatrixAgentStateTracker(AgentStateTracker):
+    """An :class:`AgentStateTracker` whose slot state is mirrored into a
+    shared :class:`SlotMatrix` row on every change.
+
+    The tracker stays authoritative (filters and orders without a matrix
+    variant read it as before); the matrix only accelerates the hot paths.
+    """
+
+    matrix: SlotMatrix = field(kw_only=True)
+    row: int = field(kw_only=True)
+
+    @override
+    def apply_diff(
+        self,
+        request: ResourceRequest,
+        containers: int,
+        session_group_id: SessionGroupID | None,
+    ) -> None:
+        super().apply_diff(request, containers, session_group_id)
+        self.matrix.consume(self.row, request.slots)
+
+    @override
+    def commit(self) -> None:
+        # Settle the matrix first: the base commit() ends with rollback().
+        self.matrix.commit(self.row)
+        super().commit()
+
+    @override
+    def rollback(self) -> None:
+        super().rollback()
+        self.matrix.rollback(self.row)
+
+    @override
+    def apply_reclaim(self, slots: Mapping[ResourceSlotName, Decimal]) -> None:
+        super().apply_reclaim(slots)
+        self.matrix.reclaim(self.row, slots)
+
+    @override
+    def clear_reclaim(self) -> None:
+        super().clear_reclaim()
+        self.matrix.clear_reclaim(self.row)
+
+
+def matrix_of(trackers: Sequence[AgentStateTracker]) -> SlotMatrix | None:
+    """The exact matrix shared by the trackers, or None when they are plain
+    trackers (or the matrix lost exactness) and the tracker path applies."""
+    if not trackers:
+        return None
+    first = trackers[0]
+    if not isinstance(first, MatrixAgentStateTracker) or not first.matrix.exact:
+        return None
+    return first.matrix
+
+
+def build_matrix_agent_trackers(resources: ResourceGroupResource) -> list[AgentStateTracker]:
+    """Build matrix-backed trackers; plain trackers when the observed
+    amounts have no exact fixed-point image."""
+    digits = SlotMatrix.digits_for(resources.agents)
+    if digits is None:
+        return build_agent_trackers(resources)
+    matrix = SlotMatrix(resources.agents, digits)
+    return [
+        MatrixAgentStateTracker(
+            original_agent=agent.to_agent_info(),
+            failed_session_ids=frozenset(
+                resources.failed_sessions_by_agent.get(agent.id, frozenset())
+            ),
+            group_member_counts=resources.group_members_by_agent.get(agent.id, {}),
+            matrix=matrix,
+            row=row,
+        )
+        for row, agent in enumerate(resources.agents)
+    ]
+
+
+def build_engine_trackers(
+    engine: AgentPlacementEngine,
+    resources: ResourceGroupResource,
+) -> list[AgentStateTracker]:
+    """Build the selection trackers for the resource group's placement engine."""
+    match engine:
+        case AgentPlacementEngine.MATRIX:
+            return build_matrix_agent_trackers(resources)
+        case _:
+            return build_agent_trackers(resources)
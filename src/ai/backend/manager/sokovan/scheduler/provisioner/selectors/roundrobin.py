@@ -13,6 +13,7 @@ sufficient for the goal of evening out placements.
 from collections.abc import Sequence
 from typing import override
 
+from .matrix import SlotMatrix
 from .selector import (
     AbstractAgentSelector,
 )
@@ -61,3 +62,22 @@ class RoundRobinAgentSelector(AbstractAgentSelector):
         selected = sorted_trackers[self._next_index % len(sorted_trackers)]
         self._next_index += 1
         return selected
+
+    @override
+    def select_tracker_by_matrix(
+        self,
+        matrix: SlotMatrix,
+        trackers: Sequence[AgentStateTracker],
+        _resource_req: ResourceRequirements,
+    ) -> AgentStateTracker:
+        """
+        Select an agent tracker using round-robin over the matrix's
+        precomputed agent-ID order.
+        """
+        sorted_trackers = sorted(
+            trackers, key=lambda tracker: matrix.id_rank[matrix.row_of(tracker)]
+        )
+
+        selected = sorted_trackers[self._next_index % len(sorted_trackers)]
+        self._next_index += 1
+        return selected
@@ -45,6 +45,7 @@ from .exceptions import (
 )
 from .filters.exclusion.filter import AbstractExclusionTrackerFilter
 from .filters.stateful.filter import AbstractStatefulTrackerFilter
+from .matrix import SlotMatrix, matrix_of
 from .orders.order import AbstractTrackerOrder
 from .tracker import AgentStateTracker
 from .types import PlacementFailure, ResourceRequirements
@@ -259,6 +260,21 @@ class AbstractAgentSelector(ABC):
         """
         raise NotImplementedError
 
+    def select_tracker_by_matrix(
+        self,
+        matrix: SlotMatrix,
+        trackers: Sequence[AgentStateTracker],
+        resource_req: ResourceRequirements,
+    ) -> AgentStateTracker:
+        """
+        Select an agent tracker from a matrix-backed pool.
+
+        Strategies that rank by slot state override this to compare the
+        fixed-point matrix rows; the pick must be the one
+        :meth:`select_tracker_by_strategy` makes.
+        """
+        return self.select_tracker_by_strategy(trackers, resource_req)
+
 
 class AgentSelector:
     """
@@ -437,9 +453,7 @@ class AgentSelector:
             )
 
         candidates = self._narrow_by_orders(candidates, criteria)
-        selected_tracker = self._strategy_pool[strategy].select_tracker_by_strategy(
-            candidates, resource_req
-        )
+        selected_tracker = self._select_by_strategy(strategy, candidates, resource_req)
         # Track the in-flight allocation for the selected agent
         selected_tracker.apply_diff(
             resource_req.requested_slots,
@@ -500,9 +514,7 @@ class AgentSelector:
             feasible = self._victim_selector.narrow_agents(
                 preemption_order, feasible, victims_by_agent, shortfalls
             )
-            selected_tracker = self._strategy_pool[strategy].select_tracker_by_strategy(
-                feasible, resource_req
-            )
+            selected_tracker = self._select_by_strategy(strategy, feasible, resource_req)
             selected_agent_id = selected_tracker.original_agent.agent_id
             chosen = self._victim_selector.collect_victims(
                 preemption_order,
@@ -592,12 +604,26 @@ class AgentSelector:
         criteria: AgentSelectionCriteria,
     ) -> Sequence[AgentStateTracker]:
         for order in self._orders:
-            best = min(order.rank(tracker, criteria) for tracker in candidates)
+            ranks = [order.rank(tracker, criteria) for tracker in candidates]
+            best = min(ranks)
             candidates = [
-                tracker for tracker in candidates if order.rank(tracker, criteria) == best
+                tracker for tracker, rank in zip(candidates, ranks, strict=True) if rank == best
             ]
         return candidates
 
+    def _select_by_strategy(
+        self,
+        strategy: AgentSelectionStrategy,
+        candidates: Sequence[AgentStateTracker],
+        resource_req: ResourceRequirements,
+    ) -> AgentStateTracker:
+        """The pooled strategy's pick, on the matrix when the pool has one."""
+        selector = self._strategy_pool[strategy]
+        matrix = matrix_of(candidates)
+        if matrix is not None:
+            return selector.select_tracker_by_matrix(matrix, candidates, resource_req)
+        return selector.select_tracker_by_strategy(candidates, resource_req)
+
     def _run_exclusion_filters(
         self,
         candidates: Sequence[AgentStateTracker],
@@ -629,6 +655,7 @@ class AgentSelector:
         recorder: TransitionRecorder[SessionId] | None,
     ) -> Sequence[AgentStateTracker]:
         entrants = candidates
+        matrix = matrix_of(candidates)
         for stateful in self._stateful_filters:
             step = (
                 recorder.step(stateful.name(), success_detail=stateful.success_message())
@@ -636,7 +663,12 @@ class AgentSelector:
                 else nullcontext()
             )
             with step:
-                candidates = stateful.filter(candidates, criteria, resource_req, limit)
+                if matrix is not None:
+                    candidates = stateful.filter_matrix(
+                        matrix, candidates, criteria, resource_req, limit
+                    )
+                else:
+                    candidates = stateful.filter(candidates, criteria, resource_req, limit)
                 if not candidates:
                     # Raised inside the step so the record names the filter.
                     raise NoAvailableAgentError(
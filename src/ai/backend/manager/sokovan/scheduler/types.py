@@ -30,6 +30,7 @@ class ScheduleType(StrEnum):
         "detect_kernel_termination"  # Detect active sessions with any kernel TERMINATED/CANCELLED
     )
     OBSERVE_FAIR_SHARE = "observe_fair_share"  # Observe RUNNING kernels for fair share calculation
+    PREFETCH_IMAGES = "prefetch_images"  # Hint agents to pull images of PENDING kernels
     CLEANUP_FORCE_TERMINATED = (
         "cleanup_force_terminated"  # Cleanup containers for force-terminated sessions
     )
@@ -15,6 +15,7 @@ from ai.backend.common.data.entity.resource_slot import ResourceSlotName
 from ai.backend.common.data.entity.user import UserID
 from ai.backend.common.types import (
     AgentId,
+    AgentPlacementEngine,
     AgentSelectionStrategy,
     PreemptionOrder,
     PreemptionVictimScope,
@@ -315,6 +316,8 @@ class ResourceGroupSchedulingPolicy:
     agent_selection_strategy: AgentSelectionStrategy
     # Victim ordering for preemption (victim-order pool key)
     preemption_order: PreemptionOrder
+    # How the selector evaluates agent slot state (tracker dicts or matrix)
+    agent_placement_engine: AgentPlacementEngine = AgentPlacementEngine.TRACKER
 
 
 @dataclass
@@ -373,6 +373,41 @@ async def get_quota_scope(request: web.Request) -> web.Response:
             })
 
 
+async def get_quota_scopes(request: web.Request) -> web.Response:
+    class Params(TypedDict):
+        volume: str
+        qsids: list[QuotaScopeID]
+
+    async with cast(
+        AbstractAsyncContextManager[Params],
+        check_params(
+            request,
+            t.Dict(
+                {
+                    t.Key("volume"): t.String(),
+                    t.Key("qsids"): t.List(tx.QuotaScopeID()),
+                },
+            ),
+        ),
+    ) as params:
+        await log_manager_api_entry(log, "get_quota_scopes", params)
+        ctx: RootContext = request.app["ctx"]
+        async with ctx.get_volume(params["volume"]) as volume:
+            with handle_external_errors():
+                quota_usages = await volume.quota_model.describe_quota_scopes(params["qsids"])
+            return web.json_response({
+                "quota_scopes": {
+                    str(qsid): {
+                        "used_bytes": usage.used_bytes if usage.used_bytes >= 0 else None,
+                        "limit_bytes": usage.limit_bytes if usage.limit_bytes >= 0 else None,
+                    }
+                    if usage
+                    else None
+                    for qsid, usage in quota_usages.items()
+                },
+            })
+
+
 async def update_quota_scope(request: web.Request) -> web.Response:
     class Params(TypedDict):
         volume: str
@@ -1353,6 +1388,7 @@ async def init_manager_app(ctx: RootContext) -> web.Application:
     app.router.add_route("GET", "/volume/hwinfo", get_hwinfo)
     app.router.add_route("POST", "/quota-scope", create_quota_scope)
     app.router.add_route("GET", "/quota-scope", get_quota_scope)
+    app.router.add_route("GET", "/quota-scopes", get_quota_scopes)
     app.router.add_route("PATCH", "/quota-scope", update_quota_scope)
     app.router.add_route("DELETE", "/quota-scope/quota", unset_quota)
     app.router.add_route("POST", "/folder/create", create_vfolder)
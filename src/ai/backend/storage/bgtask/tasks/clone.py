@@ -5,10 +5,12 @@ from typing import TYPE_CHECKING, override
 
 from pydantic import Field
 
+from ai.backend.common.bgtask.reporter import ProgressReporter
 from ai.backend.common.bgtask.task.base import (
     BaseBackgroundTaskHandler,
     BaseBackgroundTaskManifest,
 )
+from ai.backend.common.contexts.bgtask import current_bgtask_id
 from ai.backend.common.events.dispatcher import EventProducer
 from ai.backend.common.events.event_types.vfolder.anycast import (
     VFolderCloneFailureEvent,
@@ -17,6 +19,7 @@ from ai.backend.common.events.event_types.vfolder.anycast import (
 from ai.backend.common.type_adapters import VFolderIDField
 from ai.backend.logging import BraceStyleAdapter
 from ai.backend.storage.bgtask.types import StorageBgtaskName
+from ai.backend.storage.types import CloneProgress, CloneProgressCallback
 
 if TYPE_CHECKING:
     from ai.backend.storage.volumes.pool import VolumePool
@@ -59,6 +62,7 @@ class VFolderCloneTaskHandler(BaseBackgroundTaskHandler[VFolderCloneManifest, No
                 await volume.clone_vfolder(
                     manifest.src_vfolder,
                     manifest.dst_vfolder,
+                    progress=self._make_progress_callback(),
                 )
         except Exception as e:
             log.exception(
@@ -79,3 +83,19 @@ class VFolderCloneTaskHandler(BaseBackgroundTaskHandler[VFolderCloneManifest, No
                     dst_vfid=manifest.dst_vfolder,
                 )
             )
+
+    def _make_progress_callback(self) -> CloneProgressCallback | None:
+        task_id = current_bgtask_id()
+        if task_id is None:
+            return None
+        reporter = ProgressReporter(self._event_producer, task_id)
+
+        async def _report(progress: CloneProgress) -> None:
+            # The total grows until the whole source tree has been scanned.
+            reporter.total_progress = progress.bytes_found
+            reporter.current_progress = progress.bytes_copied
+            await reporter.update(
+                message=f"Copied {progress.files_copied} of {progress.files_found} files"
+            )
+
+        return _report
@@ -220,6 +220,15 @@ class HuggingFaceClient:
         )
 
 
+def _content_digest(file: RepoFile) -> str | None:
+    """Return the digest of a repository file, preferring the SHA-256 of its LFS object."""
+    if file.lfs is not None:
+        return f"sha256:{file.lfs.sha256}"
+    if file.blob_id:
+        return f"git-sha1:{file.blob_id}"
+    return None
+
+
 class HuggingFaceScanner:
     """Scanner for HuggingFace models and metadata."""
 
@@ -418,6 +427,7 @@ class HuggingFaceScanner:
                                 size=file.size,
                                 type="file",
                                 download_url=self._client.get_download_url(model, file.path),
+                                digest=_content_digest(file),
                             )
                         case RepoFolder():
                             file_obj = FileObjectData(
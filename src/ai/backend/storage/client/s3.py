@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
 from collections.abc import AsyncIterator, Iterable
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, cast, override
+from typing import Any, Final, cast, override
 
 import aioboto3
+from botocore.config import Config
 
 from ai.backend.common.dto.storage.response import ObjectMetaResponse, PresignedUploadObjectResponse
 from ai.backend.common.types import StreamReader
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_POOL_CONNECTIONS: Final = 10
+DEFAULT_UPLOAD_CONCURRENCY: Final = 4
+DEFAULT_UPLOAD_MAX_RETRIES: Final = 3
+_PART_RETRY_BACKOFF: Final = 1.0  # seconds, doubled on every retry
+
 
 @dataclass(frozen=True)
 class _S3Credentials:
@@ -74,9 +83,38 @@ class S3DownloadStreamReader(StreamReader):
         return self._config.content_type
 
 
+class _PartBufferPool:
+    """
+    Fixed-size part buffers reused across the parts of a multipart upload.
+
+    Buffers are allocated on demand and returned once their parts are uploaded,
+    so an upload holds at most one buffer per in-flight part plus the one being filled.
+    """
+
+    _part_size: int
+    _free: list[bytearray]
+
+    def __init__(self, part_size: int) -> None:
+        self._part_size = part_size
+        self._free = []
+
+    def acquire(self) -> bytearray:
+        return self._free.pop() if self._free else bytearray(self._part_size)
+
+    def release(self, buf: bytearray) -> None:
+        # The truncated buffer of the last part is not reusable.
+        if len(buf) == self._part_size:
+            self._free.append(buf)
+
+
 class S3Client:
     """
     S3 client for file upload and download operations using aioboto3.
+
+    The underlying aiobotocore client and its connection pool are opened on first use
+    and kept until :meth:`close` is called.  Multipart uploads send up to
+    ``upload_concurrency`` parts at once and retry each failed part up to
+    ``upload_max_retries`` times.
     """
 
     def __init__(
@@ -86,13 +124,48 @@ class S3Client:
         region_name: str | None,
         aws_access_key_id: str | None,
         aws_secret_access_key: str | None,
+        *,
+        upload_concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        upload_max_retries: int = DEFAULT_UPLOAD_MAX_RETRIES,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
     ) -> None:
         self.bucket_name = bucket_name
         self.endpoint_url = endpoint_url
         self.region_name = region_name
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
+        self.upload_concurrency = upload_concurrency
+        self.upload_max_retries = upload_max_retries
+        self.max_pool_connections = max_pool_connections
         self.session = aioboto3.Session()
+        self._client_stack = AsyncExitStack()
+        self._client_lock = asyncio.Lock()
+        self._s3_client: Any = None
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[Any]:
+        async with self._client_lock:
+            if self._s3_client is None:
+                self._s3_client = await self._client_stack.enter_async_context(
+                    self.session.client(
+                        "s3",
+                        endpoint_url=self.endpoint_url,
+                        region_name=self.region_name,
+                        aws_access_key_id=self.aws_access_key_id,
+                        aws_secret_access_key=self.aws_secret_access_key,
+                        config=Config(max_pool_connections=self.max_pool_connections),
+                    )
+                )
+        yield self._s3_client
+
+    async def close(self) -> None:
+        """
+        Close the underlying client and its connections.
+        The client is reopened if this instance is used again.
+        """
+        async with self._client_lock:
+            self._s3_client = None
+            await self._client_stack.aclose()
 
     async def create_bucket(self, bucket_name: str) -> None:
         """
@@ -101,13 +174,7 @@ class S3Client:
         Args:
             bucket_name: Name of the bucket to create.
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3_client:
+        async with self._client() as s3_client:
             await s3_client.create_bucket(Bucket=bucket_name)
 
     async def delete_bucket(self, bucket_name: str) -> None:
@@ -117,13 +184,7 @@ class S3Client:
         Args:
             bucket_name: Name of the bucket to delete.
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3_client:
+        async with self._client() as s3_client:
             await s3_client.delete_bucket(Bucket=bucket_name)
 
     async def upload_stream(
@@ -133,20 +194,18 @@ class S3Client:
         part_size: int,
     ) -> None:
         """
-        Upload data stream to S3 using streaming.
+        Upload data stream to S3 using a multipart upload.
+
+        The parts are uploaded concurrently while the next part is being filled from
+        the stream, and a failed part is retried by itself without restarting the
+        whole upload.
 
         Args:
             data_stream: StreamReader to upload
             s3_key: The S3 object key (destination path in bucket)
             part_size: Size of each part in bytes
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3_client:
+        async with self._client() as s3_client:
             create_args = {"Bucket": self.bucket_name, "Key": s3_key}
             if content_type := data_stream.content_type():
                 create_args["ContentType"] = content_type
@@ -154,40 +213,14 @@ class S3Client:
             resp = await s3_client.create_multipart_upload(**create_args)
             upload_id = resp["UploadId"]
 
-            parts = []
-            part_no = 1
-            buf = bytearray()
-
             try:
-                async for downloaded_chunk in data_stream.read():
-                    if not downloaded_chunk:
-                        continue
-                    buf.extend(downloaded_chunk)
-
-                    while len(buf) >= part_size:
-                        piece = bytes(buf[:part_size])
-                        del buf[:part_size]
-
-                        upload_resp = await s3_client.upload_part(
-                            Bucket=self.bucket_name,
-                            Key=s3_key,
-                            PartNumber=part_no,
-                            UploadId=upload_id,
-                            Body=piece,
-                        )
-                        parts.append({"PartNumber": part_no, "ETag": upload_resp["ETag"]})
-                        part_no += 1
-
-                if buf:
-                    upload_resp = await s3_client.upload_part(
-                        Bucket=self.bucket_name,
-                        Key=s3_key,
-                        PartNumber=part_no,
-                        UploadId=upload_id,
-                        Body=bytes(buf),
-                    )
-                    parts.append({"PartNumber": part_no, "ETag": upload_resp["ETag"]})
-
+                parts = await self._upload_parts(
+                    s3_client,
+                    data_stream,
+                    s3_key,
+                    upload_id,
+                    part_size,
+                )
                 await s3_client.complete_multipart_upload(
                     Bucket=self.bucket_name,
                     Key=s3_key,
@@ -204,6 +237,96 @@ class S3Client:
                     # Reraise original exception, not abort exception
                     raise
 
+    async def _upload_parts(
+        self,
+        s3_client: Any,
+        data_stream: StreamReader,
+        s3_key: str,
+        upload_id: str,
+        part_size: int,
+    ) -> list[dict[str, Any]]:
+        buffers = _PartBufferPool(part_size)
+        inflight: set[asyncio.Task[None]] = set()
+        etags: dict[int, str] = {}
+        part_numbers = itertools.count(1)
+
+        async def _wait_inflight(limit: int) -> None:
+            while len(inflight) > limit:
+                done, _ = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                inflight.difference_update(done)
+                for task in done:
+                    task.result()
+
+        async def _upload(part_no: int, body: bytearray) -> None:
+            etags[part_no] = await self._upload_part(s3_client, s3_key, upload_id, part_no, body)
+            buffers.release(body)
+
+        async def _submit(body: bytearray) -> None:
+            await _wait_inflight(self.upload_concurrency - 1)
+            inflight.add(asyncio.create_task(_upload(next(part_numbers), body)))
+
+        buf: bytearray | None = None
+        filled = 0
+        try:
+            async for downloaded_chunk in data_stream.read():
+                chunk = memoryview(downloaded_chunk)
+                while chunk:
+                    if buf is None:
+                        buf = buffers.acquire()
+                    size = min(len(chunk), part_size - filled)
+                    buf[filled : filled + size] = chunk[:size]
+                    filled += size
+                    chunk = chunk[size:]
+                    if filled == part_size:
+                        await _submit(buf)
+                        buf, filled = None, 0
+
+            if buf is not None and filled:
+                del buf[filled:]
+                await _submit(buf)
+            await _wait_inflight(0)
+        finally:
+            for task in inflight:
+                task.cancel()
+            await asyncio.gather(*inflight, return_exceptions=True)
+
+        return [{"PartNumber": part_no, "ETag": etags[part_no]} for part_no in sorted(etags)]
+
+    async def _upload_part(
+        self,
+        s3_client: Any,
+        s3_key: str,
+        upload_id: str,
+        part_no: int,
+        body: bytearray,
+    ) -> str:
+        attempt = 0
+        while True:
+            try:
+                upload_resp = await s3_client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    PartNumber=part_no,
+                    UploadId=upload_id,
+                    Body=body,
+                )
+                return cast(str, upload_resp["ETag"])
+            except Exception as e:
+                if attempt >= self.upload_max_retries:
+                    raise
+                delay = _PART_RETRY_BACKOFF * (2**attempt)
+                logger.warning(
+                    "Retrying part %d of %s in %.1f seconds (attempt %d/%d): %r",
+                    part_no,
+                    s3_key,
+                    delay,
+                    attempt + 1,
+                    self.upload_max_retries,
+                    e,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
     def download_stream(
         self,
         s3_key: str,
@@ -259,13 +382,7 @@ class S3Client:
         Returns:
             PresignedUploadObjectResponse: Presigned URL data
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3_client:
+        async with self._client() as s3_client:
             conditions: list[Any] = []
 
             if content_length_range:
@@ -307,13 +424,7 @@ class S3Client:
         Returns:
             str: Presigned download URL
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3_client:
+        async with self._client() as s3_client:
             params = {
                 "Bucket": self.bucket_name,
                 "Key": s3_key,
@@ -343,13 +454,7 @@ class S3Client:
         Returns:
             ObjectMetaResponse: Object metadata
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3_client:
+        async with self._client() as s3_client:
             response = await s3_client.head_object(
                 Bucket=self.bucket_name,
                 Key=s3_key,
@@ -381,13 +486,7 @@ class S3Client:
             delete_all_versions: Whether to delete all versions in versioned buckets
             batch_size: Number of objects to delete per batch
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3:
+        async with self._client() as s3:
             # If key ends with "/", treat as prefix deletion (folder)
             if key_or_prefix.endswith("/"):
                 norm_prefix = key_or_prefix
@@ -451,13 +550,7 @@ class S3Client:
         Returns:
             list[str]: List of object keys matching the prefix
         """
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            region_name=self.region_name,
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-        ) as s3_client:
+        async with self._client() as s3_client:
             object_keys = []
 
             paginator = s3_client.get_paginator("list_objects_v2")
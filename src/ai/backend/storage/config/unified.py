@@ -578,6 +578,25 @@ class StorageProxyConfig(BaseConfigSchema):
             example=ConfigExample(local="1000", prod="5000"),
         ),
     ]
+    clone_concurrency: Annotated[
+        int,
+        Field(
+            default=16,
+            ge=1,
+            validation_alias=AliasChoices("clone-concurrency", "clone_concurrency"),
+            serialization_alias="clone-concurrency",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Number of worker threads copying a directory tree when cloning a vfolder "
+                "on filesystem-based volumes. The files are reflinked where the filesystem "
+                "supports it and otherwise copied in the kernel, so higher values mainly "
+                "help trees with many small files and network filesystems."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="16", prod="32"),
+        ),
+    ]
     max_upload_size: Annotated[
         str,
         Field(
@@ -945,6 +964,21 @@ class VFSStorageConfig(BaseConfigSchema):
             example=ConfigExample(local="1073741824", prod="10737418240"),
         ),
     ]
+    deduplicate: Annotated[
+        bool,
+        Field(default=False),
+        BackendAIConfigMeta(
+            description=(
+                "Store imported artifact files as content-addressed blobs under '.blobs' and "
+                "hard-link them into the model revision paths, so that identical files of "
+                "different models and revisions are stored and downloaded only once. Blobs "
+                "no longer linked from any file are garbage-collected on startup and after "
+                "deletions. Requires a filesystem supporting hard links."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="false", prod="true"),
+        ),
+    ]
 
 
 # TODO: Remove this after migrating this to database
@@ -1078,6 +1112,42 @@ class ObjectStorageConfig(BaseConfigSchema):
             example=ConfigExample(local="5242880", prod="10485760"),
         ),
     ]
+    upload_concurrency: Annotated[
+        int,
+        Field(
+            default=4,
+            ge=1,
+            validation_alias=AliasChoices("upload-concurrency", "upload_concurrency"),
+            serialization_alias="upload-concurrency",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of parts of a multipart upload sent to object storage "
+                "at once. Each in-flight part holds a buffer of upload_chunk_size bytes, "
+                "so the memory used per upload grows with this value."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="4", prod="8"),
+        ),
+    ]
+    upload_max_retries: Annotated[
+        int,
+        Field(
+            default=3,
+            ge=0,
+            validation_alias=AliasChoices("upload-max-retries", "upload_max_retries"),
+            serialization_alias="upload-max-retries",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of retries of a failed part of a multipart upload. "
+                "Only the failed part is sent again, with an exponential backoff "
+                "starting from 1 second."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="3", prod="3"),
+        ),
+    ]
     download_chunk_size: Annotated[
         int,
         Field(
@@ -1177,6 +1247,60 @@ class HuggingfaceConfig(BaseConfigSchema):
             example=ConfigExample(local="8192", prod="65536"),
         ),
     ]
+    download_concurrency: Annotated[
+        int,
+        Field(
+            default=4,
+            ge=1,
+            validation_alias=AliasChoices("download-concurrency", "download_concurrency"),
+            serialization_alias="download-concurrency",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of files of a model downloaded from HuggingFace at once. "
+                "Models split into many shards import faster with more concurrent files."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="4", prod="8"),
+        ),
+    ]
+    download_connections: Annotated[
+        int,
+        Field(
+            default=4,
+            ge=1,
+            validation_alias=AliasChoices("download-connections", "download_connections"),
+            serialization_alias="download-connections",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Maximum number of concurrent range requests for a single file. Files "
+                "larger than download_segment_size are fetched as segments over this many "
+                "connections if the server supports range requests. Set to 1 to always "
+                "download a file over a single connection."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="4", prod="4"),
+        ),
+    ]
+    download_segment_size: Annotated[
+        int,
+        Field(
+            default=16 * 1024 * 1024,
+            ge=1024 * 1024,
+            validation_alias=AliasChoices("download-segment-size", "download_segment_size"),
+            serialization_alias="download-segment-size",
+        ),
+        BackendAIConfigMeta(
+            description=(
+                "Size in bytes of the segments of a file fetched with range requests. "
+                "Each connection of a file holds one segment in memory until it is "
+                "written to the storage in order."
+            ),
+            added_version="26.8.0",
+            example=ConfigExample(local="16777216", prod="67108864"),
+        ),
+    ]
 
 
 # TODO: Remove legacy config classes
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, override
 
 from ai.backend.common.artifact_storage import AbstractStorage, AbstractStoragePool
+from ai.backend.common.bgtask.reporter import ProgressReporter
 from ai.backend.common.contexts.request_id import current_request_id
 from ai.backend.common.data.storage.registries.types import ModelTarget
 from ai.backend.common.data.storage.types import (
@@ -117,6 +118,8 @@ class ImportStepContext:
     storage_step_mappings: dict[ArtifactStorageImportStep, StorageTarget]
     step_metadata: dict[str, Any]
     custom_storage_prefix: str | None = None
+    # Reporter of the background task running the import, if any
+    progress_reporter: ProgressReporter | None = None
 
 
 class StorageMappingResolver:
@@ -22,6 +22,7 @@ class StoragePoolProvider(NonMonitorableDependencyProvider[StorageProxyUnifiedCo
     async def provide(self, setup_input: StorageProxyUnifiedConfig) -> AsyncIterator[StoragePool]:
         """Create and provide storage pool."""
         storage_pool = StoragePool.from_config(setup_input)
-
-        # StoragePool doesn't have explicit cleanup, but yield it as a context manager
-        yield storage_pool
+        try:
+            yield storage_pool
+        finally:
+            await storage_pool.close()
@@ -27,10 +27,12 @@ from .object import (
     ArtifactStorageEmptyError,
     ArtifactVerificationFailedError,
     ArtifactVerifyStorageTypeInvalid,
+    BlobDigestMismatchError,
     FileStreamDownloadError,
     FileStreamUploadError,
     HuggingFaceAPIError,
     HuggingFaceModelNotFoundError,
+    InvalidBlobDigestError,
     ObjectInfoFetchError,
     ObjectStorageBucketNotFoundError,
     ObjectStorageConfigInvalidError,
@@ -135,4 +137,6 @@ __all__ = [
     "ArtifactVerifyStorageTypeInvalid",
     "ArtifactVerificationFailedError",
     "UnsupportedFileTypeError",
+    "InvalidBlobDigestError",
+    "BlobDigestMismatchError",
 ]
@@ -305,3 +305,33 @@ class UnsupportedFileTypeError(BackendAIError, web.HTTPBadRequest):
             operation=ErrorOperation.READ,
             error_detail=ErrorDetail.INVALID_PARAMETERS,
         )
+
+
+class InvalidBlobDigestError(BackendAIError, web.HTTPBadRequest):
+    """Raised when a content digest of a blob is malformed or of an unsupported algorithm."""
+
+    error_type = "https://api.backend.ai/probs/storage/blob/digest/invalid"
+    error_title = "Invalid Blob Digest"
+
+    @override
+    def error_code(self) -> ErrorCode:
+        return ErrorCode(
+            domain=ErrorDomain.VFS_STORAGE,
+            operation=ErrorOperation.CREATE,
+            error_detail=ErrorDetail.INVALID_PARAMETERS,
+        )
+
+
+class BlobDigestMismatchError(BackendAIError, web.HTTPInternalServerError):
+    """Raised when the content stored as a blob does not match its expected digest."""
+
+    error_type = "https://api.backend.ai/probs/storage/blob/digest/mismatch"
+    error_title = "Blob Digest Mismatch"
+
+    @override
+    def error_code(self) -> ErrorCode:
+        return ErrorCode(
+            domain=ErrorDomain.VFS_STORAGE,
+            operation=ErrorOperation.CREATE,
+            error_detail=ErrorDetail.MISMATCH,
+        )
@@ -623,10 +623,12 @@ async def server_main(
             volume_ctx(local_config, etcd, event_dispatcher, event_producer)
         )
         storage_pool = StoragePool.from_config(local_config)
+        storage_init_stack.push_async_callback(storage_pool.close)
 
         # Clean up temporary storages only on the first process
         if pidx == 0:
             storage_pool.cleanup_temporary_storages()
+            await storage_pool.collect_garbage()
 
         bgtask_mgr = await storage_init_stack.enter_async_context(
             bgtask_ctx(local_config, redis_config, event_producer, volume_pool)
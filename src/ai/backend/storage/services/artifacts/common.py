@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
-from typing import override
+from types import TracebackType
+from typing import Final, Self, override
 
 from ai.backend.common.artifact_storage import AbstractStorage
+from ai.backend.common.bgtask.reporter import ProgressReporter
 from ai.backend.common.data.artifact.types import (
     ArtifactRegistryType,
     VerificationStepResult,
     VerifierResult,
 )
+from ai.backend.common.data.storage.registries.types import ModelTarget
 from ai.backend.common.data.storage.types import ArtifactStorageImportStep
 from ai.backend.common.events.dispatcher import EventProducer
 from ai.backend.common.events.event_types.artifact.anycast import (
@@ -36,6 +40,87 @@ from ai.backend.storage.storages.vfs_storage import VFSStorage
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 
+_MiB: Final[int] = 1024 * 1024
+_THROUGHPUT_REPORT_INTERVAL: Final[float] = 10.0
+
+
+class DownloadThroughputReporter:
+    """
+    Aggregates the bytes received by the concurrent file downloads of a model import
+    and periodically reports the overall progress and throughput to the log and,
+    if given, to the progress reporter of the background task.
+
+    The bytes only go into the message of the progress reporter, as its progress
+    counts the models of a batch import.
+    """
+
+    _model: ModelTarget
+    _total_bytes: int
+    _reporter: ProgressReporter | None
+    _interval: float
+    _downloaded_bytes: int
+    _report_task: asyncio.Task[None] | None
+
+    def __init__(
+        self,
+        model: ModelTarget,
+        total_bytes: int,
+        reporter: ProgressReporter | None,
+        *,
+        interval: float = _THROUGHPUT_REPORT_INTERVAL,
+    ) -> None:
+        self._model = model
+        self._total_bytes = total_bytes
+        self._reporter = reporter
+        self._interval = interval
+        self._downloaded_bytes = 0
+        self._report_task = None
+
+    @property
+    def downloaded_bytes(self) -> int:
+        return self._downloaded_bytes
+
+    def add(self, nbytes: int) -> None:
+        self._downloaded_bytes += nbytes
+
+    async def __aenter__(self) -> Self:
+        self._report_task = asyncio.create_task(self._report_periodically())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._report_task is not None:
+            self._report_task.cancel()
+            try:
+                await self._report_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _report_periodically(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_time = loop.time()
+        last_bytes = self._downloaded_bytes
+        while True:
+            await asyncio.sleep(self._interval)
+            now, downloaded = loop.time(), self._downloaded_bytes
+            rate = (downloaded - last_bytes) / (now - last_time)
+            last_time, last_bytes = now, downloaded
+            message = (
+                f"Downloading {self._model}: {downloaded / _MiB:.1f} / "
+                f"{self._total_bytes / _MiB:.1f} MiB ({rate / _MiB:.1f} MiB/s)"
+            )
+            log.info("{}", message)
+            if self._reporter is None:
+                continue
+            try:
+                await self._reporter.update(0, message=message)
+            except Exception as e:
+                log.warning("Failed to report the download throughput: {!r}", e)
+
 
 class ModelVerifyStep(ImportStep[DownloadStepResult], ABC):
     """Base class for model verification steps that transfer files and run artifact verification"""
@@ -5,7 +5,9 @@ import logging
 import mimetypes
 import ssl
 import uuid
+from collections import deque
 from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
 from dataclasses import dataclass
 from typing import Any, Final, override
 
@@ -30,6 +32,7 @@ from ai.backend.common.data.storage.registries.types import (
 from ai.backend.common.data.storage.types import (
     ArtifactStorageImportStep,
 )
+from ai.backend.common.dto.storage.response import ObjectMetaResponse, VFSFileMetaResponse
 from ai.backend.common.events.dispatcher import EventProducer
 from ai.backend.common.events.event_types.artifact.anycast import ModelImportDoneEvent
 from ai.backend.common.types import DispatchResult, StreamReader
@@ -43,12 +46,19 @@ from ai.backend.storage.config.unified import HuggingfaceConfig
 from ai.backend.storage.context_types import ArtifactVerifierContext
 from ai.backend.storage.data.storage.types import ImportStepContext, StorageTarget
 from ai.backend.storage.errors import (
+    FileStreamDownloadError,
     HuggingFaceAPIError,
     HuggingFaceModelNotFoundError,
+    ObjectInfoFetchError,
     RegistryNotFoundError,
+    StorageBucketFileNotFoundError,
     StorageStepRequiredStepNotProvided,
 )
-from ai.backend.storage.services.artifacts.common import ModelArchiveStep, ModelVerifyStep
+from ai.backend.storage.services.artifacts.common import (
+    DownloadThroughputReporter,
+    ModelArchiveStep,
+    ModelVerifyStep,
+)
 from ai.backend.storage.services.artifacts.storage_transfer import StorageTransferManager
 from ai.backend.storage.services.artifacts.types import (
     DownloadStepResult,
@@ -56,12 +66,14 @@ from ai.backend.storage.services.artifacts.types import (
     ImportStep,
 )
 from ai.backend.storage.storages.storage_pool import StoragePool
+from ai.backend.storage.storages.vfs_storage import VFSStorage
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 
 _MiB = 1024 * 1024
 
 _DOWNLOAD_PROGRESS_UPDATE_INTERVAL: Final[int] = 30
+_DEFAULT_SEGMENT_SIZE: Final[int] = 16 * _MiB
 _PROBE_HEAD_BASE_HEADER: Final[dict[str, str]] = {"Accept-Encoding": "identity"}
 
 _DOWNLOAD_RETRIABLE_ERROR = (
@@ -81,9 +93,20 @@ class _ProbeHeadInfo:
 
 
 class HuggingFaceFileDownloadStreamReader(StreamReader):
+    """
+    Streams a file from HuggingFace, resuming with range requests after transient errors.
+
+    Files larger than ``segment_size`` are fetched as segments over up to ``connections``
+    concurrent range requests if the server accepts ranges, and the segments are
+    yielded in order.  Each segment is retried by itself.
+    """
+
     _url: str
     _chunk_size: int
     _max_retries: int
+    _connections: int
+    _segment_size: int
+    _progress_callback: Callable[[int], None] | None
     _content_type: str | None
     _redis_client: ValkeyArtifactDownloadTrackingClient
     _model_id: str
@@ -92,6 +115,7 @@ class HuggingFaceFileDownloadStreamReader(StreamReader):
     _download_complete: bool
     _progress_task: asyncio.Task[None] | None
     _token: str | None
+    _offset: int
 
     def __init__(
         self,
@@ -104,10 +128,17 @@ class HuggingFaceFileDownloadStreamReader(StreamReader):
         revision: str,
         file_path: str,
         token: str | None = None,
+        *,
+        connections: int = 1,
+        segment_size: int = _DEFAULT_SEGMENT_SIZE,
+        progress_callback: Callable[[int], None] | None = None,
     ) -> None:
         self._url = url
         self._chunk_size = chunk_size
         self._max_retries = max_retries
+        self._connections = connections
+        self._segment_size = segment_size
+        self._progress_callback = progress_callback
         self._content_type = content_type
         self._redis_client = redis_client
         self._model_id = model_id
@@ -116,6 +147,7 @@ class HuggingFaceFileDownloadStreamReader(StreamReader):
         self._download_complete = False
         self._progress_task = None
         self._token = token
+        self._offset = 0
 
     async def _periodic_progress_update(
         self,
@@ -195,83 +227,32 @@ class HuggingFaceFileDownloadStreamReader(StreamReader):
 
         headers_base = self._get_auth_headers()
 
-        offset = 0
-        backoff = 1.0
-        retries = 0
-
+        self._offset = 0
         self._download_complete = False
         self._progress_task = None
 
         # Probe head first - if this fails, we can't proceed
         probe_info = await self._probe_head()
         total = probe_info.total
-        etag = probe_info.etag
-        accept_ranges = probe_info.accept_ranges
 
         try:
             # Start background progress task
             self._progress_task = asyncio.create_task(
                 self._periodic_progress_update(
-                    offset_getter=lambda: offset,
+                    offset_getter=lambda: self._offset,
                     total_bytes=total,
                 )
             )
 
-            while True:
-                headers = dict(headers_base)
-                if offset and accept_ranges:
-                    headers["Range"] = f"bytes={offset}-"
-
-                try:
-                    async with self._session.get(
-                        self._url, headers=headers, allow_redirects=True
-                    ) as resp:
-                        # Validate partial content when resuming
-                        if offset and accept_ranges and resp.status != 206:
-                            raise aiohttp.ClientPayloadError(f"Expected 206, got {resp.status}")
-
-                        # Validate ETag across resumes
-                        resp_etag = resp.headers.get("ETag")
-                        if etag and resp_etag and resp_etag != etag:
-                            raise aiohttp.ClientPayloadError("ETag changed during resume")
-
-                        async for chunk in resp.content.iter_chunked(self._chunk_size):
-                            if not chunk:
-                                continue
-                            offset += len(chunk)
-                            yield chunk
-
-                    # Completed
-                    if offset >= total:
-                        break
-
-                    # Unexpected early EOF → retry
-                    raise aiohttp.ClientPayloadError("Early EOF before Content-Length")
-
-                except _DOWNLOAD_RETRIABLE_ERROR as e:
-                    retries += 1
-                    if retries > self._max_retries:
-                        raise aiohttp.ClientPayloadError(
-                            f"Exceeded retries while downloading {self._url} at offset={offset}"
-                        ) from e
-
-                    log.warning(
-                        "Download retry {}/{} at offset {:.1f} MiB (backoff={:.1f}s, err={})",
-                        retries,
-                        self._max_retries,
-                        offset / _MiB,
-                        backoff,
-                        e.__class__.__name__,
-                    )
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, 30.0)
-
-                    # Refresh metadata before retry
-                    probe_info = await self._probe_head()
-                    total = probe_info.total
-                    etag = probe_info.etag
-                    accept_ranges = probe_info.accept_ranges
-                    continue
+            if self._connections > 1 and probe_info.accept_ranges and total > self._segment_size:
+                chunks = self._read_segments(probe_info, headers_base)
+            else:
+                chunks = self._read_sequential(probe_info, headers_base)
+            async with aclosing(chunks):
+                async for chunk in chunks:
+                    if self._progress_callback is not None:
+                        self._progress_callback(len(chunk))
+                    yield chunk
         except Exception as e:
             # Update Redis with error status
             try:
@@ -279,7 +260,7 @@ class HuggingFaceFileDownloadStreamReader(StreamReader):
                     model_id=self._model_id,
                     revision=self._revision,
                     file_path=self._file_path,
-                    current_bytes=offset,
+                    current_bytes=self._offset,
                     total_bytes=total,
                     success=False,
                     error_message=str(e),
@@ -304,15 +285,165 @@ class HuggingFaceFileDownloadStreamReader(StreamReader):
                     model_id=self._model_id,
                     revision=self._revision,
                     file_path=self._file_path,
-                    current_bytes=offset,
+                    current_bytes=self._offset,
                     total_bytes=total,
-                    success=(offset >= total),
+                    success=(self._offset >= total),
                 )
             except Exception as redis_err:
                 log.warning("Failed to update final status in Redis: {}", str(redis_err))
 
             await self._session.close()
 
+    async def _read_sequential(
+        self,
+        probe_info: _ProbeHeadInfo,
+        headers_base: dict[str, str],
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the file over a single connection, resuming from the current offset on retries.
+        """
+        backoff = 1.0
+        retries = 0
+        total = probe_info.total
+        etag = probe_info.etag
+        accept_ranges = probe_info.accept_ranges
+
+        while True:
+            headers = dict(headers_base)
+            if self._offset and accept_ranges:
+                headers["Range"] = f"bytes={self._offset}-"
+
+            try:
+                async with self._session.get(
+                    self._url, headers=headers, allow_redirects=True
+                ) as resp:
+                    # Validate partial content when resuming
+                    if self._offset and accept_ranges and resp.status != 206:
+                        raise aiohttp.ClientPayloadError(f"Expected 206, got {resp.status}")
+
+                    # Validate ETag across resumes
+                    resp_etag = resp.headers.get("ETag")
+                    if etag and resp_etag and resp_etag != etag:
+                        raise aiohttp.ClientPayloadError("ETag changed during resume")
+
+                    async for chunk in resp.content.iter_chunked(self._chunk_size):
+                        if not chunk:
+                            continue
+                        self._offset += len(chunk)
+                        yield chunk
+
+                # Completed
+                if self._offset >= total:
+                    break
+
+                # Unexpected early EOF → retry
+                raise aiohttp.ClientPayloadError("Early EOF before Content-Length")
+
+            except _DOWNLOAD_RETRIABLE_ERROR as e:
+                retries += 1
+                if retries > self._max_retries:
+                    raise aiohttp.ClientPayloadError(
+                        f"Exceeded retries while downloading {self._url} at offset={self._offset}"
+                    ) from e
+
+                log.warning(
+                    "Download retry {}/{} at offset {:.1f} MiB (backoff={:.1f}s, err={})",
+                    retries,
+                    self._max_retries,
+                    self._offset / _MiB,
+                    backoff,
+                    e.__class__.__name__,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+                # Refresh metadata before retry
+                probe_info = await self._probe_head()
+                total = probe_info.total
+                etag = probe_info.etag
+                accept_ranges = probe_info.accept_ranges
+                continue
+
+    async def _read_segments(
+        self,
+        probe_info: _ProbeHeadInfo,
+        headers_base: dict[str, str],
+    ) -> AsyncIterator[bytes]:
+        """
+        Fetch the file as segments with up to ``connections`` range requests in flight,
+        yielding the segments in order.
+        """
+        total = probe_info.total
+        starts = iter(range(0, total, self._segment_size))
+        pending: deque[asyncio.Task[bytes]] = deque()
+
+        def _fetch_next() -> None:
+            if (start := next(starts, None)) is None:
+                return
+            end = min(start + self._segment_size, total)
+            pending.append(
+                asyncio.create_task(self._fetch_segment(start, end, probe_info.etag, headers_base))
+            )
+
+        try:
+            for _ in range(self._connections):
+                _fetch_next()
+            while pending:
+                segment = await pending.popleft()
+                # Keep the connections busy while the consumer writes this segment.
+                _fetch_next()
+                self._offset += len(segment)
+                yield segment
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _fetch_segment(
+        self,
+        start: int,
+        end: int,
+        etag: str | None,
+        headers_base: dict[str, str],
+    ) -> bytes:
+        backoff = 1.0
+        retries = 0
+        while True:
+            headers = dict(headers_base)
+            headers["Range"] = f"bytes={start}-{end - 1}"
+            try:
+                async with self._session.get(
+                    self._url, headers=headers, allow_redirects=True
+                ) as resp:
+                    # Never read a full response into memory when the range is ignored.
+                    if resp.status != 206:
+                        raise aiohttp.ClientPayloadError(f"Expected 206, got {resp.status}")
+                    resp_etag = resp.headers.get("ETag")
+                    if etag and resp_etag and resp_etag != etag:
+                        raise aiohttp.ClientPayloadError("ETag changed between segments")
+                    data = await resp.read()
+                if len(data) != end - start:
+                    raise aiohttp.ClientPayloadError(
+                        f"Expected {end - start} bytes in segment, got {len(data)}"
+                    )
+                return data
+            except _DOWNLOAD_RETRIABLE_ERROR as e:
+                retries += 1
+                if retries > self._max_retries:
+                    raise aiohttp.ClientPayloadError(
+                        f"Exceeded retries while downloading {self._url} at offset={start}"
+                    ) from e
+                log.warning(
+                    "Segment retry {}/{} at offset {:.1f} MiB (backoff={:.1f}s, err={})",
+                    retries,
+                    self._max_retries,
+                    start / _MiB,
+                    backoff,
+                    e.__class__.__name__,
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
     @override
     def content_type(self) -> str | None:
         return self._content_type
@@ -546,6 +677,7 @@ class HuggingFaceService:
         storage_step_mappings: dict[ArtifactStorageImportStep, StorageTarget],
         pipeline: ImportPipeline,
         storage_prefix: str | None = None,
+        reporter: ProgressReporter | None = None,
     ) -> None:
         """Import a HuggingFace model to storage using ImportPipeline.
 
@@ -557,6 +689,7 @@ class HuggingFaceService:
             storage_prefix: Custom prefix path for storing imported models.
                 If None, uses default path.
                 If "/", stores files at root.
+            reporter: ProgressReporter of the background task running the import, if any
 
         Raises:
             HuggingFaceModelNotFoundError: If model is not found
@@ -573,6 +706,7 @@ class HuggingFaceService:
                 storage_step_mappings=storage_step_mappings,
                 step_metadata={},
                 custom_storage_prefix=storage_prefix,
+                progress_reporter=reporter,
             )
 
             # Execute import pipeline
@@ -682,6 +816,7 @@ class HuggingFaceService:
                             storage_step_mappings=storage_step_mappings,
                             pipeline=pipeline,
                             storage_prefix=storage_prefix,
+                            reporter=reporter,
                         )
 
                         successful_models += 1
@@ -819,6 +954,7 @@ class HuggingFaceDownloadStep(ImportStep[None]):
 
         # Initialize artifact download tracking in Redis with all file information
         revision = context.model.resolve_revision(ArtifactRegistryType.HUGGINGFACE)
+        completed_paths = await self._get_completed_paths(context.model.model_id, revision)
         file_info_list = [(file.path, file.size) for file in file_infos]
         await self._redis_client.init_artifact_download(
             model_id=context.model.model_id,
@@ -828,24 +964,73 @@ class HuggingFaceDownloadStep(ImportStep[None]):
 
         # Default prefix: {model_id}/{revision}
         default_prefix = f"{context.model.model_id}/{revision}"
+        storage_keys = [
+            self._resolve_storage_key(context, default_prefix, file_info.path)
+            for file_info in file_infos
+        ]
+
+        pending: list[tuple[FileObjectData, str]] = []
+        for file_info, storage_key in zip(file_infos, storage_keys, strict=True):
+            if file_info.path in completed_paths and await self._is_stored(
+                download_storage_target.resolve_storage(context.storage_pool),
+                storage_key,
+                file_info.size,
+            ):
+                log.info(
+                    "[download] Skipping the file already downloaded by a previous attempt: {}",
+                    storage_key,
+                )
+                await self._redis_client.update_file_progress(
+                    model_id=context.model.model_id,
+                    revision=revision,
+                    file_path=file_info.path,
+                    current_bytes=file_info.size,
+                    total_bytes=file_info.size,
+                    success=True,
+                )
+                continue
+            pending.append((file_info, storage_key))
 
-        downloaded_files: list[tuple[FileObjectData, str]] = []
-        total_bytes = 0
-
-        for file_info in file_infos:
-            storage_key = self._resolve_storage_key(context, default_prefix, file_info.path)
-            storage_key = await self._download_file_to_storage(
-                file_info=file_info,
-                model=context.model,
-                storage_target=download_storage_target,
-                storage_pool=context.storage_pool,
-                download_chunk_size=chunk_size,
-                redis_client=self._redis_client,
-                storage_key=storage_key,
-                token=registry_config.token,
-            )
-            downloaded_files.append((file_info, storage_key))
-            total_bytes += file_info.size
+        semaphore = asyncio.Semaphore(registry_config.download_concurrency)
+        async with DownloadThroughputReporter(
+            context.model,
+            sum(file_info.size for file_info, _ in pending),
+            context.progress_reporter,
+        ) as throughput:
+
+            async def _download(file_info: FileObjectData, storage_key: str) -> str:
+                async with semaphore:
+                    return await self._download_file_to_storage(
+                        file_info=file_info,
+                        model=context.model,
+                        storage_target=download_storage_target,
+                        storage_pool=context.storage_pool,
+                        download_chunk_size=chunk_size,
+                        redis_client=self._redis_client,
+                        storage_key=storage_key,
+                        token=registry_config.token,
+                        connections=registry_config.download_connections,
+                        segment_size=registry_config.download_segment_size,
+                        progress_callback=throughput.add,
+                    )
+
+            tasks = {
+                storage_key: asyncio.create_task(_download(file_info, storage_key))
+                for file_info, storage_key in pending
+            }
+            try:
+                await asyncio.gather(*tasks.values())
+            finally:
+                # Stop the remaining downloads if any of them has failed.
+                for task in tasks.values():
+                    task.cancel()
+                await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+        downloaded_files = [
+            (file_info, tasks[storage_key].result() if storage_key in tasks else storage_key)
+            for file_info, storage_key in zip(file_infos, storage_keys, strict=True)
+        ]
+        total_bytes = sum(file_info.size for file_info in file_infos)
 
         log.info(
             "Download completed: model={}, files={}, total_bytes={}",
@@ -860,6 +1045,32 @@ class HuggingFaceDownloadStep(ImportStep[None]):
             total_bytes=total_bytes,
         )
 
+    async def _get_completed_paths(self, model_id: str, revision: str) -> set[str]:
+        """
+        Return the paths of the files completed by a previous attempt of the same import,
+        which are tracked until the tracking data expires.
+        """
+        try:
+            file_progress = await self._redis_client.get_all_file_progress(model_id, revision)
+        except Exception as e:
+            log.warning("Failed to read the previous download progress of {}: {}", model_id, e)
+            return set()
+        return {
+            progress.file_path
+            for progress in file_progress
+            if progress.success and progress.current_bytes == progress.total_bytes
+        }
+
+    async def _is_stored(self, storage: AbstractStorage, storage_key: str, size: int) -> bool:
+        try:
+            file_info: ObjectMetaResponse | VFSFileMetaResponse = await storage.get_file_info(
+                storage_key
+            )
+        except (StorageBucketFileNotFoundError, ObjectInfoFetchError, FileStreamDownloadError):
+            # Storages wrap a missing file into their own fetch errors.
+            return False
+        return file_info.content_length == size
+
     async def _download_file_to_storage(
         self,
         *,
@@ -871,6 +1082,9 @@ class HuggingFaceDownloadStep(ImportStep[None]):
         redis_client: ValkeyArtifactDownloadTrackingClient,
         storage_key: str,
         token: str | None = None,
+        connections: int = 1,
+        segment_size: int = _DEFAULT_SEGMENT_SIZE,
+        progress_callback: Callable[[int], None] | None = None,
     ) -> str:
         """Download file from HuggingFace to specified storage"""
         storage = storage_target.resolve_storage(storage_pool)
@@ -878,6 +1092,27 @@ class HuggingFaceDownloadStep(ImportStep[None]):
 
         revision = model.resolve_revision(ArtifactRegistryType.HUGGINGFACE)
 
+        # Files identical to the ones of previously imported models are stored only once.
+        blob_storage: VFSStorage | None = None
+        if isinstance(storage, VFSStorage) and storage.deduplicates and file_info.digest:
+            blob_storage = storage
+            if await blob_storage.link_blob(storage_key, file_info.digest, file_info.size):
+                log.info(
+                    "[download] Reusing the stored blob {} in {}: {}",
+                    file_info.digest,
+                    storage_name,
+                    storage_key,
+                )
+                await redis_client.update_file_progress(
+                    model_id=model.model_id,
+                    revision=revision,
+                    file_path=file_info.path,
+                    current_bytes=file_info.size,
+                    total_bytes=file_info.size,
+                    success=True,
+                )
+                return storage_key
+
         log.info(
             "[download] Starting download to {}: file_path={}, storage_key={}, file_size={}",
             storage_name,
@@ -898,12 +1133,23 @@ class HuggingFaceDownloadStep(ImportStep[None]):
             revision=revision,
             file_path=file_info.path,
             token=token,
+            connections=connections,
+            segment_size=segment_size,
+            progress_callback=progress_callback,
         )
 
-        await storage.stream_upload(
-            filepath=storage_key,
-            data_stream=data_stream,
-        )
+        if blob_storage is not None and file_info.digest:
+            await blob_storage.stream_upload_blob(
+                filepath=storage_key,
+                digest=file_info.digest,
+                size=file_info.size,
+                data_stream=data_stream,
+            )
+        else:
+            await storage.stream_upload(
+                filepath=storage_key,
+                data_stream=data_stream,
+            )
 
         log.info("[download] Successfully downloaded to {}: {}", storage_name, storage_key)
         return storage_key
@@ -504,6 +504,7 @@ class ReservoirService:
                 storage_step_mappings=storage_step_mappings,
                 step_metadata={},
                 custom_storage_prefix=storage_prefix,
+                progress_reporter=reporter,
             )
 
             # Execute import pipeline
@@ -845,7 +846,7 @@ class ReservoirDownloadStep(ImportStep[None]):
             options=options,
             model_id=context.model.model_id,
             revision=revision,
-            progress_reporter=None,
+            progress_reporter=context.progress_reporter,
             key_prefix=model_prefix,
         )
 
@@ -874,15 +875,8 @@ class ReservoirDownloadStep(ImportStep[None]):
                 f"No bucket configured for storage '{storage_name}'"
             )
 
-        # Create S3Client from ObjectStorage configuration
-        s3_client = S3Client(
-            bucket_name=bucket_name,
-            endpoint_url=storage._endpoint,
-            region_name=storage._region,
-            aws_access_key_id=storage._access_key,
-            aws_secret_access_key=storage._secret_key,
-        )
-        return s3_client, bucket_name
+        # Reuse the long-lived S3Client of the ObjectStorage and its connection pool
+        return storage._get_s3_client(), bucket_name
 
     async def _stream_bucket_to_bucket(
         self,
@@ -916,82 +910,85 @@ class ReservoirDownloadStep(ImportStep[None]):
             aws_secret_access_key=source_cfg.object_storage_secret_key,
         )
 
-        target_keys, size_map, total_bytes = await self._list_all_keys_and_sizes(
-            s3_client=src_s3_client,
-            prefix=key_prefix,
-        )
+        try:
+            target_keys, size_map, total_bytes = await self._list_all_keys_and_sizes(
+                s3_client=src_s3_client,
+                prefix=key_prefix,
+            )
 
-        if not target_keys:
-            raise ArtifactStorageEmptyError()
+            if not target_keys:
+                raise ArtifactStorageEmptyError()
 
-        # Initialize artifact download tracking in Redis with all file information
-        file_info_list = [(key, size_map.get(key, 0)) for key in target_keys]
-        await self._redis_client.init_artifact_download(
-            model_id=model_id,
-            revision=revision,
-            file_info_list=file_info_list,
-        )
+            # Initialize artifact download tracking in Redis with all file information
+            file_info_list = [(key, size_map.get(key, 0)) for key in target_keys]
+            await self._redis_client.init_artifact_download(
+                model_id=model_id,
+                revision=revision,
+                file_info_list=file_info_list,
+            )
 
-        log.trace(
-            "[stream_bucket_to_bucket] start src_endpoint={} src_bucket={} src_prefix={} "
-            "dst_storage={} dst_bucket={} objects={} total_bytes={} concurrency={}",
-            source_cfg.endpoint,
-            bucket_name,
-            key_prefix,
-            storage_name,
-            bucket_name,
-            len(target_keys),
-            total_bytes,
-            options.concurrency,
-        )
+            log.trace(
+                "[stream_bucket_to_bucket] start src_endpoint={} src_bucket={} src_prefix={} "
+                "dst_storage={} dst_bucket={} objects={} total_bytes={} concurrency={}",
+                source_cfg.endpoint,
+                bucket_name,
+                key_prefix,
+                storage_name,
+                bucket_name,
+                len(target_keys),
+                total_bytes,
+                options.concurrency,
+            )
 
-        copied = 0
-        sem = asyncio.Semaphore(options.concurrency)
-
-        async def _copy_single_object(key: str) -> int:
-            """
-            Returns:
-                The number of bytes copied.
-            """
-            async with sem:
-                size = size_map.get(key, -1)
-                log.trace("[stream_bucket_to_bucket] begin key={} size={}", key, size)
-
-                download_chunk_size = storage._reservoir_download_chunk_size
-
-                # Content-Type
-                object_meta = await src_s3_client.get_object_meta(key)
-                ctype = (
-                    object_meta.content_type
-                    or mimetypes.guess_type(key)[0]
-                    or "application/octet-stream"
-                )
+            copied = 0
+            sem = asyncio.Semaphore(options.concurrency)
+
+            async def _copy_single_object(key: str) -> int:
+                """
+                Returns:
+                    The number of bytes copied.
+                """
+                async with sem:
+                    size = size_map.get(key, -1)
+                    log.trace("[stream_bucket_to_bucket] begin key={} size={}", key, size)
+
+                    download_chunk_size = storage._reservoir_download_chunk_size
+
+                    # Content-Type
+                    object_meta = await src_s3_client.get_object_meta(key)
+                    ctype = (
+                        object_meta.content_type
+                        or mimetypes.guess_type(key)[0]
+                        or "application/octet-stream"
+                    )
 
-                data_stream = ReservoirS3FileDownloadStreamReader(
-                    src_s3_client=src_s3_client,
-                    key=key,
-                    size=size,
-                    options=options,
-                    download_chunk_size=download_chunk_size,
-                    content_type=ctype,
-                    redis_client=self._redis_client,
-                    model_id=model_id,
-                    revision=revision,
-                )
+                    data_stream = ReservoirS3FileDownloadStreamReader(
+                        src_s3_client=src_s3_client,
+                        key=key,
+                        size=size,
+                        options=options,
+                        download_chunk_size=download_chunk_size,
+                        content_type=ctype,
+                        redis_client=self._redis_client,
+                        model_id=model_id,
+                        revision=revision,
+                    )
 
-                part_size = storage._upload_chunk_size
-                await dst_client.upload_stream(
-                    data_stream,
-                    key,
-                    part_size=part_size,
-                )
+                    part_size = storage._upload_chunk_size
+                    await dst_client.upload_stream(
+                        data_stream,
+                        key,
+                        part_size=part_size,
+                    )
 
-                log.trace("[stream_bucket_to_bucket] done key={} bytes={}", key, size)
-                return max(size, 0)
+                    log.trace("[stream_bucket_to_bucket] done key={} bytes={}", key, size)
+                    return max(size, 0)
 
-        # TODO: Replace this with global semaphore
-        sizes = await asyncio.gather(*(_copy_single_object(k) for k in target_keys))
-        bytes_copied = sum(sizes)
+            # TODO: Replace this with global semaphore
+            sizes = await asyncio.gather(*(_copy_single_object(k) for k in target_keys))
+            bytes_copied = sum(sizes)
+        finally:
+            await src_s3_client.close()
 
         log.trace(
             "[stream_bucket_to_bucket] all done objects={} total_bytes={}", copied, total_bytes
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Self, override
+
+from ai.backend.common.types import StreamReader
+from ai.backend.logging import BraceStyleAdapter
+from ai.backend.storage.errors import BlobDigestMismatchError, InvalidBlobDigestError
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+BLOB_STORE_DIRNAME: Final[str] = ".blobs"
+_STAGING_DIRNAME: Final[str] = "staging"
+# Staged files older than this are leftovers of crashed uploads.
+_STALE_STAGING_AGE: Final[float] = 24 * 60 * 60.0
+
+_DIGEST_LENGTHS: Final[dict[str, int]] = {"sha256": 64, "git-sha1": 40}
+
+
+@dataclass(frozen=True, slots=True)
+class BlobDigest:
+    """
+    Content digest of a blob in the ``<algorithm>:<hex>`` form.
+
+    ``sha256`` is the SHA-256 of the content, such as the oid of a Git LFS object.
+    ``git-sha1`` is the Git blob id, the SHA-1 of the content prefixed with the
+    ``blob <size>\\0`` header, which the registries report for files not in LFS.
+    """
+
+    algorithm: str
+    hexdigest: str
+
+    @classmethod
+    def parse(cls, digest: str) -> Self:
+        algorithm, _, hexdigest = digest.partition(":")
+        hexdigest = hexdigest.lower()
+        if len(hexdigest) != _DIGEST_LENGTHS.get(algorithm, -1) or any(
+            c not in "0123456789abcdef" for c in hexdigest
+        ):
+            raise InvalidBlobDigestError(f"Invalid blob digest: {digest}")
+        return cls(algorithm, hexdigest)
+
+    def __str__(self) -> str:
+        return f"{self.algorithm}:{self.hexdigest}"
+
+    def hasher(self, size: int) -> hashlib._Hash:
+        match self.algorithm:
+            case "git-sha1":
+                hasher = hashlib.sha1(usedforsecurity=False)
+                hasher.update(f"blob {size}\0".encode())
+                return hasher
+            case _:
+                return hashlib.sha256()
+
+
+class DigestVerifyingStreamReader(StreamReader):
+    """Passes through the chunks of a stream while hashing them for :meth:`verify`."""
+
+    _stream: StreamReader
+    _digest: BlobDigest
+    _hasher: hashlib._Hash
+
+    def __init__(self, stream: StreamReader, digest: BlobDigest, size: int) -> None:
+        self._stream = stream
+        self._digest = digest
+        self._hasher = digest.hasher(size)
+
+    @override
+    async def read(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream.read():
+            self._hasher.update(chunk)
+            yield chunk
+
+    @override
+    def content_type(self) -> str | None:
+        return self._stream.content_type()
+
+    def verify(self) -> None:
+        if (actual := self._hasher.hexdigest()) != self._digest.hexdigest:
+            raise BlobDigestMismatchError(
+                f"Content digest mismatch: expected {self._digest}, "
+                f"got {self._digest.algorithm}:{actual}"
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class GarbageCollectionResult:
+    removed_blobs: int
+    reclaimed_bytes: int
+
+
+class BlobStore:
+    """
+    Content-addressed store of immutable blobs in a directory of a VFS storage.
+
+    A blob is kept at ``<root>/<algorithm>/<xx>/<hexdigest>`` and every file stored
+    with it is a hard link to the blob, so that identical files of different
+    models and revisions share the same data on the disk.  The link count of the
+    blob inode is its reference count: deleting or moving away a referencing file
+    within the filesystem updates it without any bookkeeping, and a blob linked
+    only from the store is garbage.
+
+    The referencing files must never be rewritten in place, as it would change
+    the content of all other references.
+    """
+
+    _root: Path
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def blob_path(self, digest: BlobDigest) -> Path:
+        return self._root / digest.algorithm / digest.hexdigest[:2] / digest.hexdigest
+
+    def staging_path(self) -> Path:
+        return self._root / _STAGING_DIRNAME / uuid.uuid4().hex
+
+    async def reference_count(self, digest: BlobDigest) -> int:
+        """Return the number of files linked to the blob, or -1 if there is no such blob."""
+        loop = asyncio.get_running_loop()
+        try:
+            stat = await loop.run_in_executor(None, self.blob_path(digest).stat)
+        except FileNotFoundError:
+            return -1
+        return stat.st_nlink - 1
+
+    async def link(self, digest: BlobDigest, target: Path, size: int) -> bool:
+        """
+        Make *target* a reference to the blob of *digest* if the store has it with
+        the given size, replacing an existing file.  Returns False if not.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._link, digest, target, size)
+
+    async def commit(self, staged: Path, digest: BlobDigest, target: Path) -> None:
+        """
+        Add the verified staged file as the blob of *digest* and move it to *target*.
+        If another upload has added the same blob meanwhile, *target* refers to
+        that blob instead and the staged file is discarded.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._commit, staged, digest, target)
+
+    async def collect_garbage(self) -> GarbageCollectionResult:
+        """Remove the blobs not referenced by any file and the stale staged files."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._collect_garbage)
+
+    def _link(self, digest: BlobDigest, target: Path, size: int) -> bool:
+        blob_path = self.blob_path(digest)
+        try:
+            if blob_path.stat().st_size != size:
+                log.warning("Ignoring the blob {} of an unexpected size", digest)
+                return False
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._replace_with_link(blob_path, target)
+        except FileNotFoundError:
+            # Not in the store, or just removed by the garbage collector.
+            return False
+        return True
+
+    def _commit(self, staged: Path, digest: BlobDigest, target: Path) -> None:
+        blob_path = self.blob_path(digest)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Link before moving the staged file so that the blob is never unreferenced.
+            os.link(staged, blob_path)
+        except FileExistsError:
+            try:
+                self._replace_with_link(blob_path, target)
+            except FileNotFoundError:
+                # The existing blob has been collected meanwhile; keep ours unshared.
+                staged.replace(target)
+            else:
+                staged.unlink()
+            return
+        staged.replace(target)
+
+    @staticmethod
+    def _replace_with_link(source: Path, target: Path) -> None:
+        # Replace the directory entry atomically instead of truncating the existing
+        # file, which may be a reference to another blob.
+        tmp_link = target.with_name(f".{target.name}.{uuid.uuid4().hex}")
+        os.link(source, tmp_link)
+        try:
+            tmp_link.replace(target)
+        except BaseException:
+            tmp_link.unlink(missing_ok=True)
+            raise
+
+    def _collect_garbage(self) -> GarbageCollectionResult:
+        removed_blobs = 0
+        reclaimed_bytes = 0
+        for algorithm in _DIGEST_LENGTHS:
+            for blob_path in (self._root / algorithm).glob("*/*"):
+                try:
+                    stat = blob_path.stat()
+                    if stat.st_nlink > 1:
+                        continue
+                    blob_path.unlink()
+                except FileNotFoundError:
+                    continue
+                removed_blobs += 1
+                reclaimed_bytes += stat.st_size
+        stale_before = time.time() - _STALE_STAGING_AGE
+        for staged in (self._root / _STAGING_DIRNAME).glob("*"):
+            try:
+                if staged.stat().st_mtime < stale_before:
+                    staged.unlink()
+            except FileNotFoundError:
+                continue
+        if removed_blobs:
+            log.info(
+                "Removed {} unreferenced blobs ({} bytes) from {}",
+                removed_blobs,
+                reclaimed_bytes,
+                self._root,
+            )
+        return GarbageCollectionResult(removed_blobs, reclaimed_bytes)
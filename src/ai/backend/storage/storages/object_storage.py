@@ -8,7 +8,7 @@ from ai.backend.common.dto.storage.response import (
     PresignedUploadObjectResponse,
 )
 from ai.backend.common.types import StreamReader
-from ai.backend.storage.client.s3 import S3Client
+from ai.backend.storage.client.s3 import DEFAULT_MAX_POOL_CONNECTIONS, S3Client
 from ai.backend.storage.config.unified import (
     ObjectStorageConfig,
     PresignedDownloadConfig,
@@ -37,6 +37,7 @@ class ObjectStorage(AbstractStorage):
     _reservoir_download_chunk_size: int
     _presigned_upload_config: PresignedUploadConfig
     _presigned_download_config: PresignedDownloadConfig
+    _s3_client: S3Client
 
     @property
     @override
@@ -55,6 +56,16 @@ class ObjectStorage(AbstractStorage):
         self._reservoir_download_chunk_size = cfg.reservoir_download_chunk_size
         self._presigned_upload_config = cfg.presigned_upload
         self._presigned_download_config = cfg.presigned_download
+        self._s3_client = S3Client(
+            bucket_name=self._bucket,
+            endpoint_url=self._endpoint,
+            region_name=self._region,
+            aws_access_key_id=self._access_key,
+            aws_secret_access_key=self._secret_key,
+            upload_concurrency=cfg.upload_concurrency,
+            upload_max_retries=cfg.upload_max_retries,
+            max_pool_connections=max(DEFAULT_MAX_POOL_CONNECTIONS, cfg.upload_concurrency),
+        )
 
     @override
     async def stream_upload(
@@ -229,11 +240,8 @@ class ObjectStorage(AbstractStorage):
         except Exception as e:
             raise ObjectInfoFetchError(f"List objects failed: {e!s}") from e
 
+    async def close(self) -> None:
+        await self._s3_client.close()
+
     def _get_s3_client(self) -> S3Client:
-        return S3Client(
-            bucket_name=self._bucket,
-            endpoint_url=self._endpoint,
-            region_name=self._region,
-            aws_access_key_id=self._access_key,
-            aws_secret_access_key=self._secret_key,
-        )
+        return self._s3_client
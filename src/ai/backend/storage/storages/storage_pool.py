@@ -140,6 +140,14 @@ class StoragePool(AbstractStoragePool):
         """
         return name in self._storages
 
+    async def close(self) -> None:
+        """
+        Close the connections held by the object storages in the pool.
+        """
+        for storage in self._storages.values():
+            if isinstance(storage, ObjectStorage):
+                await storage.close()
+
     def cleanup_temporary_storages(self) -> None:
         """
         Clean up all temporary VFS storages.
@@ -149,3 +157,13 @@ class StoragePool(AbstractStoragePool):
         for storage in self._storages.values():
             if isinstance(storage, VFSStorage):
                 storage.cleanup_temporary_storage()
+
+    async def collect_garbage(self) -> None:
+        """
+        Remove the unreferenced blobs of deduplicating VFS storages.
+        This should be called only by the first process (pidx=0) on server startup.
+        """
+
+        for storage in self._storages.values():
+            if isinstance(storage, VFSStorage):
+                await storage.collect_garbage()
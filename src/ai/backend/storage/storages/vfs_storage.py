@@ -32,6 +32,12 @@ from ai.backend.storage.errors import (
     ObjectInfoFetchError,
     StorageBucketFileNotFoundError,
 )
+from ai.backend.storage.storages.blob_store import (
+    BLOB_STORE_DIRNAME,
+    BlobDigest,
+    BlobStore,
+    DigestVerifyingStreamReader,
+)
 from ai.backend.storage.utils import normalize_filepath
 
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
@@ -134,6 +140,7 @@ class VFSStorage(AbstractStorage):
     _download_chunk_size: int
     _temporary: bool
     _max_file_size: int | None
+    _blob_store: BlobStore | None
 
     def __init__(self, name: str, cfg: VFSStorageConfig) -> None:
         self._name = name
@@ -148,6 +155,9 @@ class VFSStorage(AbstractStorage):
         self._upload_chunk_size = cfg.upload_chunk_size
         self._download_chunk_size = cfg.download_chunk_size
         self._max_file_size = cfg.max_file_size
+        self._blob_store = (
+            BlobStore(self._base_path / BLOB_STORE_DIRNAME) if cfg.deduplicate else None
+        )
 
     def cleanup_temporary_storage(self) -> None:
         """
@@ -181,6 +191,10 @@ class VFSStorage(AbstractStorage):
     def base_path(self) -> Path:
         return self._base_path
 
+    @property
+    def deduplicates(self) -> bool:
+        return self._blob_store is not None
+
     def resolve_path(self, filepath: str) -> Path:
         """
         Resolve relative filepath to absolute path within base_path.
@@ -230,6 +244,9 @@ class VFSStorage(AbstractStorage):
 
             # Create parent directories if needed
             target_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._blob_store is not None and target_path.is_file():
+                # Never truncate a file that may be a reference to a shared blob.
+                await aiofiles.os.remove(target_path)
 
             # Stream write to file
             total_size = 0
@@ -251,6 +268,67 @@ class VFSStorage(AbstractStorage):
         except Exception as e:
             raise FileStreamUploadError(f"Upload failed: {e!s}") from e
 
+    async def link_blob(self, filepath: str, digest: str, size: int) -> bool:
+        """
+        Store the file as a reference to an existing blob of the given digest and size.
+
+        Args:
+            filepath: Path to the file to store (relative to base_path)
+            digest: Content digest of the file (e.g., ``sha256:<hex>``)
+            size: Size of the file in bytes
+
+        Returns:
+            True if the blob exists and the file now refers to it, False otherwise
+        """
+        if self._blob_store is None:
+            return False
+        try:
+            return await self._blob_store.link(
+                BlobDigest.parse(digest), self.resolve_path(filepath), size
+            )
+        except Exception as e:
+            raise FileStreamUploadError(f"Linking blob failed: {e!s}") from e
+
+    async def stream_upload_blob(
+        self,
+        filepath: str,
+        digest: str,
+        size: int,
+        data_stream: StreamReader,
+    ) -> None:
+        """
+        Upload a file of a known digest using streaming, keeping it as a blob to be
+        shared with identical files if deduplication is enabled.
+
+        Args:
+            filepath: Path to the file to upload (relative to base_path)
+            digest: Content digest of the file (e.g., ``sha256:<hex>``)
+            size: Size of the file in bytes
+            data_stream: Async iterator of file data chunks
+        """
+        if self._blob_store is None:
+            await self.stream_upload(filepath, data_stream)
+            return
+        blob_digest = BlobDigest.parse(digest)
+        staged = self._blob_store.staging_path()
+        verifying_stream = DigestVerifyingStreamReader(data_stream, blob_digest, size)
+        try:
+            await self.stream_upload(str(staged.relative_to(self._base_path)), verifying_stream)
+            verifying_stream.verify()
+            await self._blob_store.commit(staged, blob_digest, self.resolve_path(filepath))
+        except BaseException:
+            staged.unlink(missing_ok=True)
+            raise
+
+    async def collect_garbage(self) -> None:
+        """Remove the blobs no longer referenced by any file if deduplication is enabled."""
+        if self._blob_store is None:
+            return
+        try:
+            await self._blob_store.collect_garbage()
+        except Exception as e:
+            log.warning("Failed to collect unreferenced blobs of {}: {}", self._name, e)
+
     @override
     async def stream_download(self, filepath: str) -> StreamReader:
         """
@@ -337,17 +415,26 @@ class VFSStorage(AbstractStorage):
                 # Silently ignore non-existent files (similar to S3 behavior)
                 return
 
+            # Only deleting a file that shares its inode can leave a blob unreferenced.
+            releases_blobs = False
             if target_path.is_file():
+                releases_blobs = self._blob_store is not None and target_path.stat().st_nlink > 1
                 await aiofiles.os.remove(target_path)
             elif target_path.is_dir():
                 # Remove directory recursively
                 loop = asyncio.get_running_loop()
+                if self._blob_store is not None:
+                    releases_blobs = await loop.run_in_executor(
+                        None, _contains_hard_links, target_path
+                    )
                 await loop.run_in_executor(None, shutil.rmtree, target_path)
             else:
                 raise FileStreamUploadError(f"Cannot delete: {filepath}")
 
         except Exception as e:
             raise FileStreamUploadError(f"Delete failed: {e!s}") from e
+        if releases_blobs:
+            await self.collect_garbage()
 
     async def list_directory(self, directory: str) -> list[VFSFileInfo]:
         """
@@ -501,3 +588,11 @@ class VFSStorage(AbstractStorage):
         self, filepath: str
     ) -> PresignedDownloadObjectResponse:
         raise NotImplementedAPI("VFS storage doesn't support presigned download URLs")
+
+
+def _contains_hard_links(root: Path) -> bool:
+    for dirpath, _, filenames in root.walk():
+        for name in filenames:
+            if (dirpath / name).lstat().st_nlink > 1:
+                return True
+    return False
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import enum
-from collections.abc import AsyncIterator, Mapping
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path, PurePath
@@ -17,6 +17,8 @@ from ai.backend.common.types import QuotaConfig, StreamReader, VFolderID
 __all__ = (
     "SENTINEL",
     "CapacityUsage",
+    "CloneProgress",
+    "CloneProgressCallback",
     "DirEntry",
     "DirEntryType",
     "FSPerfMetric",
@@ -95,6 +97,18 @@ class Stat:
     created: datetime
 
 
+@attrs.define(slots=True, frozen=True)
+class CloneProgress:
+    # The totals grow while the source tree is being walked.
+    files_found: int
+    bytes_found: int
+    files_copied: int
+    bytes_copied: int
+
+
+type CloneProgressCallback = Callable[[CloneProgress], Awaitable[None]]
+
+
 class DirEntryType(enum.Enum):
     FILE = 0
     DIRECTORY = 1
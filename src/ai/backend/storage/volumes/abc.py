@@ -19,6 +19,7 @@ from ai.backend.logging import BraceStyleAdapter
 from ai.backend.storage.errors import InvalidSubpathError, VFolderNotFoundError
 from ai.backend.storage.types import (
     CapacityUsage,
+    CloneProgressCallback,
     DirEntry,
     FSPerfMetric,
     QuotaConfig,
@@ -85,6 +86,22 @@ class AbstractQuotaModel(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def describe_quota_scopes(
+        self,
+        quota_scope_ids: Sequence[QuotaScopeID],
+    ) -> dict[QuotaScopeID, QuotaUsage | None]:
+        """
+        Get the information about the given quota scopes at once.
+        The value is None for the quota scopes that do not exist.
+
+        Backends that query the usage of all quota scopes together should override
+        this to serve the whole batch from a single query.
+        """
+        return {
+            quota_scope_id: await self.describe_quota_scope(quota_scope_id)
+            for quota_scope_id in quota_scope_ids
+        }
+
     @abstractmethod
     async def update_quota_scope(
         self,
@@ -125,12 +142,16 @@ class AbstractFSOpModel(metaclass=ABCMeta):
         self,
         src_path: Path,
         dst_path: Path,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         """
         The actual backend-specific implementation of copying
         files from a directory to another in an efficient way.
         The source and destination are in the same filesystem namespace
         but they may be on different physical media.
+
+        Implementations that can track the copied amount report it to *progress*.
         """
         raise NotImplementedError
 
@@ -288,6 +309,8 @@ class AbstractVolume(metaclass=ABCMeta):
         self,
         src_vfid: VFolderID,
         dst_vfid: VFolderID,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         """
         Create a new vfolder on the same volume and copy all contents of the source
@@ -159,6 +159,7 @@ class CephFSVolume(BaseVolume):
         return CephFSOpModel(
             self.mount_path,
             self.local_config["storage-proxy"]["scandir-limit"],
+            clone_concurrency=self.local_config["storage-proxy"]["clone-concurrency"],
         )
 
     @override
@@ -8,7 +8,13 @@ from ai.backend.common.events.dispatcher import EventDispatcher, EventProducer
 from ai.backend.common.json import dump_json_str
 from ai.backend.common.types import BinarySize, HardwareMetadata, QuotaScopeID
 from ai.backend.logging import BraceStyleAdapter
-from ai.backend.storage.types import CapacityUsage, FSPerfMetric, QuotaConfig, QuotaUsage
+from ai.backend.storage.types import (
+    CapacityUsage,
+    CloneProgressCallback,
+    FSPerfMetric,
+    QuotaConfig,
+    QuotaUsage,
+)
 from ai.backend.storage.volumes.abc import (
     CAP_FAST_FS_SIZE,
     CAP_METRIC,
@@ -129,6 +135,8 @@ class GPFSOpModel(BaseFSOpModel):
         self,
         src_path: Path,
         dst_path: Path,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         await self.api_client.copy_folder(
             self.fs,
@@ -38,6 +38,7 @@ from ai.backend.storage.subproc import spawn_and_watch
 from ai.backend.storage.types import (
     SENTINEL,
     CapacityUsage,
+    CloneProgressCallback,
     DirEntry,
     DirEntryType,
     FSPerfMetric,
@@ -222,6 +223,8 @@ class XCPFSOpModel(BaseFSOpModel):
         self,
         src_path: Path,
         dst_path: Path,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         if not src_path.is_relative_to(self.mount_path):
             raise InvalidPathError(f"Invalid path inside the volume: {src_path}")
@@ -474,6 +477,7 @@ class NetAppVolume(BaseVolume):
         return BaseFSOpModel(
             self.mount_path,
             self.local_config["storage-proxy"]["scandir-limit"],
+            clone_concurrency=self.local_config["storage-proxy"]["clone-concurrency"],
         )
 
     @override
@@ -9,6 +9,7 @@ from ai.backend.common.events.dispatcher import EventDispatcher, EventProducer
 from ai.backend.common.types import BinarySize, HardwareMetadata, QuotaScopeID
 from ai.backend.storage.types import (
     CapacityUsage,
+    CloneProgressCallback,
     DirEntry,
     DirEntryType,
     FSPerfMetric,
@@ -89,6 +90,8 @@ class NoopFSOpModel(AbstractFSOpModel):
         self,
         src_path: Path,
         dst_path: Path,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         pass
 
@@ -183,6 +186,8 @@ class NoopVolume(AbstractVolume):
         self,
         src_vfid: VFolderID,
         dst_vfid: VFolderID,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         return None
 
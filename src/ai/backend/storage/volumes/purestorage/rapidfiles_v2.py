@@ -16,7 +16,13 @@ from ai.backend.storage.errors import (
     SubprocessStdoutNotAvailableError,
 )
 from ai.backend.storage.subproc import run
-from ai.backend.storage.types import DirEntry, DirEntryType, Stat, TreeUsage
+from ai.backend.storage.types import (
+    CloneProgressCallback,
+    DirEntry,
+    DirEntryType,
+    Stat,
+    TreeUsage,
+)
 from ai.backend.storage.utils import fstime2datetime
 
 from .rapidfiles import RapidFileToolsFSOpModel
@@ -30,6 +36,8 @@ class RapidFileToolsv2FSOpModel(RapidFileToolsFSOpModel):
         self,
         src_path: Path,
         dst_path: Path,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         extra_opts: list[bytes] = []
         if src_path.is_dir():
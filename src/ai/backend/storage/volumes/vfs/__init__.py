@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import errno
-import functools
 import logging
 import os
 import secrets
@@ -34,6 +33,7 @@ from ai.backend.storage.subproc import run
 from ai.backend.storage.types import (
     SENTINEL,
     CapacityUsage,
+    CloneProgressCallback,
     DirEntry,
     DirEntryType,
     FSPerfMetric,
@@ -55,6 +55,8 @@ from ai.backend.storage.volumes.abc import (
 )
 from ai.backend.storage.watcher import DeletePathTask, WatcherClient
 
+from .clone import DEFAULT_CLONE_CONCURRENCY, TreeCloner
+
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 
 
@@ -223,27 +225,34 @@ class SetGIDQuotaModel(BaseQuotaModel):
 
 class BaseFSOpModel(AbstractFSOpModel):
     def __init__(
-        self, mount_path: Path, scandir_limit: int, watcher: WatcherClient | None = None
+        self,
+        mount_path: Path,
+        scandir_limit: int,
+        watcher: WatcherClient | None = None,
+        *,
+        clone_concurrency: int = DEFAULT_CLONE_CONCURRENCY,
     ) -> None:
         self.mount_path = mount_path
         self.scandir_limit = scandir_limit
         self.watcher = watcher
+        self.clone_concurrency = clone_concurrency
 
     @override
     async def copy_tree(
         self,
         src_path: Path,
         dst_path: Path,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(
-            None,
-            functools.partial(
-                shutil.copytree,
-                src_path,
-                dst_path,
-                dirs_exist_ok=True,
-            ),
+        cloner = TreeCloner(src_path, dst_path, concurrency=self.clone_concurrency)
+        result = await cloner.run(progress)
+        log.debug(
+            "copied {} files ({} bytes) from {} to {}",
+            result.files_copied,
+            result.bytes_copied,
+            src_path,
+            dst_path,
         )
 
     @override
@@ -425,6 +434,7 @@ class BaseVolume(AbstractVolume):
             self.mount_path,
             self.local_config["storage-proxy"]["scandir-limit"],
             self.watcher,
+            clone_concurrency=self.local_config["storage-proxy"]["clone-concurrency"],
         )
 
     @override
@@ -480,6 +490,8 @@ class BaseVolume(AbstractVolume):
         self,
         src_vfid: VFolderID,
         dst_vfid: VFolderID,
+        *,
+        progress: CloneProgressCallback | None = None,
     ) -> None:
         # check if there is enough space in the destination
         fs_usage = await self.get_fs_usage()
@@ -506,7 +518,7 @@ class BaseVolume(AbstractVolume):
 
         # perform the file-tree copy
         try:
-            await self.fsop_model.copy_tree(src_vfpath, dst_vfpath)
+            await self.fsop_model.copy_tree(src_vfpath, dst_vfpath, progress=progress)
         except Exception as e:
             await self.delete_vfolder(dst_vfid)
             log.exception("clone_vfolder: error during copy_tree()")
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import asyncio
+import errno
+import fcntl
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Final
+
+from ai.backend.logging import BraceStyleAdapter
+from ai.backend.storage.types import CloneProgress, CloneProgressCallback
+
+log = BraceStyleAdapter(logging.getLogger(__spec__.name))
+
+DEFAULT_CLONE_CONCURRENCY: Final[int] = 16
+
+# _IOW(0x94, 9, int) from <linux/fs.h>, also known as BTRFS_IOC_CLONE.
+FICLONE: Final[int] = 0x40049409
+
+# Small files are copied in batches to amortize the cost of scheduling a job.
+_FILE_BATCH_SIZE: Final[int] = 64
+_FILE_BATCH_BYTES: Final[int] = 64 * 1024 * 1024
+_COPY_CHUNK_SIZE: Final[int] = 1024 * 1024 * 1024
+_READ_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+# Errors meaning that a copy method is not available for the files, not that the
+# copy has failed, e.g. a filesystem without reflinks or a kernel without the syscall.
+_UNSUPPORTED_ERRNOS: Final[frozenset[int]] = frozenset({
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+})
+
+
+class _Counters:
+    __slots__ = ("bytes_copied", "bytes_found", "files_copied", "files_found", "lock")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.files_found = 0
+        self.bytes_found = 0
+        self.files_copied = 0
+        self.bytes_copied = 0
+
+    def snapshot(self) -> CloneProgress:
+        with self.lock:
+            return CloneProgress(
+                files_found=self.files_found,
+                bytes_found=self.bytes_found,
+                files_copied=self.files_copied,
+                bytes_copied=self.bytes_copied,
+            )
+
+
+class TreeCloner:
+    """
+    Copies a directory tree with a pool of worker threads.
+
+    Each directory is scanned by a job that creates its subdirectories, schedules
+    their scans and schedules the files in batches, so that wide and deep trees
+    are copied in parallel.  The data of a file is copied by the first method
+    that the filesystem supports, in the order of:
+
+    * ``FICLONE`` to share the extents (a reflink on XFS, btrfs and bcachefs),
+    * ``copy_file_range()`` to copy it in the kernel, which NFS and CephFS
+      may offload to the server,
+    * ``sendfile()``, and finally reading and writing through userspace.
+
+    A method is no longer tried once it reports being unsupported.  The permission
+    bits and timestamps of all entries are preserved, directories being updated
+    after their contents are complete.  Symbolic links are copied as links
+    instead of following them out of the source tree, and other special files
+    are skipped.
+    """
+
+    _src_root: Path
+    _dst_root: Path
+    _concurrency: int
+    _counters: _Counters
+    _lock: threading.Lock
+    _idle: threading.Event
+    _pending: int
+    _error: BaseException | None
+    _aborted: bool
+    _directories: list[tuple[Path, Path]]
+    _executor: ThreadPoolExecutor | None
+    _use_reflink: bool
+    _use_copy_file_range: bool
+    _use_sendfile: bool
+
+    def __init__(
+        self,
+        src_root: Path,
+        dst_root: Path,
+        *,
+        concurrency: int = DEFAULT_CLONE_CONCURRENCY,
+    ) -> None:
+        self._src_root = src_root
+        self._dst_root = dst_root
+        self._concurrency = max(1, concurrency)
+        self._counters = _Counters()
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._pending = 0
+        self._error = None
+        self._aborted = False
+        self._directories = []
+        self._executor = None
+        self._use_reflink = hasattr(fcntl, "ioctl")
+        self._use_copy_file_range = hasattr(os, "copy_file_range")
+        self._use_sendfile = hasattr(os, "sendfile")
+
+    @property
+    def progress(self) -> CloneProgress:
+        return self._counters.snapshot()
+
+    async def run(
+        self,
+        progress: CloneProgressCallback | None = None,
+        *,
+        progress_interval: float = 1.0,
+    ) -> CloneProgress:
+        """
+        Copy the source tree into the destination, merging into existing directories
+        and overwriting existing files, and report the progress to *progress*
+        every *progress_interval* seconds and at the end.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(self._concurrency, thread_name_prefix="clone-tree")
+        self._executor = executor
+        try:
+            if self._src_root.is_dir() and not self._src_root.is_symlink():
+                self._submit(self._clone_directory_root)
+            else:
+                self._submit(self._copy_root_file)
+            while not await loop.run_in_executor(None, self._idle.wait, progress_interval):
+                if progress is not None:
+                    await progress(self._counters.snapshot())
+            if self._error is not None:
+                raise self._error
+            await loop.run_in_executor(None, self._copy_directory_stats)
+        except BaseException:
+            # Stop scheduling new jobs; the running ones finish in the background.
+            with self._lock:
+                self._aborted = True
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown(wait=False)
+        result = self._counters.snapshot()
+        if progress is not None:
+            await progress(result)
+        return result
+
+    def _submit(self, func: Callable[..., None], *args: Any) -> None:
+        executor = self._executor
+        if executor is None:
+            raise RuntimeError("The tree cloner is not running")
+        with self._lock:
+            if self._aborted:
+                return
+            self._pending += 1
+            self._idle.clear()
+        executor.submit(self._run_job, func, *args)
+
+    def _run_job(self, func: Callable[..., None], *args: Any) -> None:
+        try:
+            func(*args)
+        except BaseException as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+                self._aborted = True
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.set()
+
+    def _clone_directory_root(self) -> None:
+        self._dst_root.mkdir(parents=True, exist_ok=True)
+        self._clone_directory(self._src_root, self._dst_root)
+
+    def _copy_root_file(self) -> None:
+        size = self._src_root.stat().st_size
+        with self._counters.lock:
+            self._counters.files_found += 1
+            self._counters.bytes_found += size
+        self._copy_file(self._src_root, self._dst_root)
+
+    def _clone_directory(self, src_dir: Path, dst_dir: Path) -> None:
+        with self._lock:
+            self._directories.append((src_dir, dst_dir))
+        batch: list[tuple[Path, Path, bool]] = []
+        batch_bytes = 0
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                src = src_dir / entry.name
+                dst = dst_dir / entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    dst.mkdir(exist_ok=True)
+                    self._submit(self._clone_directory, src, dst)
+                    continue
+                is_symlink = entry.is_symlink()
+                if not is_symlink:
+                    if not entry.is_file(follow_symlinks=False):
+                        log.warning("clone: skipping the special file {}", src)
+                        continue
+                    size = entry.stat(follow_symlinks=False).st_size
+                    with self._counters.lock:
+                        self._counters.files_found += 1
+                        self._counters.bytes_found += size
+                    batch_bytes += size
+                batch.append((src, dst, is_symlink))
+                if len(batch) >= _FILE_BATCH_SIZE or batch_bytes >= _FILE_BATCH_BYTES:
+                    self._submit(self._copy_entries, batch)
+                    batch = []
+                    batch_bytes = 0
+        if batch:
+            self._submit(self._copy_entries, batch)
+
+    def _copy_entries(self, batch: list[tuple[Path, Path, bool]]) -> None:
+        for src, dst, is_symlink in batch:
+            with self._lock:
+                if self._aborted:
+                    return
+            if is_symlink:
+                self._copy_symlink(src, dst)
+            else:
+                self._copy_file(src, dst)
+
+    def _copy_symlink(self, src: Path, dst: Path) -> None:
+        target = src.readlink()
+        try:
+            dst.symlink_to(target)
+        except FileExistsError:
+            dst.unlink()
+            dst.symlink_to(target)
+        shutil.copystat(src, dst, follow_symlinks=False)
+
+    def _copy_file(self, src: Path, dst: Path) -> None:
+        if dst.is_symlink():
+            dst.unlink()
+        with src.open("rb") as fsrc, dst.open("wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            self._copy_data(fsrc.fileno(), fdst.fileno(), size)
+        shutil.copystat(src, dst)
+        with self._counters.lock:
+            self._counters.files_copied += 1
+
+    def _copy_data(self, src_fd: int, dst_fd: int, size: int) -> None:
+        if size == 0:
+            return
+        if self._use_reflink:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                self._use_reflink = False
+            else:
+                self._add_copied_bytes(size)
+                return
+        if self._use_copy_file_range:
+            try:
+                if self._copy_with(self._copy_file_range_chunk, src_fd, dst_fd):
+                    return
+            except _UnsupportedMethod:
+                self._use_copy_file_range = False
+        if self._use_sendfile:
+            try:
+                if self._copy_with(self._sendfile_chunk, src_fd, dst_fd):
+                    return
+            except _UnsupportedMethod:
+                self._use_sendfile = False
+        self._copy_with(self._read_write_chunk, src_fd, dst_fd)
+
+    def _copy_with(
+        self,
+        copy_chunk: Callable[[int, int, int], int],
+        src_fd: int,
+        dst_fd: int,
+    ) -> bool:
+        """
+        Copy the rest of the file from the current offsets with *copy_chunk*.
+        Returns False if it has copied nothing, e.g. from a pseudo-filesystem
+        reporting a wrong size, for the next method to retry.
+        """
+        offset = 0
+        while True:
+            try:
+                copied = copy_chunk(src_fd, dst_fd, offset)
+            except OSError as e:
+                if offset == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                    raise _UnsupportedMethod from e
+                raise
+            if copied == 0:
+                return offset > 0
+            offset += copied
+            self._add_copied_bytes(copied)
+
+    @staticmethod
+    def _copy_file_range_chunk(src_fd: int, dst_fd: int, _offset: int) -> int:
+        # Both file offsets advance by themselves.
+        return os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE)
+
+    @staticmethod
+    def _sendfile_chunk(src_fd: int, dst_fd: int, offset: int) -> int:
+        return os.sendfile(dst_fd, src_fd, offset, _COPY_CHUNK_SIZE)
+
+    @staticmethod
+    def _read_write_chunk(src_fd: int, dst_fd: int, offset: int) -> int:
+        data = os.pread(src_fd, _READ_CHUNK_SIZE, offset)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(dst_fd, view) :]
+        return len(data)
+
+    def _add_copied_bytes(self, size: int) -> None:
+        with self._counters.lock:
+            self._counters.bytes_copied += size
+
+    def _copy_directory_stats(self) -> None:
+        # Deepest first, as updating the contents of a directory changes its mtime.
+        for src_dir, dst_dir in sorted(
+            self._directories, key=lambda dirs: len(dirs[1].parts), reverse=True
+        ):
+            shutil.copystat(src_dir, dst_dir)
+
+
+class _UnsupportedMethod(Exception):
+    pass
@@ -1,7 +1,8 @@
 import asyncio
 import logging
 import os
-from collections.abc import Mapping
+import time
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any, override
@@ -33,6 +34,7 @@ from ai.backend.storage.watcher import WatcherClient
 log = BraceStyleAdapter(logging.getLogger(__spec__.name))
 
 DEFAULT_LOCK_FILE = Path("/tmp/backendai-xfs-file-lock")
+DEFAULT_QUOTA_REPORT_TTL = 5.0
 
 
 class XfsProjectRegistry:
@@ -141,6 +143,83 @@ class XfsProjectRegistry:
         return project_id
 
 
+class XfsQuotaReportCache:
+    """
+    Caches the project quota report of an XFS mount.
+
+    ``xfs_quota`` reports the usage of all projects in the mount at once, so a
+    report is parsed once into the fields of each project and shared by all
+    lookups for ``ttl`` seconds.  Concurrent lookups of an expired report wait
+    for a single refresh instead of running one each, and lookups of projects
+    missing from the report force at most one refresh per ``ttl``.
+    """
+
+    _mount_path: Path
+    _ttl: float
+    _lock: asyncio.Lock
+    _report: dict[str, list[str]]
+    _fetched_at: float
+    _miss_invalidated_at: float
+    _generation: int
+
+    def __init__(self, mount_path: Path, *, ttl: float = DEFAULT_QUOTA_REPORT_TTL) -> None:
+        self._mount_path = mount_path
+        self._ttl = ttl
+        self._lock = asyncio.Lock()
+        self._report = {}
+        self._fetched_at = float("-inf")
+        self._miss_invalidated_at = float("-inf")
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        """Make the next lookup fetch a new report, e.g. after changing a quota."""
+        self._generation += 1
+        self._fetched_at = float("-inf")
+
+    def invalidate_on_miss(self) -> bool:
+        """
+        Invalidate the report after a lookup missed a project, unless the report has
+        already been invalidated for a miss within ``ttl`` seconds.
+        Returns whether the report was invalidated.
+        """
+        now = time.monotonic()
+        if now - self._miss_invalidated_at < self._ttl:
+            return False
+        self._miss_invalidated_at = now
+        self.invalidate()
+        return True
+
+    async def get_report(self) -> Mapping[str, list[str]]:
+        """
+        Return the report lines split into fields, keyed by the first field which is
+        the project name registered in ``/etc/projid`` or ``#<project id>``.
+        """
+        if self._is_fresh():
+            return self._report
+        async with self._lock:
+            if self._is_fresh():
+                return self._report
+            generation = self._generation
+            full_report = await run(
+                # -p: project quota only
+                # -b: as number of blocks
+                # -N: without header
+                ["sudo", "xfs_quota", "-x", "-c", "report -p -b -N", self._mount_path],
+            )
+            report: dict[str, list[str]] = {}
+            for line in full_report.splitlines():
+                if fields := line.split():
+                    report[fields[0]] = fields
+            # Do not cache a report fetched before an invalidation.
+            if generation == self._generation:
+                self._report = report
+                self._fetched_at = time.monotonic()
+            return report
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._fetched_at < self._ttl
+
+
 class XFSProjectQuotaModel(BaseQuotaModel):
     """
     Implements the quota scope model using XFS projects.
@@ -151,12 +230,15 @@ class XFSProjectQuotaModel(BaseQuotaModel):
         mount_path: Path,
         project_registry: XfsProjectRegistry,
         lock_path: Path,
+        *,
+        quota_report_ttl: float = DEFAULT_QUOTA_REPORT_TTL,
     ) -> None:
         super().__init__(mount_path)
         self.project_registry = project_registry
         stat_vfs = os.statvfs(mount_path)
         self.block_size = stat_vfs.f_bsize
         self._lock_path = lock_path
+        self._report_cache = XfsQuotaReportCache(mount_path, ttl=quota_report_ttl)
 
     @override
     async def create_quota_scope(
@@ -197,22 +279,59 @@ class XFSProjectQuotaModel(BaseQuotaModel):
     ) -> QuotaUsage | None:
         if not self.mangle_qspath(quota_scope_id).exists():
             return None
-        full_report = await run(
-            # -p: project quota only
-            # -b: as number of blocks
-            # -N: without header
-            ["sudo", "xfs_quota", "-x", "-c", "report -p -b -N", self.mount_path],
-        )
-        report = ""
-        for line in full_report.splitlines():
-            if quota_scope_id.pathname in line:
-                report = line
-                break
-        else:
+        usages = await self._describe_existing_quota_scopes([quota_scope_id])
+        if (usage := usages[quota_scope_id]) is None:
             raise QuotaTreeNotFoundError(f"unknown xfs project ID: {quota_scope_id.pathname}")
-        if len(report.split()) != 6:
+        return usage
+
+    @override
+    async def describe_quota_scopes(
+        self,
+        quota_scope_ids: Sequence[QuotaScopeID],
+    ) -> dict[QuotaScopeID, QuotaUsage | None]:
+        existing_ids = [qsid for qsid in quota_scope_ids if self.mangle_qspath(qsid).exists()]
+        usages: dict[QuotaScopeID, QuotaUsage | None] = dict.fromkeys(quota_scope_ids)
+        if existing_ids:
+            usages.update(await self._describe_existing_quota_scopes(existing_ids))
+        return usages
+
+    async def _describe_existing_quota_scopes(
+        self,
+        quota_scope_ids: Sequence[QuotaScopeID],
+    ) -> dict[QuotaScopeID, QuotaUsage | None]:
+        """Describe quota scopes with existing directories, or None if not in the report."""
+        report = await self._report_cache.get_report()
+        if any(self._find_report_fields(report, qsid) is None for qsid in quota_scope_ids):
+            # The project may have been added by another process after the report.
+            if self._report_cache.invalidate_on_miss():
+                report = await self._report_cache.get_report()
+        usages: dict[QuotaScopeID, QuotaUsage | None] = {}
+        for quota_scope_id in quota_scope_ids:
+            fields = self._find_report_fields(report, quota_scope_id)
+            if fields is None:
+                log.warning("unknown xfs project ID: {}", quota_scope_id.pathname)
+                usages[quota_scope_id] = None
+                continue
+            usages[quota_scope_id] = self._parse_report_fields(quota_scope_id, fields)
+        return usages
+
+    def _find_report_fields(
+        self,
+        report: Mapping[str, list[str]],
+        quota_scope_id: QuotaScopeID,
+    ) -> list[str] | None:
+        if (fields := report.get(quota_scope_id.pathname)) is not None:
+            return fields
+        # The report shows the numeric ID of a project without a name in /etc/projid.
+        project_id = self.project_registry.name_id_map.get(quota_scope_id.pathname)
+        if project_id is None:
+            return None
+        return report.get(f"#{project_id}")
+
+    def _parse_report_fields(self, quota_scope_id: QuotaScopeID, fields: list[str]) -> QuotaUsage:
+        if len(fields) != 6:
             raise InvalidQuotaFormatError("unexpected format for xfs_quota report")
-        _, used_kbs, _, hard_limit_kbs, _, _ = report.split()
+        _, used_kbs, _, hard_limit_kbs, _, _ = fields
         # By default, report command displays the sizes in the 1 KiB unit.
         used_bytes = int(used_kbs) * 1024
         hard_limit_bytes = int(hard_limit_kbs) * 1024
@@ -222,7 +341,7 @@ class XFSProjectQuotaModel(BaseQuotaModel):
                 used_bytes,
                 hard_limit_bytes,
                 quota_scope_id,
-                report,
+                " ".join(fields),
             )
         return QuotaUsage(used_bytes, hard_limit_bytes)
 
@@ -259,6 +378,7 @@ class XFSProjectQuotaModel(BaseQuotaModel):
                 self.mount_path,
             ],
         )
+        self._report_cache.invalidate()
 
     @override
     async def unset_quota(self, quota_scope_id: QuotaScopeID) -> None:
@@ -281,6 +401,7 @@ class XFSProjectQuotaModel(BaseQuotaModel):
             await self.project_registry.remove_project_entry(quota_scope_id)
             await self.project_registry.read_project_info()
             await aiofiles.os.rmdir(qspath)
+        self._report_cache.invalidate()
 
 
 class XfsVolume(BaseVolume):
@@ -342,6 +463,7 @@ class XfsVolume(BaseVolume):
             self.mount_path,
             self.project_registry,
             self._lock_path,
+            quota_report_ttl=float(self.config.get("quota_report_ttl", DEFAULT_QUOTA_REPORT_TTL)),
         )
 
     @override
@@ -4,7 +4,6 @@ import secrets
 import signal
 from collections.abc import Mapping
 from http import HTTPStatus
-from pickle import PickleError
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -212,10 +211,9 @@ async def test_auto_pull_none_when_missing(agent: DockerAgent, mocker: Any) -> N
 
 
 async def test_save_last_registry_exception(agent: DockerAgent, mocker: Any) -> None:
-    agent.latest_registry_written_time = MagicMock(return_value=0)  # type: ignore[attr-defined]
-    mocker.patch("ai.backend.agent.agent.pickle.dump", side_effect=PickleError)
-    registry_state_path = (
-        agent.local_config.agent.var_base_path / f"last_registry.{agent.local_instance_id}.dat"
+    mocker.patch("pathlib.Path.replace", side_effect=PermissionError)
+    registry_snapshot_path = (
+        agent.local_config.agent.var_base_path / f"last_registry.{agent.local_instance_id}.snapshot"
     )
-    await agent.save_last_registry()
-    assert not registry_state_path.exists()
+    await agent.save_last_registry(force=True)
+    assert not registry_snapshot_path.exists()
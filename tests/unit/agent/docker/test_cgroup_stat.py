@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+
+import pytest
+
+from ai.backend.agent.docker.cgroup_stat import (
+    CgroupStatReader,
+    find_keyed_value,
+    sum_blkio_service_bytes,
+    sum_io_stat,
+)
+from ai.backend.common.types import ContainerId
+
+CID_A = ContainerId("a" * 64)
+CID_B = ContainerId("b" * 64)
+
+
+@pytest.fixture
+async def reader() -> AsyncIterator[CgroupStatReader]:
+    reader = CgroupStatReader()
+    yield reader
+    await reader.close()
+
+
+def _concat(_cid: ContainerId, contents: Sequence[bytes]) -> bytes:
+    return b"|".join(contents)
+
+
+class TestParsers:
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            (b"anon", 1024),
+            (b"inactive_file", 4096),
+            (b"file", 8192),
+            (b"missing", None),
+        ],
+    )
+    def test_find_keyed_value(self, key: bytes, expected: int | None) -> None:
+        data = b"anon 1024\nfile 8192\nactive_file 4\ninactive_file 4096\n"
+        assert find_keyed_value(data, key) == expected
+
+    def test_sum_io_stat(self) -> None:
+        data = (
+            b"8:16 rbytes=1459200 wbytes=314773504 rios=192 wios=353 dbytes=0 dios=0\n"
+            b"253:0 8:0 rbytes=3387392 wbytes=176128 rios=103 wios=32 dbytes=0 dios=0\n"
+        )
+        assert sum_io_stat(data) == (1459200 + 3387392, 314773504 + 176128)
+
+    def test_sum_blkio_service_bytes(self) -> None:
+        data = b"8:0 Read 13918208\n8:0 Write 512\n8:0 Total 13918720\nTotal 13918720\n"
+        assert sum_blkio_service_bytes(data) == (13918208, 512)
+
+
+class TestCgroupStatReader:
+    async def test_rereads_through_cached_descriptors(
+        self, tmp_path: Path, reader: CgroupStatReader
+    ) -> None:
+        stat_file = tmp_path / "memory.current"
+        stat_file.write_bytes(b"100\n")
+        assert await reader.read({CID_A: [stat_file]}, _concat) == {CID_A: b"100\n"}
+        fd = reader._fds[CID_A][stat_file]
+
+        stat_file.write_bytes(b"2048\n")
+        assert await reader.read({CID_A: [stat_file]}, _concat) == {CID_A: b"2048\n"}
+        assert reader._fds[CID_A][stat_file] == fd
+
+    async def test_failures_are_isolated_per_container(
+        self, tmp_path: Path, reader: CgroupStatReader
+    ) -> None:
+        stat_file = tmp_path / "cpu.stat"
+        stat_file.write_bytes(b"usage_usec 10\n")
+        results = await reader.read(
+            {CID_A: [tmp_path / "missing"], CID_B: [stat_file]},
+            _concat,
+        )
+        assert isinstance(results[CID_A], FileNotFoundError)
+        assert results[CID_B] == b"usage_usec 10\n"
+        assert CID_A not in reader._fds
+
+    async def test_descriptors_of_vanished_containers_are_closed(
+        self, tmp_path: Path, reader: CgroupStatReader
+    ) -> None:
+        stat_file = tmp_path / "io.stat"
+        stat_file.write_bytes(b"")
+        await reader.read({CID_A: [stat_file], CID_B: [stat_file]}, _concat)
+        await reader.read({CID_B: [stat_file]}, _concat)
+        assert reader._fds.keys() == {CID_B}
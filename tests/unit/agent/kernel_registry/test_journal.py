@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import pickle
+import uuid
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from ai.backend.agent.kernel import AbstractKernel
+from ai.backend.agent.kernel_registry.exception import KernelRegistryNotFound
+from ai.backend.agent.kernel_registry.journal.creator import JournalBasedLoaderWriterCreator
+from ai.backend.agent.kernel_registry.journal.records import (
+    JournalOp,
+    JournalRecord,
+    decode_records,
+    encode_records,
+)
+from ai.backend.agent.kernel_registry.loader.journal import JournalBasedKernelRegistryLoader
+from ai.backend.agent.kernel_registry.loader.pickle import PickleBasedKernelRegistryLoader
+from ai.backend.agent.kernel_registry.writer.journal import JournalBasedKernelRegistryWriter
+from ai.backend.agent.kernel_registry.writer.types import KernelRegistrySaveMetadata
+from ai.backend.common.types import KernelId
+
+
+@dataclass
+class _StubKernel:
+    kernel_id: KernelId
+    state: str
+
+
+def _registry(*kernels: _StubKernel) -> MutableMapping[KernelId, AbstractKernel]:
+    return cast(
+        MutableMapping[KernelId, AbstractKernel],
+        {kernel.kernel_id: kernel for kernel in kernels},
+    )
+
+
+def _new_kernel(state: str = "running") -> _StubKernel:
+    return _StubKernel(KernelId(uuid.uuid4()), state)
+
+
+@pytest.fixture
+def creator(tmp_path: Path) -> JournalBasedLoaderWriterCreator:
+    return JournalBasedLoaderWriterCreator(
+        registry_file_path=tmp_path / "last_registry.i-test.dat",
+        legacy_registry_file_path=tmp_path / "ipc" / "last_registry.i-test.dat",
+    )
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path) -> Path:
+    return tmp_path / "last_registry.i-test.snapshot"
+
+
+@pytest.fixture
+def journal_path(tmp_path: Path) -> Path:
+    return tmp_path / "last_registry.i-test.journal"
+
+
+def _journal_ops(journal_path: Path) -> list[JournalOp]:
+    records, _ = decode_records(journal_path.read_bytes())
+    return [record.op for record in records]
+
+
+class TestJournalBasedKernelRegistry:
+    async def test_changes_are_appended_as_deltas(
+        self,
+        creator: JournalBasedLoaderWriterCreator,
+        journal_path: Path,
+    ) -> None:
+        writer = creator.create_writer()
+        kernel_a, kernel_b = _new_kernel(), _new_kernel()
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_b),
+            KernelRegistrySaveMetadata(True),
+        )
+        assert _journal_ops(journal_path) == [JournalOp.BEGIN]
+
+        kernel_c = _new_kernel()
+        kernel_a.state = "terminating"
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_c),
+            KernelRegistrySaveMetadata(True),
+        )
+        ops = _journal_ops(journal_path)
+        assert ops[0] == JournalOp.BEGIN
+        assert sorted(ops[1:]) == sorted([JournalOp.REMOVE, JournalOp.PUT, JournalOp.PUT])
+
+        # Saving an unchanged registry appends nothing.
+        size = journal_path.stat().st_size
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_c),
+            KernelRegistrySaveMetadata(True),
+        )
+        assert journal_path.stat().st_size == size
+
+        loaded = await creator.create_loader().load_kernel_registry()
+        assert loaded == {kernel_a.kernel_id: kernel_a, kernel_c.kernel_id: kernel_c}
+
+    async def test_kernel_ids_hint_limits_the_changes(
+        self,
+        creator: JournalBasedLoaderWriterCreator,
+        journal_path: Path,
+    ) -> None:
+        writer = creator.create_writer()
+        kernel_a, kernel_b = _new_kernel(), _new_kernel()
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_b),
+            KernelRegistrySaveMetadata(True),
+        )
+        kernel_a.state = "terminated"
+        kernel_b.state = "terminated"
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_b),
+            KernelRegistrySaveMetadata(True, kernel_ids=[kernel_b.kernel_id]),
+        )
+        records, _ = decode_records(journal_path.read_bytes())
+        assert [(record.op, record.kernel_id) for record in records[1:]] == [
+            (JournalOp.PUT, kernel_b.kernel_id)
+        ]
+
+    async def test_saves_within_the_cool_down_are_deferred(
+        self,
+        snapshot_path: Path,
+        journal_path: Path,
+    ) -> None:
+        writer = JournalBasedKernelRegistryWriter(snapshot_path, journal_path)
+        kernel_a, kernel_b = _new_kernel(), _new_kernel()
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_b),
+            KernelRegistrySaveMetadata(True),
+        )
+        kernel_a.state = "terminated"
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_b),
+            KernelRegistrySaveMetadata(False, kernel_ids=[kernel_a.kernel_id]),
+        )
+        assert _journal_ops(journal_path) == [JournalOp.BEGIN]
+
+        # The next forced save also writes the changes hinted by the skipped one.
+        kernel_b.state = "terminated"
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_b),
+            KernelRegistrySaveMetadata(True, kernel_ids=[kernel_b.kernel_id]),
+        )
+        records, _ = decode_records(journal_path.read_bytes())
+        assert [record.op for record in records[1:]] == [JournalOp.PUT, JournalOp.PUT]
+        assert {record.kernel_id for record in records[1:]} == {
+            kernel_a.kernel_id,
+            kernel_b.kernel_id,
+        }
+
+    async def test_compaction_rewrites_the_snapshot(
+        self,
+        tmp_path: Path,
+        snapshot_path: Path,
+        journal_path: Path,
+    ) -> None:
+        writer = JournalBasedKernelRegistryWriter(
+            snapshot_path, journal_path, compaction_threshold=2
+        )
+        kernel = _new_kernel()
+        await writer.save_kernel_registry(_registry(kernel), KernelRegistrySaveMetadata(True))
+        for i in range(4):
+            kernel.state = f"state-{i}"
+            await writer.save_kernel_registry(_registry(kernel), KernelRegistrySaveMetadata(True))
+        assert _journal_ops(journal_path) == [JournalOp.BEGIN, JournalOp.PUT]
+
+        loader = JournalBasedKernelRegistryLoader(
+            snapshot_path,
+            journal_path,
+            legacy_loader=PickleBasedKernelRegistryLoader(
+                tmp_path / "last_registry.i-test.dat",
+                tmp_path / "ipc" / "last_registry.i-test.dat",
+            ),
+        )
+        loaded = await loader.load_kernel_registry()
+        assert cast(_StubKernel, loaded[kernel.kernel_id]).state == "state-3"
+
+    async def test_torn_tail_is_discarded(
+        self,
+        creator: JournalBasedLoaderWriterCreator,
+        journal_path: Path,
+    ) -> None:
+        writer = creator.create_writer()
+        kernel_a = _new_kernel()
+        await writer.save_kernel_registry(_registry(kernel_a), KernelRegistrySaveMetadata(True))
+        kernel_b = _new_kernel()
+        await writer.save_kernel_registry(
+            _registry(kernel_a, kernel_b),
+            KernelRegistrySaveMetadata(True),
+        )
+        journal_path.write_bytes(journal_path.read_bytes()[:-3])
+
+        loaded = await creator.create_loader().load_kernel_registry()
+        assert loaded == {kernel_a.kernel_id: kernel_a}
+
+    async def test_stale_journal_is_not_replayed(
+        self,
+        creator: JournalBasedLoaderWriterCreator,
+        journal_path: Path,
+    ) -> None:
+        writer = creator.create_writer()
+        kernel = _new_kernel()
+        await writer.save_kernel_registry(_registry(kernel), KernelRegistrySaveMetadata(True))
+        # A journal of an older snapshot, as left by a compaction interrupted midway.
+        journal_path.write_bytes(
+            encode_records([
+                JournalRecord(JournalOp.BEGIN, snapshot_id="older"),
+                JournalRecord(JournalOp.REMOVE, kernel_id=kernel.kernel_id),
+            ])
+        )
+        loaded = await creator.create_loader().load_kernel_registry()
+        assert loaded == {kernel.kernel_id: kernel}
+
+    async def test_legacy_pickle_registry_is_imported(
+        self,
+        tmp_path: Path,
+        creator: JournalBasedLoaderWriterCreator,
+    ) -> None:
+        with pytest.raises(KernelRegistryNotFound):
+            await creator.create_loader().load_kernel_registry()
+
+        kernel = _new_kernel()
+        with (tmp_path / "last_registry.i-test.dat").open("wb") as f:
+            pickle.dump({kernel.kernel_id: kernel}, f)
+        loaded = await creator.create_loader().load_kernel_registry()
+        assert loaded == {kernel.kernel_id: kernel}
+
+        # Once a snapshot exists, the legacy registry is no longer consulted.
+        writer = creator.create_writer()
+        await writer.save_kernel_registry(_registry(), KernelRegistrySaveMetadata(True))
+        assert await creator.create_loader().load_kernel_registry() == {}
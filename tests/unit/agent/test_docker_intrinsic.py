@@ -10,12 +10,14 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from ai.backend.agent.docker.cgroup_stat import CgroupStatReader
 from ai.backend.agent.docker.intrinsic import (
     ContainerNetStat,
     CPUPlugin,
     MemoryPlugin,
     read_proc_net_dev,
 )
+from ai.backend.agent.scratch import ScratchUsageTracker
 from ai.backend.agent.stats import StatModes
 
 
@@ -54,6 +56,18 @@ class BaseDockerIntrinsicTest:
             },
         }
 
+    @pytest.fixture
+    def cgroup_dir(self, tmp_path: Path) -> Path:
+        """A fake cgroup v2 directory shared by all controllers of a container."""
+        path = tmp_path / "cgroup"
+        path.mkdir()
+        (path / "cpu.stat").write_text("usage_usec 1000000\n")
+        (path / "memory.current").write_text("1048576\n")
+        (path / "memory.max").write_text("1048576\n")
+        (path / "memory.stat").write_text("anon 0\ninactive_file 0\n")
+        (path / "io.stat").write_text("")
+        return path
+
     @pytest.fixture
     def docker_stat_context(self) -> MagicMock:
         ctx = MagicMock()
@@ -85,19 +99,16 @@ class TestCPUPluginDockerClientLifecycle(BaseDockerIntrinsicTest):
         plugin = CPUPlugin.__new__(CPUPlugin)
         plugin.local_config = {"agent": {"docker-mode": "default"}}
         plugin._docker = AsyncMock()
+        plugin._cgroup_reader = CgroupStatReader()
         return plugin
 
     @pytest.fixture
-    def cpu_cgroup_context(self, cgroup_stat_context: MagicMock) -> MagicMock:
+    def cpu_cgroup_context(self, cgroup_stat_context: MagicMock, cgroup_dir: Path) -> MagicMock:
         """CGROUP stat context with CPU cgroup v2 path mocks."""
         cgroup_stat_context.agent.docker_info = {"CgroupVersion": "2"}
 
-        async def mock_get_cgroup_path(subsys: str, cid: str) -> MagicMock:
-            path = MagicMock()
-            stat_file = MagicMock()
-            stat_file.read_text.return_value = "usage_usec 1000000\n"
-            path.__truediv__ = MagicMock(return_value=stat_file)
-            return path
+        async def mock_get_cgroup_path(subsys: str, cid: str) -> Path:
+            return cgroup_dir
 
         cgroup_stat_context.agent.get_cgroup_path = mock_get_cgroup_path
         return cgroup_stat_context
@@ -146,31 +157,25 @@ class TestMemoryPluginDockerClientLifecycle(BaseDockerIntrinsicTest):
     @pytest.fixture
     def memory_plugin(self) -> MemoryPlugin:
         plugin = MemoryPlugin.__new__(MemoryPlugin)
-        plugin.local_config = {"agent": {"docker-mode": "default"}}
+        plugin.local_config = {
+            "agent": {"docker-mode": "default"},
+            "container": {"scratch-root": Path("/tmp/scratches")},
+        }
         plugin._docker = AsyncMock()
+        plugin._cgroup_reader = CgroupStatReader()
+        plugin._scratch_usage = ScratchUsageTracker()
         return plugin
 
     @pytest.fixture
     def memory_cgroup_context(
-        self, cgroup_stat_context: MagicMock
+        self, cgroup_stat_context: MagicMock, cgroup_dir: Path
     ) -> Generator[MagicMock, None, None]:
         """CGROUP stat context with memory/io cgroup v2 path mocks and related patches."""
         ctx = cgroup_stat_context
         ctx.agent.get_cgroup_version = MagicMock(return_value="2")
 
-        mem_path = MagicMock()
-        mem_stat = MagicMock()
-        mem_stat.read_text.return_value = "inactive_file 0\n"
-        mem_path.__truediv__ = MagicMock(return_value=mem_stat)
-        io_path = MagicMock()
-        io_stat = MagicMock()
-        io_stat.read_text.return_value = ""
-        io_path.__truediv__ = MagicMock(return_value=io_stat)
-
-        async def mock_get_cgroup_path(subsys: str, cid: str) -> MagicMock:
-            if subsys == "memory":
-                return mem_path
-            return io_path
+        async def mock_get_cgroup_path(subsys: str, cid: str) -> Path:
+            return cgroup_dir
 
         ctx.agent.get_cgroup_path = mock_get_cgroup_path
 
@@ -182,10 +187,6 @@ class TestMemoryPluginDockerClientLifecycle(BaseDockerIntrinsicTest):
             patch(
                 "ai.backend.agent.docker.intrinsic.DockerContainer",
             ) as mock_container_cls,
-            patch(
-                "ai.backend.agent.docker.intrinsic.read_sysfs",
-                return_value=1048576,
-            ),
             patch(
                 "ai.backend.agent.docker.intrinsic.read_proc_net_dev",
                 return_value=ContainerNetStat(rx_bytes=0, tx_bytes=0),
@@ -215,6 +216,7 @@ class TestMemoryPluginDockerClientLifecycle(BaseDockerIntrinsicTest):
             await memory_plugin.init()
             mock_docker_cls.assert_called_once()
             assert memory_plugin._docker is not None
+            await memory_plugin.cleanup()
 
     async def test_cleanup_closes_docker_client(self, memory_plugin: MemoryPlugin) -> None:
         """Verify cleanup() closes the Docker client."""
@@ -252,14 +254,20 @@ class TestMemoryPluginContainerPidValidation(BaseDockerIntrinsicTest):
     @pytest.fixture
     def memory_plugin(self) -> MemoryPlugin:
         plugin = MemoryPlugin.__new__(MemoryPlugin)
-        plugin.local_config = {"agent": {"docker-mode": "default"}}
+        plugin.local_config = {
+            "agent": {"docker-mode": "default"},
+            "container": {"scratch-root": Path("/tmp/scratches")},
+        }
         plugin._docker = AsyncMock()
+        plugin._cgroup_reader = CgroupStatReader()
+        plugin._scratch_usage = ScratchUsageTracker()
         return plugin
 
     @contextmanager
     def _make_cgroup_context(
         self,
         cgroup_stat_context: MagicMock,
+        cgroup_dir: Path,
         container_pid: int,
     ) -> Generator[tuple[MagicMock, MagicMock], None, None]:
         """Build a CGROUP stat context with configurable container PID.
@@ -270,19 +278,8 @@ class TestMemoryPluginContainerPidValidation(BaseDockerIntrinsicTest):
         ctx = cgroup_stat_context
         ctx.agent.get_cgroup_version = MagicMock(return_value="2")
 
-        mem_path = MagicMock()
-        mem_stat = MagicMock()
-        mem_stat.read_text.return_value = "inactive_file 0\n"
-        mem_path.__truediv__ = MagicMock(return_value=mem_stat)
-        io_path = MagicMock()
-        io_stat = MagicMock()
-        io_stat.read_text.return_value = ""
-        io_path.__truediv__ = MagicMock(return_value=io_stat)
-
-        async def mock_get_cgroup_path(subsys: str, cid: str) -> MagicMock:
-            if subsys == "memory":
-                return mem_path
-            return io_path
+        async def mock_get_cgroup_path(subsys: str, cid: str) -> Path:
+            return cgroup_dir
 
         ctx.agent.get_cgroup_path = mock_get_cgroup_path
 
@@ -294,10 +291,6 @@ class TestMemoryPluginContainerPidValidation(BaseDockerIntrinsicTest):
             patch(
                 "ai.backend.agent.docker.intrinsic.DockerContainer",
             ) as mock_container_cls,
-            patch(
-                "ai.backend.agent.docker.intrinsic.read_sysfs",
-                return_value=1048576,
-            ),
             patch(
                 "ai.backend.agent.docker.intrinsic.read_proc_net_dev",
             ) as mock_read_proc_net_dev,
@@ -322,16 +315,18 @@ class TestMemoryPluginContainerPidValidation(BaseDockerIntrinsicTest):
         self,
         memory_plugin: MemoryPlugin,
         cgroup_stat_context: MagicMock,
+        cgroup_dir: Path,
     ) -> None:
         """When container PID is 0 (not running), net stats should be 0
         but other stats collected."""
         with self._make_cgroup_context(
             cgroup_stat_context,
+            cgroup_dir,
             container_pid=0,
         ) as (ctx, mock_read):
             results = await memory_plugin.gather_container_measures(ctx, ["cid_001"])
             mock_read.assert_not_called()
-            # mem stats should be collected (read_sysfs returns 1048576)
+            # mem stats should be collected (memory.current is 1048576)
             assert results[0].per_container["cid_001"].value == 1048576
             # net_rx and net_tx should be 0
             assert results[3].per_container["cid_001"].value == 0
@@ -341,11 +336,13 @@ class TestMemoryPluginContainerPidValidation(BaseDockerIntrinsicTest):
         self,
         memory_plugin: MemoryPlugin,
         cgroup_stat_context: MagicMock,
+        cgroup_dir: Path,
     ) -> None:
         """When container PID > 0, read_proc_net_dev should be called
         and net stats collected."""
         with self._make_cgroup_context(
             cgroup_stat_context,
+            cgroup_dir,
             container_pid=12345,
         ) as (ctx, mock_read):
             results = await memory_plugin.gather_container_measures(ctx, ["cid_001"])
@@ -360,11 +357,13 @@ class TestMemoryPluginContainerPidValidation(BaseDockerIntrinsicTest):
         self,
         memory_plugin: MemoryPlugin,
         cgroup_stat_context: MagicMock,
+        cgroup_dir: Path,
     ) -> None:
         """When read_proc_net_dev raises OSError, net stats should be 0
         but other stats collected."""
         with self._make_cgroup_context(
             cgroup_stat_context,
+            cgroup_dir,
             container_pid=12345,
         ) as (ctx, mock_read):
             mock_read.side_effect = OSError("No such file or directory")
@@ -379,6 +378,7 @@ class TestMemoryPluginContainerPidValidation(BaseDockerIntrinsicTest):
 @dataclass
 class _SysfsMocks:
     ctx: MagicMock
+    container_cls: MagicMock
     container: AsyncMock
     read_proc_net_dev: MagicMock
     loop: MagicMock
@@ -391,12 +391,19 @@ class TestMemoryPluginSysfsTimeoutAndErrorIsolation(BaseDockerIntrinsicTest):
     @pytest.fixture
     def memory_plugin(self) -> MemoryPlugin:
         plugin = MemoryPlugin.__new__(MemoryPlugin)
-        plugin.local_config = {"agent": {"docker-mode": "default"}}
+        plugin.local_config = {
+            "agent": {"docker-mode": "default"},
+            "container": {"scratch-root": Path("/tmp/scratches")},
+        }
         plugin._docker = AsyncMock()
+        plugin._cgroup_reader = CgroupStatReader()
+        plugin._scratch_usage = ScratchUsageTracker()
         return plugin
 
     @pytest.fixture
-    def sysfs_mocks(self, cgroup_stat_context: MagicMock) -> Generator[_SysfsMocks, None, None]:
+    def sysfs_mocks(
+        self, cgroup_stat_context: MagicMock, cgroup_dir: Path
+    ) -> Generator[_SysfsMocks, None, None]:
         """Fully patched sysfs_impl environment with default happy-path behavior.
 
         Tests override specific mock side_effects before calling the target function.
@@ -404,17 +411,8 @@ class TestMemoryPluginSysfsTimeoutAndErrorIsolation(BaseDockerIntrinsicTest):
         ctx = cgroup_stat_context
         ctx.agent.get_cgroup_version = MagicMock(return_value="2")
 
-        mem_path = MagicMock()
-        mem_stat = MagicMock()
-        mem_stat.read_text.return_value = "inactive_file 0\n"
-        mem_path.__truediv__ = MagicMock(return_value=mem_stat)
-        io_path = MagicMock()
-        io_stat = MagicMock()
-        io_stat.read_text.return_value = ""
-        io_path.__truediv__ = MagicMock(return_value=io_stat)
-
-        async def mock_get_cgroup_path(subsys: str, cid: str) -> MagicMock:
-            return mem_path if subsys == "memory" else io_path
+        async def mock_get_cgroup_path(subsys: str, cid: str) -> Path:
+            return cgroup_dir
 
         ctx.agent.get_cgroup_path = mock_get_cgroup_path
 
@@ -426,7 +424,6 @@ class TestMemoryPluginSysfsTimeoutAndErrorIsolation(BaseDockerIntrinsicTest):
             patch(
                 "ai.backend.agent.docker.intrinsic.DockerContainer",
             ) as mock_container_cls,
-            patch("ai.backend.agent.docker.intrinsic.read_sysfs", return_value=1048576),
             patch(
                 "ai.backend.agent.docker.intrinsic.read_proc_net_dev",
                 return_value=ContainerNetStat(rx_bytes=0, tx_bytes=0),
@@ -446,6 +443,7 @@ class TestMemoryPluginSysfsTimeoutAndErrorIsolation(BaseDockerIntrinsicTest):
 
             yield _SysfsMocks(
                 ctx=ctx,
+                container_cls=mock_container_cls,
                 container=mock_container,
                 read_proc_net_dev=mock_read_proc_net_dev,
                 loop=mock_loop,
@@ -517,12 +515,11 @@ class TestMemoryPluginSysfsTimeoutAndErrorIsolation(BaseDockerIntrinsicTest):
         branch in the results loop.
         """
 
-        async def selective_run_in_executor(executor: Any, fn: Any, *args: Any) -> Any:
-            if args and args[0] == "broken_container":
-                raise RuntimeError("unexpected executor failure")
-            return fn(*args)
-
-        sysfs_mocks.loop.return_value.run_in_executor = selective_run_in_executor
+        broken_container = AsyncMock()
+        broken_container.show.side_effect = RuntimeError("unexpected docker failure")
+        sysfs_mocks.container_cls.side_effect = lambda _docker, **kwargs: (
+            broken_container if kwargs["id"] == "broken_container" else sysfs_mocks.container
+        )
 
         results = await memory_plugin.gather_container_measures(
             sysfs_mocks.ctx, ["broken_container", "healthy_container"]
@@ -540,12 +537,11 @@ class TestMemoryPluginSysfsTimeoutAndErrorIsolation(BaseDockerIntrinsicTest):
         Exception), it must propagate instead of being silently skipped.
         This ensures shutdown signals are not swallowed by return_exceptions=True."""
 
-        async def cancel_on_first(executor: Any, fn: Any, *args: Any) -> Any:
-            if args and args[0] == "cancelled_container":
-                raise asyncio.CancelledError()
-            return fn(*args)
-
-        sysfs_mocks.loop.return_value.run_in_executor = cancel_on_first
+        cancelled_container = AsyncMock()
+        cancelled_container.show.side_effect = asyncio.CancelledError()
+        sysfs_mocks.container_cls.side_effect = lambda _docker, **kwargs: (
+            cancelled_container if kwargs["id"] == "cancelled_container" else sysfs_mocks.container
+        )
 
         with pytest.raises(asyncio.CancelledError):
             await memory_plugin.gather_container_measures(
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from ai.backend.agent.image_cache import ImageCacheManager, ImageStorageUsage
+from ai.backend.common.types import ImageCanonical
+
+IMG_A = ImageCanonical("cr.backend.ai/stable/python:3.11-ubuntu22.04")
+IMG_B = ImageCanonical("cr.backend.ai/stable/pytorch:2.3-py311-cuda12.1")
+IMG_C = ImageCanonical("cr.backend.ai/stable/tensorflow:2.15-py311-cuda12.1")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def cache(clock: _Clock) -> ImageCacheManager:
+    cache = ImageCacheManager(min_idle_time=60.0, clock=clock)
+    cache.sync([IMG_A, IMG_B, IMG_C], {IMG_A: 100, IMG_B: 200, IMG_C: 300})
+    clock.now += 10.0
+    cache.touch(IMG_B)
+    clock.now += 10.0
+    cache.touch(IMG_C)
+    clock.now += 100.0
+    return cache
+
+
+class TestImageCacheManager:
+    def test_evicts_least_recently_used_until_enough_is_freed(
+        self, cache: ImageCacheManager
+    ) -> None:
+        assert cache.select_evictions(150) == [IMG_A, IMG_B]
+        assert cache.select_evictions(100) == [IMG_A]
+        assert cache.select_evictions(0) == []
+
+    def test_touched_and_in_use_images_are_kept(
+        self, cache: ImageCacheManager, clock: _Clock
+    ) -> None:
+        cache.touch(IMG_A)
+        assert cache.select_evictions(10_000, in_use={IMG_C}) == [IMG_B]
+        clock.now += 60.0
+        assert cache.select_evictions(10_000, in_use={IMG_C}) == [IMG_B, IMG_A]
+
+    def test_sync_drops_removed_images_and_keeps_last_use(self, cache: ImageCacheManager) -> None:
+        last_used = cache.get_last_used(IMG_B)
+        cache.sync([IMG_B], {IMG_B: 250})
+        assert cache.get_last_used(IMG_A) is None
+        assert cache.get_last_used(IMG_B) == last_used
+        assert cache.select_evictions(200) == [IMG_B]
+
+
+def test_storage_usage_ratio() -> None:
+    assert ImageStorageUsage(used=85, total=100).ratio == 0.85
+    assert ImageStorageUsage(used=0, total=0).ratio == 0.0
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ai.backend.agent.docker.utils import LayerProgressAggregator
+from ai.backend.agent.image_pull import ImagePullCoordinator, PullProgressCallback
+
+KEY = ("cr.backend.ai/stable/python:3.11-ubuntu22.04", "sha256:" + "a" * 64)
+
+
+class _Pull:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.report: PullProgressCallback | None = None
+
+    async def __call__(self, report: PullProgressCallback) -> None:
+        self.calls += 1
+        self.report = report
+        self.started.set()
+        await self.release.wait()
+
+
+class TestImagePullCoordinator:
+    async def test_concurrent_callers_share_one_pull(self) -> None:
+        coordinator = ImagePullCoordinator()
+        pull = _Pull()
+        first = asyncio.create_task(coordinator.pull(KEY, pull))
+        await pull.started.wait()
+        second = asyncio.create_task(coordinator.pull(KEY, pull))
+        await asyncio.sleep(0)
+        assert coordinator.is_pulling(KEY)
+
+        pull.release.set()
+        assert await first is True
+        assert await second is False
+        assert pull.calls == 1
+        assert not coordinator.is_pulling(KEY)
+
+    async def test_failure_is_raised_to_all_waiters(self) -> None:
+        coordinator = ImagePullCoordinator()
+        started = asyncio.Event()
+
+        async def failing_pull(report: PullProgressCallback) -> None:
+            started.set()
+            await asyncio.sleep(0.01)
+            raise RuntimeError("Failed to pull image: manifest unknown")
+
+        first = asyncio.create_task(coordinator.pull(KEY, failing_pull))
+        await started.wait()
+        second = asyncio.create_task(coordinator.pull(KEY, failing_pull))
+        for waiter in (first, second):
+            with pytest.raises(RuntimeError, match="manifest unknown"):
+                await waiter
+        assert not coordinator.is_pulling(KEY)
+
+    async def test_cancelled_waiter_does_not_abort_the_pull(self) -> None:
+        coordinator = ImagePullCoordinator()
+        pull = _Pull()
+        first = asyncio.create_task(coordinator.pull(KEY, pull))
+        await pull.started.wait()
+        second = asyncio.create_task(coordinator.pull(KEY, pull))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        pull.release.set()
+        assert await second is False
+        assert pull.calls == 1
+
+    async def test_progress_is_fanned_out_to_all_waiters(self) -> None:
+        coordinator = ImagePullCoordinator(progress_interval=0.0)
+        pull = _Pull()
+        reports: dict[str, list[tuple[int, int]]] = {"first": [], "second": []}
+
+        def listener(name: str) -> PullProgressCallback:
+            async def _report(current: int, total: int) -> None:
+                reports[name].append((current, total))
+
+            return _report
+
+        first = asyncio.create_task(coordinator.pull(KEY, pull, progress=listener("first")))
+        await pull.started.wait()
+        assert pull.report is not None
+        await pull.report(10, 100)
+        second = asyncio.create_task(coordinator.pull(KEY, pull, progress=listener("second")))
+        await asyncio.sleep(0)
+        await pull.report(100, 100)
+        pull.release.set()
+        await asyncio.gather(first, second)
+
+        assert reports["first"] == [(10, 100), (100, 100)]
+        # A late joiner first gets the progress made so far.
+        assert reports["second"] == [(10, 100), (100, 100)]
+
+
+class TestLayerProgressAggregator:
+    def test_sums_up_downloading_layers(self) -> None:
+        progress = LayerProgressAggregator()
+        assert not progress.update({"status": "Pulling from stable/python", "id": "3.11"})
+        assert not progress.update({"status": "Already exists", "id": "l0"})
+        assert progress.update({
+            "status": "Downloading",
+            "progressDetail": {"current": 10, "total": 100},
+            "id": "l1",
+        })
+        assert progress.update({
+            "status": "Downloading",
+            "progressDetail": {"current": 50, "total": 200},
+            "id": "l2",
+        })
+        assert (progress.current, progress.total) == (60, 300)
+
+        assert progress.update({"status": "Download complete", "id": "l1"})
+        assert not progress.update({"status": "Pull complete", "id": "l1"})
+        assert (progress.current, progress.total) == (150, 300)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ai.backend.agent.scratch import IncrementalDirWalker, ScratchUsageMethod, ScratchUsageTracker
+
+
+def _du(root: Path) -> int:
+    total = root.lstat().st_blocks * 512
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in [*dirnames, *filenames]:
+            total += (Path(dirpath) / name).lstat().st_blocks * 512
+    return total
+
+
+@pytest.fixture
+def scratch_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "kernel"
+    for sub in ("work/a", "work/b/c", "config"):
+        (root / sub).mkdir(parents=True)
+    (root / "work/a/data.bin").write_bytes(b"x" * 100_000)
+    (root / "work/b/c/log.txt").write_bytes(b"y" * 10_000)
+    (root / "config/environ.txt").write_text("FOO=bar\n")
+    return root
+
+
+class TestIncrementalDirWalker:
+    def test_scan_matches_du(self, scratch_dir: Path) -> None:
+        assert IncrementalDirWalker().scan(scratch_dir) == _du(scratch_dir)
+
+    def test_rescan_lists_only_changed_directories(self, scratch_dir: Path) -> None:
+        walker = IncrementalDirWalker()
+        walker.scan(scratch_dir)
+        (scratch_dir / "work/b/c/more.bin").write_bytes(b"z" * 50_000)
+
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def scandir(path: str) -> os.ScandirIterator[str]:
+            listed.append(path)
+            return real_scandir(path)
+
+        with patch("ai.backend.agent.scratch.usage.os.scandir", side_effect=scandir):
+            usage = walker.scan(scratch_dir)
+        assert listed == [str(scratch_dir / "work/b/c")]
+        assert usage == _du(scratch_dir)
+
+    def test_removed_subtree_is_dropped(self, scratch_dir: Path) -> None:
+        walker = IncrementalDirWalker()
+        walker.scan(scratch_dir)
+        (scratch_dir / "work/b/c/log.txt").unlink()
+        (scratch_dir / "work/b/c").rmdir()
+        assert walker.scan(scratch_dir) == _du(scratch_dir)
+
+
+class TestScratchUsageTracker:
+    async def test_refresh_reports_usage_per_container(self, scratch_dir: Path) -> None:
+        tracker = ScratchUsageTracker()
+        tracker.sync({"cid": scratch_dir})
+        assert tracker.get_usage("cid") is None
+        await tracker.refresh()
+        assert tracker.get_usage("cid") == _du(scratch_dir)
+        assert tracker._targets["cid"].method == ScratchUsageMethod.WALK
+
+        tracker.sync({})
+        assert tracker.get_usage("cid") is None
+
+    async def test_missing_directory_is_skipped(self, tmp_path: Path) -> None:
+        tracker = ScratchUsageTracker()
+        tracker.sync({"cid": tmp_path / "gone"})
+        await tracker.refresh()
+        assert tracker.get_usage("cid") is None
+
+    @pytest.mark.parametrize(
+        ("parent_project_id", "expected_method"),
+        [
+            (0, ScratchUsageMethod.PROJECT_QUOTA),
+            # Inherited from the parent, so the quota covers more than this container.
+            (42, ScratchUsageMethod.WALK),
+        ],
+    )
+    async def test_project_quota_requires_an_own_project_id(
+        self,
+        scratch_dir: Path,
+        parent_project_id: int,
+        expected_method: ScratchUsageMethod,
+    ) -> None:
+        project_ids = {scratch_dir: 42, scratch_dir.parent: parent_project_id}
+        tracker = ScratchUsageTracker()
+        tracker.sync({"cid": scratch_dir})
+        with (
+            patch(
+                "ai.backend.agent.scratch.usage.get_project_id",
+                side_effect=lambda path: project_ids[path],
+            ),
+            patch("ai.backend.agent.scratch.usage._find_block_device", return_value="/dev/sdb"),
+            patch("ai.backend.agent.scratch.usage.get_project_quota_usage", return_value=4096),
+        ):
+            await tracker.refresh()
+        assert tracker._targets["cid"].method == expected_method
+
+    async def test_shared_project_id_falls_back_to_walk(self, tmp_path: Path) -> None:
+        for name in ("kernel1", "kernel2"):
+            (tmp_path / name).mkdir()
+        tracker = ScratchUsageTracker()
+        tracker.sync({"cid1": tmp_path / "kernel1", "cid2": tmp_path / "kernel2"})
+        with (
+            patch(
+                "ai.backend.agent.scratch.usage.get_project_id",
+                side_effect=lambda path: 0 if path == tmp_path else 42,
+            ),
+            patch("ai.backend.agent.scratch.usage._find_block_device", return_value="/dev/sdb"),
+            patch("ai.backend.agent.scratch.usage.get_project_quota_usage", return_value=4096),
+        ):
+            await tracker.refresh()
+        assert tracker._targets["cid1"].method == ScratchUsageMethod.WALK
+        assert tracker._targets["cid2"].method == ScratchUsageMethod.WALK
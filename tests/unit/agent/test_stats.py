@@ -7,7 +7,14 @@ from unittest.mock import patch
 
 import pytest
 
-from ai.backend.agent.stats import Measurement, Metric, MetricTypes, MovingStatistics
+from ai.backend.agent.stats import (
+    Measurement,
+    Metric,
+    MetricTypes,
+    MovingStatistics,
+    _format_float,
+    _to_serializable_value,
+)
 
 
 class TestMovingStatistics:
@@ -86,6 +93,29 @@ class TestMovingStatistics:
 
         assert stats.rate == case.expected_rate
 
+    def test_serializable_dict(self) -> None:
+        with patch("time.perf_counter", side_effect=[1.0, 3.0, 5.0]):
+            stats = MovingStatistics(Decimal("10.5"))
+            stats.update(Decimal("20.25"))
+            stats.update(Decimal(30))
+
+        assert stats.to_serializable_dict() == {
+            "min": "10.5",
+            "max": "30",
+            "sum": "60.75",
+            "avg": "20.25",
+            "diff": "9.75",
+            "rate": "4.875",
+            "version": 2,
+        }
+
+    @pytest.mark.parametrize(
+        "value",
+        [0.0, -0.0, 50.0, 12.5, 0.0005, 0.0015, 1 / 3, -1.2345, 123456789.1234567, float("inf")],
+    )
+    def test_float_formatting_matches_decimal_quantization(self, value: float) -> None:
+        assert _format_float(value) == _to_serializable_value(Decimal(value))
+
 
 # Large enough that leaking it into `current` reads as an unmistakable spike
 # (pct would be 1,000,000%), never as a plausible utilization value.
@@ -161,3 +191,16 @@ class TestMetric:
 
         assert cpu_util_metric.current == Decimal(500)
         assert cpu_util_metric.to_serializable_dict()["pct"] == "50"
+
+    def test_serializes_only_filtered_stats(self, cpu_util_metric: Metric) -> None:
+        with patch("time.perf_counter", return_value=2.0):
+            cpu_util_metric.update(Measurement(Decimal(1500)))
+
+        assert cpu_util_metric.to_serializable_dict() == {
+            "current": "500",
+            "capacity": "1000",
+            "pct": "50",
+            "unit_hint": "percent",
+            "stats.max": "1500",
+            "stats.avg": "1250",
+        }
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from ai.backend.appproxy.common.errors import AdmissionQueueFull, AdmissionTimeout
+from ai.backend.appproxy.worker.proxy.backend.admission import (
+    AdmissionController,
+    AdmissionSpec,
+)
+
+
+def _make_controller(
+    replicas: list[int], *, max_queue_size: int = 8, queue_timeout: float = 5.0
+) -> AdmissionController:
+    return AdmissionController(
+        AdmissionSpec(
+            max_inflight_per_replica=1,
+            max_queue_size=max_queue_size,
+            queue_timeout=queue_timeout,
+        ),
+        replica_count=lambda: replicas[0],
+        metrics=MagicMock(),
+        deployment_id="deployment",
+    )
+
+
+async def _pass_through(controller: AdmissionController) -> None:
+    async with controller.admit():
+        pass
+
+
+class TestAdmissionController:
+    async def test_waiters_are_admitted_in_order(self) -> None:
+        controller = _make_controller([1])
+        admitted: list[int] = []
+        release = asyncio.Event()
+
+        async def request(idx: int) -> None:
+            async with controller.admit():
+                admitted.append(idx)
+                await release.wait()
+
+        async with asyncio.TaskGroup() as tg:
+            for idx in range(3):
+                tg.create_task(request(idx))
+                await asyncio.sleep(0)
+            assert admitted == [0]
+            assert controller.queued == 2
+            release.set()
+        assert admitted == [0, 1, 2]
+        assert controller.active == 0
+
+    async def test_full_queue_is_rejected(self) -> None:
+        controller = _make_controller([1], max_queue_size=1)
+        async with controller.admit():
+            queued = asyncio.create_task(_pass_through(controller))
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionQueueFull) as exc_info:
+                await _pass_through(controller)
+            assert exc_info.value.headers["Retry-After"] == "5"
+            queued.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await queued
+        assert controller.queued == 0
+        assert controller.active == 0
+
+    async def test_queued_request_is_shed_after_deadline(self) -> None:
+        controller = _make_controller([1], queue_timeout=0.01)
+        async with controller.admit():
+            with pytest.raises(AdmissionTimeout):
+                await _pass_through(controller)
+            assert controller.queued == 0
+        assert controller.active == 0
+
+    async def test_wake_admits_when_replicas_appear(self) -> None:
+        replicas = [0]
+        controller = _make_controller(replicas)
+        task = asyncio.create_task(_pass_through(controller))
+        await asyncio.sleep(0)
+        assert controller.queued == 1
+        replicas[0] = 1
+        controller.wake()
+        await task
+        assert controller.active == 0
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ai.backend.appproxy.common.config import get_default_redis_key_ttl
+from ai.backend.appproxy.worker.live_data import LiveDataAggregator
+
+
+@pytest.fixture
+def valkey_live() -> MagicMock:
+    client = MagicMock()
+    client.store_and_incr_multiple_live_data = AsyncMock()
+    return client
+
+
+class TestLiveDataAggregator:
+    async def test_flush_coalesces_writes(self, valkey_live: MagicMock) -> None:
+        aggregator = LiveDataAggregator(valkey_live, flush_interval=3600)
+        aggregator.mark_last_used(["session.a.last_access", "circuit.b.last_access"], 10.0)
+        aggregator.mark_last_used(["session.a.last_access"], 12.0)
+        aggregator.mark_last_used(["session.a.last_access"], 11.0)
+        for _ in range(3):
+            aggregator.increase_request_count("session.a.requests")
+
+        await aggregator.flush()
+
+        valkey_live.store_and_incr_multiple_live_data.assert_awaited_once()
+        values, increments = valkey_live.store_and_incr_multiple_live_data.await_args.args
+        assert values == {"session.a.last_access": "12.0", "circuit.b.last_access": "10.0"}
+        assert increments == {"session.a.requests": 3}
+        # Only the last-access markers take the longer TTL.
+        assert valkey_live.store_and_incr_multiple_live_data.await_args.kwargs == {
+            "ex": get_default_redis_key_ttl()
+        }
+
+        await aggregator.flush()
+        valkey_live.store_and_incr_multiple_live_data.assert_awaited_once()
+
+    async def test_failed_flush_is_retried(self, valkey_live: MagicMock) -> None:
+        aggregator = LiveDataAggregator(valkey_live, flush_interval=3600)
+        aggregator.mark_last_used(["session.a.last_access"], 10.0)
+        aggregator.increase_request_count("session.a.requests")
+        valkey_live.store_and_incr_multiple_live_data.side_effect = ConnectionError()
+        with pytest.raises(ConnectionError):
+            await aggregator.flush()
+
+        valkey_live.store_and_incr_multiple_live_data.side_effect = None
+        aggregator.mark_last_used(["session.a.last_access"], 20.0)
+        aggregator.increase_request_count("session.a.requests")
+        await aggregator.flush()
+
+        values, increments = valkey_live.store_and_incr_multiple_live_data.await_args.args
+        assert values == {"session.a.last_access": "20.0"}
+        assert increments == {"session.a.requests": 2}
+
+    async def test_run_flushes_on_exit(self, valkey_live: MagicMock) -> None:
+        aggregator = LiveDataAggregator(valkey_live, flush_interval=3600)
+        async with aggregator.run():
+            aggregator.increase_request_count("session.a.requests")
+        valkey_live.store_and_incr_multiple_live_data.assert_awaited_once()
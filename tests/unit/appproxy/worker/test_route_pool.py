@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+
+from ai.backend.appproxy.common.types import ProxyProtocol, RouteBalancingMode, RouteInfo
+from ai.backend.appproxy.worker.proxy.backend.pool import RoutePool, RoutePoolSpec
+
+
+def create_route(port: int, traffic_ratio: float = 1.0) -> RouteInfo:
+    return RouteInfo(
+        route_id=uuid4(),
+        session_id=uuid4(),
+        session_name=None,
+        kernel_host="127.0.0.1",
+        kernel_port=port,
+        protocol=ProxyProtocol.HTTP,
+        traffic_ratio=traffic_ratio,
+    )
+
+
+@pytest.fixture
+def routes() -> list[RouteInfo]:
+    return [create_route(30001), create_route(30002)]
+
+
+def _make_pool(routes: list[RouteInfo], mode: RouteBalancingMode) -> RoutePool:
+    return RoutePool(
+        initial_routes=routes,
+        spec=RoutePoolSpec(balancing_mode=mode, health_check_interval=3600),
+    )
+
+
+class TestRoutePoolBalancing:
+    async def test_least_outstanding_avoids_busy_route(self, routes: list[RouteInfo]) -> None:
+        pool = _make_pool(routes, RouteBalancingMode.LEAST_OUTSTANDING)
+        try:
+            with pool.track(routes[0]):
+                for _ in range(20):
+                    assert await pool.select() == routes[1]
+            selected = {(await pool.select()).kernel_port for _ in range(100)}
+            assert selected == {30001, 30002}
+        finally:
+            await pool.close()
+
+    async def test_two_choices_prefers_less_loaded_route(self, routes: list[RouteInfo]) -> None:
+        pool = _make_pool(routes, RouteBalancingMode.POWER_OF_TWO_CHOICES)
+        try:
+            with pool.track(routes[1]), pool.track(routes[1]):
+                for _ in range(20):
+                    assert await pool.select() == routes[0]
+        finally:
+            await pool.close()
+
+    async def test_peak_ewma_avoids_slow_route(self, routes: list[RouteInfo]) -> None:
+        pool = _make_pool(routes, RouteBalancingMode.PEAK_EWMA)
+        try:
+            with pool.track(routes[0]) as tracker:
+                tracker._started_at -= 5.0  # the first route answered after 5 seconds
+                tracker.responded()
+            with pool.track(routes[1]) as tracker:
+                tracker.responded()
+            for _ in range(20):
+                assert await pool.select() == routes[1]
+        finally:
+            await pool.close()
+
+    async def test_idle_pool_keeps_traffic_ratio(self) -> None:
+        canary, stable = create_route(30001, traffic_ratio=0.1), create_route(30002, 0.9)
+        pool = _make_pool([canary, stable], RouteBalancingMode.LEAST_OUTSTANDING)
+        try:
+            counts = Counter([(await pool.select()).kernel_port for _ in range(2000)])
+        finally:
+            await pool.close()
+        assert 100 < counts[30001] < 320
+
+    async def test_track_ignores_replaced_route(self, routes: list[RouteInfo]) -> None:
+        pool = _make_pool(routes, RouteBalancingMode.LEAST_OUTSTANDING)
+        try:
+            stale = routes[0].model_copy(update={"route_id": uuid4()})
+            with pool.track(stale) as tracker:
+                tracker.responded()
+                selected = {(await pool.select()).kernel_port for _ in range(100)}
+            assert selected == {30001, 30002}
+        finally:
+            await pool.close()
+
+
+class TestRoutePoolSelection:
+    async def test_weighted_pick_follows_traffic_ratio(self) -> None:
+        routes = [create_route(30001, 0.2), create_route(30002, 0.3), create_route(30003, 0.5)]
+        pool = _make_pool(routes, RouteBalancingMode.WEIGHTED_RANDOM)
+        try:
+            counts = Counter([(await pool.select()).kernel_port for _ in range(4000)])
+        finally:
+            await pool.close()
+        assert 650 < counts[30001] < 950
+        assert 1050 < counts[30002] < 1350
+        assert 1800 < counts[30003] < 2200
+
+    async def test_health_flip_swaps_selection(self, routes: list[RouteInfo]) -> None:
+        pool = _make_pool(routes, RouteBalancingMode.WEIGHTED_RANDOM)
+        try:
+            for _ in range(RoutePoolSpec().failure_threshold):
+                pool.record_failure(routes[0])
+            for _ in range(20):
+                assert await pool.select() == routes[1]
+
+            pool.record_success(routes[0])
+            selected = {(await pool.select()).kernel_port for _ in range(100)}
+            assert selected == {30001, 30002}
+        finally:
+            await pool.close()
+
+    async def test_update_swaps_selection(self, routes: list[RouteInfo]) -> None:
+        pool = _make_pool(routes, RouteBalancingMode.WEIGHTED_RANDOM)
+        try:
+            await pool.update([routes[1]])
+            for _ in range(20):
+                assert await pool.select() == routes[1]
+        finally:
+            await pool.close()
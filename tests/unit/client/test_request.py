@@ -5,7 +5,7 @@ import io
 import json
 from collections.abc import Iterator
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any
+from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock
 
@@ -13,14 +13,11 @@ import aiohttp
 import pytest
 from aioresponses import aioresponses
 
-from ai.backend.client.config import API_VERSION, get_config
+from ai.backend.client.config import API_VERSION, APIConfig, get_config
 from ai.backend.client.exceptions import BackendAPIError, BackendClientError
 from ai.backend.client.request import AttachedFile, Request, Response
 from ai.backend.client.session import AsyncSession, Session
 
-if TYPE_CHECKING:
-    from ai.backend.client.config import APIConfig
-
 
 @pytest.fixture(scope="module", autouse=True)
 def api_version() -> Iterator[None]:
@@ -231,6 +228,30 @@ async def test_fetch_client_error_async(dummy_endpoint: str) -> None:
                     pass
 
 
+async def test_fetch_fails_over_to_the_next_endpoint(defconfig: APIConfig) -> None:
+    config = APIConfig(
+        endpoint="http://a.test:8081,http://b.test:8081",
+        access_key=defconfig.access_key,
+        secret_key=defconfig.secret_key,
+        load_balancer="simple_rr",
+    )
+    # The endpoints are shuffled on load.
+    failing, healthy = config.endpoints
+    body = b'{"test": 5678}'
+    with aioresponses() as m:
+        m.post(str(failing) + "/function", exception=aiohttp.ClientConnectionError())
+        m.post(
+            str(healthy) + "/function",
+            status=HTTPStatus.OK,
+            body=body,
+            headers={"Content-Type": "application/json", "Content-Length": str(len(body))},
+        )
+        async with AsyncSession(config=config):
+            rqst = Request("POST", "/function")
+            async with rqst.fetch() as resp:
+                assert await resp.json() == {"test": 5678}
+
+
 @pytest.mark.xfail
 async def test_fetch_cancellation_async(dummy_endpoint: str) -> None:
     # It seems that aiohttp swallows asyncio.CancelledError
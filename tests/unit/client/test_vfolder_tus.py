@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import secrets
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from http import HTTPStatus
 from pathlib import Path
 from time import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 from unittest.mock import AsyncMock
 from uuid import UUID
 
 import pytest
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from aiotusclient import client
 from yarl import URL
 
@@ -195,6 +197,119 @@ async def test_vfolder_download(mocker: object) -> None:
                     "Last-Modified": str(today_timestamp),
                 },
                 status=HTTPStatus.OK,
+                repeat=True,
             )
             await session.VFolder(vfolder_name).download([mock_file])
             assert Path("fake-file1").exists() == 1
+
+
+async def test_recursive_upload_batches_mkdir_and_bounds_concurrency(tmp_path: Path) -> None:
+    basedir = tmp_path.resolve()
+    (basedir / "data" / "nested" / "deep").mkdir(parents=True)
+    (basedir / "data" / "empty").mkdir()
+    expected_files = {basedir / "data" / "top.txt"}
+    (basedir / "data" / "top.txt").write_bytes(b"x")
+    for idx in range(10):
+        file_path = basedir / "data" / "nested" / "deep" / f"{idx}.bin"
+        file_path.write_bytes(b"x")
+        expected_files.add(file_path)
+
+    uploaded: set[Path] = set()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_upload_file(file_path: Path, *args: object) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        uploaded.add(file_path)
+
+    async with AsyncSession() as session:
+        vfolder = session.VFolder("fake-vfolder-name", id=UUID(int=1))
+        mkdir = AsyncMock()
+        with (
+            mock.patch.object(vfolder, "_upload_file", side_effect=fake_upload_file),
+            mock.patch.object(vfolder, "_mkdir", mkdir),
+        ):
+            await vfolder.upload(
+                ["data"], basedir=basedir, recursive=True, dst_dir="dst", max_concurrency=3
+            )
+
+    mkdir.assert_awaited_once_with([Path("dst/data/empty")], parents=True, exist_ok=True)
+    assert uploaded == expected_files
+    assert max_in_flight == 3
+
+
+def _serve_ranges(
+    content: bytes, requested: list[tuple[int, int]]
+) -> Callable[..., CallbackResult]:
+    def callback(url: URL, **kwargs: Any) -> CallbackResult:
+        start_str, _, end_str = kwargs["headers"]["Range"].removeprefix("bytes=").partition("-")
+        start, end = int(start_str), min(int(end_str), len(content) - 1)
+        requested.append((start, end))
+        return CallbackResult(
+            status=HTTPStatus.PARTIAL_CONTENT,
+            body=content[start : end + 1],
+            headers={
+                "Content-Range": f"bytes {start}-{end}/{len(content)}",
+                "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+            },
+        )
+
+    return callback
+
+
+async def _download_ranged(
+    tmp_path: Path, content: bytes, requested: list[tuple[int, int]]
+) -> None:
+    storage_url = "http://127.0.0.1:6021/download"
+    vfolder_id = UUID(int=1)
+    with aioresponses() as m:
+        async with AsyncSession() as session:
+            m.post(
+                build_url(session.config, f"/folders/{vfolder_id.hex}/request-download"),
+                payload={"token": "fake-token", "url": storage_url},
+                status=HTTPStatus.OK,
+            )
+            m.get(
+                f"{storage_url}?token=fake-token",
+                callback=_serve_ranges(content, requested),
+                repeat=True,
+            )
+            await session.VFolder("fake-vfolder-name", id=vfolder_id).download(
+                ["model.bin"], basedir=tmp_path, part_size=1024, max_concurrency=4
+            )
+
+
+async def test_vfolder_download_ranged(tmp_path: Path) -> None:
+    content = secrets.token_bytes(10 * 1024 + 7)
+    requested: list[tuple[int, int]] = []
+    await _download_ranged(tmp_path, content, requested)
+
+    assert (tmp_path / "model.bin").read_bytes() == content
+    assert not (tmp_path / "model.bin.bai-download").exists()
+    assert sorted(requested) == [
+        (idx * 1024, min(idx * 1024 + 1023, len(content) - 1)) for idx in range(11)
+    ]
+
+
+async def test_vfolder_download_resumes_from_manifest(tmp_path: Path) -> None:
+    content = secrets.token_bytes(4 * 1024)
+    partial = bytearray(len(content))
+    partial[:2048] = content[:2048]
+    (tmp_path / "model.bin").write_bytes(partial)
+    (tmp_path / "model.bin.bai-download").write_text(
+        json.dumps({
+            "size": len(content),
+            "last_modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+            "part_size": 1024,
+            "completed": [0, 1],
+        })
+    )
+    requested: list[tuple[int, int]] = []
+    await _download_ranged(tmp_path, content, requested)
+
+    assert (tmp_path / "model.bin").read_bytes() == content
+    assert sorted(requested) == [(2048, 3071), (3072, 4095)]
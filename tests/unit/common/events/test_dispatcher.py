@@ -6,7 +6,11 @@ from typing import override
 
 import pytest
 
-from ai.backend.common.events.dispatcher import EventDispatcher
+from ai.backend.common.events.dispatcher import (
+    ConcurrencyOptions,
+    EventDispatcher,
+    HandlerConcurrencyLimiter,
+)
 from ai.backend.common.events.types import (
     AbstractAnycastEvent,
     AbstractBroadcastEvent,
@@ -276,3 +280,95 @@ class TestUndecodablePayload:
 
         assert received == []
         assert mq.done_calls == [b"test-msg-id"]
+
+
+class TestConcurrencyOptions:
+    """Runs sharing a limiter are bounded, and serialized per ordering key."""
+
+    @pytest.fixture
+    def mq(self) -> StubMessageQueue:
+        return StubMessageQueue(
+            anycast_messages=[
+                _make_anycast_mq_message(DummyAnycastEvent(value=value)) for value in range(6)
+            ],
+        )
+
+    async def test_runs_with_the_same_key_keep_dispatch_order(
+        self,
+        mq: StubMessageQueue,
+    ) -> None:
+        dispatcher = EventDispatcher(mq)  # type: ignore[arg-type]
+        finished: list[int] = []
+
+        async def handler(ctx: object, source: AgentId, ev: DummyAnycastEvent) -> None:
+            # Earlier events take longer, so unordered runs would finish in reverse.
+            await asyncio.sleep(0.01 * (6 - ev.value))
+            finished.append(ev.value)
+
+        opts: ConcurrencyOptions = {
+            "limiter": HandlerConcurrencyLimiter(8),
+            "ordering_key": lambda ev: ev.value % 2,
+        }
+        dispatcher.consume(DummyAnycastEvent, object(), handler, concurrency_opts=opts)
+        await dispatcher.start()
+        await asyncio.sleep(0.3)
+        await dispatcher.close()
+
+        assert [v for v in finished if v % 2 == 0] == [0, 2, 4]
+        assert [v for v in finished if v % 2 == 1] == [1, 3, 5]
+
+    async def test_limiter_bounds_concurrent_runs(
+        self,
+        mq: StubMessageQueue,
+    ) -> None:
+        dispatcher = EventDispatcher(mq)  # type: ignore[arg-type]
+        running = 0
+        peak = 0
+        received: list[int] = []
+
+        async def handler(ctx: object, source: AgentId, ev: DummyAnycastEvent) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            received.append(ev.value)
+
+        opts: ConcurrencyOptions = {"limiter": HandlerConcurrencyLimiter(2)}
+        dispatcher.consume(DummyAnycastEvent, object(), handler, concurrency_opts=opts)
+        await dispatcher.start()
+        await asyncio.sleep(0.2)
+        await dispatcher.close()
+
+        assert sorted(received) == list(range(6))
+        assert peak == 2
+
+
+class TestMaxPendingHandlers:
+    """The dispatch loop stops pulling messages while the in-flight budget is spent."""
+
+    async def test_dispatch_waits_for_the_budget(self) -> None:
+        mq = StubMessageQueue(
+            anycast_messages=[
+                _make_anycast_mq_message(DummyAnycastEvent(value=value)) for value in range(3)
+            ],
+        )
+        dispatcher = EventDispatcher(mq, max_pending_handlers=1)  # type: ignore[arg-type]
+        release = asyncio.Event()
+        started: list[int] = []
+
+        async def handler(ctx: object, source: AgentId, ev: DummyAnycastEvent) -> None:
+            started.append(ev.value)
+            await release.wait()
+
+        dispatcher.consume(DummyAnycastEvent, object(), handler)
+        await dispatcher.start()
+        await asyncio.sleep(0.05)
+        assert started == [0]
+
+        release.set()
+        await asyncio.sleep(0.05)
+        await dispatcher.close()
+
+        assert started == [0, 1, 2]
+        assert len(mq.done_calls) == 3
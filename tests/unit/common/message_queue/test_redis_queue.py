@@ -9,6 +9,7 @@ from ai.backend.common.defs import REDIS_STREAM_DB
 from ai.backend.common.message_queue.message import MQMessage
 from ai.backend.common.message_queue.payload import AnycastMessagePayload, BroadcastMessagePayload
 from ai.backend.common.message_queue.redis_queue import RedisMQArgs, RedisQueue
+from ai.backend.common.message_queue.redis_queue.consumer import _ReadCountState
 from ai.backend.common.message_queue.types import MessageName
 from ai.backend.common.types import (
     HostPortPair,
@@ -178,3 +179,58 @@ async def test_done(redis_queue: RedisQueue) -> None:
     async for message in redis_queue.consume_queue():
         await redis_queue.done(message.msg_id)
         return
+
+
+async def test_batched_done(
+    redis_container: tuple[str, HostPortPair], queue_args: RedisMQArgs
+) -> None:
+    # Acknowledgments are sent in batches and the remainder is flushed on close
+    queue_args.consume_ack_flush_interval = 0.05
+    queue_args.anycast_stream_key = queue_args.group_name = "test-batched-ack"
+    queue_args.consume_stream_keys = {"test-batched-ack"}
+    redis_target = RedisTarget(
+        addr=redis_container[1],
+        redis_helper_config={
+            "socket_timeout": 5.0,
+            "socket_connect_timeout": 2.0,
+            "reconnect_poll_timeout": 0.3,
+        },
+    )
+    queue = await RedisQueue.create(redis_target, queue_args)
+    test_payload = AnycastMessagePayload(
+        name=MessageName("test-event"), source="i-test", payload="{}"
+    )
+    for _ in range(10):
+        await queue.send(test_payload)
+
+    consumed = 0
+    async for message in queue.consume_queue():
+        await queue.done(message.msg_id)
+        consumed += 1
+        if consumed == 10:
+            break
+    await queue.close()
+
+    conn = redis_helper.get_redis_object(redis_target, name="test-redis", db=REDIS_STREAM_DB)
+    try:
+        pending = await conn.client.xpending("test-batched-ack", "test-batched-ack")
+        assert pending["pending"] == 0
+        await conn.client.delete("test-batched-ack")
+    finally:
+        await conn.close()
+
+
+def test_read_count_adapts_to_backlog() -> None:
+    state = _ReadCountState(current=64, minimum=8, maximum=512)
+    state.update(64)
+    assert state.current == 128
+    for _ in range(5):
+        state.update(state.current)
+    assert state.current == 512
+    state.update(0)
+    assert state.current == 256
+    for _ in range(10):
+        state.update(0)
+    assert state.current == 8
+    state.update(5)
+    assert state.current == 8
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ai.backend.kernel import base
+from ai.backend.kernel.base import pipe_output
+
+
+@pytest.fixture
+def log_file(tmp_path: Path) -> Iterator[BinaryIO]:
+    with (tmp_path / "task.log").open("ab") as f:
+        yield f
+
+
+@pytest.fixture
+def writer() -> Iterator[concurrent.futures.ThreadPoolExecutor]:
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+def _make_outsock() -> Any:
+    outsock = MagicMock()
+    outsock.send_multipart = AsyncMock()
+    return outsock
+
+
+class TestPipeOutput:
+    async def test_burst_is_coalesced_into_few_batches(
+        self,
+        tmp_path: Path,
+        capfd: pytest.CaptureFixture[str],
+        log_file: BinaryIO,
+        writer: concurrent.futures.ThreadPoolExecutor,
+    ) -> None:
+        lines = [f"step {i}: loss=0.{i:04d}\n".encode() for i in range(10_000)]
+        stream = asyncio.StreamReader()
+        for line in lines:
+            stream.feed_data(line)
+        stream.feed_eof()
+        outsock = _make_outsock()
+
+        await pipe_output(stream, outsock, "stdout", log_file.fileno(), writer)
+
+        expected = b"".join(lines)
+        frames = [call.args[0] for call in outsock.send_multipart.await_args_list]
+        assert len(frames) < len(lines) // 100
+        assert all(target == b"stdout" for target, _ in frames)
+        assert b"".join(data for _, data in frames) == expected
+        # The console is fd 1, which capfd redirects to a temporary file.
+        assert capfd.readouterr().out == expected.decode()
+        assert (tmp_path / "task.log").read_bytes() == expected
+
+    async def test_trickling_output_is_flushed_without_waiting_for_more(
+        self,
+        capfd: pytest.CaptureFixture[str],
+        log_file: BinaryIO,
+        writer: concurrent.futures.ThreadPoolExecutor,
+    ) -> None:
+        stream = asyncio.StreamReader()
+        outsock = _make_outsock()
+        task = asyncio.create_task(
+            pipe_output(stream, outsock, "stdout", log_file.fileno(), writer)
+        )
+        stream.feed_data(b"Collecting numpy\n")
+        async with asyncio.timeout(1.0):
+            while not outsock.send_multipart.await_count:
+                await asyncio.sleep(base.OUTPUT_FLUSH_INTERVAL)
+        outsock.send_multipart.assert_awaited_once_with([b"stdout", b"Collecting numpy\n"])
+        stream.feed_eof()
+        await task
+
+
+def test_writev_all_resumes_after_partial_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    real_writev = os.writev
+
+    def short_writev(fd: int, buffers: Any) -> int:
+        # Emulate a pipe that accepts at most 3 bytes per call.
+        data = b"".join(bytes(buf) for buf in buffers)[:3]
+        return real_writev(fd, [data])
+
+    monkeypatch.setattr(base.os, "writev", short_writev)
+    with (tmp_path / "out").open("wb") as f:
+        base._writev_all(f.fileno(), [b"hello", b"", b" ", b"world\n"])
+    assert (tmp_path / "out").read_bytes() == b"hello world\n"
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import sqlalchemy as sa
+
+from ai.backend.common.data.entity.domain import DomainID
+from ai.backend.common.events.event_types.auth.broadcast import (
+    AuthContextInvalidatedBroadcastEvent,
+)
+from ai.backend.common.types import ResourceSlot
+from ai.backend.manager.api.gql_legacy.keypair import ModifyKeyPair
+from ai.backend.manager.api.rest.middleware.auth_cache import (
+    AuthContextCache,
+    AuthTableWriteWatcher,
+)
+from ai.backend.manager.data.auth.hash import PasswordHashAlgorithm
+from ai.backend.manager.models.domain import DomainRow
+from ai.backend.manager.models.hasher.types import PasswordInfo
+from ai.backend.manager.models.keypair import KeyPairRow
+from ai.backend.manager.models.resource_policy import (
+    KeyPairResourcePolicyRow,
+    UserResourcePolicyRow,
+)
+from ai.backend.manager.models.user import UserRole, UserRow
+from ai.backend.manager.models.utils import ExtendedAsyncSAEngine
+from ai.backend.testutils.db import with_tables
+
+
+class TestKeyPairDeactivationInvalidatesAuthContexts:
+    @pytest.fixture
+    async def db_with_cleanup(
+        self, database_connection: ExtendedAsyncSAEngine
+    ) -> AsyncGenerator[ExtendedAsyncSAEngine, None]:
+        async with with_tables(
+            database_connection,
+            [
+                DomainRow,
+                UserResourcePolicyRow,
+                KeyPairResourcePolicyRow,
+                UserRow,
+                KeyPairRow,
+            ],
+        ):
+            yield database_connection
+
+    @pytest.fixture
+    async def access_key(self, db_with_cleanup: ExtendedAsyncSAEngine) -> str:
+        domain_id = DomainID(uuid.uuid4())
+        domain_name = f"test-domain-{uuid.uuid4()}"
+        user_uuid = uuid.uuid4()
+        email = f"test-{uuid.uuid4()}@example.com"
+        access_key = f"AKIA{uuid.uuid4().hex[:16]}"
+        async with db_with_cleanup.begin_session() as db_sess:
+            db_sess.add(
+                DomainRow(
+                    id=domain_id,
+                    name=domain_name,
+                    description="test",
+                    is_active=True,
+                    total_resource_slots=ResourceSlot(),
+                    allowed_vfolder_hosts={},
+                    allowed_docker_registries=[],
+                )
+            )
+            db_sess.add(
+                UserResourcePolicyRow(
+                    name="test-user-policy",
+                    max_vfolder_count=10,
+                    max_quota_scope_size=-1,
+                    max_session_count_per_model_session=10,
+                    max_customized_image_count=10,
+                )
+            )
+            db_sess.add(
+                KeyPairResourcePolicyRow(
+                    name="test-keypair-policy",
+                    max_concurrent_sessions=10,
+                    max_concurrent_sftp_sessions=2,
+                    max_containers_per_session=10,
+                    idle_timeout=3600,
+                )
+            )
+            await db_sess.flush()
+            db_sess.add(
+                UserRow(
+                    uuid=user_uuid,
+                    username=email,
+                    email=email,
+                    password=PasswordInfo(
+                        password="test_password",
+                        algorithm=PasswordHashAlgorithm.PBKDF2_SHA256,
+                        rounds=100_000,
+                        salt_size=32,
+                    ),
+                    domain_name=domain_name,
+                    role=UserRole.USER,
+                    resource_policy="test-user-policy",
+                    need_password_change=False,
+                    domain_id=domain_id,
+                )
+            )
+            await db_sess.flush()
+            db_sess.add(
+                KeyPairRow(
+                    access_key=access_key,
+                    secret_key="test_secret_key",
+                    user=user_uuid,
+                    is_active=True,
+                    is_default=True,
+                    resource_policy="test-keypair-policy",
+                )
+            )
+        return access_key
+
+    async def test_legacy_mutation_invalidates_cached_contexts(
+        self,
+        db_with_cleanup: ExtendedAsyncSAEngine,
+        access_key: str,
+    ) -> None:
+        cache: AuthContextCache[str] = AuthContextCache(ttl=3600, max_size=10)
+        cache.put(access_key, "ctx", generation=cache.generation)
+        event_producer = MagicMock()
+        event_producer.broadcast_event = AsyncMock()
+        info = MagicMock()
+        info.context.db = db_with_cleanup
+
+        async with AuthTableWriteWatcher(db_with_cleanup, event_producer, cache).run():
+            result = await ModifyKeyPair.mutate(None, info, access_key, {"is_active": False})
+            # The local cache is dropped as soon as the write is committed.
+            assert cache.get(access_key) is None
+
+        assert result.ok
+        event_producer.broadcast_event.assert_awaited_once_with(
+            AuthContextInvalidatedBroadcastEvent()
+        )
+
+    async def test_rolled_back_write_keeps_cached_contexts(
+        self,
+        db_with_cleanup: ExtendedAsyncSAEngine,
+        access_key: str,
+    ) -> None:
+        cache: AuthContextCache[str] = AuthContextCache(ttl=3600, max_size=10)
+        cache.put(access_key, "ctx", generation=cache.generation)
+        event_producer = MagicMock()
+        event_producer.broadcast_event = AsyncMock()
+
+        async with AuthTableWriteWatcher(db_with_cleanup, event_producer, cache).run():
+            async with db_with_cleanup.connect() as conn:
+                await conn.execute(
+                    sa.update(KeyPairRow)
+                    .values(is_active=False)
+                    .where(KeyPairRow.access_key == access_key)
+                )
+                await conn.rollback()
+
+        assert cache.get(access_key) == "ctx"
+        event_producer.broadcast_event.assert_not_awaited()
@@ -0,0 +1,77 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ai.backend.manager.api.rest.middleware.auth_cache import (
+    AuthContextCache,
+    KeypairQueryCounter,
+)
+
+
+class TestAuthContextCache:
+    def test_evicts_least_recently_used(self) -> None:
+        cache: AuthContextCache[str] = AuthContextCache(ttl=60, max_size=2)
+        cache.put("AK1", "ctx1", generation=cache.generation)
+        cache.put("AK2", "ctx2", generation=cache.generation)
+        assert cache.get("AK1") == "ctx1"
+        cache.put("AK3", "ctx3", generation=cache.generation)
+
+        assert cache.get("AK2") is None
+        assert cache.get("AK1") == "ctx1"
+        assert cache.get("AK3") == "ctx3"
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        now = 1000.0
+        cache: AuthContextCache[str] = AuthContextCache(ttl=30, max_size=10, clock=lambda: now)
+        cache.put("AK1", "ctx1", generation=cache.generation)
+        now += 29
+        assert cache.get("AK1") == "ctx1"
+
+        now += 1
+        assert cache.get("AK1") is None
+        assert len(cache) == 0
+
+    def test_put_after_invalidation_is_ignored(self) -> None:
+        cache: AuthContextCache[str] = AuthContextCache(ttl=60, max_size=10)
+        generation = cache.generation
+        # An invalidation lands while the lookup is still querying the database.
+        cache.clear()
+        cache.put("AK1", "stale", generation=generation)
+        assert cache.get("AK1") is None
+
+
+class TestKeypairQueryCounter:
+    async def test_write_through_without_interval(self) -> None:
+        valkey_stat = MagicMock()
+        valkey_stat.increment_keypair_query_count = AsyncMock()
+        counter = KeypairQueryCounter(valkey_stat, flush_interval=None)
+
+        await counter.record("AK1")
+
+        valkey_stat.increment_keypair_query_count.assert_awaited_once_with("AK1")
+
+    async def test_buffers_and_flushes_on_exit(self) -> None:
+        valkey_stat = MagicMock()
+        valkey_stat.increment_keypair_query_counts = AsyncMock()
+        counter = KeypairQueryCounter(valkey_stat, flush_interval=3600)
+
+        async with counter.run():
+            await counter.record("AK1")
+            await counter.record("AK1")
+            await counter.record("AK2")
+            valkey_stat.increment_keypair_query_counts.assert_not_awaited()
+
+        valkey_stat.increment_keypair_query_counts.assert_awaited_once_with({"AK1": 2, "AK2": 1})
+
+    async def test_failed_flush_keeps_counts(self) -> None:
+        valkey_stat = MagicMock()
+        valkey_stat.increment_keypair_query_counts = AsyncMock(side_effect=[ConnectionError, None])
+        counter = KeypairQueryCounter(valkey_stat, flush_interval=3600)
+        await counter.record("AK1")
+
+        with pytest.raises(ConnectionError):
+            await counter.flush()
+        await counter.record("AK1")
+        await counter.flush()
+
+        valkey_stat.increment_keypair_query_counts.assert_awaited_with({"AK1": 2})
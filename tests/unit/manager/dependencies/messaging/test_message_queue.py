@@ -18,6 +18,8 @@ class MockManagerConfig:
     """Simple mock for manager config."""
 
     id: str
+    event_dispatch_max_pending: int | None = None
+    event_ack_flush_interval: float | None = None
 
 
 @dataclass
@@ -0,0 +1,148 @@
+"""Tests for the in-memory scheduling occupancy snapshot store."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Collection
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from ai.backend.common.data.entity.domain import DomainID
+from ai.backend.common.data.entity.project import ProjectID
+from ai.backend.common.data.entity.resource_slot import ResourceSlotName
+from ai.backend.common.data.entity.user import UserID
+from ai.backend.common.types import SessionId
+from ai.backend.manager.repositories.scheduler.db_source.types import (
+    OccupancyChecksum,
+    SessionOccupancyEntry,
+)
+from ai.backend.manager.repositories.scheduler.snapshot_store.occupancy import (
+    OccupancySnapshotStore,
+)
+from ai.backend.manager.repositories.scheduler.types.session import PendingSessions
+from ai.backend.manager.views.sokovan.snapshot import SlotAllocation
+
+_USER = UserID(uuid.uuid4())
+_PROJECT = ProjectID(uuid.uuid4())
+_DOMAIN = DomainID(uuid.uuid4())
+_CPU = ResourceSlotName("cpu")
+
+
+def _entry(
+    session_id: SessionId, *, requested: str = "0", used: str = "0"
+) -> SessionOccupancyEntry:
+    return SessionOccupancyEntry(
+        session_id=session_id,
+        user_id=_USER,
+        project_id=_PROJECT,
+        domain_id=_DOMAIN,
+        slots={_CPU: SlotAllocation(requested=Decimal(requested), used=Decimal(used))},
+        allocation_row_count=1,
+        counts_session=True,
+        is_private=False,
+    )
+
+
+def _pending() -> PendingSessions:
+    pending = MagicMock(spec=PendingSessions)
+    pending.user_uuids = {_USER}
+    pending.project_ids = {_PROJECT}
+    pending.domain_ids = {_DOMAIN}
+    return pending
+
+
+class _FakeDBSource:
+    """Serves session occupancies from a mutable dict, like the DB would."""
+
+    def __init__(self) -> None:
+        self.rows: dict[SessionId, SessionOccupancyEntry] = {}
+        self.fetch_session_occupancies = AsyncMock(side_effect=self._fetch)
+        self.fetch_occupancy_checksum = AsyncMock(side_effect=self._checksum)
+
+    async def _fetch(
+        self, session_ids: Collection[SessionId] | None = None
+    ) -> list[SessionOccupancyEntry]:
+        if session_ids is None:
+            return list(self.rows.values())
+        return [self.rows[sid] for sid in session_ids if sid in self.rows]
+
+    async def _checksum(self) -> OccupancyChecksum:
+        return OccupancyChecksum(
+            allocation_row_count=sum(e.allocation_row_count for e in self.rows.values()),
+            requested=sum((e.slots[_CPU].requested for e in self.rows.values()), Decimal(0)),
+            used=sum((e.slots[_CPU].used for e in self.rows.values()), Decimal(0)),
+            session_count=len(self.rows),
+        )
+
+
+@pytest.fixture
+def db_source() -> _FakeDBSource:
+    return _FakeDBSource()
+
+
+@pytest.fixture
+def store(db_source: _FakeDBSource) -> OccupancySnapshotStore:
+    return OccupancySnapshotStore(db_source)  # type: ignore[arg-type]
+
+
+class TestOccupancySnapshotStore:
+    async def test_seeds_once_and_aggregates_owner_scopes(
+        self, db_source: _FakeDBSource, store: OccupancySnapshotStore
+    ) -> None:
+        s1, s2 = SessionId(uuid.uuid4()), SessionId(uuid.uuid4())
+        db_source.rows = {s1: _entry(s1, requested="2"), s2: _entry(s2, used="3")}
+
+        snapshot = await store.snapshot(_pending(), reconcile_interval=3600)
+        await store.snapshot(_pending(), reconcile_interval=3600)
+
+        assert db_source.fetch_session_occupancies.await_count == 1
+        user = snapshot.by_user[_USER]
+        assert user.slots[_CPU] == SlotAllocation(requested=Decimal(2), used=Decimal(3))
+        assert user.session_count == 2
+        assert snapshot.by_project[_PROJECT].slots[_CPU].allocated == Decimal(5)
+        assert snapshot.by_domain[_DOMAIN].slots[_CPU].allocated == Decimal(5)
+
+    async def test_stale_sessions_are_patched_by_id(
+        self, db_source: _FakeDBSource, store: OccupancySnapshotStore
+    ) -> None:
+        s1, s2 = SessionId(uuid.uuid4()), SessionId(uuid.uuid4())
+        db_source.rows = {s1: _entry(s1, requested="2")}
+        await store.snapshot(_pending(), reconcile_interval=3600)
+
+        # s1 terminates, s2 gets scheduled
+        db_source.rows = {s2: _entry(s2, requested="4")}
+        store.mark_stale([s1, s2])
+        snapshot = await store.snapshot(_pending(), reconcile_interval=3600)
+
+        db_source.fetch_session_occupancies.assert_awaited_with({s1, s2})
+        user = snapshot.by_user[_USER]
+        assert user.slots[_CPU] == SlotAllocation(requested=Decimal(4), used=Decimal(0))
+        assert user.session_count == 1
+
+    async def test_reconcile_reseeds_on_missed_event(
+        self, db_source: _FakeDBSource, store: OccupancySnapshotStore
+    ) -> None:
+        s1 = SessionId(uuid.uuid4())
+        await store.snapshot(_pending(), reconcile_interval=3600)
+        assert _USER not in (await store.snapshot(_pending(), reconcile_interval=3600)).by_user
+
+        # A session appears without any lifecycle hint reaching this manager.
+        db_source.rows = {s1: _entry(s1, requested="1")}
+        snapshot = await store.snapshot(_pending(), reconcile_interval=0)
+
+        assert snapshot.by_user[_USER].slots[_CPU].requested == Decimal(1)
+
+    async def test_returned_snapshot_is_detached(
+        self, db_source: _FakeDBSource, store: OccupancySnapshotStore
+    ) -> None:
+        s1 = SessionId(uuid.uuid4())
+        db_source.rows = {s1: _entry(s1, requested="2")}
+        first = await store.snapshot(_pending(), reconcile_interval=3600)
+        first.by_user.clear()
+        first.by_project[_PROJECT] = first.by_project[_PROJECT].add(MagicMock(slots={_CPU: 1}))
+
+        second = await store.snapshot(_pending(), reconcile_interval=3600)
+        assert second.by_user[_USER].session_count == 1
+        assert second.by_project[_PROJECT].slots[_CPU].requested == Decimal(2)
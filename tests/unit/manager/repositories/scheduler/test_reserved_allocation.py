@@ -325,6 +325,80 @@ class TestAllocateSessionsReservation:
                 ).scalar_one()
                 assert kernel.status == KernelStatus.PENDING
 
+    async def test_a6_mixed_batch_promotes_only_pending_kernels(
+        self,
+        db_with_cleanup: ExtendedAsyncSAEngine,
+        test_domain_id: DomainID,
+        test_domain: DomainFixtureData,
+        test_scaling_group_id: ResourceGroupID,
+        test_scaling_group_name: str,
+        test_group_id: uuid.UUID,
+        test_user_uuid: uuid.UUID,
+        test_access_key: AccessKey,
+        test_agent_id: str,
+        resource_slot_types: None,
+    ) -> None:
+        """A6: a batch re-sending an allocated session reserves only the new one's slots."""
+        await seed_agent_resources(
+            db_with_cleanup,
+            test_agent_id,
+            cpu_capacity=Decimal("10"),
+            mem_capacity=Decimal("102400"),
+        )
+        session_a, kernels_a = await create_pending_session_with_kernels(
+            db_with_cleanup,
+            domain_id=test_domain_id,
+            domain_name=test_domain.domain_name,
+            resource_group_id=test_scaling_group_id,
+            resource_group_name=test_scaling_group_name,
+            group_id=test_group_id,
+            user_uuid=test_user_uuid,
+            access_key=test_access_key,
+            agent_assignments=[(test_agent_id, Decimal("2"), Decimal("4096"))],
+        )
+        session_b, kernels_b = await create_pending_session_with_kernels(
+            db_with_cleanup,
+            domain_id=test_domain_id,
+            domain_name=test_domain.domain_name,
+            resource_group_id=test_scaling_group_id,
+            resource_group_name=test_scaling_group_name,
+            group_id=test_group_id,
+            user_uuid=test_user_uuid,
+            access_key=test_access_key,
+            agent_assignments=[
+                (test_agent_id, Decimal("1"), Decimal("1024")),
+                (test_agent_id, Decimal("3"), Decimal("2048")),
+            ],
+        )
+        batch_a = make_session_allocations(
+            session_id=session_a,
+            kernel_assignments=[(kernels_a[0], test_agent_id)],
+        )
+        batch_b = make_session_allocations(
+            session_id=session_b,
+            kernel_assignments=[(kernel_id, test_agent_id) for kernel_id in kernels_b],
+        )
+
+        db_source = ScheduleDBSource(db_with_cleanup)
+        assert await db_source.allocate_sessions(batch_a) == [session_a]
+        result = await db_source.allocate_sessions(batch_a + batch_b)
+        assert result == [session_a, session_b]
+
+        resources = await fetch_agent_resources(db_with_cleanup, test_agent_id)
+        assert resources["cpu"].reserved == Decimal("6")  # 2 + 1 + 3, session A not twice
+        assert resources["mem"].reserved == Decimal("7168")
+
+        async with db_with_cleanup.begin_readonly_session() as db_sess:
+            for kernel_id in kernels_a + kernels_b:
+                kernel = (
+                    await db_sess.execute(sa.select(KernelRow).where(KernelRow.id == kernel_id))
+                ).scalar_one()
+                assert kernel.status == KernelStatus.SCHEDULED
+            session = (
+                await db_sess.execute(sa.select(SessionRow).where(SessionRow.id == session_b))
+            ).scalar_one()
+            assert session.agent_ids == [test_agent_id]
+
 
 class TestReservedOnlyRelease:
     """Group C: a SCHEDULED-but-never-RUNNING kernel releases reserved, not used."""
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime
 from unittest.mock import AsyncMock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from dateutil.tz import tzutc
@@ -599,6 +599,23 @@ def kernel_without_agent() -> KernelInfo:
     )
 
 
+@pytest.fixture
+def pending_kernel_factory() -> Callable[..., KernelInfo]:
+    """Factory for PENDING kernels without an agent, as seen by the kernel observers."""
+
+    def _create(
+        image_id: UUID | None = None,
+        requested_slots: ResourceSlot | None = None,
+    ) -> KernelInfo:
+        kernel = _create_kernel(status=KernelStatus.PENDING)
+        kernel.image.image_id = image_id
+        kernel.resource.agent = None
+        kernel.resource.requested_slots = requested_slots or ResourceSlot()
+        return kernel
+
+    return _create
+
+
 # =============================================================================
 # Mock Response Fixtures (factories for creating mock responses from sessions)
 # =============================================================================
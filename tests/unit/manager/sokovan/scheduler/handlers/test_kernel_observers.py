@@ -0,0 +1,138 @@
+"""Unit tests for Sokovan scheduler kernel observers."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from ai.backend.common.data.entity.resource_group import ResourceGroupID, ResourceGroupName
+from ai.backend.common.data.entity.resource_slot import ResourceSlotName
+from ai.backend.common.types import (
+    AgentId,
+    AgentSelectionStrategy,
+    ArchName,
+    ResourceSlot,
+    SessionId,
+)
+from ai.backend.manager.data.kernel.types import KernelInfo
+from ai.backend.manager.sokovan.scheduler.handlers.observer.image_prefetch import (
+    ImagePrefetchObserver,
+    select_prefetch_agents,
+)
+from ai.backend.manager.views.sokovan.agent import AgentMeta, AgentResource, SlotResource
+from ai.backend.manager.views.sokovan.image import ImageConfigData
+from ai.backend.manager.views.sokovan.lifecycle import SessionsForPullWithImages
+
+
+def _agent_meta(agent_id: str, *, free_cpu: str, architecture: str = "x86_64") -> AgentMeta:
+    return AgentMeta(
+        id=AgentId(agent_id),
+        addr=f"{agent_id}:6001",
+        architecture=ArchName(architecture),
+        resources=AgentResource(
+            slots={
+                ResourceSlotName("cpu"): SlotResource(
+                    capacity=Decimal("8"),
+                    reserved=Decimal("8") - Decimal(free_cpu),
+                    used=Decimal(0),
+                ),
+            }
+        ),
+        container_count=0,
+    )
+
+
+def _image_config(image_id: uuid.UUID, canonical: str) -> ImageConfigData:
+    return ImageConfigData(
+        id=image_id,
+        canonical=canonical,
+        architecture=ArchName("x86_64"),
+        project="stable",
+        is_local=False,
+        digest="sha256:" + "0" * 64,
+        labels={},
+        registry_name="cr.backend.ai",
+        registry_url="https://cr.backend.ai",
+        registry_username=None,
+        registry_password=None,
+    )
+
+
+AGENTS = [
+    _agent_meta("agent-busy", free_cpu="1"),
+    _agent_meta("agent-idle", free_cpu="8"),
+    _agent_meta("agent-half", free_cpu="4"),
+    _agent_meta("agent-arm", free_cpu="8", architecture="aarch64"),
+]
+
+
+class TestSelectPrefetchAgents:
+    def test_dispersed_prefers_most_free_agents_that_fit(self) -> None:
+        selected = select_prefetch_agents(
+            AGENTS, "x86_64", {"cpu": Decimal("2")}, AgentSelectionStrategy.DISPERSED, limit=2
+        )
+        assert [agent.id for agent in selected] == ["agent-idle", "agent-half"]
+
+    def test_concentrated_prefers_least_free_agents_that_fit(self) -> None:
+        selected = select_prefetch_agents(
+            AGENTS, "x86_64", {"cpu": Decimal("2")}, AgentSelectionStrategy.CONCENTRATED, limit=2
+        )
+        assert [agent.id for agent in selected] == ["agent-half", "agent-idle"]
+
+
+class TestImagePrefetchObserver:
+    async def test_hints_images_in_pending_queue_order(
+        self,
+        mock_repository: AsyncMock,
+        pending_kernel_factory: Callable[..., KernelInfo],
+    ) -> None:
+        image_late, image_early = uuid.uuid4(), uuid.uuid4()
+        kernel_late = pending_kernel_factory(image_late, ResourceSlot({"cpu": Decimal("6")}))
+        kernel_early = pending_kernel_factory(image_early, ResourceSlot({"cpu": Decimal("2")}))
+        configs = {
+            image_late: _image_config(image_late, "cr.backend.ai/stable/late:1"),
+            image_early: _image_config(image_early, "cr.backend.ai/stable/early:1"),
+        }
+        mock_repository.get_sessions_for_pull_by_ids.return_value = SessionsForPullWithImages(
+            sessions=[], image_configs=configs
+        )
+        mock_repository.fetch_compute_schedule_data.return_value = MagicMock(
+            resources=MagicMock(agents=AGENTS),
+            agent_selection_strategy=AgentSelectionStrategy.DISPERSED,
+        )
+        mock_repository.get_resource_group_name_by_id.return_value = ResourceGroupName("gpu")
+        valkey_schedule = AsyncMock()
+        valkey_schedule.get_pending_queue.return_value = [
+            SessionId(uuid.UUID(kernel.session.session_id))
+            for kernel in (kernel_early, kernel_late)
+        ]
+        launcher = AsyncMock()
+        observer = ImagePrefetchObserver(
+            mock_repository, launcher, valkey_schedule, max_images=1, agents_per_image=1
+        )
+
+        resource_group_id = ResourceGroupID(uuid.uuid4())
+
+        result = await observer.observe(resource_group_id, [kernel_late, kernel_early])
+
+        assert result.observed_count == 2
+        mock_repository.get_resource_group_name_by_id.assert_awaited_once_with(resource_group_id)
+        valkey_schedule.get_pending_queue.assert_awaited_once_with("gpu")
+        launcher.prefetch_images.assert_awaited_once_with({
+            AgentId("agent-idle"): [configs[image_early]]
+        })
+
+    async def test_kernels_without_image_are_skipped(
+        self,
+        mock_repository: AsyncMock,
+        pending_kernel_factory: Callable[..., KernelInfo],
+    ) -> None:
+        launcher = AsyncMock()
+        observer = ImagePrefetchObserver(mock_repository, launcher, AsyncMock())
+
+        result = await observer.observe(ResourceGroupID(uuid.uuid4()), [pending_kernel_factory()])
+
+        assert result.observed_count == 0
+        launcher.prefetch_images.assert_not_awaited()
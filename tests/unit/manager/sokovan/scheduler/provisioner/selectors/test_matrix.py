@@ -0,0 +1,217 @@
+"""Tests for the matrix placement engine (``selectors/matrix.py``).
+
+The matrix engine must produce exactly the placements of the tracker
+engine; each scenario runs the same batch through both and compares.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+
+import pytest
+
+from ai.backend.common.data.entity.resource_group import ResourceGroupID
+from ai.backend.common.data.entity.resource_slot import ResourceSlotName
+from ai.backend.common.types import (
+    AgentId,
+    AgentPlacementEngine,
+    AgentSelectionStrategy,
+    ArchName,
+    PreemptionOrder,
+    SessionId,
+)
+from ai.backend.manager.data.session.options import AgentSelectionPolicy
+from ai.backend.manager.sokovan.scheduler.provisioner.selectors.matrix import (
+    MatrixAgentStateTracker,
+    build_engine_trackers,
+    matrix_of,
+)
+from ai.backend.manager.sokovan.scheduler.provisioner.selectors.pool import (
+    create_agent_selector,
+)
+from ai.backend.manager.sokovan.scheduler.provisioner.selectors.selector import (
+    AgentSelectionCriteria,
+)
+from ai.backend.manager.sokovan.scheduler.provisioner.selectors.tracker import AgentStateTracker
+from ai.backend.manager.sokovan.scheduler.provisioner.selectors.types import ResourceRequirements
+from ai.backend.manager.views.sokovan.agent import (
+    AgentLimit,
+    AgentMeta,
+    AgentResource,
+    ResourceGroupResource,
+    SlotResource,
+)
+from ai.backend.manager.views.sokovan.workload import ResourceRequest
+
+NO_LIMIT = AgentLimit(max_container_count=None)
+CPU = ResourceSlotName("cpu")
+MEM = ResourceSlotName("mem")
+
+
+def _agent(
+    agent_id: str,
+    capacities: Mapping[str, str],
+    used: Mapping[str, str] | None = None,
+) -> AgentMeta:
+    used = used or {}
+    return AgentMeta(
+        id=AgentId(agent_id),
+        addr=f"{agent_id}:6001",
+        architecture=ArchName("x86_64"),
+        resources=AgentResource(
+            slots={
+                ResourceSlotName(name): SlotResource(
+                    capacity=Decimal(amount),
+                    reserved=Decimal(0),
+                    used=Decimal(used.get(name, "0")),
+                )
+                for name, amount in capacities.items()
+            }
+        ),
+        container_count=0,
+    )
+
+
+def _req(slots: Mapping[str, str]) -> ResourceRequirements:
+    return ResourceRequirements(
+        requested_slots=ResourceRequest(
+            slots={ResourceSlotName(name): Decimal(amount) for name, amount in slots.items()}
+        ),
+        required_architecture=ArchName("x86_64"),
+        container_count=1,
+    )
+
+
+def _criteria(requirements: Sequence[ResourceRequirements]) -> AgentSelectionCriteria:
+    return AgentSelectionCriteria(
+        session_id=SessionId(uuid.uuid4()),
+        resource_group_id=ResourceGroupID(uuid.UUID(int=0)),
+        requirements=requirements,
+        agent_selection_policy=AgentSelectionPolicy.STRICT,
+        designated_agent_ids=None,
+        job_priority=0,
+        victim_candidates=None,
+        session_group=None,
+    )
+
+
+def _random_agents(rng: random.Random, count: int) -> list[AgentMeta]:
+    agents = []
+    for index in range(count):
+        capacities = {"cpu": str(rng.choice([4, 8, 16])), "mem": str(rng.choice([8, 16, 32]))}
+        used = {"cpu": str(rng.randint(0, 4)), "mem": str(rng.randint(0, 8))}
+        if rng.random() < 0.3:
+            capacities["cuda.shares"] = str(Decimal(rng.randint(1, 8)) / 2)
+        agents.append(_agent(f"agent-{index:03d}", capacities, used))
+    rng.shuffle(agents)
+    return agents
+
+
+def _random_sessions(rng: random.Random, count: int) -> list[list[ResourceRequirements]]:
+    sessions = []
+    for _ in range(count):
+        requirements = []
+        for _ in range(rng.randint(1, 3)):
+            slots = {"cpu": str(rng.randint(1, 4)), "mem": str(rng.randint(1, 8))}
+            if rng.random() < 0.3:
+                slots["cuda.shares"] = str(Decimal(rng.randint(0, 4)) / 2)
+            requirements.append(_req(slots))
+        sessions.append(requirements)
+    return sessions
+
+
+async def _place_all(
+    engine: AgentPlacementEngine,
+    strategy: AgentSelectionStrategy,
+    agents: list[AgentMeta],
+    sessions: list[list[ResourceRequirements]],
+) -> list[list[AgentId] | None]:
+    selector = create_agent_selector(["cuda.shares", "cpu", "mem"])
+    trackers = build_engine_trackers(engine, ResourceGroupResource(agents=agents))
+    outcomes: list[list[AgentId] | None] = []
+    for requirements in sessions:
+        computation = await selector.compute_placements(
+            strategy, trackers, _criteria(requirements), NO_LIMIT, PreemptionOrder.OLDEST
+        )
+        if computation.failures:
+            outcomes.append(None)
+            continue
+        outcomes.append([selection.selected_agent.agent_id for selection in computation.selections])
+    return outcomes
+
+
+class TestMatrixEngineParity:
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            AgentSelectionStrategy.CONCENTRATED,
+            AgentSelectionStrategy.DISPERSED,
+            AgentSelectionStrategy.ROUNDROBIN,
+            AgentSelectionStrategy.LEGACY,
+        ],
+    )
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    async def test_matches_tracker_engine(
+        self, strategy: AgentSelectionStrategy, seed: int
+    ) -> None:
+        rng = random.Random(seed)
+        agents = _random_agents(rng, 24)
+        sessions = _random_sessions(rng, 60)
+
+        expected = await _place_all(AgentPlacementEngine.TRACKER, strategy, agents, sessions)
+        actual = await _place_all(AgentPlacementEngine.MATRIX, strategy, agents, sessions)
+
+        assert actual == expected
+
+
+class TestSlotMatrix:
+    def test_rows_follow_tracker_state(self) -> None:
+        trackers = build_engine_trackers(
+            AgentPlacementEngine.MATRIX,
+            ResourceGroupResource(agents=[_agent("agent-a", {"cpu": "8", "mem": "16"})]),
+        )
+        tracker = trackers[0]
+        assert isinstance(tracker, MatrixAgentStateTracker)
+        matrix = tracker.matrix
+
+        tracker.apply_diff(_req({"cpu": "2"}).requested_slots, 1, None)
+        tracker.commit()
+        tracker.apply_diff(_req({"cpu": "1", "mem": "4"}).requested_slots, 1, None)
+        tracker.apply_reclaim({CPU: Decimal("3")})
+        tracker.rollback()
+        tracker.clear_reclaim()
+
+        remaining = tracker.remaining_slots()
+        row = matrix.remaining[tracker.row]
+        assert row[matrix.slot_index[CPU]] == remaining[CPU] * matrix.scale == 6
+        assert row[matrix.slot_index[MEM]] == remaining[MEM] * matrix.scale == 16
+
+    def test_scale_covers_fractional_amounts(self) -> None:
+        trackers = build_engine_trackers(
+            AgentPlacementEngine.MATRIX,
+            ResourceGroupResource(agents=[_agent("agent-a", {"cpu": "8", "cuda.shares": "2.25"})]),
+        )
+        matrix = matrix_of(trackers)
+        assert matrix is not None
+        assert matrix.scale == 100
+
+    def test_unrepresentable_amount_falls_back_to_trackers(self) -> None:
+        trackers = build_engine_trackers(
+            AgentPlacementEngine.MATRIX,
+            ResourceGroupResource(agents=[_agent("agent-a", {"cpu": "8"})]),
+        )
+        trackers[0].apply_diff(_req({"cpu": "0.5"}).requested_slots, 1, None)
+
+        assert matrix_of(trackers) is None
+        assert trackers[0].remaining_slots()[CPU] == Decimal("7.5")
+
+    def test_tracker_engine_builds_plain_trackers(self) -> None:
+        trackers = build_engine_trackers(
+            AgentPlacementEngine.TRACKER,
+            ResourceGroupResource(agents=[_agent("agent-a", {"cpu": "8"})]),
+        )
+        assert type(trackers[0]) is AgentStateTracker
+        assert matrix_of(trackers) is None
@@ -7,11 +7,12 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from aiohttp import ClientError, ClientResponseError
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from huggingface_hub.hf_api import RepoFile
 
 from ai.backend.common.bgtask.bgtask import BackgroundTaskManager
 from ai.backend.common.bgtask.reporter import ProgressReporter
+from ai.backend.common.data.artifact.types import FileDownloadProgressData
 from ai.backend.common.data.storage.registries.types import (
     FileObjectData,
     ModelData,
@@ -143,6 +144,7 @@ def mock_redis_client() -> MagicMock:
     mock_client = MagicMock()
     mock_client.init_artifact_download = AsyncMock()
     mock_client.update_file_progress = AsyncMock()
+    mock_client.get_all_file_progress = AsyncMock(return_value=[])
     mock_client.cleanup_artifact_download = AsyncMock()
     return mock_client
 
@@ -511,6 +513,117 @@ class TestHuggingFaceDownloadStep:
                 assert result.storage_name == "test_storage"
                 mock_download_upload.assert_called_once()
 
+    async def test_execute_skips_files_completed_by_previous_attempt(
+        self,
+        hf_download_step: HuggingFaceDownloadStep,
+        mock_import_step_context: ImportStepContext,
+        mock_file_info: FileObjectData,
+        mock_storage_pool: MagicMock,
+        mock_redis_client: MagicMock,
+    ) -> None:
+        """Test that files completed and stored by a previous attempt are not downloaded again."""
+        other_file = FileObjectData(
+            path="model.safetensors",
+            size=1024,
+            type="file",
+            download_url=(
+                "https://huggingface.co/microsoft/DialoGPT-medium/resolve/main/model.safetensors"
+            ),
+        )
+        mock_redis_client.get_all_file_progress.return_value = [
+            FileDownloadProgressData(
+                file_path=mock_file_info.path,
+                success=True,
+                current_bytes=mock_file_info.size,
+                total_bytes=mock_file_info.size,
+                last_updated=0.0,
+            ),
+        ]
+        mock_storage = mock_storage_pool.get_storage.return_value
+        mock_storage.get_file_info = AsyncMock(
+            return_value=Mock(content_length=mock_file_info.size)
+        )
+
+        with patch.object(hf_download_step, "_make_scanner") as mock_make_scanner:
+            mock_scanner = MagicMock(spec=HuggingFaceScanner)
+            mock_scanner.list_model_files_info = AsyncMock(
+                return_value=[mock_file_info, other_file]
+            )
+            mock_make_scanner.return_value = mock_scanner
+
+            with patch.object(
+                hf_download_step, "_download_file_to_storage", new_callable=AsyncMock
+            ) as mock_download_upload:
+                mock_download_upload.return_value = "downloaded/key"
+
+                result = await hf_download_step.execute(mock_import_step_context, None)
+
+        mock_download_upload.assert_called_once()
+        assert mock_download_upload.call_args.kwargs["file_info"] == other_file
+        assert [file_info.path for file_info, _ in result.downloaded_files] == [
+            "config.json",
+            "model.safetensors",
+        ]
+        assert result.downloaded_files[1][1] == "downloaded/key"
+        assert result.total_bytes == mock_file_info.size + other_file.size
+        mock_redis_client.update_file_progress.assert_called_once_with(
+            model_id="microsoft/DialoGPT-medium",
+            revision="main",
+            file_path=mock_file_info.path,
+            current_bytes=mock_file_info.size,
+            total_bytes=mock_file_info.size,
+            success=True,
+        )
+
+    async def test_read_large_file_in_concurrent_segments(
+        self,
+        mock_redis_client: MagicMock,
+    ) -> None:
+        """Test that a large file is fetched with range requests and yielded in order."""
+        data = bytes(range(256)) * 40
+        url = "http://test.com/model.safetensors"
+        received_bytes: list[int] = []
+
+        def serve_range(url: object, **kwargs: object) -> CallbackResult:
+            headers = kwargs["headers"]
+            assert isinstance(headers, dict)
+            start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+            return CallbackResult(status=206, body=data[start : end + 1])
+
+        download_stream = HuggingFaceFileDownloadStreamReader(
+            url,
+            _DEFAULT_CHUNK_SIZE,
+            max_retries=8,
+            content_type="application/octet-stream",
+            redis_client=mock_redis_client,
+            model_id="test-model",
+            revision="main",
+            file_path="model.safetensors",
+            connections=3,
+            segment_size=1000,
+            progress_callback=received_bytes.append,
+        )
+        with aioresponses() as mocked:
+            mocked.head(
+                url,
+                headers={"Content-Length": str(len(data)), "Accept-Ranges": "bytes"},
+            )
+            mocked.get(url, callback=serve_range, repeat=True)
+
+            chunks = [chunk async for chunk in download_stream.read()]
+
+        assert b"".join(chunks) == data
+        assert len(chunks) == 11
+        assert sum(received_bytes) == len(data)
+        mock_redis_client.update_file_progress.assert_called_with(
+            model_id="test-model",
+            revision="main",
+            file_path="model.safetensors",
+            current_bytes=len(data),
+            total_bytes=len(data),
+            success=True,
+        )
+
     @patch("aiohttp.ClientSession")
     async def test_make_download_file_stream_success(
         self,
@@ -698,6 +811,9 @@ class TestHuggingFaceDownloadStep:
                 revision=mock_import_step_context.model.revision,
                 file_path=mock_file_info.path,
                 token=None,
+                connections=1,
+                segment_size=16 * 1024 * 1024,
+                progress_callback=None,
             )
 
             # Get the mock storage from the pool and check it was called
@@ -812,12 +928,13 @@ class TestReservoirDownloadStep:
         mock_object_storage_config: ObjectStorageConfig,
         mock_storage_pool: MagicMock,
     ) -> None:
-        """Test successful S3 client creation."""
+        """Test that the S3 client of the storage is reused."""
         client, bucket_name = reservoir_download_step._get_s3_client(
             mock_storage_pool, "test_storage"
         )
         assert bucket_name == "test-bucket"
-        assert client.bucket_name == "test-bucket"
+        storage = mock_storage_pool.get_storage("test_storage")
+        assert client is storage._get_s3_client.return_value
 
     def test_get_s3_client_storage_not_found(
         self,
@@ -931,6 +1048,7 @@ class TestReservoirDownloadStep:
             mock_src_client = MagicMock()
             mock_src_client.download_stream = AsyncMock()
             mock_src_client.get_object_meta = AsyncMock()
+            mock_src_client.close = AsyncMock()
             mock_s3_client_class.return_value = mock_src_client
 
             # Mock download stream
@@ -962,6 +1080,7 @@ class TestReservoirDownloadStep:
             assert downloaded_files[1][0].path == "config.json"
             mock_list_keys.assert_called_once()
             assert mock_dst_client.upload_stream.call_count == 2
+            mock_src_client.close.assert_awaited_once()
 
     async def test_stream_bucket_to_bucket_no_objects(
         self,
@@ -117,6 +117,7 @@ async def volume(
         {
             "storage-proxy": {
                 "scandir-limit": 1000,
+                "clone-concurrency": 4,
             },
         },
         volume_path,
@@ -173,3 +174,4 @@ async def s3_client(minio_container: Any) -> AsyncIterator[S3Client]:  # noqa: F
                 raise
 
     yield client
+    await client.close()
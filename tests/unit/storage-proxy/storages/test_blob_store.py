@@ -0,0 +1,132 @@
+import hashlib
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import override
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ai.backend.common.types import StreamReader
+from ai.backend.storage.config.unified import VFSStorageConfig
+from ai.backend.storage.errors import BlobDigestMismatchError, InvalidBlobDigestError
+from ai.backend.storage.storages.blob_store import BLOB_STORE_DIRNAME, BlobDigest
+from ai.backend.storage.storages.vfs_storage import VFSStorage
+
+_CONTENT = b"safetensors" * 1000
+
+
+class TestStreamReader(StreamReader):
+    def __init__(self, data_chunks: list[bytes]):
+        self._data_chunks = data_chunks
+
+    @override
+    async def read(self) -> AsyncIterator[bytes]:
+        for chunk in self._data_chunks:
+            yield chunk
+
+    @override
+    def content_type(self) -> str | None:
+        return None
+
+
+def _sha256(data: bytes) -> str:
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+@pytest.fixture
+def vfs_storage(tmp_path: Path) -> VFSStorage:
+    config = VFSStorageConfig(base_path=tmp_path, deduplicate=True)  # type: ignore[call-arg]
+    return VFSStorage("test_vfs", config)
+
+
+def test_parse_digest() -> None:
+    digest = BlobDigest.parse("git-sha1:" + "A" * 40)
+    assert (digest.algorithm, digest.hexdigest) == ("git-sha1", "a" * 40)
+    for invalid in ("sha256:abc", "md5:" + "a" * 32, "sha256:" + "g" * 64, "a" * 64):
+        with pytest.raises(InvalidBlobDigestError):
+            BlobDigest.parse(invalid)
+
+
+async def test_identical_files_share_one_blob(vfs_storage: VFSStorage) -> None:
+    digest = _sha256(_CONTENT)
+    await vfs_storage.stream_upload_blob(
+        "org/model/main/model.safetensors",
+        digest,
+        len(_CONTENT),
+        TestStreamReader([_CONTENT[:100], _CONTENT[100:]]),
+    )
+    assert await vfs_storage.link_blob("fork/model/main/model.safetensors", digest, len(_CONTENT))
+    assert not await vfs_storage.link_blob("fork/model/main/other.bin", _sha256(b"x"), 1)
+
+    first = vfs_storage.resolve_path("org/model/main/model.safetensors")
+    second = vfs_storage.resolve_path("fork/model/main/model.safetensors")
+    assert first.read_bytes() == _CONTENT
+    assert first.stat().st_ino == second.stat().st_ino
+    assert first.stat().st_nlink == 3
+    assert not any((vfs_storage.base_path / BLOB_STORE_DIRNAME / "staging").iterdir())
+
+
+async def test_git_blob_id_is_verified(vfs_storage: VFSStorage) -> None:
+    content = b'{"model_type": "llama"}\n'
+    blob_id = hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+    await vfs_storage.stream_upload_blob(
+        "org/model/main/config.json",
+        f"git-sha1:{blob_id}",
+        len(content),
+        TestStreamReader([content]),
+    )
+    assert vfs_storage.resolve_path("org/model/main/config.json").read_bytes() == content
+
+
+async def test_digest_mismatch_is_not_stored(vfs_storage: VFSStorage) -> None:
+    digest = _sha256(_CONTENT)
+    with pytest.raises(BlobDigestMismatchError):
+        await vfs_storage.stream_upload_blob(
+            "org/model/main/model.safetensors",
+            digest,
+            len(_CONTENT),
+            TestStreamReader([b"corrupted"]),
+        )
+    assert not vfs_storage.resolve_path("org/model/main/model.safetensors").exists()
+    assert not await vfs_storage.link_blob("org/model/main/model.safetensors", digest, 9)
+    assert not any((vfs_storage.base_path / BLOB_STORE_DIRNAME / "staging").iterdir())
+
+
+async def test_overwriting_a_reference_keeps_the_blob(vfs_storage: VFSStorage) -> None:
+    digest = _sha256(_CONTENT)
+    await vfs_storage.stream_upload_blob(
+        "org/model/main/model.safetensors", digest, len(_CONTENT), TestStreamReader([_CONTENT])
+    )
+    await vfs_storage.stream_upload("org/model/main/model.safetensors", TestStreamReader([b"new"]))
+
+    assert vfs_storage.resolve_path("org/model/main/model.safetensors").read_bytes() == b"new"
+    assert await vfs_storage.link_blob("fork/model/main/model.safetensors", digest, len(_CONTENT))
+    assert vfs_storage.resolve_path("fork/model/main/model.safetensors").read_bytes() == _CONTENT
+
+
+async def test_unreferenced_blobs_are_collected(vfs_storage: VFSStorage) -> None:
+    digest = _sha256(_CONTENT)
+    await vfs_storage.stream_upload_blob(
+        "org/model/main/model.safetensors", digest, len(_CONTENT), TestStreamReader([_CONTENT])
+    )
+    assert await vfs_storage.link_blob("org/model/v2/model.safetensors", digest, len(_CONTENT))
+
+    await vfs_storage.delete_file("org/model/main")
+    assert await vfs_storage.link_blob("org/model/v3/model.safetensors", digest, len(_CONTENT))
+
+    await vfs_storage.delete_file("org/model/v2")
+    await vfs_storage.delete_file("org/model/v3")
+    assert not await vfs_storage.link_blob("org/model/v4/model.safetensors", digest, len(_CONTENT))
+
+
+async def test_deleting_unshared_files_skips_collection(
+    vfs_storage: VFSStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await vfs_storage.stream_upload("org/model/main/README.md", TestStreamReader([b"readme"]))
+    collect_garbage = AsyncMock()
+    monkeypatch.setattr(vfs_storage, "collect_garbage", collect_garbage)
+
+    await vfs_storage.delete_file("org/model/main/README.md")
+    await vfs_storage.delete_file("org/model")
+
+    collect_garbage.assert_not_awaited()
@@ -1,10 +1,12 @@
 from collections.abc import AsyncIterator
-from typing import override
+from typing import Any, override
+from unittest.mock import AsyncMock
 
 import pytest
 from botocore.exceptions import ClientError
 
 from ai.backend.common.types import StreamReader
+from ai.backend.storage.client import s3 as s3_module
 from ai.backend.storage.client.s3 import S3Client
 
 
@@ -46,6 +48,107 @@ async def test_upload_stream_success(s3_client: S3Client) -> None:
     assert b"".join(chunks) == b"chunk1chunk2chunk3"
 
 
+async def test_upload_stream_multipart_concurrently(s3_client: S3Client) -> None:
+    """Test multipart upload of parts filled from unaligned chunks"""
+    data = bytes(range(256)) * (_DEFAULT_UPLOAD_STREAM_CHUNK_SIZE * 3 // 256 + 1000)
+    # Chunk boundaries that do not line up with the part boundaries
+    chunks = [data[i : i + 3_000_000] for i in range(0, len(data), 3_000_000)]
+    client = S3Client(
+        bucket_name=s3_client.bucket_name,
+        endpoint_url=s3_client.endpoint_url,
+        region_name=s3_client.region_name,
+        aws_access_key_id=s3_client.aws_access_key_id,
+        aws_secret_access_key=s3_client.aws_secret_access_key,
+        upload_concurrency=2,
+    )
+    try:
+        await client.upload_stream(
+            TestStreamReader(chunks),
+            "test/multipart.bin",
+            part_size=_DEFAULT_UPLOAD_STREAM_CHUNK_SIZE,
+        )
+    finally:
+        await client.close()
+
+    downloaded = []
+    download_stream = s3_client.download_stream(
+        "test/multipart.bin", _DEFAULT_UPLOAD_STREAM_CHUNK_SIZE
+    )
+    async for chunk in download_stream.read():
+        downloaded.append(chunk)
+    assert b"".join(downloaded) == data
+
+
+class _FakeMultipartClient:
+    def __init__(self, *, fail_once: set[int], fail_always: set[int] | None = None) -> None:
+        self.uploaded: dict[int, bytes] = {}
+        self.attempts: dict[int, int] = {}
+        self._fail_once = fail_once
+        self._fail_always = fail_always or set()
+        self.create_multipart_upload = AsyncMock(return_value={"UploadId": "upload-1"})
+        self.complete_multipart_upload = AsyncMock()
+        self.abort_multipart_upload = AsyncMock()
+
+    async def upload_part(self, *, PartNumber: int, Body: bytearray, **kwargs: Any) -> Any:
+        attempt = self.attempts[PartNumber] = self.attempts.get(PartNumber, 0) + 1
+        if PartNumber in self._fail_always or (PartNumber in self._fail_once and attempt == 1):
+            raise ConnectionResetError("connection reset by peer")
+        self.uploaded[PartNumber] = bytes(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+
+def _make_client_with(fake: _FakeMultipartClient, **kwargs: Any) -> S3Client:
+    client = S3Client(
+        bucket_name="test-bucket",
+        endpoint_url="http://127.0.0.1:9000",
+        region_name="us-east-1",
+        aws_access_key_id="minioadmin",
+        aws_secret_access_key="minioadmin",
+        **kwargs,
+    )
+    client._s3_client = fake
+    return client
+
+
+async def test_upload_stream_retries_only_failed_parts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a failed part is retried by itself"""
+    monkeypatch.setattr(s3_module, "_PART_RETRY_BACKOFF", 0.0)
+    fake = _FakeMultipartClient(fail_once={2})
+    client = _make_client_with(fake, upload_concurrency=2, upload_max_retries=1)
+
+    await client.upload_stream(TestStreamReader([b"abcdefghij"]), "test/retry.bin", part_size=4)
+
+    assert fake.uploaded == {1: b"abcd", 2: b"efgh", 3: b"ij"}
+    assert fake.attempts == {1: 1, 2: 2, 3: 1}
+    fake.complete_multipart_upload.assert_awaited_once()
+    assert fake.complete_multipart_upload.call_args.kwargs["MultipartUpload"] == {
+        "Parts": [
+            {"PartNumber": 1, "ETag": "etag-1"},
+            {"PartNumber": 2, "ETag": "etag-2"},
+            {"PartNumber": 3, "ETag": "etag-3"},
+        ]
+    }
+    fake.abort_multipart_upload.assert_not_awaited()
+
+
+async def test_upload_stream_aborts_after_retries_exhausted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the multipart upload is aborted when a part keeps failing"""
+    monkeypatch.setattr(s3_module, "_PART_RETRY_BACKOFF", 0.0)
+    fake = _FakeMultipartClient(fail_once=set(), fail_always={1})
+    client = _make_client_with(fake, upload_concurrency=2, upload_max_retries=2)
+
+    with pytest.raises(ConnectionResetError):
+        await client.upload_stream(
+            TestStreamReader([b"abcd", b"efgh"]), "test/fail.bin", part_size=4
+        )
+
+    assert fake.attempts[1] == 3
+    fake.complete_multipart_upload.assert_not_awaited()
+    fake.abort_multipart_upload.assert_awaited_once()
+
+
 async def test_download_stream_success(s3_client: S3Client) -> None:
     """Test successful stream download"""
     test_data = b"This is test file content"
@@ -1,10 +1,13 @@
+import os
 import tempfile
 from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
+from ai.backend.storage.types import CloneProgress
 from ai.backend.storage.volumes.vfs import BaseFSOpModel
+from ai.backend.storage.volumes.vfs.clone import TreeCloner
 
 
 @pytest.fixture
@@ -72,3 +75,60 @@ async def test_scan_tree_with_limit(dummy_path: Path) -> None:
     async for item in fsop_model.scan_tree(dummy_path, recursive=False):
         result.append(item)
     assert len(result) == 5
+
+
+async def test_copy_tree(dummy_path: Path, tmp_path: Path) -> None:
+    os.chmod(dummy_path / "a.txt", 0o640)
+    os.utime(dummy_path / "inner1" / "d.txt", (1_600_000_000, 1_600_000_000))
+    os.utime(dummy_path / "inner2", (1_500_000_000, 1_500_000_000))
+    (dummy_path / "inner1" / "link").symlink_to("../a.txt")
+    fsop_model = BaseFSOpModel(dummy_path, 10, clone_concurrency=4)
+    reports: list[CloneProgress] = []
+
+    async def _report(progress: CloneProgress) -> None:
+        reports.append(progress)
+
+    dst_path = tmp_path / "dst"
+    await fsop_model.copy_tree(dummy_path, dst_path, progress=_report)
+
+    for path in dummy_path.rglob("*"):
+        copied = dst_path / path.relative_to(dummy_path)
+        src_stat, dst_stat = path.lstat(), copied.lstat()
+        assert (dst_stat.st_mode, dst_stat.st_mtime_ns) == (src_stat.st_mode, src_stat.st_mtime_ns)
+        if path.is_file() and not path.is_symlink():
+            assert copied.read_bytes() == path.read_bytes()
+    assert os.readlink(dst_path / "inner1" / "link") == "../a.txt"
+    assert reports[-1] == CloneProgress(
+        files_found=6, bytes_found=20, files_copied=6, bytes_copied=20
+    )
+
+
+async def test_copy_tree_overwrites_existing_files(dummy_path: Path, tmp_path: Path) -> None:
+    dst_path = tmp_path / "dst"
+    (dst_path / "inner1").mkdir(parents=True)
+    (dst_path / "inner1" / "d.txt").write_bytes(b"stale content")
+    (dst_path / "extra.txt").write_bytes(b"kept")
+
+    await BaseFSOpModel(dummy_path, 10).copy_tree(dummy_path, dst_path)
+
+    assert (dst_path / "inner1" / "d.txt").read_bytes() == b"qwer"
+    assert (dst_path / "extra.txt").read_bytes() == b"kept"
+
+
+async def test_copy_tree_falls_back_to_userspace_copy(dummy_path: Path, tmp_path: Path) -> None:
+    big_file = dummy_path / "inner2" / "big.bin"
+    big_file.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+    cloner = TreeCloner(dummy_path, tmp_path / "dst", concurrency=2)
+    cloner._use_reflink = False
+    cloner._use_copy_file_range = False
+    cloner._use_sendfile = False
+
+    result = await cloner.run()
+
+    assert (tmp_path / "dst" / "inner2" / "big.bin").read_bytes() == big_file.read_bytes()
+    assert result.bytes_copied == result.bytes_found == 20 + big_file.stat().st_size
+
+
+async def test_copy_single_file(dummy_path: Path, tmp_path: Path) -> None:
+    await BaseFSOpModel(dummy_path, 10).copy_tree(dummy_path / "a.txt", tmp_path / "a.txt")
+    assert (tmp_path / "a.txt").read_bytes() == b"123"
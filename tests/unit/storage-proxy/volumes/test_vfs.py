@@ -38,6 +38,7 @@ class TestBaseVolume:
             {
                 "storage-proxy": {
                     "scandir-limit": 1000,
+                    "clone-concurrency": 4,
                 },
             },
             temp_volume_path,
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ai.backend.common.types import QuotaScopeID, QuotaScopeType
+from ai.backend.storage.errors import QuotaTreeNotFoundError
+from ai.backend.storage.types import QuotaConfig, QuotaUsage
+from ai.backend.storage.volumes.xfs import XFSProjectQuotaModel, XfsProjectRegistry
+
+QSID_1 = QuotaScopeID(QuotaScopeType.USER, uuid.UUID(int=1))
+QSID_2 = QuotaScopeID(QuotaScopeType.USER, uuid.UUID(int=2))
+QSID_3 = QuotaScopeID(QuotaScopeType.PROJECT, uuid.UUID(int=3))
+
+
+def _report_line(qsid: QuotaScopeID, used_kbs: int, limit_kbs: int) -> str:
+    return f"{qsid.pathname} {used_kbs} {limit_kbs} {limit_kbs} 00 [--------]"
+
+
+class TestXFSProjectQuotaModel:
+    @pytest.fixture
+    def mock_run(self) -> AsyncMock:
+        return AsyncMock(
+            return_value="\n".join([
+                _report_line(QSID_1, 100, 1000),
+                _report_line(QSID_2, 200, 2000),
+                "#3 0 0 0 00 [--------]",
+            ])
+        )
+
+    @pytest.fixture
+    def quota_model(
+        self,
+        tmp_path: Path,
+        mock_run: AsyncMock,
+    ) -> Iterator[XFSProjectQuotaModel]:
+        registry = XfsProjectRegistry()
+        registry.name_id_map = {QSID_3.pathname: 3}
+        model = XFSProjectQuotaModel(tmp_path, registry, tmp_path / "lock", quota_report_ttl=60)
+        for qsid in (QSID_1, QSID_2):
+            model.mangle_qspath(qsid).mkdir(parents=True)
+        with patch("ai.backend.storage.volumes.xfs.run", mock_run):
+            yield model
+
+    async def test_describe_is_served_from_one_report(
+        self,
+        quota_model: XFSProjectQuotaModel,
+        mock_run: AsyncMock,
+    ) -> None:
+        usages = await asyncio.gather(
+            quota_model.describe_quota_scope(QSID_1),
+            quota_model.describe_quota_scope(QSID_2),
+            quota_model.describe_quota_scope(QSID_1),
+        )
+        assert usages == [
+            QuotaUsage(100 * 1024, 1000 * 1024),
+            QuotaUsage(200 * 1024, 2000 * 1024),
+            QuotaUsage(100 * 1024, 1000 * 1024),
+        ]
+        assert mock_run.await_count == 1
+
+    async def test_describe_quota_scopes(
+        self,
+        quota_model: XFSProjectQuotaModel,
+        mock_run: AsyncMock,
+    ) -> None:
+        quota_model.mangle_qspath(QSID_3).mkdir(parents=True)
+        usages = await quota_model.describe_quota_scopes([
+            QSID_1,
+            QSID_3,
+            QuotaScopeID(QuotaScopeType.USER, uuid.UUID(int=4)),
+        ])
+        assert usages == {
+            QSID_1: QuotaUsage(100 * 1024, 1000 * 1024),
+            # Reported by the project ID without a registered name.
+            QSID_3: QuotaUsage(0, 0),
+            QuotaScopeID(QuotaScopeType.USER, uuid.UUID(int=4)): None,
+        }
+        assert mock_run.await_count == 1
+
+    async def test_update_invalidates_the_report(
+        self,
+        quota_model: XFSProjectQuotaModel,
+        mock_run: AsyncMock,
+    ) -> None:
+        await quota_model.describe_quota_scope(QSID_1)
+        await quota_model.update_quota_scope(QSID_1, QuotaConfig(2000 * 1024))
+        mock_run.return_value = _report_line(QSID_1, 100, 2000)
+
+        assert await quota_model.describe_quota_scope(QSID_1) == QuotaUsage(100 * 1024, 2000 * 1024)
+
+    async def test_unknown_project_refreshes_the_report_once(
+        self,
+        quota_model: XFSProjectQuotaModel,
+        mock_run: AsyncMock,
+    ) -> None:
+        await quota_model.describe_quota_scope(QSID_1)
+        unknown = QuotaScopeID(QuotaScopeType.USER, uuid.UUID(int=5))
+        quota_model.mangle_qspath(unknown).mkdir(parents=True)
+
+        with pytest.raises(QuotaTreeNotFoundError):
+            await quota_model.describe_quota_scope(unknown)
+        assert mock_run.await_count == 2
+
+        # Repeated misses within the TTL are served from the refreshed report.
+        with pytest.raises(QuotaTreeNotFoundError):
+            await quota_model.describe_quota_scope(unknown)
+        assert mock_run.await_count == 2
+
+    async def test_batch_reports_an_unknown_project_as_none(
+        self,
+        quota_model: XFSProjectQuotaModel,
+        mock_run: AsyncMock,
+    ) -> None:
+        unknown = QuotaScopeID(QuotaScopeType.USER, uuid.UUID(int=5))
+        quota_model.mangle_qspath(unknown).mkdir(parents=True)
+
+        for _ in range(3):
+            usages = await quota_model.describe_quota_scopes([QSID_1, unknown])
+            assert usages == {QSID_1: QuotaUsage(100 * 1024, 1000 * 1024), unknown: None}
+        assert mock_run.await_count == 2